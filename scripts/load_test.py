@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+MCP Load-Test Harness
+
+Drives the real FastMCP server through an MCP client, either in-process or
+over stdio, with a weighted mix of tool calls (character analysis, personas,
+Suno commands, albums and wiki queries) and reports throughput, latency
+percentiles and error rate per tool.
+
+Each stage runs for a fixed duration at one load level:
+
+- open loop: requests arrive at a fixed rate whatever the response times,
+  and latency is measured from each request's scheduled arrival, so a slow
+  server is not hidden by the harness slowing down with it
+- closed loop: a fixed number of clients each send their next request when
+  the previous one returns
+
+Requests and arrival times come from a seeded random generator, so two runs
+with the same options send the same requests; results are written as JSON
+together with the options, and can be compared with a previous run's file.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SERVER_SCRIPT = PROJECT_ROOT / "src" / "character_music_mcp" / "server.py"
+
+# Directories holding the server's flat-imported modules
+SOURCE_DIRS = [str(path) for path in sorted((PROJECT_ROOT / "src" / "character_music_mcp").rglob("*"))
+               if path.is_dir() and path.name != "__pycache__"]
+SOURCE_DIRS.insert(0, str(SERVER_SCRIPT.parent))
+
+# Version of the results file layout
+RESULTS_FORMAT_VERSION = 1
+
+# Latency percentiles reported per tool
+PERCENTILES = (50, 95, 99, 99.9)
+
+# Default request mix: category -> relative weight
+DEFAULT_MIX = {"analysis": 4, "personas": 2, "commands": 2, "albums": 1, "wiki": 1}
+
+# Changes in p99 latency or throughput beyond this fraction are flagged when comparing runs
+COMPARISON_TOLERANCE = 0.10
+
+# Characters and settings combined into distinct stories, so identical concurrent
+# requests do not collapse into one call through the server's single-flight
+CHARACTER_PAIRS = [
+    ("Sarah Chen", "Marcus Webb"), ("Elena Voss", "Tomas Reyes"), ("Amara Okafor", "Felix Brandt"),
+    ("Iris Tanaka", "Jonah Price"), ("Lucia Moretti", "Owen Hale"), ("Nadia Petrova", "Caleb Stone"),
+    ("Maya Lindqvist", "Rafael Ortiz"), ("Hana Kim", "Declan Moore"),
+]
+SETTINGS = [
+    ("the edge of the pier", "the ocean after the storm took her father"),
+    ("the empty train station", "the silence after her brother left"),
+    ("the rooftop garden", "the city that never let her rest"),
+    ("the abandoned theater", "the stage where her voice once broke"),
+]
+STORY_TEMPLATE = (
+    "{hero} stood at {place}, remembering everything. {hero_first} had always feared {fear}. "
+    "\"I will not run anymore,\" {hero_first} said to {friend}. {friend} watched her with worry, "
+    "knowing {hero_first} hid her grief behind ambition. Years later {hero_first} returned, "
+    "stronger, and {friend} finally understood what she had been fighting for."
+)
+ALBUM_CONCEPTS = ["Finding courage after loss", "Leaving home", "Voices that return", "Quiet defiance"]
+WIKI_TOPICS = ["genres", "meta_tags", "techniques", "best_practices"]
+
+
+def build_story(index: int) -> str:
+    """Story number index of the input pool"""
+    hero, friend = CHARACTER_PAIRS[index % len(CHARACTER_PAIRS)]
+    place, fear = SETTINGS[(index // len(CHARACTER_PAIRS)) % len(SETTINGS)]
+    return STORY_TEMPLATE.format(hero=hero, hero_first=hero.split()[0], friend=friend, place=place, fear=fear)
+
+
+@dataclass
+class RequestKind:
+    """A category of the request mix: the tool it calls and how to build its arguments"""
+    tool: str
+    build_arguments: Callable[["InputPool", random.Random], Dict[str, Any]]
+
+
+@dataclass
+class InputPool:
+    """Distinct stories, and the characters and personas prepared from them before the stages run"""
+    stories: List[str]
+    characters_json: List[str] = field(default_factory=list)
+    personas_json: List[str] = field(default_factory=list)
+
+    def pick(self, rng: random.Random) -> int:
+        return rng.randrange(len(self.stories))
+
+
+def _commands_arguments(pool: InputPool, rng: random.Random) -> Dict[str, Any]:
+    index = rng.randrange(len(pool.personas_json))
+    return {"personas_json": pool.personas_json[index], "characters_json": pool.characters_json[index]}
+
+
+REQUEST_KINDS: Dict[str, RequestKind] = {
+    "analysis": RequestKind("analyze_character_text",
+                            lambda pool, rng: {"text": pool.stories[pool.pick(rng)]}),
+    "personas": RequestKind("generate_artist_personas",
+                            lambda pool, rng: {"characters_json": rng.choice(pool.characters_json)}),
+    "commands": RequestKind("create_suno_commands", _commands_arguments),
+    "albums": RequestKind("create_conceptual_album",
+                          lambda pool, rng: {"content": pool.stories[pool.pick(rng)],
+                                             "album_concept": rng.choice(ALBUM_CONCEPTS), "track_count": 4}),
+    "wiki": RequestKind("crawl_suno_wiki_best_practices", lambda pool, rng: {"topic": rng.choice(WIKI_TOPICS)}),
+}
+
+
+@dataclass
+class Stage:
+    """One load level held for a fixed duration"""
+    mode: str  # "open" (level is arrivals per second) or "closed" (level is clients)
+    level: float
+    duration: float
+
+    @property
+    def label(self) -> str:
+        return f"{self.level:g} req/s open loop" if self.mode == "open" else f"{self.level:g} clients closed loop"
+
+
+@dataclass
+class LoadTestConfig:
+    """Everything that determines which requests a run sends"""
+    transport: str = "inprocess"
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    stages: List[Stage] = field(default_factory=list)
+    arrivals: str = "poisson"  # Open-loop inter-arrival times: "poisson" or "uniform"
+    seed: int = 42
+    input_pool_size: int = 8
+    warmup_requests: int = 10
+    max_in_flight: int = 256  # Open-loop arrivals beyond this are dropped and counted as errors
+    request_timeout: float = 60.0
+    startup: bool = True  # Run the server's startup initialization (in-process; stdio always does)
+
+
+class ToolStats:
+    """Latencies and errors of one tool within a stage"""
+
+    def __init__(self):
+        self.latencies: List[float] = []  # Seconds, successful calls only
+        self.errors: Dict[str, int] = {}
+
+    def record(self, latency: float, error: Optional[str]) -> None:
+        if error is None:
+            self.latencies.append(latency)
+        else:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        error_count = sum(self.errors.values())
+        requests = len(self.latencies) + error_count
+        ordered = sorted(self.latencies)
+        summary = {
+            "requests": requests,
+            "successes": len(ordered),
+            "errors": error_count,
+            "error_rate": error_count / requests if requests else 0.0,
+            "throughput_rps": len(ordered) / elapsed if elapsed > 0 else 0.0,
+            "mean_ms": sum(ordered) / len(ordered) * 1000 if ordered else None,
+            "max_ms": ordered[-1] * 1000 if ordered else None,
+        }
+        for quantile in PERCENTILES:
+            value = percentile(ordered, quantile)
+            summary[f"p{quantile:g}_ms"] = value * 1000 if value is not None else None
+        if self.errors:
+            summary["error_kinds"] = dict(self.errors)
+        return summary
+
+
+def percentile(ordered: List[float], quantile: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted values"""
+    if not ordered:
+        return None
+    rank = math.ceil(round(quantile / 100 * len(ordered), 6))  # Rounded: 99.9 / 100 * 1000 is not exactly 999
+    return ordered[min(len(ordered), max(rank, 1)) - 1]
+
+
+def _error_of(result: Any) -> Optional[str]:
+    """Error kind of a tool result, or None if it succeeded"""
+    if getattr(result, "is_error", False):
+        return "tool_error"
+    for content in getattr(result, "content", None) or []:
+        try:
+            payload = json.loads(getattr(content, "text", "") or "null")
+        except json.JSONDecodeError:
+            continue
+        if isinstance(payload, dict) and payload.get("error"):
+            return "error_response"
+    return None
+
+
+class LoadTestRunner:
+    """Sends the request mix to an MCP client stage by stage and collects per-tool statistics"""
+
+    def __init__(self, client: Any, config: LoadTestConfig):
+        self.client = client
+        self.config = config
+        self.pool = InputPool([build_story(i) for i in range(config.input_pool_size)])
+        self._categories = [category for category in config.mix if config.mix[category] > 0]
+        self._weights = [config.mix[category] for category in self._categories]
+        unknown = set(self._categories) - REQUEST_KINDS.keys()
+        if unknown:
+            raise ValueError(f"Unknown request categories: {', '.join(sorted(unknown))}. "
+                             f"Use {', '.join(REQUEST_KINDS)}")
+
+    async def prepare(self) -> None:
+        """Build the characters and personas later requests take as input, and warm the server up"""
+        for story in self.pool.stories:
+            characters = await self._call_checked("analyze_character_text", {"text": story})
+            personas = await self._call_checked("generate_artist_personas", {"characters_json": characters})
+            self.pool.characters_json.append(characters)
+            self.pool.personas_json.append(personas)
+
+        rng = random.Random(f"{self.config.seed}-warmup")
+        for _ in range(self.config.warmup_requests):
+            tool, arguments = self._next_request(rng)
+            await self._call(tool, arguments)
+
+    async def run(self) -> Dict[str, Any]:
+        """Prepare inputs, run every stage and return the results"""
+        await self.prepare()
+        stages = []
+        for number, stage in enumerate(self.config.stages):
+            rng = random.Random(f"{self.config.seed}-{number}")
+            runner = self._run_open_loop if stage.mode == "open" else self._run_closed_loop
+            stages.append(await runner(stage, rng))
+        return {
+            "format_version": RESULTS_FORMAT_VERSION,
+            "timestamp": datetime.now().isoformat(),
+            "config": config_to_dict(self.config),
+            "environment": environment_info(),
+            "stages": stages,
+        }
+
+    async def _run_open_loop(self, stage: Stage, rng: random.Random) -> Dict[str, Any]:
+        stats: Dict[str, ToolStats] = {}
+        in_flight: set = set()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + stage.duration
+        arrival = started
+        offered = dropped = 0
+
+        while True:
+            arrival += rng.expovariate(stage.level) if self.config.arrivals == "poisson" else 1 / stage.level
+            if arrival >= deadline:
+                break
+            tool, arguments = self._next_request(rng)
+            await asyncio.sleep(max(0.0, arrival - loop.time()))
+            offered += 1
+            if len(in_flight) >= self.config.max_in_flight:
+                dropped += 1
+                stats.setdefault(tool, ToolStats()).record(0.0, "dropped")
+                continue
+            task = asyncio.create_task(self._timed_call(tool, arguments, arrival, stats))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        await self._drain(in_flight)
+        summary = self._stage_summary(stage, stats, loop.time() - started)
+        summary.update(offered_requests=offered, offered_rps=offered / stage.duration, dropped=dropped)
+        return summary
+
+    async def _run_closed_loop(self, stage: Stage, rng: random.Random) -> Dict[str, Any]:
+        stats: Dict[str, ToolStats] = {}
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + stage.duration
+        # One generator per client, so the requests sent do not depend on which client finishes first
+        client_rngs = [random.Random(f"{rng.random()}-{client}") for client in range(int(stage.level))]
+
+        async def client_loop(client_rng: random.Random) -> None:
+            while loop.time() < deadline:
+                tool, arguments = self._next_request(client_rng)
+                await self._timed_call(tool, arguments, loop.time(), stats)
+
+        await asyncio.gather(*(client_loop(client_rng) for client_rng in client_rngs))
+        return self._stage_summary(stage, stats, loop.time() - started)
+
+    async def _drain(self, in_flight: set) -> None:
+        """Wait for requests still in flight at the end of an open-loop stage"""
+        if in_flight:
+            _, pending = await asyncio.wait(set(in_flight), timeout=self.config.request_timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _stage_summary(self, stage: Stage, stats: Dict[str, ToolStats], elapsed: float) -> Dict[str, Any]:
+        overall = ToolStats()
+        for tool_stats in stats.values():
+            overall.latencies.extend(tool_stats.latencies)
+            for kind, count in tool_stats.errors.items():
+                overall.errors[kind] = overall.errors.get(kind, 0) + count
+        return {
+            "mode": stage.mode,
+            "level": stage.level,
+            "duration": stage.duration,
+            "elapsed": elapsed,
+            "tools": {tool: stats[tool].summary(elapsed) for tool in sorted(stats)},
+            "all": overall.summary(elapsed),
+        }
+
+    def _next_request(self, rng: random.Random) -> Tuple[str, Dict[str, Any]]:
+        kind = REQUEST_KINDS[rng.choices(self._categories, self._weights)[0]]
+        return kind.tool, kind.build_arguments(self.pool, rng)
+
+    async def _timed_call(self, tool: str, arguments: Dict[str, Any], scheduled: float,
+                          stats: Dict[str, ToolStats]) -> None:
+        error = await self._call(tool, arguments)
+        latency = asyncio.get_running_loop().time() - scheduled
+        stats.setdefault(tool, ToolStats()).record(latency, error)
+
+    async def _call(self, tool: str, arguments: Dict[str, Any]) -> Optional[str]:
+        try:
+            result = await self.client.call_tool(tool, arguments, raise_on_error=False,
+                                                 timeout=self.config.request_timeout)
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.TimeoutError, TimeoutError):
+            return "timeout"
+        except Exception as e:
+            return type(e).__name__
+        return _error_of(result)
+
+    async def _call_checked(self, tool: str, arguments: Dict[str, Any]) -> str:
+        result = await self.client.call_tool(tool, arguments, timeout=self.config.request_timeout)
+        if _error_of(result):
+            raise RuntimeError(f"Preparing load-test inputs failed: {tool} returned {result.content[0].text}")
+        return result.content[0].text
+
+
+# ================================================================================================
+# CLIENTS AND RESULTS
+# ================================================================================================
+
+def create_client(config: LoadTestConfig, server_log: Optional[str] = None) -> Any:
+    """MCP client for the configured transport"""
+    from fastmcp import Client
+
+    if config.transport == "stdio":
+        from fastmcp.client.transports import PythonStdioTransport
+
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(SOURCE_DIRS + [os.environ.get("PYTHONPATH", "")]))
+        return Client(PythonStdioTransport(str(SERVER_SCRIPT), env=env, cwd=str(PROJECT_ROOT),
+                                           log_file=Path(server_log) if server_log else None),
+                      log_handler=_ignore_server_log)
+
+    for source_dir in reversed(SOURCE_DIRS):
+        if source_dir not in sys.path:
+            sys.path.insert(0, source_dir)
+    import server
+    return Client(server.mcp, log_handler=_ignore_server_log)
+
+
+async def _ignore_server_log(message: Any) -> None:
+    """Tools' progress messages to the client are not part of the measurement"""
+
+
+async def run_load_test(config: LoadTestConfig, client: Any = None, server_log: Optional[str] = None) -> Dict[str, Any]:
+    """Run every stage of config against the server and return the results"""
+    if client is None:
+        client = create_client(config, server_log)
+        if config.transport == "inprocess" and config.startup:
+            import server
+            await server.startup()
+    async with client:
+        return await LoadTestRunner(client, config).run()
+
+
+def config_to_dict(config: LoadTestConfig) -> Dict[str, Any]:
+    return asdict(config)
+
+
+def environment_info() -> Dict[str, Any]:
+    """Where a run happened, to tell apart result changes that come from the machine"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": commit,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any],
+                    tolerance: float = COMPARISON_TOLERANCE) -> Dict[str, Any]:
+    """
+    Compare two runs stage by stage and tool by tool
+
+    Stages are matched by mode and level. Runs are comparable only if they
+    sent the same requests, i.e. their configs match apart from the stage
+    list; the differing options are listed otherwise.
+    """
+    ignored = {"stages"}
+    differing = sorted(key for key in current["config"].keys() | baseline["config"].keys()
+                       if key not in ignored and current["config"].get(key) != baseline["config"].get(key))
+
+    baseline_stages = {(stage["mode"], stage["level"]): stage for stage in baseline["stages"]}
+    rows = []
+    for stage in current["stages"]:
+        previous = baseline_stages.get((stage["mode"], stage["level"]))
+        if previous is None:
+            continue
+        for tool, summary in list(stage["tools"].items()) + [("all", stage["all"])]:
+            before = previous["tools"].get(tool) if tool != "all" else previous["all"]
+            if not before:
+                continue
+            row = {"stage": Stage(stage["mode"], stage["level"], stage["duration"]).label, "tool": tool}
+            for metric in ("p50_ms", "p99_ms", "throughput_rps", "error_rate"):
+                row[metric] = (before[metric], summary[metric], _relative_change(before[metric], summary[metric]))
+            p99_change, throughput_change = row["p99_ms"][2], row["throughput_rps"][2]
+            row["regression"] = bool((p99_change is not None and p99_change > tolerance)
+                                     or (throughput_change is not None and throughput_change < -tolerance)
+                                     or summary["error_rate"] > before["error_rate"])
+            rows.append(row)
+    return {"comparable": not differing, "differing_options": differing, "rows": rows}
+
+
+def _relative_change(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    if before is None or after is None or before == 0:
+        return None
+    return (after - before) / before
+
+
+# ================================================================================================
+# COMMAND LINE
+# ================================================================================================
+
+def _format_ms(value: Optional[float]) -> str:
+    return f"{value:9.1f}" if value is not None else f"{'-':>9}"
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    config = results["config"]
+    print(f"\n📈 Load test over {config['transport']} transport, seed {config['seed']}, "
+          f"mix {', '.join(f'{k}={v:g}' for k, v in config['mix'].items())}")
+    for stage in results["stages"]:
+        label = Stage(stage["mode"], stage["level"], stage["duration"]).label
+        overall = stage["all"]
+        line = f"\n🔹 {label} for {stage['duration']:g}s: {overall['throughput_rps']:.2f} req/s completed"
+        if stage["mode"] == "open":
+            line += f", {stage['offered_rps']:.2f} req/s offered, {stage['dropped']} dropped"
+        print(line)
+        print(f"  {'tool':<32}{'requests':>9}{'errors':>8}{'req/s':>9}"
+              + "".join(f"{f'p{q:g} ms':>10}" for q in PERCENTILES))
+        for tool, summary in list(stage["tools"].items()) + [("all", overall)]:
+            print(f"  {tool:<32}{summary['requests']:>9}{summary['error_rate']:>8.1%}"
+                  f"{summary['throughput_rps']:>9.2f}"
+                  + "".join(f" {_format_ms(summary[f'p{q:g}_ms'])}" for q in PERCENTILES))
+
+
+def print_comparison(comparison: Dict[str, Any]) -> None:
+    print("\n🔍 Comparison with baseline")
+    if not comparison["comparable"]:
+        print(f"  ⚠️  Runs sent different requests (options differ: {', '.join(comparison['differing_options'])})")
+    for row in comparison["rows"]:
+        marker = "❌" if row["regression"] else "✅"
+        changes = []
+        for metric in ("p50_ms", "p99_ms", "throughput_rps"):
+            before, after, change = row[metric]
+            changes.append(f"{metric} {before or 0:.1f}→{after or 0:.1f}"
+                           + (f" ({change:+.0%})" if change is not None else ""))
+        print(f"  {marker} {row['stage']:<26} {row['tool']:<32} {', '.join(changes)}")
+
+
+def _parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for entry in text.split(","):
+        category, _, weight = entry.partition("=")
+        mix[category.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def _parse_levels(text: Optional[str]) -> List[float]:
+    return [float(level) for level in text.split(",")] if text else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the MCP server with a configurable request mix")
+    parser.add_argument("--transport", choices=["inprocess", "stdio"], default="inprocess",
+                        help="Run the server in this process or as a subprocess over stdio")
+    parser.add_argument("--mix", type=_parse_mix, default=dict(DEFAULT_MIX),
+                        help=f"Request mix as category=weight pairs, categories: {', '.join(REQUEST_KINDS)}")
+    parser.add_argument("--rates", help="Comma-separated open-loop arrival rates (requests per second)")
+    parser.add_argument("--concurrency", help="Comma-separated closed-loop client counts")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per stage")
+    parser.add_argument("--arrivals", choices=["poisson", "uniform"], default="poisson",
+                        help="Open-loop inter-arrival times")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for requests and arrival times")
+    parser.add_argument("--input-pool", type=int, default=8, help="Number of distinct input stories")
+    parser.add_argument("--warmup", type=int, default=10, help="Requests sent before the first stage")
+    parser.add_argument("--max-in-flight", type=int, default=256,
+                        help="Open-loop arrivals beyond this many outstanding requests are dropped")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds")
+    parser.add_argument("--skip-startup", action="store_true",
+                        help="In-process only: skip the server's startup initialization (wiki data download)")
+    parser.add_argument("--server-log", help="Stdio only: file for the server's stderr")
+    parser.add_argument("--output", default="load_test_results.json", help="Results file")
+    parser.add_argument("--baseline", help="Previous results file to compare with")
+    parser.add_argument("--tolerance", type=float, default=COMPARISON_TOLERANCE,
+                        help="Relative p99 or throughput change reported as a regression")
+    args = parser.parse_args()
+
+    stages = ([Stage("open", rate, args.duration) for rate in _parse_levels(args.rates)]
+              + [Stage("closed", clients, args.duration) for clients in _parse_levels(args.concurrency)])
+    if not stages:
+        stages = [Stage("closed", 1, args.duration)]
+
+    config = LoadTestConfig(
+        transport=args.transport,
+        mix=args.mix,
+        stages=stages,
+        arrivals=args.arrivals,
+        seed=args.seed,
+        input_pool_size=args.input_pool,
+        warmup_requests=args.warmup,
+        max_in_flight=args.max_in_flight,
+        request_timeout=args.timeout,
+        startup=not args.skip_startup,
+    )
+
+    print(f"🚀 Running {len(stages)} load stage(s) of {args.duration:g}s against the MCP server...")
+    start_time = time.time()
+    results = asyncio.run(run_load_test(config, server_log=args.server_log))
+    print_results(results)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n📄 Results saved to: {args.output} ({time.time() - start_time:.1f}s)")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            comparison = compare_results(results, json.load(f), args.tolerance)
+        print_comparison(comparison)
+        if any(row["regression"] for row in comparison["rows"]):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
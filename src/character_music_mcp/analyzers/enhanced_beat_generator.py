@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
 from enhanced_emotional_analyzer import EmotionalInsight, EmotionalProfile
+from tracing import traced
 
 
 @dataclass
@@ -270,6 +271,7 @@ class EnhancedBeatGenerator:
             }
         }
 
+    @traced("beat_generation")
     def generate_beat_patterns(self, emotional_profile: EmotionalProfile, genre_preferences: List[str] = None) -> Dict[str, Any]:
         """
         Generate comprehensive beat patterns based on emotional analysis
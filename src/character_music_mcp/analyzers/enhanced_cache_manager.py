@@ -7,20 +7,31 @@ cache warming strategies, and comprehensive monitoring.
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 import aiofiles
+from mcp_tool_activity import ToolActivityTracker, get_tool_activity_tracker
+from memory_diagnostics import get_memory_diagnostics
+from metrics_exposition import MetricsBuilder
 from wiki_cache_manager import CacheEntry, WikiCacheManager
 
+if TYPE_CHECKING:
+    from wiki_downloader import DownloadResult, WikiDownloader
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Most recent timings kept per cache operation for the performance stats
+OPERATION_TIMES_WINDOW = 1000
+
 # ================================================================================================
 # ENHANCED DATA MODELS
 # ================================================================================================
@@ -33,6 +44,11 @@ class CacheConfig:
     cleanup_threshold: float = 0.8  # Cleanup when cache reaches this percentage of max
     warmup_urls: List[str] = field(default_factory=list)  # URLs to pre-warm
     priority_patterns: List[str] = field(default_factory=list)  # URL patterns with high priority
+    warmup_frequent_urls: int = 10  # Most accessed URLs added to each warm-up
+    warmup_max_age_hours: int = 24  # Cached pages older than this are prefetched again
+    warmup_max_concurrent: int = 4  # Concurrent prefetch downloads
+    warmup_interval_seconds: float = 21600  # Time between background warm-ups
+    warmup_idle_seconds: float = 5.0  # Quiet period after the last tool call before warming
 
 @dataclass
 class CacheMetrics:
@@ -77,6 +93,75 @@ class CacheWarmupResult:
     failed_warmups: int
     duration_seconds: float
     errors: List[str] = field(default_factory=list)
+    already_fresh: int = 0
+    prefetched_urls: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+
+# ================================================================================================
+# EVICTION INDEX
+# ================================================================================================
+
+class EvictionIndex:
+    """
+    Min-heap of eviction candidates with lazily invalidated entries
+
+    Each URL has one live (pinned, key, sequence) record; updating a URL pushes a
+    new record and leaves the old one in the heap to be skipped when popped.
+    Unpinned URLs always come out before pinned ones. The index also keeps the
+    running size total so threshold checks don't have to walk the cache.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[bool, float, int, str]] = []
+        self._records: Dict[str, Tuple[bool, float, int]] = {}
+        self._sizes: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        self.total_size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._records
+
+    def update(self, url: str, key: float, size_bytes: int, pinned: bool = False) -> None:
+        """Insert or re-key a URL (lower key = evicted sooner)"""
+        sequence = next(self._sequence)
+        self._records[url] = (pinned, key, sequence)
+        self.total_size_bytes += size_bytes - self._sizes.get(url, 0)
+        self._sizes[url] = size_bytes
+        heapq.heappush(self._heap, (pinned, key, sequence, url))
+        self._compact_if_needed()
+
+    def discard(self, url: str) -> None:
+        """Forget a URL; its heap records become stale"""
+        if self._records.pop(url, None) is not None:
+            self.total_size_bytes -= self._sizes.pop(url)
+
+    def pop_victim(self) -> Optional[str]:
+        """Remove and return the URL with the lowest eviction key"""
+        while self._heap:
+            pinned, key, sequence, url = heapq.heappop(self._heap)
+            if self._records.get(url) == (pinned, key, sequence):
+                self.discard(url)
+                return url
+        return None
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._records.clear()
+        self._sizes.clear()
+        self.total_size_bytes = 0
+
+    def _compact_if_needed(self) -> None:
+        # Frequently accessed URLs leave stale records behind; rebuild once they dominate
+        if len(self._heap) > 2 * len(self._records) + 64:
+            self._heap = [(pinned, key, sequence, url)
+                          for url, (pinned, key, sequence) in self._records.items()]
+            heapq.heapify(self._heap)
 
 # ================================================================================================
 # ENHANCED CACHE MANAGER
@@ -85,19 +170,31 @@ class CacheWarmupResult:
 class EnhancedCacheManager(WikiCacheManager):
     """Enhanced cache manager with intelligent optimization and monitoring"""
 
-    def __init__(self, cache_root: str = "./data/wiki", config: Optional[CacheConfig] = None):
+    def __init__(self, cache_root: str = "./data/wiki", config: Optional[CacheConfig] = None,
+                 downloader: Optional['WikiDownloader'] = None,
+                 reparse_callback: Optional[Callable[[List[str]], Awaitable[Any]]] = None,
+                 activity_tracker: Optional[ToolActivityTracker] = None):
         """
         Initialize EnhancedCacheManager
 
         Args:
             cache_root: Root directory for cache storage
             config: Cache configuration
+            downloader: WikiDownloader used to prefetch stale pages during warm-up
+            reparse_callback: Called with the prefetched URLs after a warm-up,
+                e.g. WikiDataManager.reparse_pages
+            activity_tracker: Tool activity tracker used to warm up only while idle
         """
         super().__init__(cache_root)
 
         self.config = config or CacheConfig()
         self.metrics = CacheMetrics()
 
+        # Prefetching
+        self.downloader = downloader
+        self.reparse_callback = reparse_callback
+        self._activity_tracker = activity_tracker or get_tool_activity_tracker()
+
         # Priority tracking
         self._priority_urls: Set[str] = set()
         self._access_frequency: Dict[str, int] = defaultdict(int)
@@ -107,8 +204,14 @@ class EnhancedCacheManager(WikiCacheManager):
         self._cleanup_task: Optional[asyncio.Task] = None
         self._warmup_task: Optional[asyncio.Task] = None
 
+        # Eviction candidates, re-keyed on every access instead of rescored at cleanup
+        self._eviction_index = EvictionIndex()
+
         # Performance tracking
-        self._operation_times: Dict[str, List[float]] = defaultdict(list)
+        self._operation_times: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=OPERATION_TIMES_WINDOW))
+
+        get_memory_diagnostics().register(self, "_priority_urls", "_access_frequency", "_last_access_time",
+                                          "_operation_times")
 
     async def initialize(self) -> None:
         """Initialize enhanced cache manager"""
@@ -120,6 +223,8 @@ class EnhancedCacheManager(WikiCacheManager):
         # Set up priority URLs
         self._setup_priority_urls()
 
+        self._rebuild_eviction_index()
+
         # Start background tasks
         await self._start_background_tasks()
 
@@ -161,6 +266,7 @@ class EnhancedCacheManager(WikiCacheManager):
             self._last_access_time[url] = datetime.now()
         else:
             self.metrics.cache_misses += 1
+        self._update_eviction_entry(url)
 
         # Update hit rate
         total_requests = self.metrics.cache_hits + self.metrics.cache_misses
@@ -181,6 +287,7 @@ class EnhancedCacheManager(WikiCacheManager):
             await self._intelligent_cleanup()
 
         result = await super().add_file(url, local_path, download_date)
+        self._update_eviction_entry(url)
 
         # Track performance
         operation_time = time.time() - start_time
@@ -188,16 +295,41 @@ class EnhancedCacheManager(WikiCacheManager):
 
         # Update metrics
         self.metrics.total_entries = len(self._cache_entries)
-        self.metrics.total_size_bytes = sum(entry.file_size for entry in self._cache_entries.values())
+        self.metrics.total_size_bytes = self._eviction_index.total_size_bytes
 
         return result
 
-    async def warm_cache(self, urls: Optional[List[str]] = None) -> CacheWarmupResult:
+    def collect_metrics(self, builder: MetricsBuilder) -> None:
+        """Write lookup counts, cache size and evictions into a metrics scrape"""
+        self._collect_cache_metrics(builder, self.metrics.cache_hits, self.metrics.cache_misses)
+        cache = type(self).__name__
+        builder.gauge("character_music_cache_size_bytes", "Bytes of content in the cache",
+                      self._eviction_index.total_size_bytes, cache=cache)
+        builder.counter("character_music_cache_evictions", "Entries evicted by cache cleanup",
+                        self.metrics.evicted_entries, cache=cache)
+
+    async def remove_file(self, url: str) -> bool:
+        """Remove a file from cache and from the eviction index"""
+        self._eviction_index.discard(url)
+        return await super().remove_file(url)
+
+    async def remove_files(self, urls: List[str]) -> int:
+        """Remove several files from cache and from the eviction index"""
+        for url in urls:
+            self._eviction_index.discard(url)
+        return await super().remove_files(urls)
+
+    async def warm_cache(self, urls: Optional[List[str]] = None, wait_for_idle: bool = False) -> CacheWarmupResult:
         """
         Warm cache with frequently accessed or priority URLs
 
+        Pages that are missing or older than warmup_max_age_hours are prefetched
+        through the downloader with bounded concurrency, and only those pages
+        are handed to reparse_callback afterwards.
+
         Args:
-            urls: Specific URLs to warm (defaults to configured warmup URLs)
+            urls: Specific URLs to warm (defaults to configured, frequent and priority URLs)
+            wait_for_idle: Hold each download until no tool call has run for warmup_idle_seconds
 
         Returns:
             CacheWarmupResult with warming statistics
@@ -212,56 +344,75 @@ class EnhancedCacheManager(WikiCacheManager):
                 self._access_frequency.items(),
                 key=lambda x: x[1],
                 reverse=True
-            )[:10]  # Top 10 most accessed
+            )[:self.config.warmup_frequent_urls]
 
             urls.extend([url for url, _ in frequent_urls])
 
             # Add priority URLs
             urls.extend(self._priority_urls)
 
-        # Remove duplicates
-        urls = list(set(urls))
-
-        successful = 0
-        failed = 0
-        errors = []
+        # Remove duplicates, keeping the first occurrence
+        urls = list(dict.fromkeys(urls))
 
         logger.info(f"Starting cache warmup for {len(urls)} URLs")
 
+        already_fresh = 0
+        stale_urls = []
         for url in urls:
-            try:
-                # Check if already cached and fresh
-                if await self.is_file_fresh(url, 24):  # 24 hours freshness
-                    successful += 1
-                    continue
+            if await self.is_file_fresh(url, self.config.warmup_max_age_hours):
+                already_fresh += 1
+            else:
+                stale_urls.append(url)
 
-                # Need to download - this would typically be done by the downloader
-                # For now, we'll just mark it as needing warmup
-                logger.debug(f"URL needs warming: {url}")
-                successful += 1
+        prefetched_urls = []
+        errors = []
 
+        if stale_urls and self.downloader is None:
+            errors.extend(f"Failed to warm {url}: no downloader configured" for url in stale_urls)
+        elif stale_urls:
+            semaphore = asyncio.Semaphore(self.config.warmup_max_concurrent)
+            results = await asyncio.gather(
+                *(self._prefetch(url, semaphore, wait_for_idle) for url in stale_urls),
+                return_exceptions=True
+            )
+
+            for url, result in zip(stale_urls, results, strict=True):
+                if isinstance(result, Exception):
+                    errors.append(f"Failed to warm {url}: {str(result)}")
+                elif result.success:
+                    prefetched_urls.append(url)
+                else:
+                    errors.append(f"Failed to warm {url}: {result.error_message}")
+
+        for error_msg in errors:
+            logger.warning(error_msg)
+
+        if prefetched_urls and self.reparse_callback:
+            try:
+                await self.reparse_callback(prefetched_urls)
             except Exception as e:
-                failed += 1
-                error_msg = f"Failed to warm {url}: {str(e)}"
-                errors.append(error_msg)
-                logger.warning(error_msg)
+                logger.error(f"Error re-parsing prefetched pages: {e}")
 
+        successful = already_fresh + len(prefetched_urls)
         duration = time.time() - start_time
 
         # Update metrics
         self.metrics.warmup_runs += 1
         self.metrics.last_warmup = datetime.now()
-        self.metrics.warmed_entries += successful
+        self.metrics.warmed_entries += len(prefetched_urls)
 
         result = CacheWarmupResult(
             total_urls=len(urls),
             successful_warmups=successful,
-            failed_warmups=failed,
+            failed_warmups=len(errors),
             duration_seconds=duration,
-            errors=errors
+            errors=errors,
+            already_fresh=already_fresh,
+            prefetched_urls=prefetched_urls
         )
 
-        logger.info(f"Cache warmup completed: {successful}/{len(urls)} successful in {duration:.2f}s")
+        logger.info(f"Cache warmup completed: {successful}/{len(urls)} successful "
+                    f"({len(prefetched_urls)} prefetched) in {duration:.2f}s")
         return result
 
     async def get_enhanced_stats(self) -> CacheMetrics:
@@ -344,7 +495,7 @@ class EnhancedCacheManager(WikiCacheManager):
 
     async def _should_cleanup(self) -> bool:
         """Check if cache cleanup is needed"""
-        current_size_mb = sum(entry.file_size for entry in self._cache_entries.values()) / (1024 * 1024)
+        current_size_mb = self._eviction_index.total_size_bytes / (1024 * 1024)
         current_entries = len(self._cache_entries)
 
         size_threshold = self.config.max_size_mb * self.config.cleanup_threshold
@@ -356,6 +507,9 @@ class EnhancedCacheManager(WikiCacheManager):
         """
         Perform intelligent cache cleanup based on access patterns and priorities
 
+        Victims come off the eviction index lowest key first, priority URLs
+        last, and are removed with a single index write.
+
         Returns:
             Number of entries removed
         """
@@ -363,64 +517,27 @@ class EnhancedCacheManager(WikiCacheManager):
         start_time = time.time()
 
         # Calculate target size and entries
-        target_size_mb = self.config.max_size_mb * 0.7  # Clean to 70% of max
+        target_size_bytes = self.config.max_size_mb * 0.7 * 1024 * 1024  # Clean to 70% of max
         target_entries = int(self.config.max_entries * 0.7)
 
-        current_size_mb = sum(entry.file_size for entry in self._cache_entries.values()) / (1024 * 1024)
-        current_entries = len(self._cache_entries)
+        if len(self._eviction_index) != len(self._cache_entries):
+            # Entries were added or dropped behind our back (e.g. by the base class)
+            self._rebuild_eviction_index()
 
-        if current_size_mb <= target_size_mb and current_entries <= target_entries:
-            return 0
-
-        # Score entries for eviction (lower score = more likely to evict)
-        entry_scores = {}
-
-        for url, entry in self._cache_entries.items():
-            score = 0.0
-
-            # Age factor (older = lower score)
-            age_days = (datetime.now() - entry.download_date).days
-            score -= age_days * 0.1
-
-            # Access frequency factor
-            access_count = self._access_frequency.get(url, 0)
-            score += access_count * 2.0
-
-            # Recent access factor
-            if url in self._last_access_time:
-                hours_since_access = (datetime.now() - self._last_access_time[url]).total_seconds() / 3600
-                score -= hours_since_access * 0.01
-
-            # Priority factor
-            if url in self._priority_urls:
-                score += 100.0  # High priority
-
-            # Size factor (larger files get slightly lower score)
-            size_mb = entry.file_size / (1024 * 1024)
-            score -= size_mb * 0.1
-
-            entry_scores[url] = score
-
-        # Sort by score (lowest first for eviction)
-        sorted_entries = sorted(entry_scores.items(), key=lambda x: x[1])
-
-        # Remove entries until we reach target
-        removed_count = 0
-        current_size_bytes = sum(entry.file_size for entry in self._cache_entries.values())
-
-        for url, score in sorted_entries:
-            if (current_size_bytes / (1024 * 1024) <= target_size_mb and
-                len(self._cache_entries) <= target_entries):
+        victims = []
+        remaining_entries = len(self._cache_entries)
+        while (self._eviction_index.total_size_bytes > target_size_bytes or
+               remaining_entries > target_entries):
+            url = self._eviction_index.pop_victim()
+            if url is None:
                 break
+            victims.append(url)
+            remaining_entries -= 1
 
-            # Don't remove high-priority items unless absolutely necessary
-            if url in self._priority_urls and removed_count < len(sorted_entries) * 0.5:
-                continue
+        if not victims:
+            return 0
 
-            entry = self._cache_entries[url]
-            if await self.remove_file(url):
-                current_size_bytes -= entry.file_size
-                removed_count += 1
+        removed_count = await self.remove_files(victims)
 
         # Update metrics
         self.metrics.cleanup_runs += 1
@@ -432,6 +549,36 @@ class EnhancedCacheManager(WikiCacheManager):
 
         return removed_count
 
+    def _eviction_key(self, url: str, entry: CacheEntry) -> float:
+        """
+        Time-independent eviction key (lower = evicted sooner)
+
+        Every entry's score decays at the same rate with the clock (0.1 per day
+        of age, 0.01 per hour since last access), so anchoring both terms at
+        their timestamps orders entries the same way at any later time.
+        Entries never read are treated as last accessed when downloaded.
+        """
+        last_access = self._last_access_time.get(url, entry.download_date)
+        return (self._access_frequency.get(url, 0) * 2.0
+                + entry.download_date.timestamp() * (0.1 / 86400)
+                + last_access.timestamp() * (0.01 / 3600)
+                - entry.file_size / (1024 * 1024) * 0.1)
+
+    def _update_eviction_entry(self, url: str) -> None:
+        """Re-key a URL after it was added or accessed"""
+        entry = self._cache_entries.get(url)
+        if entry is None:
+            self._eviction_index.discard(url)
+            return
+        self._eviction_index.update(url, self._eviction_key(url, entry), entry.file_size,
+                                    pinned=url in self._priority_urls)
+
+    def _rebuild_eviction_index(self) -> None:
+        """Re-key every cached URL, e.g. after loading the index"""
+        self._eviction_index.clear()
+        for url in self._cache_entries:
+            self._update_eviction_entry(url)
+
     def _setup_priority_urls(self) -> None:
         """Set up priority URLs based on configuration patterns"""
         for pattern in self.config.priority_patterns:
@@ -439,13 +586,28 @@ class EnhancedCacheManager(WikiCacheManager):
             # In a real implementation, you'd use regex or glob patterns
             self._priority_urls.add(pattern)
 
+    async def _prefetch(self, url: str, semaphore: asyncio.Semaphore, wait_for_idle: bool) -> 'DownloadResult':
+        """Download one page into the cache"""
+        async with semaphore:
+            if wait_for_idle:
+                await self._activity_tracker.wait_until_idle(self.config.warmup_idle_seconds)
+
+            result = await self.downloader.download_page(url, local_path=self.get_organized_path(url))
+
+            # The downloader only indexes pages in its own cache manager
+            if result.success and self.downloader.cache_manager is not self:
+                await self.add_file(url, result.local_path, result.download_time)
+
+            return result
+
     async def _start_background_tasks(self) -> None:
         """Start background maintenance tasks"""
         # Periodic cleanup task
         self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
 
-        # Periodic warmup task
-        self._warmup_task = asyncio.create_task(self._periodic_warmup())
+        # Periodic warmup task; without a downloader there is nothing to prefetch
+        if self.downloader is not None:
+            self._warmup_task = asyncio.create_task(self._periodic_warmup())
 
     async def _periodic_cleanup(self) -> None:
         """Periodic cleanup task"""
@@ -462,14 +624,15 @@ class EnhancedCacheManager(WikiCacheManager):
                 logger.error(f"Error in periodic cleanup: {e}")
 
     async def _periodic_warmup(self) -> None:
-        """Periodic warmup task"""
+        """Periodic warmup task, run while no tool call is in flight"""
         while True:
             try:
-                await asyncio.sleep(21600)  # Run every 6 hours
+                await asyncio.sleep(self.config.warmup_interval_seconds)
 
-                # Only warm if we have configured URLs
-                if self.config.warmup_urls:
-                    await self.warm_cache()
+                # Only warm if there is something worth keeping warm
+                if self.config.warmup_urls or self._priority_urls or self._access_frequency:
+                    await self._activity_tracker.wait_until_idle(self.config.warmup_idle_seconds)
+                    await self.warm_cache(wait_for_idle=True)
 
             except asyncio.CancelledError:
                 break
@@ -13,11 +13,22 @@ Addresses requirements 1.1, 1.2, 1.3, 1.4, 1.5 from the MCP tools diagnostic fix
 
 import logging
 import re
+from bisect import bisect_right
 from collections import Counter, defaultdict
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+from regex_registry import (
+    CAPITALIZED_NAME,
+    CAPITALIZED_WORD,
+    SENTENCE_BOUNDARY,
+    SPEECH_VERBS,
+    compile_all,
+    compile_pattern,
+    compile_table,
+)
 from standard_character_profile import StandardCharacterProfile
+from tracing import span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +49,189 @@ class NarrativeTheme:
     evidence: List[str]
     keywords: List[str]
 
+class SentenceKeywordIncidence:
+    """
+    Sparse sentence x keyword incidence matrix for one text
+
+    Sentences are split on [.!?]+ once; each keyword column lists the indices of
+    the sentences containing it as a (case-insensitive) substring. Columns are
+    built with one scan per keyword, however many themes share it.
+    """
+
+    # Never occurs in a keyword, so matches can't straddle two sentences
+    _SEPARATOR = '\x00'
+
+    def __init__(self, text: str, keywords: List[str]):
+        self.sentences = SENTENCE_BOUNDARY.split(text)
+        # Offsets come from the lowered sentences, which can be longer than the originals ('İ' -> 'i̇')
+        lowered = [sentence.lower() for sentence in self.sentences]
+        self._joined = self._SEPARATOR.join(lowered)
+
+        self._starts = []
+        offset = 0
+        for sentence in lowered:
+            self._starts.append(offset)
+            offset += len(sentence) + len(self._SEPARATOR)
+
+        self._columns: Dict[str, List[int]] = {}
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            if keyword_lower not in self._columns:
+                self._columns[keyword_lower] = self._scan(keyword_lower)
+
+    def sentences_with(self, keyword: str) -> List[int]:
+        """Indices of the sentences containing keyword"""
+        keyword_lower = keyword.lower()
+        if keyword_lower not in self._columns:
+            self._columns[keyword_lower] = self._scan(keyword_lower)
+        return self._columns[keyword_lower]
+
+    def multi_keyword_sentences(self, keywords: List[str], minimum: int = 2) -> List[int]:
+        """Indices of the sentences containing at least `minimum` of keywords, in text order"""
+        hits = Counter()
+        for keyword in keywords:
+            hits.update(self.sentences_with(keyword))
+        return sorted(index for index, count in hits.items() if count >= minimum)
+
+    def _scan(self, keyword_lower: str) -> List[int]:
+        if not keyword_lower:
+            return list(range(len(self.sentences)))
+
+        column = []
+        position = self._joined.find(keyword_lower)
+        while position != -1:
+            index = bisect_right(self._starts, position) - 1
+            column.append(index)
+            # One hit per sentence is enough; resume at the next sentence
+            if index + 1 >= len(self._starts):
+                break
+            position = self._joined.find(keyword_lower, self._starts[index + 1])
+        return column
+
+# Named entity patterns for character detection
+CHARACTER_PATTERNS = compile_table({
+    'full_names': r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b',
+    'single_names': r'\b[A-Z][a-z]{2,15}\b',
+    'dialogue_attribution': r'([A-Z][a-z]+)\s+(?:said|asked|replied|whispered|shouted|exclaimed|muttered|declared|announced|continued|added|interrupted|insisted|protested|agreed|disagreed|laughed|cried|sighed)',
+    'possessive_names': r"([A-Z][a-z]+)'s\s+",
+    'direct_address': r'"[^"]*,\s*([A-Z][a-z]+)[,.]',
+    'action_attribution': r'([A-Z][a-z]+)\s+(?:walked|ran|stood|sat|looked|turned|moved|stepped|jumped|climbed|fell|rose|entered|left|arrived|departed)'
+})
+
+# Names never contain digits or punctuation
+NON_NAME_CHARACTERS = re.compile(r'[0-9@#$%^&*()_+=\[\]{}|\\:";\'<>?,./]')
+
+# Capitalized names followed by a narrative action
+CHARACTER_ACTION_PATTERN = re.compile(r'\b[A-Z][a-z]+\s+(stood|walked|felt|said|had|was|were)\b')
+
+# Explicit character description sections
+CHARACTER_MARKER = re.compile(r'\n\s*Character:\s*')
+NAME_LINE = re.compile(r'^[A-Z][a-z]+ [A-Z][a-z]+\s*$')
+
+# Past tense verbs that suggest narrative content
+PAST_TENSE_PATTERNS = compile_all([
+    r'\b(stood|walked|ran|felt|said|whispered|had|was|were)\b'
+])
+
+# Philosophical language that suggests conceptual content
+PHILOSOPHICAL_PATTERNS = compile_all([
+    r'\bwhat is\b', r'\bwhy do\b', r'\bhow can\b', r'\bthe nature of\b',
+    r'\bexistence\b', r'\breality\b', r'\btruth\b', r'\bmeaning\b'
+])
+
+# Philosophical and abstract concepts
+CONCEPT_PATTERNS = compile_all([
+    r'\b(consciousness|awareness|perception|reality|truth|existence|being|identity|self|soul|mind|spirit)\b',
+    r'\b(freedom|liberty|choice|will|determinism|fate|destiny|purpose|meaning|significance)\b',
+    r'\b(love|hate|fear|hope|despair|joy|sorrow|anger|peace|harmony|conflict)\b',
+    r'\b(justice|morality|ethics|virtue|vice|good|evil|right|wrong|duty|responsibility)\b',
+    r'\b(time|eternity|mortality|immortality|death|life|birth|creation|destruction)\b',
+    r'\b(knowledge|wisdom|ignorance|understanding|learning|discovery|revelation|insight)\b'
+], re.IGNORECASE)
+
+# Thematic statements in philosophical text
+THEME_STATEMENT_PATTERNS = compile_all([
+    r'the nature of ([^.!?]+)',
+    r'what it means to ([^.!?]+)',
+    r'the essence of ([^.!?]+)',
+    r'the question of ([^.!?]+)',
+    r'the problem of ([^.!?]+)'
+], re.IGNORECASE)
+
+# Character names at the start of a description section
+SECTION_NAME_PATTERNS = compile_all([
+    r'Name:\s*([^\n]+)',
+    r'Character:\s*([^\n]+)',
+    r'^([A-Z][a-z]+ [A-Z][a-z]+)',  # First Last at start
+    r'^([A-Z][a-z]+)\s*[-:]',  # Name followed by dash or colon
+], re.MULTILINE)
+
+# Skin layer: physical descriptions and mannerisms
+PHYSICAL_PATTERNS = compile_all([
+    r'\b(?:tall|short|thin|fat|slim|heavy|light|dark|pale|tanned|blonde|brunette|redhead)\b',
+    r'\b(?:hair|eyes|skin|face|build|height|weight)\b.*?(?:was|were|is|are)\s+([^.!?]+)',
+    r'\b(?:wore|dressed|clothing|outfit|appearance)\b.*?([^.!?]+)',
+    r'\b(?:beautiful|handsome|ugly|attractive|plain|striking|elegant|rough)\b'
+], re.IGNORECASE)
+
+MANNERISM_PATTERNS = compile_all([
+    r'\b(?:smiled|frowned|gestured|nodded|shook|laughed|sighed|whispered|grinned|winked|shrugged)\b',
+    r'\b(?:habit|tendency|way|manner)\b.*?(?:of|to)\s+([^.!?]+)',
+    r'\b(?:always|often|frequently|usually)\b.*?([^.!?]+)'
+], re.IGNORECASE)
+
+# Flesh layer: backstory, relationships and formative experiences
+BACKSTORY_PATTERNS = compile_all([
+    r'\b(?:grew up|childhood|born|raised|family|parents|mother|father|past|history|before|used to|once|years ago)\b.*?([^.!?]+)',
+    r'\b(?:background|origin|came from|lived in|worked as|studied|education)\b.*?([^.!?]+)'
+], re.IGNORECASE)
+
+RELATIONSHIP_PATTERNS = compile_all([
+    r'\b(?:friend|enemy|lover|partner|spouse|husband|wife|boyfriend|girlfriend|parent|child|son|daughter|brother|sister|sibling|colleague|mentor|student|teacher|boss|employee)\b',
+    r'\b(?:relationship|married|dating|engaged|divorced|separated)\b.*?([^.!?]+)',
+    r'\b(?:loves|hates|likes|dislikes|trusts|distrusts)\b.*?([A-Z][a-z]+)'
+], re.IGNORECASE)
+
+EXPERIENCE_PATTERNS = compile_all([
+    r'\b(?:experienced|learned|discovered|realized|changed|transformed|happened|occurred|event|incident|moment)\b.*?([^.!?]+)',
+    r'\b(?:first time|last time|never forget|always remember|turning point|life-changing)\b.*?([^.!?]+)'
+], re.IGNORECASE)
+
+# Core layer: motivations, fears, desires and conflicts
+MOTIVATION_PATTERNS = compile_all([
+    r'\b(?:wants|needs|desires|seeks|hopes|dreams|goals|ambitions|purpose|drive|motivation)\b.*?([^.!?]+)',
+    r'\b(?:trying to|attempting to|working toward|striving for|aiming to)\b.*?([^.!?]+)'
+], re.IGNORECASE)
+
+FEAR_PATTERNS = compile_all([
+    r'\b(?:afraid|fear|scared|terrified|worried|anxious|phobia|nightmare|dread)\b.*?([^.!?]+)',
+    r'\b(?:what if|worried about|concerned about|frightened by)\b.*?([^.!?]+)'
+], re.IGNORECASE)
+
+DESIRE_PATTERNS = compile_all([
+    r'\b(?:love|want|desire|wish|long for|crave|yearn|dream of|hope for)\b.*?([^.!?]+)',
+    r'\b(?:if only|wished|dreamed|longed)\b.*?([^.!?]+)'
+], re.IGNORECASE)
+
+CONFLICT_PATTERNS = compile_all([
+    r'\b(?:conflict|struggle|fight|battle|oppose|against|problem|dilemma|torn between)\b.*?([^.!?]+)',
+    r'\b(?:can\'t decide|difficult choice|internal struggle|at odds)\b.*?([^.!?]+)'
+], re.IGNORECASE)
+
+# Causal phrasing around an emotional keyword
+CAUSAL_PATTERNS = compile_all([
+    r'because of', r'due to', r'as a result of', r'stemming from',
+    r'rooted in', r'triggered by', r'caused by'
+], re.IGNORECASE)
+
+# Setting and world-building elements
+SETTING_PATTERNS = compile_all([
+    r'\b(?:in|at|on|near|by|inside|outside|within|beneath|above|below)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+    r'\b(?:city|town|village|forest|castle|house|building|room|street|road|path|mountain|river|ocean|lake)\b[^.!?]*',
+    r'\b(?:morning|afternoon|evening|night|dawn|dusk|midnight|noon)\b[^.!?]*',
+    r'\b(?:winter|spring|summer|fall|autumn)\b[^.!?]*'
+], re.IGNORECASE)
+
 class EnhancedCharacterAnalyzer:
     """
     Enhanced character analyzer with robust detection and three-layer analysis
@@ -54,14 +248,7 @@ class EnhancedCharacterAnalyzer:
         self.logger = logging.getLogger(__name__)
 
         # Enhanced character detection patterns
-        self.character_patterns = {
-            'full_names': r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b',
-            'single_names': r'\b[A-Z][a-z]{2,15}\b',
-            'dialogue_attribution': r'([A-Z][a-z]+)\s+(?:said|asked|replied|whispered|shouted|exclaimed|muttered|declared|announced|continued|added|interrupted|insisted|protested|agreed|disagreed|laughed|cried|sighed)',
-            'possessive_names': r"([A-Z][a-z]+)'s\s+",
-            'direct_address': r'"[^"]*,\s*([A-Z][a-z]+)[,.]',
-            'action_attribution': r'([A-Z][a-z]+)\s+(?:walked|ran|stood|sat|looked|turned|moved|stepped|jumped|climbed|fell|rose|entered|left|arrived|departed)'
-        }
+        self.character_patterns = CHARACTER_PATTERNS
 
         # Common words to exclude from character detection
         self.common_words = {
@@ -134,6 +321,10 @@ class EnhancedCharacterAnalyzer:
                 'patterns': [r'\bidentity\b', r'\bwho am I\b', r'\bfind myself\b', r'\bpurpose\b']
             }
         }
+        self._compiled_theme_patterns = {
+            theme_name: compile_all(theme_data.get('patterns', []), re.IGNORECASE)
+            for theme_name, theme_data in self.theme_patterns.items()
+        }
 
         # Enhanced emotional indicators
         self.emotion_patterns = {
@@ -223,28 +414,18 @@ class EnhancedCharacterAnalyzer:
         if '"' in text and text.count('"') > 0:  # Dialogue indicates narrative
             narrative_score += 3
 
-        # Look for past tense narrative patterns
-        past_tense_patterns = [
-            r'\b(stood|walked|ran|felt|said|whispered|had|was|were)\b'
-        ]
-        for pattern in past_tense_patterns:
-            matches = len(re.findall(pattern, text_lower))
+        for pattern in PAST_TENSE_PATTERNS:
+            matches = len(pattern.findall(text_lower))
             if matches > 3:  # Multiple past tense verbs suggest narrative
                 narrative_score += 2
 
         # Look for character names with actions
-        character_action_pattern = r'\b[A-Z][a-z]+\s+(stood|walked|felt|said|had|was|were)\b'
-        character_actions = len(re.findall(character_action_pattern, text))
+        character_actions = len(CHARACTER_ACTION_PATTERN.findall(text))
         if character_actions > 2:
             narrative_score += 3
 
-        # Check for philosophical language patterns
-        philosophical_patterns = [
-            r'\bwhat is\b', r'\bwhy do\b', r'\bhow can\b', r'\bthe nature of\b',
-            r'\bexistence\b', r'\breality\b', r'\btruth\b', r'\bmeaning\b'
-        ]
-        for pattern in philosophical_patterns:
-            if re.search(pattern, text_lower):
+        for pattern in PHILOSOPHICAL_PATTERNS:
+            if pattern.search(text_lower):
                 conceptual_score += 1
 
         # Determine content type
@@ -276,11 +457,12 @@ class EnhancedCharacterAnalyzer:
             return "use_explicit"
         else:  # mixed
             # For mixed content, check which approach is more appropriate
-            if len(re.findall(r'\b[A-Z][a-z]+\b', text)) > 10:  # Many proper names
+            if len(CAPITALIZED_WORD.findall(text)) > 10:  # Many proper names
                 return "extract"
             else:
                 return "hybrid"
 
+    @traced("character_detection")
     async def _detect_characters_by_type(self, text: str, content_type: str, strategy: str, ctx=None) -> List[StandardCharacterProfile]:
         """
         Detect or create characters based on content type and strategy
@@ -387,18 +569,10 @@ class EnhancedCharacterAnalyzer:
 
     def _extract_key_concepts(self, text: str) -> List[str]:
         """Extract key philosophical/abstract concepts from text"""
-        concept_patterns = [
-            r'\b(consciousness|awareness|perception|reality|truth|existence|being|identity|self|soul|mind|spirit)\b',
-            r'\b(freedom|liberty|choice|will|determinism|fate|destiny|purpose|meaning|significance)\b',
-            r'\b(love|hate|fear|hope|despair|joy|sorrow|anger|peace|harmony|conflict)\b',
-            r'\b(justice|morality|ethics|virtue|vice|good|evil|right|wrong|duty|responsibility)\b',
-            r'\b(time|eternity|mortality|immortality|death|life|birth|creation|destruction)\b',
-            r'\b(knowledge|wisdom|ignorance|understanding|learning|discovery|revelation|insight)\b'
-        ]
 
         concepts = []
-        for pattern in concept_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in CONCEPT_PATTERNS:
+            matches = pattern.findall(text)
             concepts.extend([match.lower() for match in matches])
 
         # Count frequency and return most common
@@ -409,17 +583,8 @@ class EnhancedCharacterAnalyzer:
         """Extract philosophical themes from text"""
         themes = []
 
-        # Look for thematic statements
-        theme_patterns = [
-            r'the nature of ([^.!?]+)',
-            r'what it means to ([^.!?]+)',
-            r'the essence of ([^.!?]+)',
-            r'the question of ([^.!?]+)',
-            r'the problem of ([^.!?]+)'
-        ]
-
-        for pattern in theme_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in THEME_STATEMENT_PATTERNS:
+            matches = pattern.findall(text)
             themes.extend([match.strip() for match in matches])
 
         return themes[:3]  # Return top 3 themes
@@ -546,7 +711,7 @@ class EnhancedCharacterAnalyzer:
         sections = []
 
         # Split by "Character:" indicators
-        char_splits = re.split(r'\n\s*Character:\s*', text)
+        char_splits = CHARACTER_MARKER.split(text)
 
         if len(char_splits) > 1:
             # First split might not be a character if it doesn't start with "Character:"
@@ -567,7 +732,7 @@ class EnhancedCharacterAnalyzer:
 
             for line in lines:
                 line = line.strip()
-                if re.match(r'^[A-Z][a-z]+ [A-Z][a-z]+\s*$', line):  # Name pattern
+                if NAME_LINE.match(line):  # Name pattern
                     if current_section:
                         sections.append(current_section.strip())
                     current_section = f"Character: {line}\n"
@@ -581,16 +746,8 @@ class EnhancedCharacterAnalyzer:
 
     def _extract_character_name_from_section(self, section: str) -> Optional[str]:
         """Extract character name from a description section"""
-        # Look for name patterns
-        name_patterns = [
-            r'Name:\s*([^\n]+)',
-            r'Character:\s*([^\n]+)',
-            r'^([A-Z][a-z]+ [A-Z][a-z]+)',  # First Last at start
-            r'^([A-Z][a-z]+)\s*[-:]',  # Name followed by dash or colon
-        ]
-
-        for pattern in name_patterns:
-            match = re.search(pattern, section, re.MULTILINE)
+        for pattern in SECTION_NAME_PATTERNS:
+            match = pattern.search(section)
             if match:
                 return match.group(1).strip()
 
@@ -620,7 +777,7 @@ class EnhancedCharacterAnalyzer:
         """Extract a field value from structured text"""
         for field_name in field_names:
             pattern = rf'{field_name}:\s*([^\n]+(?:\n(?!\w+:)[^\n]+)*)'
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = compile_pattern(pattern, re.IGNORECASE | re.MULTILINE).search(text)
             if match:
                 return match.group(1).strip()
         return ""
@@ -629,7 +786,7 @@ class EnhancedCharacterAnalyzer:
         """Extract a list field from structured text"""
         for field_name in field_names:
             pattern = rf'{field_name}:\s*([^\n]+(?:\n(?!\w+:)[^\n]+)*)'
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = compile_pattern(pattern, re.IGNORECASE | re.MULTILINE).search(text)
             if match:
                 value = match.group(1).strip()
                 # Split by common separators
@@ -643,6 +800,7 @@ class EnhancedCharacterAnalyzer:
                     return [value]
         return []
 
+    @traced("character_analysis")
     async def analyze_text(self, text: str, ctx=None) -> Dict[str, Any]:
         """
         Perform comprehensive character analysis on input text
@@ -658,8 +816,9 @@ class EnhancedCharacterAnalyzer:
             await ctx.info("Starting enhanced character analysis...")
 
         # Step 0: Detect content type before processing
-        content_type = self._detect_content_type(text)
-        processing_strategy = self._determine_processing_strategy(content_type, text)
+        with span("content_type_detection"):
+            content_type = self._detect_content_type(text)
+            processing_strategy = self._determine_processing_strategy(content_type, text)
 
         if ctx:
             await ctx.info(f"Detected content type: {content_type}, using strategy: {processing_strategy}")
@@ -674,8 +833,9 @@ class EnhancedCharacterAnalyzer:
         emotional_arc = await self._analyze_emotional_arc_varied(text, ctx)
 
         # Step 4: Additional analysis
-        setting = self._extract_setting_information(text)
-        complexity = self._calculate_text_complexity(text)
+        with span("setting_and_complexity"):
+            setting = self._extract_setting_information(text)
+            complexity = self._calculate_text_complexity(text)
 
         result = {
             'characters': [char.to_dict() for char in characters],
@@ -1054,38 +1214,38 @@ class EnhancedCharacterAnalyzer:
         potential_names = defaultdict(int)
 
         # Pattern 1: Full names (First Last, First Middle Last)
-        full_names = re.findall(self.character_patterns['full_names'], text)
+        full_names = self.character_patterns['full_names'].findall(text)
         for name in full_names:
             if name not in self.common_words:
                 potential_names[name] += 3  # Higher weight for full names
 
         # Pattern 2: Single names with frequency check
-        single_names = re.findall(self.character_patterns['single_names'], text)
+        single_names = self.character_patterns['single_names'].findall(text)
         name_counts = Counter(single_names)
         for name, count in name_counts.items():
             if name not in self.common_words and count >= 2:  # Must appear at least twice
                 potential_names[name] += count
 
         # Pattern 3: Dialogue attribution
-        dialogue_names = re.findall(self.character_patterns['dialogue_attribution'], text)
+        dialogue_names = self.character_patterns['dialogue_attribution'].findall(text)
         for name in dialogue_names:
             if name not in self.common_words:
                 potential_names[name] += 4  # High weight for dialogue attribution
 
         # Pattern 4: Possessive forms
-        possessive_names = re.findall(self.character_patterns['possessive_names'], text)
+        possessive_names = self.character_patterns['possessive_names'].findall(text)
         for name in possessive_names:
             if name not in self.common_words:
                 potential_names[name] += 2
 
         # Pattern 5: Direct address in dialogue
-        address_names = re.findall(self.character_patterns['direct_address'], text)
+        address_names = self.character_patterns['direct_address'].findall(text)
         for name in address_names:
             if name not in self.common_words:
                 potential_names[name] += 3
 
         # Pattern 6: Action attribution
-        action_names = re.findall(self.character_patterns['action_attribution'], text)
+        action_names = self.character_patterns['action_attribution'].findall(text)
         for name in action_names:
             if name not in self.common_words:
                 potential_names[name] += 2
@@ -1102,7 +1262,7 @@ class EnhancedCharacterAnalyzer:
                 continue
 
             # Skip if name contains numbers or special characters
-            if re.search(r'[0-9@#$%^&*()_+=\[\]{}|\\:";\'<>?,./]', name):
+            if NON_NAME_CHARACTERS.search(name):
                 continue
 
             # Calculate confidence score
@@ -1124,15 +1284,16 @@ class EnhancedCharacterAnalyzer:
         context_score = 0.0
 
         # Check for character-like context around mentions
+        escaped_name = re.escape(name)
         character_contexts = [
-            r'\b' + re.escape(name) + r'\b\s+(?:was|is|had|has|did|does|said|says|felt|feels|thought|thinks|looked|looks|walked|walks|ran|runs|stood|sat)',
-            r'(?:he|she|they)\s+.*\b' + re.escape(name) + r'\b',
-            r'\b' + re.escape(name) + r'\b.*(?:smiled|frowned|laughed|cried|whispered|shouted)',
-            r'\b' + re.escape(name) + r'\b.*(?:heart|mind|eyes|face|hand)'  # Physical/emotional references
+            r'\b' + escaped_name + r'\b\s+(?:was|is|had|has|did|does|said|says|felt|feels|thought|thinks|looked|looks|walked|walks|ran|runs|stood|sat)',
+            r'(?:he|she|they)\s+.*\b' + escaped_name + r'\b',
+            r'\b' + escaped_name + r'\b.*(?:smiled|frowned|laughed|cried|whispered|shouted)',
+            r'\b' + escaped_name + r'\b.*(?:heart|mind|eyes|face|hand)'  # Physical/emotional references
         ]
 
         for pattern in character_contexts:
-            matches = len(re.findall(pattern, text, re.IGNORECASE))
+            matches = len(compile_pattern(pattern, re.IGNORECASE).findall(text))
             context_score += matches * 0.1  # Increased weight
 
         context_score = min(context_score, 0.4)  # Max 0.4 from context
@@ -1152,6 +1313,7 @@ class EnhancedCharacterAnalyzer:
         total_score = base_score + context_score + position_score + frequency_bonus
         return min(total_score, 1.0)
 
+    @traced("character_profile")
     async def _build_three_layer_profile(self, name: str, text: str, ctx=None) -> StandardCharacterProfile:
         """
         Build comprehensive character profile using three-layer analysis
@@ -1213,7 +1375,7 @@ class EnhancedCharacterAnalyzer:
     def _extract_character_segments(self, name: str, text: str) -> List[str]:
         """Extract text segments that mention the character"""
         # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_BOUNDARY.split(text)
         segments = []
 
         # Find sentences mentioning the character
@@ -1244,18 +1406,10 @@ class EnhancedCharacterAnalyzer:
             'behavioral_traits': []
         }
 
-        # Physical description patterns
-        physical_patterns = [
-            r'\b(?:tall|short|thin|fat|slim|heavy|light|dark|pale|tanned|blonde|brunette|redhead)\b',
-            r'\b(?:hair|eyes|skin|face|build|height|weight)\b.*?(?:was|were|is|are)\s+([^.!?]+)',
-            r'\b(?:wore|dressed|clothing|outfit|appearance)\b.*?([^.!?]+)',
-            r'\b(?:beautiful|handsome|ugly|attractive|plain|striking|elegant|rough)\b'
-        ]
-
         physical_descriptions = []
         for segment in segments:
-            for pattern in physical_patterns:
-                matches = re.findall(pattern, segment, re.IGNORECASE)
+            for pattern in PHYSICAL_PATTERNS:
+                matches = pattern.findall(segment)
                 for match in matches:
                     if isinstance(match, tuple):
                         physical_descriptions.extend([m for m in match if m.strip()])
@@ -1267,17 +1421,10 @@ class EnhancedCharacterAnalyzer:
         else:
             skin_layer['physical_description'] = f"Physical description of {name} not explicitly provided in text."
 
-        # Mannerisms - repeated behaviors and gestures
-        mannerism_patterns = [
-            r'\b(?:smiled|frowned|gestured|nodded|shook|laughed|sighed|whispered|grinned|winked|shrugged)\b',
-            r'\b(?:habit|tendency|way|manner)\b.*?(?:of|to)\s+([^.!?]+)',
-            r'\b(?:always|often|frequently|usually)\b.*?([^.!?]+)'
-        ]
-
         for segment in segments:
             if name.lower() in segment.lower():
-                for pattern in mannerism_patterns:
-                    matches = re.findall(pattern, segment, re.IGNORECASE)
+                for pattern in MANNERISM_PATTERNS:
+                    matches = pattern.findall(segment)
                     for match in matches:
                         if isinstance(match, str) and len(match.strip()) > 3:
                             skin_layer['mannerisms'].append(f"{match.strip()[:60]}...")
@@ -1290,13 +1437,13 @@ class EnhancedCharacterAnalyzer:
         dialogue_segments = []
 
         # Extract dialogue
-        dialogue_pattern = r'"([^"]+)"\s*,?\s*' + re.escape(name) + r'\s+(?:said|asked|replied|whispered|shouted|exclaimed)'
-        dialogue_matches = re.findall(dialogue_pattern, full_text, re.IGNORECASE)
+        dialogue_pattern = r'"([^"]+)"\s*,?\s*' + re.escape(name) + r'\s+' + SPEECH_VERBS
+        dialogue_matches = compile_pattern(dialogue_pattern, re.IGNORECASE).findall(full_text)
         dialogue_segments.extend(dialogue_matches)
 
         # Reverse pattern - name first, then dialogue
-        reverse_pattern = re.escape(name) + r'\s+(?:said|asked|replied|whispered|shouted|exclaimed)\s*,?\s*"([^"]+)"'
-        reverse_matches = re.findall(reverse_pattern, full_text, re.IGNORECASE)
+        reverse_pattern = re.escape(name) + r'\s+' + SPEECH_VERBS + r'\s*,?\s*"([^"]+)"'
+        reverse_matches = compile_pattern(reverse_pattern, re.IGNORECASE).findall(full_text)
         dialogue_segments.extend(reverse_matches)
 
         # Analyze speech patterns
@@ -1357,17 +1504,11 @@ class EnhancedCharacterAnalyzer:
             'social_connections': []
         }
 
-        # Backstory patterns
-        backstory_patterns = [
-            r'\b(?:grew up|childhood|born|raised|family|parents|mother|father|past|history|before|used to|once|years ago)\b.*?([^.!?]+)',
-            r'\b(?:background|origin|came from|lived in|worked as|studied|education)\b.*?([^.!?]+)'
-        ]
-
         backstory_segments = []
         for segment in segments:
             if name.lower() in segment.lower():
-                for pattern in backstory_patterns:
-                    matches = re.findall(pattern, segment, re.IGNORECASE)
+                for pattern in BACKSTORY_PATTERNS:
+                    matches = pattern.findall(segment)
                     for match in matches:
                         if isinstance(match, str) and len(match.strip()) > 10:
                             backstory_segments.append(match.strip())
@@ -1377,35 +1518,22 @@ class EnhancedCharacterAnalyzer:
         else:
             flesh_layer['backstory'] = f"Backstory for {name} not explicitly detailed in the provided text."
 
-        # Relationships
-        relationship_patterns = [
-            r'\b(?:friend|enemy|lover|partner|spouse|husband|wife|boyfriend|girlfriend|parent|child|son|daughter|brother|sister|sibling|colleague|mentor|student|teacher|boss|employee)\b',
-            r'\b(?:relationship|married|dating|engaged|divorced|separated)\b.*?([^.!?]+)',
-            r'\b(?:loves|hates|likes|dislikes|trusts|distrusts)\b.*?([A-Z][a-z]+)'
-        ]
-
         relationships = []
         for segment in segments:
             if name.lower() in segment.lower():
-                for pattern in relationship_patterns:
-                    matches = re.findall(pattern, segment, re.IGNORECASE)
+                for pattern in RELATIONSHIP_PATTERNS:
+                    matches = pattern.findall(segment)
                     for match in matches:
                         if isinstance(match, str) and len(match.strip()) > 3:
                             relationships.append(f"Relationship context: {segment[:60]}...")
 
         flesh_layer['relationships'] = list(set(relationships))[:5]
 
-        # Formative experiences
-        experience_patterns = [
-            r'\b(?:experienced|learned|discovered|realized|changed|transformed|happened|occurred|event|incident|moment)\b.*?([^.!?]+)',
-            r'\b(?:first time|last time|never forget|always remember|turning point|life-changing)\b.*?([^.!?]+)'
-        ]
-
         experiences = []
         for segment in segments:
             if name.lower() in segment.lower():
-                for pattern in experience_patterns:
-                    matches = re.findall(pattern, segment, re.IGNORECASE)
+                for pattern in EXPERIENCE_PATTERNS:
+                    matches = pattern.findall(segment)
                     for match in matches:
                         if isinstance(match, str) and len(match.strip()) > 10:
                             experiences.append(f"Experience: {match.strip()[:60]}...")
@@ -1417,7 +1545,7 @@ class EnhancedCharacterAnalyzer:
         for segment in segments:
             if name.lower() in segment.lower():
                 # Find other proper names in the same segment
-                other_names = re.findall(r'\b[A-Z][a-z]{2,}\b', segment)
+                other_names = CAPITALIZED_NAME.findall(segment)
                 for other_name in other_names:
                     if other_name != name and other_name not in self.common_words and len(other_name) > 2:
                         connections.append(f"Connected to {other_name} in context: {segment[:40]}...")
@@ -1440,68 +1568,44 @@ class EnhancedCharacterAnalyzer:
             'personality_drivers': []
         }
 
-        # Motivations
-        motivation_patterns = [
-            r'\b(?:wants|needs|desires|seeks|hopes|dreams|goals|ambitions|purpose|drive|motivation)\b.*?([^.!?]+)',
-            r'\b(?:trying to|attempting to|working toward|striving for|aiming to)\b.*?([^.!?]+)'
-        ]
-
         motivations = []
         for segment in segments:
             if name.lower() in segment.lower():
-                for pattern in motivation_patterns:
-                    matches = re.findall(pattern, segment, re.IGNORECASE)
+                for pattern in MOTIVATION_PATTERNS:
+                    matches = pattern.findall(segment)
                     for match in matches:
                         if isinstance(match, str) and len(match.strip()) > 5:
                             motivations.append(f"Motivation: {match.strip()[:60]}...")
 
         core_layer['motivations'] = list(set(motivations))[:4]
 
-        # Fears
-        fear_patterns = [
-            r'\b(?:afraid|fear|scared|terrified|worried|anxious|phobia|nightmare|dread)\b.*?([^.!?]+)',
-            r'\b(?:what if|worried about|concerned about|frightened by)\b.*?([^.!?]+)'
-        ]
-
         fears = []
         for segment in segments:
             if name.lower() in segment.lower():
-                for pattern in fear_patterns:
-                    matches = re.findall(pattern, segment, re.IGNORECASE)
+                for pattern in FEAR_PATTERNS:
+                    matches = pattern.findall(segment)
                     for match in matches:
                         if isinstance(match, str) and len(match.strip()) > 5:
                             fears.append(f"Fear: {match.strip()[:60]}...")
 
         core_layer['fears'] = list(set(fears))[:4]
 
-        # Desires
-        desire_patterns = [
-            r'\b(?:love|want|desire|wish|long for|crave|yearn|dream of|hope for)\b.*?([^.!?]+)',
-            r'\b(?:if only|wished|dreamed|longed)\b.*?([^.!?]+)'
-        ]
-
         desires = []
         for segment in segments:
             if name.lower() in segment.lower():
-                for pattern in desire_patterns:
-                    matches = re.findall(pattern, segment, re.IGNORECASE)
+                for pattern in DESIRE_PATTERNS:
+                    matches = pattern.findall(segment)
                     for match in matches:
                         if isinstance(match, str) and len(match.strip()) > 5:
                             desires.append(f"Desire: {match.strip()[:60]}...")
 
         core_layer['desires'] = list(set(desires))[:4]
 
-        # Conflicts
-        conflict_patterns = [
-            r'\b(?:conflict|struggle|fight|battle|oppose|against|problem|dilemma|torn between)\b.*?([^.!?]+)',
-            r'\b(?:can\'t decide|difficult choice|internal struggle|at odds)\b.*?([^.!?]+)'
-        ]
-
         conflicts = []
         for segment in segments:
             if name.lower() in segment.lower():
-                for pattern in conflict_patterns:
-                    matches = re.findall(pattern, segment, re.IGNORECASE)
+                for pattern in CONFLICT_PATTERNS:
+                    matches = pattern.findall(segment)
                     for match in matches:
                         if isinstance(match, str) and len(match.strip()) > 5:
                             conflicts.append(f"Conflict: {match.strip()[:60]}...")
@@ -1606,7 +1710,7 @@ class EnhancedCharacterAnalyzer:
 
         # Dialogue bonus
         dialogue_pattern = r'"[^"]*"[^"]*' + re.escape(name)
-        dialogue_mentions = len(re.findall(dialogue_pattern, text, re.IGNORECASE))
+        dialogue_mentions = len(compile_pattern(dialogue_pattern, re.IGNORECASE).findall(text))
         dialogue_bonus = min(dialogue_mentions * 0.05, 0.2)
 
         total_importance = frequency_score + position_bonus + dialogue_bonus
@@ -1618,21 +1722,22 @@ class EnhancedCharacterAnalyzer:
 
         # Pattern 1: "John, also known as Jack"
         pattern1 = rf"{re.escape(name)}[,\s]+(?:also known as|nicknamed|called|known as)\s+([A-Z][a-z]+)"
-        matches1 = re.findall(pattern1, text, re.IGNORECASE)
+        matches1 = compile_pattern(pattern1, re.IGNORECASE).findall(text)
         aliases.extend(matches1)
 
         # Pattern 2: "Jack (also known as John)"
         pattern2 = rf"([A-Z][a-z]+)[,\s]*\([^)]*{re.escape(name)}[^)]*\)"
-        matches2 = re.findall(pattern2, text, re.IGNORECASE)
+        matches2 = compile_pattern(pattern2, re.IGNORECASE).findall(text)
         aliases.extend(matches2)
 
         # Pattern 3: "John (Jack)"
         pattern3 = rf"{re.escape(name)}\s*\(([A-Z][a-z]+)\)"
-        matches3 = re.findall(pattern3, text, re.IGNORECASE)
+        matches3 = compile_pattern(pattern3, re.IGNORECASE).findall(text)
         aliases.extend(matches3)
 
         return list(set(aliases))
 
+    @traced("theme_analysis")
     async def _analyze_narrative_themes_semantic(self, text: str, ctx=None) -> List[NarrativeTheme]:
         """
         Semantic analysis to identify multiple narrative themes
@@ -1645,6 +1750,11 @@ class EnhancedCharacterAnalyzer:
         themes = []
         text_lower = text.lower()
 
+        # Sentences and keyword occurrences are indexed once for all themes
+        all_keywords = [keyword for theme_data in self.theme_patterns.values() for keyword in theme_data['keywords']]
+        incidence = SentenceKeywordIncidence(text, all_keywords)
+        keyword_counts = {}
+
         for theme_name, theme_data in self.theme_patterns.items():
             evidence = []
             keyword_matches = []
@@ -1652,13 +1762,16 @@ class EnhancedCharacterAnalyzer:
 
             # Check keywords
             for keyword in theme_data['keywords']:
-                count = text_lower.count(keyword.lower())
+                keyword_lower = keyword.lower()
+                if keyword_lower not in keyword_counts:
+                    keyword_counts[keyword_lower] = text_lower.count(keyword_lower)
+                count = keyword_counts[keyword_lower]
                 if count > 0:
                     keyword_matches.append(f"{keyword} ({count} occurrences)")
 
             # Check patterns
-            for pattern in theme_data.get('patterns', []):
-                matches = re.findall(pattern, text, re.IGNORECASE)
+            for pattern in self._compiled_theme_patterns[theme_name]:
+                matches = pattern.findall(text)
                 if matches:
                     pattern_matches.extend([f"Pattern match: {match}" for match in matches[:3]])
 
@@ -1666,14 +1779,11 @@ class EnhancedCharacterAnalyzer:
             keyword_strength = len(keyword_matches) * 0.1
             pattern_strength = len(pattern_matches) * 0.15
 
-            # Context analysis - look for thematic sentences
-            theme_sentences = []
-            sentences = re.split(r'[.!?]+', text)
-            for sentence in sentences:
-                sentence_lower = sentence.lower()
-                theme_word_count = sum(1 for keyword in theme_data['keywords'] if keyword.lower() in sentence_lower)
-                if theme_word_count >= 2:  # Sentence contains multiple theme words
-                    theme_sentences.append(sentence.strip()[:100] + "...")
+            # Context analysis - look for thematic sentences (containing multiple theme words)
+            theme_sentences = [
+                incidence.sentences[index].strip()[:100] + "..."
+                for index in incidence.multi_keyword_sentences(theme_data['keywords'])
+            ]
 
             context_strength = len(theme_sentences) * 0.2
             total_strength = keyword_strength + pattern_strength + context_strength
@@ -1699,6 +1809,7 @@ class EnhancedCharacterAnalyzer:
 
         return themes[:8]  # Return top 8 themes
 
+    @traced("emotional_arc")
     async def _analyze_emotional_arc_varied(self, text: str, ctx=None) -> List[EmotionalState]:
         """
         Analyze emotional progression with deeper psychological analysis
@@ -1897,7 +2008,7 @@ class EnhancedCharacterAnalyzer:
 
         Returns depth score and contextual information for deeper emotional analysis
         """
-        sentences = re.split(r'[.!?]+', section)
+        sentences = SENTENCE_BOUNDARY.split(section)
         keyword_sentence = None
 
         # Find the sentence containing the keyword
@@ -1930,14 +2041,8 @@ class EnhancedCharacterAnalyzer:
                 depth_score += 0.15
                 context_factors.append(f"depth indicator: {indicator}")
 
-        # Check for causal relationships (deeper emotions have causes)
-        causal_patterns = [
-            r'because of', r'due to', r'as a result of', r'stemming from',
-            r'rooted in', r'triggered by', r'caused by'
-        ]
-
-        for pattern in causal_patterns:
-            if re.search(pattern, keyword_sentence, re.IGNORECASE):
+        for pattern in CAUSAL_PATTERNS:
+            if pattern.search(keyword_sentence):
                 depth_score += 0.25
                 context_factors.append("causal relationship identified")
 
@@ -2077,7 +2182,7 @@ class EnhancedCharacterAnalyzer:
     def _extract_philosophical_context(self, text: str, trigger: str) -> List[str]:
         """Extract contextual information around philosophical triggers"""
         contexts = []
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_BOUNDARY.split(text)
 
         for sentence in sentences:
             if trigger.lower() in sentence.lower():
@@ -2247,7 +2352,7 @@ class EnhancedCharacterAnalyzer:
             await ctx.info("Performing deep contextual emotional analysis...")
 
         contextual_emotions = []
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_BOUNDARY.split(text)
 
         # Enhanced question analysis - different types of questions reveal different emotions
         questions = [s for s in sentences if '?' in s]
@@ -2478,16 +2583,10 @@ class EnhancedCharacterAnalyzer:
 
     def _extract_setting_information(self, text: str) -> str:
         """Extract setting and world-building information"""
-        setting_patterns = [
-            r'\b(?:in|at|on|near|by|inside|outside|within|beneath|above|below)\s+(?:the\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'\b(?:city|town|village|forest|castle|house|building|room|street|road|path|mountain|river|ocean|lake)\b[^.!?]*',
-            r'\b(?:morning|afternoon|evening|night|dawn|dusk|midnight|noon)\b[^.!?]*',
-            r'\b(?:winter|spring|summer|fall|autumn)\b[^.!?]*'
-        ]
 
         setting_elements = []
-        for pattern in setting_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in SETTING_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, tuple):
                     setting_elements.extend([m for m in match if m.strip()])
@@ -2505,7 +2604,7 @@ class EnhancedCharacterAnalyzer:
             return 0.0
 
         words = text.split()
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_BOUNDARY.split(text)
 
         if not words or not sentences:
             return 0.0
@@ -2892,7 +2991,7 @@ class ThematicCoherenceValidator:
 
     def _analyze_sentence_structure(self, text: str) -> str:
         """Analyze sentence structure complexity"""
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_BOUNDARY.split(text)
         if not sentences:
             return 'unknown'
 
@@ -2982,7 +3081,7 @@ class ThematicCoherenceValidator:
 
     def _check_viewpoint_consistency(self, text: str) -> float:
         """Check consistency of viewpoint within text"""
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_BOUNDARY.split(text)
         viewpoints = []
 
         for sentence in sentences:
@@ -10,6 +10,8 @@ the generic "contemplative" responses with meaningful, varied emotional insights
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+from tracing import traced
+
 
 @dataclass
 class EmotionalInsight:
@@ -204,6 +206,7 @@ class EnhancedEmotionalAnalyzer:
             "loss": 1.3
         }
 
+    @traced("emotional_analysis")
     def analyze_emotional_content(self, text: str, source_type: str = "general") -> EmotionalProfile:
         """
         Perform comprehensive emotional analysis of text content
@@ -6,12 +6,15 @@ This module provides the EnhancedGenreMapper class that replaces hardcoded genre
 with wiki-sourced data, implementing intelligent trait-to-genre matching using semantic analysis.
 """
 
+import heapq
 import logging
+from array import array
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Set, Tuple
 
 from performance_monitor import PerformanceMonitor
+from tracing import traced
 from wiki_data_models import Genre
 from wiki_data_system import WikiDataManager
 
@@ -42,6 +45,305 @@ class GenreHierarchy:
     parent_genres: List[str] = field(default_factory=list)
     related_genres: List[str] = field(default_factory=list)
 
+# Parent genres and the subgenre names that imply them
+PARENT_GENRE_PATTERNS = {
+    'metal': ['heavy metal', 'death metal', 'black metal', 'thrash metal', 'doom metal',
+             'power metal', 'progressive metal', 'symphonic metal', 'folk metal'],
+    'rock': ['alternative rock', 'indie rock', 'hard rock', 'soft rock', 'progressive rock',
+            'art rock', 'classic rock', 'punk rock', 'garage rock', 'psychedelic rock'],
+    'jazz': ['smooth jazz', 'bebop', 'swing', 'fusion', 'free jazz', 'cool jazz',
+            'hard bop', 'modal jazz', 'latin jazz', 'contemporary jazz'],
+    'electronic': ['techno', 'house', 'trance', 'dubstep', 'drum and bass', 'ambient',
+                  'synthwave', 'electro', 'breakbeat', 'downtempo'],
+    'folk': ['folk rock', 'indie folk', 'acoustic folk', 'traditional folk', 'contemporary folk',
+            'celtic folk', 'american folk', 'world folk'],
+    'pop': ['indie pop', 'art pop', 'electropop', 'synthpop', 'dance pop', 'teen pop',
+           'baroque pop', 'chamber pop'],
+    'hip hop': ['old school hip hop', 'conscious rap', 'gangsta rap', 'trap', 'boom bap',
+               'alternative hip hop', 'experimental hip hop'],
+    'country': ['country rock', 'alt-country', 'bluegrass', 'honky-tonk', 'outlaw country',
+               'contemporary country', 'country pop'],
+    'blues': ['delta blues', 'chicago blues', 'electric blues', 'acoustic blues',
+             'country blues', 'rhythm and blues'],
+    'punk': ['hardcore punk', 'pop punk', 'post-punk', 'street punk', 'anarcho-punk',
+            'ska punk', 'celtic punk'],
+    'classical': ['baroque', 'romantic', 'contemporary classical', 'minimalist',
+                 'orchestral', 'chamber music', 'opera']
+}
+
+# Base genres recognised inside compound genre names
+COMPOUND_BASE_GENRES = [
+    'rock', 'pop', 'jazz', 'blues', 'folk', 'country', 'electronic', 'metal',
+    'punk', 'hip hop', 'classical', 'ambient', 'house', 'techno', 'soul',
+    'funk', 'reggae', 'ska', 'gospel', 'world'
+]
+
+# Genre families for semantic grouping
+GENRE_FAMILIES = {
+    'electronic': ['electronic', 'techno', 'house', 'trance', 'dubstep', 'edm', 'synthwave', 'ambient electronic'],
+    'rock': ['rock', 'alternative rock', 'indie rock', 'hard rock', 'soft rock', 'progressive rock', 'art rock'],
+    'metal': ['metal', 'heavy metal', 'death metal', 'black metal', 'thrash metal', 'doom metal', 'power metal'],
+    'jazz': ['jazz', 'smooth jazz', 'bebop', 'swing', 'fusion', 'free jazz', 'cool jazz'],
+    'blues': ['blues', 'delta blues', 'chicago blues', 'electric blues', 'acoustic blues'],
+    'folk': ['folk', 'folk rock', 'indie folk', 'acoustic folk', 'traditional folk'],
+    'pop': ['pop', 'indie pop', 'art pop', 'electropop', 'synthpop', 'dance pop'],
+    'hip_hop': ['hip hop', 'rap', 'trap', 'old school hip hop', 'conscious rap'],
+    'country': ['country', 'country rock', 'bluegrass', 'americana', 'alt-country'],
+    'classical': ['classical', 'baroque', 'romantic', 'contemporary classical', 'orchestral'],
+    'ambient': ['ambient', 'dark ambient', 'drone', 'atmospheric', 'soundscape'],
+    'punk': ['punk', 'punk rock', 'hardcore punk', 'pop punk', 'post-punk']
+}
+
+# Parent/child patterns for hierarchy in genre names, tried in order
+NAME_HIERARCHY_PATTERNS = [
+    ('rock', ['alternative rock', 'indie rock', 'hard rock', 'soft rock', 'progressive rock']),
+    ('metal', ['heavy metal', 'death metal', 'black metal', 'thrash metal', 'doom metal']),
+    ('jazz', ['smooth jazz', 'bebop', 'swing', 'fusion', 'free jazz']),
+    ('electronic', ['techno', 'house', 'trance', 'dubstep', 'synthwave']),
+    ('folk', ['folk rock', 'indie folk', 'acoustic folk', 'traditional folk']),
+    ('pop', ['indie pop', 'art pop', 'electropop', 'synthpop', 'dance pop'])
+]
+
+# ================================================================================================
+# GENRE GRAPH
+# ================================================================================================
+
+# Nearest neighbours kept per genre; larger similar-genre queries rank directly
+GENRE_NEIGHBOR_COUNT = 16
+
+# Related genres listed in a genre hierarchy
+RELATED_GENRE_COUNT = 8
+
+# Padding that gives the first and last letters of a name trigrams of their own
+TRIGRAM_PADDING = '  '
+
+
+def _jaccard(first: Set[str], second: Set[str]) -> float:
+    """Jaccard overlap of two sets, 0 when both are empty"""
+    union = first | second
+    return len(first & second) / len(union) if union else 0
+
+
+def _name_trigrams(name: str) -> Set[str]:
+    """Padded three-letter runs of a lowercased genre name"""
+    padded = f"{TRIGRAM_PADDING}{name}{TRIGRAM_PADDING}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class GenreFeatures:
+    """Per-genre inputs to the pairwise similarity measures, extracted once"""
+    name: str
+    name_lower: str
+    characteristics: Set[str]
+    moods: Set[str]
+    instruments: Set[str]
+    description_words: Set[str]
+    subgenres: Set[str]
+    families: Set[str]
+    name_patterns: Tuple[Tuple[bool, bool], ...]
+
+    @classmethod
+    def from_genre(cls, genre: Genre) -> 'GenreFeatures':
+        name_lower = genre.name.lower()
+        return cls(
+            name=genre.name,
+            name_lower=name_lower,
+            characteristics=set(genre.characteristics),
+            moods=set(genre.mood_associations),
+            instruments=set(genre.typical_instruments),
+            description_words=set(genre.description.lower().split()),
+            subgenres=set(genre.subgenres or ()),
+            families={family for family, members in GENRE_FAMILIES.items()
+                      if any(member in name_lower for member in members)},
+            name_patterns=tuple((parent in name_lower, any(child in name_lower for child in children))
+                                for parent, children in NAME_HIERARCHY_PATTERNS)
+        )
+
+    def content_similarity(self, other: 'GenreFeatures') -> float:
+        """Same as EnhancedGenreMapper._calculate_content_similarity"""
+        return (_jaccard(self.characteristics, other.characteristics) * 0.4 +
+                _jaccard(self.moods, other.moods) * 0.4 +
+                _jaccard(self.instruments, other.instruments) * 0.2)
+
+    def semantic_similarity(self, other: 'GenreFeatures') -> float:
+        """Same as EnhancedGenreMapper._calculate_genre_semantic_similarity"""
+        if not self.families or not other.families:
+            return 0.0
+        return len(self.families & other.families) / max(len(self.families), len(other.families))
+
+    def hierarchical_similarity(self, other: 'GenreFeatures') -> float:
+        """Same as EnhancedGenreMapper._calculate_hierarchical_similarity"""
+        if other.name in self.subgenres or self.name in other.subgenres:
+            return 0.8
+        if self.subgenres and other.subgenres:
+            shared_subgenres = self.subgenres & other.subgenres
+            if shared_subgenres:
+                return len(shared_subgenres) / len(self.subgenres | other.subgenres) * 0.6
+
+        pattern_pairs = zip(self.name_patterns, other.name_patterns, strict=True)
+        for (parent_in_self, child_in_self), (parent_in_other, child_in_other) in pattern_pairs:
+            if (parent_in_self and child_in_other) or (parent_in_other and child_in_self):
+                return 0.7
+            if child_in_self and child_in_other:
+                return 0.5
+        return 0.0
+
+
+class GenreGraph:
+    """
+    Genre hierarchy, nearest neighbours and name index built once per genre list
+
+    Parents and the name and trigram indexes are built up front. The nearest
+    neighbours and related genres of a genre are ranked the first time that
+    genre is queried and kept as arrays, so later queries are O(k) lookups.
+    Scores are those of the pairwise measures in EnhancedGenreMapper.
+    """
+
+    def __init__(self, genres: List[Genre]):
+        self.genres = genres
+        self.size = len(genres)
+        self.features = [GenreFeatures.from_genre(genre) for genre in genres]
+        self._positions = {id(genre): index for index, genre in enumerate(genres)}
+
+        # First genre with each lowercased name, as a linear scan would find it
+        self.index_by_name: Dict[str, int] = {}
+        for index, features in enumerate(self.features):
+            self.index_by_name.setdefault(features.name_lower, index)
+
+        # Genres by each padded trigram of their name, in list order
+        self._trigram_index: Dict[str, array] = {}
+        for index, features in enumerate(self.features):
+            for trigram in _name_trigrams(features.name_lower):
+                self._trigram_index.setdefault(trigram, array('i')).append(index)
+
+        # Genres listing each subgenre name, in list order
+        self._listed_as_subgenre: Dict[str, List[str]] = {}
+        for genre, features in zip(genres, self.features, strict=True):
+            for subgenre in features.subgenres:
+                self._listed_as_subgenre.setdefault(subgenre, []).append(genre.name)
+
+        self.parents = [self.infer_parents(features) for features in self.features]
+
+        self._neighbors: List[Optional[Tuple[array, array]]] = [None] * self.size
+        self._related: List[Optional[List[str]]] = [None] * self.size
+
+    def position(self, genre: Genre) -> Optional[int]:
+        """Index of a genre object in the graph, None if it is not one of its genres"""
+        return self._positions.get(id(genre))
+
+    def fuzzy_find(self, genre_name: str, threshold: float) -> Optional[Tuple[int, float]]:
+        """
+        Index and ratio of the genre whose name best matches genre_name
+
+        Only names sharing a padded trigram with genre_name are compared with
+        SequenceMatcher, in list order, so ties go to the earlier genre as in a
+        full scan. A name sharing no three-letter run with genre_name, not even
+        its first or last letter, is not considered.
+        """
+        name_lower = genre_name.lower()
+        candidates = set()
+        for trigram in _name_trigrams(name_lower):
+            candidates.update(self._trigram_index.get(trigram, ()))
+
+        best_index = None
+        best_ratio = 0.0
+        matcher = SequenceMatcher(None, name_lower)
+        for index in sorted(candidates):
+            matcher.set_seq2(self.features[index].name_lower)
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() <= best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio and ratio >= threshold:
+                best_ratio = ratio
+                best_index = index
+        return (best_index, best_ratio) if best_index is not None else None
+
+    def infer_parents(self, features: GenreFeatures) -> List[str]:
+        """Same as EnhancedGenreMapper._infer_parent_genres_enhanced against this graph's genres"""
+        parent_genres = []
+        for parent, children in PARENT_GENRE_PATTERNS.items():
+            if any(child in features.name_lower for child in children) and parent in self.index_by_name:
+                parent_genres.append(parent)
+
+        for listing_genre in self._listed_as_subgenre.get(features.name, ()):
+            if listing_genre not in parent_genres:
+                parent_genres.append(listing_genre)
+
+        for part in COMPOUND_BASE_GENRES:
+            if part in features.name_lower and part != features.name_lower:
+                if part in self.index_by_name and part not in parent_genres:
+                    parent_genres.append(part)
+        return parent_genres
+
+    def neighbors(self, index: int) -> Tuple[array, array]:
+        """Indexes and scores of the GENRE_NEIGHBOR_COUNT genres most similar to a genre"""
+        row = self._neighbors[index]
+        if row is None:
+            row = self._neighbors[index] = self.rank_similar(self.features[index], GENRE_NEIGHBOR_COUNT)
+        return row
+
+    def rank_similar(self, target: GenreFeatures, limit: int) -> Tuple[array, array]:
+        """
+        Rank the genres most similar to target, best first
+
+        Every measure but the name ratio is cheap set arithmetic, so each genre
+        is first bounded with a perfect name ratio; SequenceMatcher only runs on
+        genres whose bound can still enter the top limit.
+        """
+        bounded = []
+        for other_index, other in enumerate(self.features):
+            if other.name_lower == target.name_lower:
+                continue
+            content = target.content_similarity(other)
+            description = _jaccard(target.description_words, other.description_words)
+            semantic = target.semantic_similarity(other)
+            hierarchical = target.hierarchical_similarity(other)
+            bound = content * 0.3 + (1.0 * 0.6 + description * 0.4) * 0.25 + semantic * 0.25 + hierarchical * 0.2
+            bounded.append((-bound, other_index, content, description, semantic, hierarchical))
+        bounded.sort()
+
+        best: List[Tuple[float, int]] = []
+        matcher = SequenceMatcher(None, target.name_lower)
+        for negative_bound, other_index, content, description, semantic, hierarchical in bounded:
+            if len(best) == limit and -negative_bound < best[0][0]:
+                break
+            matcher.set_seq2(self.features[other_index].name_lower)
+            name = matcher.ratio()
+            score = content * 0.3 + (name * 0.6 + description * 0.4) * 0.25 + semantic * 0.25 + hierarchical * 0.2
+
+            # Higher scores first, then earlier genres, as a stable sort of a full scan
+            entry = (score, -other_index)
+            if len(best) < limit:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+
+        best.sort(reverse=True)
+        return array('i', [-negative_index for _, negative_index in best]), array('d', [score for score, _ in best])
+
+    def related(self, index: int) -> List[str]:
+        """Names of up to RELATED_GENRE_COUNT genres related to a genre"""
+        names = self._related[index]
+        if names is None:
+            names = self._related[index] = self.rank_related(self.features[index])
+        return names
+
+    def rank_related(self, target: GenreFeatures) -> List[str]:
+        """Same as EnhancedGenreMapper._find_related_genres_enhanced against this graph's genres"""
+        related_scores = []
+        for other in self.features:
+            if other.name == target.name:
+                continue
+            combined_score = (target.content_similarity(other) * 0.4 +
+                              target.semantic_similarity(other) * 0.4 +
+                              target.hierarchical_similarity(other) * 0.2)
+            if combined_score > 0.3:
+                related_scores.append((other.name, combined_score))
+
+        related_scores.sort(key=lambda x: x[1], reverse=True)
+        return [name for name, _ in related_scores[:RELATED_GENRE_COUNT]]
+
 # ================================================================================================
 # ENHANCED GENRE MAPPER
 # ================================================================================================
@@ -60,9 +362,12 @@ class EnhancedGenreMapper:
         self.wiki_data_manager = wiki_data_manager
         self.performance_monitor = performance_monitor
         self._genres_cache: Optional[List[Genre]] = None
+        self._genres_version: Optional[int] = None
+        self._genre_graph: Optional[GenreGraph] = None
         self._trait_keywords_cache: Optional[Dict[str, Set[str]]] = None
         self._fallback_mappings = self._get_fallback_mappings()
 
+    @traced("wiki_genre_mapping")
     async def map_traits_to_genres(self, traits: List[str], max_results: int = 5,
                                   use_hierarchical: bool = True) -> List[GenreMatch]:
         """
@@ -219,6 +524,7 @@ class EnhancedGenreMapper:
             logger.error(f"Error getting genre hierarchy for {genre_name}: {e}")
             return None
 
+    @traced("genre_similarity")
     async def find_similar_genres(self, target_genre: str, max_results: int = 5,
                                  similarity_threshold: float = 0.2) -> List[Tuple[Genre, float]]:
         """
@@ -245,32 +551,17 @@ class EnhancedGenreMapper:
                     logger.warning(f"Target genre '{target_genre}' not found")
                     return []
 
-            # Calculate similarity scores using multiple algorithms
-            similarities = []
+            # Look the neighbours up in the genre graph, ranking afresh past its row length
+            graph = self._get_genre_graph()
+            index = graph.position(target_genre_obj)
+            if index is not None and max_results <= GENRE_NEIGHBOR_COUNT:
+                indexes, scores = graph.neighbors(index)
+            else:
+                indexes, scores = graph.rank_similar(GenreFeatures.from_genre(target_genre_obj), max_results)
 
-            for genre in genres:
-                if genre.name.lower() == target_genre_obj.name.lower():
-                    continue  # Skip the target genre itself
-
-                # Combine multiple similarity measures
-                content_similarity = self._calculate_content_similarity(target_genre_obj, genre)
-                structural_similarity = self._calculate_structural_similarity(target_genre_obj, genre)
-                semantic_similarity = self._calculate_genre_semantic_similarity(target_genre_obj, genre)
-                hierarchical_similarity = self._calculate_hierarchical_similarity(target_genre_obj, genre)
-
-                # Weighted combination of similarity measures
-                combined_similarity = (
-                    content_similarity * 0.3 +
-                    structural_similarity * 0.25 +
-                    semantic_similarity * 0.25 +
-                    hierarchical_similarity * 0.2
-                )
-
-                if combined_similarity >= similarity_threshold:
-                    similarities.append((genre, combined_similarity))
-
-            # Sort by similarity and return top results
-            similarities.sort(key=lambda x: x[1], reverse=True)
+            similarities = [(genres[other_index], similarity)
+                            for other_index, similarity in zip(indexes, scores, strict=True)
+                            if similarity >= similarity_threshold]
             return similarities[:max_results]
 
         except Exception as e:
@@ -280,16 +571,34 @@ class EnhancedGenreMapper:
     # Private methods
 
     async def _get_genres(self) -> List[Genre]:
-        """Get genres from wiki data manager with caching"""
+        """Get genres from wiki data manager with caching, reloading them when the wiki data changes"""
+        if self._genres_cache is not None and self._genres_version is not None:
+            version = getattr(self.wiki_data_manager, 'data_version', None)
+            if isinstance(version, int) and version != self._genres_version:
+                self._genres_cache = None
+
         if self._genres_cache is None:
             try:
                 self._genres_cache = await self.wiki_data_manager.get_genres()
+                version = getattr(self.wiki_data_manager, 'data_version', None)
+                self._genres_version = version if isinstance(version, int) else None
             except Exception as e:
                 logger.error(f"Error getting genres from wiki data manager: {e}")
                 self._genres_cache = []
 
         return self._genres_cache or []
 
+    def _get_genre_graph(self) -> Optional[GenreGraph]:
+        """Get the genre graph of the cached genres, rebuilding it when they were replaced"""
+        genres = self._genres_cache
+        if not genres:
+            return None
+
+        graph = self._genre_graph
+        if graph is None or graph.genres is not genres or graph.size != len(genres):
+            graph = self._genre_graph = GenreGraph(genres)
+        return graph
+
     def _prepare_genre_text(self, genre: Genre) -> str:
         """Prepare genre text for matching analysis"""
         text_parts = [
@@ -416,86 +725,32 @@ class EnhancedGenreMapper:
 
     def _find_genre_by_name(self, genre_name: str) -> Optional[Genre]:
         """Find a genre by name"""
-        if not self._genres_cache:
+        graph = self._get_genre_graph()
+        if graph is None:
             return None
 
-        genre_name_lower = genre_name.lower()
-        for genre in self._genres_cache:
-            if genre.name.lower() == genre_name_lower:
-                return genre
-
-        return None
+        index = graph.index_by_name.get(genre_name.lower())
+        return graph.genres[index] if index is not None else None
 
     async def _infer_parent_genres_enhanced(self, genre: Genre) -> List[str]:
         """Enhanced parent genre inference using wiki data and pattern analysis"""
-        parent_genres = []
-        genre_lower = genre.name.lower()
-
-        # Get all available genres for cross-referencing
-        all_genres = await self._get_genres()
-        genre_names = [g.name.lower() for g in all_genres]
-
-        # Enhanced parent-child patterns with more comprehensive mapping
-        hierarchical_patterns = {
-            'metal': ['heavy metal', 'death metal', 'black metal', 'thrash metal', 'doom metal',
-                     'power metal', 'progressive metal', 'symphonic metal', 'folk metal'],
-            'rock': ['alternative rock', 'indie rock', 'hard rock', 'soft rock', 'progressive rock',
-                    'art rock', 'classic rock', 'punk rock', 'garage rock', 'psychedelic rock'],
-            'jazz': ['smooth jazz', 'bebop', 'swing', 'fusion', 'free jazz', 'cool jazz',
-                    'hard bop', 'modal jazz', 'latin jazz', 'contemporary jazz'],
-            'electronic': ['techno', 'house', 'trance', 'dubstep', 'drum and bass', 'ambient',
-                          'synthwave', 'electro', 'breakbeat', 'downtempo'],
-            'folk': ['folk rock', 'indie folk', 'acoustic folk', 'traditional folk', 'contemporary folk',
-                    'celtic folk', 'american folk', 'world folk'],
-            'pop': ['indie pop', 'art pop', 'electropop', 'synthpop', 'dance pop', 'teen pop',
-                   'baroque pop', 'chamber pop'],
-            'hip hop': ['old school hip hop', 'conscious rap', 'gangsta rap', 'trap', 'boom bap',
-                       'alternative hip hop', 'experimental hip hop'],
-            'country': ['country rock', 'alt-country', 'bluegrass', 'honky-tonk', 'outlaw country',
-                       'contemporary country', 'country pop'],
-            'blues': ['delta blues', 'chicago blues', 'electric blues', 'acoustic blues',
-                     'country blues', 'rhythm and blues'],
-            'punk': ['hardcore punk', 'pop punk', 'post-punk', 'street punk', 'anarcho-punk',
-                    'ska punk', 'celtic punk'],
-            'classical': ['baroque', 'romantic', 'contemporary classical', 'minimalist',
-                         'orchestral', 'chamber music', 'opera']
-        }
-
-        # Check for direct parent-child relationships
-        for parent, children in hierarchical_patterns.items():
-            if any(child in genre_lower for child in children):
-                # Verify parent genre exists in our data
-                if parent in genre_names:
-                    parent_genres.append(parent)
-
-        # Check if this genre appears as a subgenre of others
-        for other_genre in all_genres:
-            if (other_genre.subgenres and
-                genre.name in other_genre.subgenres and
-                other_genre.name not in parent_genres):
-                parent_genres.append(other_genre.name)
-
-        # Infer from compound genre names (e.g., "folk rock" -> ["folk", "rock"])
-        compound_parts = self._extract_compound_genre_parts(genre.name)
-        for part in compound_parts:
-            if part in genre_names and part not in parent_genres:
-                parent_genres.append(part)
+        # Parents only count if they are genres in our data
+        await self._get_genres()
+        graph = self._get_genre_graph()
+        if graph is None:
+            return []
 
-        return parent_genres
+        index = graph.position(genre)
+        if index is not None:
+            return list(graph.parents[index])
+        return graph.infer_parents(GenreFeatures.from_genre(genre))
 
     def _extract_compound_genre_parts(self, genre_name: str) -> List[str]:
         """Extract base genre parts from compound genre names"""
         genre_lower = genre_name.lower()
 
-        # Common base genres that appear in compound names
-        base_genres = [
-            'rock', 'pop', 'jazz', 'blues', 'folk', 'country', 'electronic', 'metal',
-            'punk', 'hip hop', 'classical', 'ambient', 'house', 'techno', 'soul',
-            'funk', 'reggae', 'ska', 'gospel', 'world'
-        ]
-
         found_parts = []
-        for base in base_genres:
+        for base in COMPOUND_BASE_GENRES:
             if base in genre_lower and base != genre_lower:
                 found_parts.append(base)
 
@@ -507,27 +762,11 @@ class EnhancedGenreMapper:
         if not all_genres:
             return []
 
-        related_scores = []
-
-        # Find genres with similar characteristics using multiple measures
-        for other_genre in all_genres:
-            if other_genre.name == genre.name:
-                continue
-
-            # Calculate multiple similarity measures
-            content_sim = self._calculate_content_similarity(genre, other_genre)
-            semantic_sim = self._calculate_genre_semantic_similarity(genre, other_genre)
-            hierarchical_sim = self._calculate_hierarchical_similarity(genre, other_genre)
-
-            # Combined similarity score
-            combined_score = (content_sim * 0.4 + semantic_sim * 0.4 + hierarchical_sim * 0.2)
-
-            if combined_score > 0.3:  # Threshold for relatedness
-                related_scores.append((other_genre.name, combined_score))
-
-        # Sort by similarity and return top related genres
-        related_scores.sort(key=lambda x: x[1], reverse=True)
-        return [name for name, _ in related_scores[:8]]  # Return up to 8 related genres
+        graph = self._get_genre_graph()
+        index = graph.position(genre)
+        if index is not None:
+            return list(graph.related(index))
+        return graph.rank_related(GenreFeatures.from_genre(genre))
 
     def _calculate_content_similarity(self, genre1: Genre, genre2: Genre) -> float:
         """Calculate content-based similarity between two genres"""
@@ -566,27 +805,11 @@ class EnhancedGenreMapper:
 
     def _calculate_genre_semantic_similarity(self, genre1: Genre, genre2: Genre) -> float:
         """Calculate semantic similarity using genre family relationships"""
-        # Define genre families for semantic grouping
-        genre_families = {
-            'electronic': ['electronic', 'techno', 'house', 'trance', 'dubstep', 'edm', 'synthwave', 'ambient electronic'],
-            'rock': ['rock', 'alternative rock', 'indie rock', 'hard rock', 'soft rock', 'progressive rock', 'art rock'],
-            'metal': ['metal', 'heavy metal', 'death metal', 'black metal', 'thrash metal', 'doom metal', 'power metal'],
-            'jazz': ['jazz', 'smooth jazz', 'bebop', 'swing', 'fusion', 'free jazz', 'cool jazz'],
-            'blues': ['blues', 'delta blues', 'chicago blues', 'electric blues', 'acoustic blues'],
-            'folk': ['folk', 'folk rock', 'indie folk', 'acoustic folk', 'traditional folk'],
-            'pop': ['pop', 'indie pop', 'art pop', 'electropop', 'synthpop', 'dance pop'],
-            'hip_hop': ['hip hop', 'rap', 'trap', 'old school hip hop', 'conscious rap'],
-            'country': ['country', 'country rock', 'bluegrass', 'americana', 'alt-country'],
-            'classical': ['classical', 'baroque', 'romantic', 'contemporary classical', 'orchestral'],
-            'ambient': ['ambient', 'dark ambient', 'drone', 'atmospheric', 'soundscape'],
-            'punk': ['punk', 'punk rock', 'hardcore punk', 'pop punk', 'post-punk']
-        }
-
         # Find which families each genre belongs to
         genre1_families = []
         genre2_families = []
 
-        for family, genres in genre_families.items():
+        for family, genres in GENRE_FAMILIES.items():
             if any(g in genre1.name.lower() for g in genres):
                 genre1_families.append(family)
             if any(g in genre2.name.lower() for g in genres):
@@ -626,17 +849,7 @@ class EnhancedGenreMapper:
         name1_lower = name1.lower()
         name2_lower = name2.lower()
 
-        # Common hierarchical patterns
-        hierarchical_patterns = [
-            ('rock', ['alternative rock', 'indie rock', 'hard rock', 'soft rock', 'progressive rock']),
-            ('metal', ['heavy metal', 'death metal', 'black metal', 'thrash metal', 'doom metal']),
-            ('jazz', ['smooth jazz', 'bebop', 'swing', 'fusion', 'free jazz']),
-            ('electronic', ['techno', 'house', 'trance', 'dubstep', 'synthwave']),
-            ('folk', ['folk rock', 'indie folk', 'acoustic folk', 'traditional folk']),
-            ('pop', ['indie pop', 'art pop', 'electropop', 'synthpop', 'dance pop'])
-        ]
-
-        for parent, children in hierarchical_patterns:
+        for parent, children in NAME_HIERARCHY_PATTERNS:
             # Check if one is parent and other is child
             if parent in name1_lower and any(child in name2_lower for child in children):
                 return 0.7
@@ -650,23 +863,6 @@ class EnhancedGenreMapper:
 
         return 0.0
 
-    async def _fuzzy_find_genre(self, genre_name: str, threshold: float = 0.6) -> Optional[Genre]:
-        """Find a genre using fuzzy string matching"""
-        genres = await self._get_genres()
-        if not genres:
-            return None
-
-        best_match = None
-        best_ratio = 0.0
-
-        for genre in genres:
-            ratio = SequenceMatcher(None, genre_name.lower(), genre.name.lower()).ratio()
-            if ratio > best_ratio and ratio >= threshold:
-                best_ratio = ratio
-                best_match = genre
-
-        return best_match
-
     async def find_fallback_matches(self, traits: List[str], max_results: int = 5) -> List[GenreMatch]:
         """
         Find genre matches using intelligent fallback algorithms when direct matches fail
@@ -914,25 +1110,20 @@ class EnhancedGenreMapper:
         if not genres:
             return None
 
-        best_match = None
-        best_ratio = 0.0
-
-        genre_name_lower = genre_name.lower()
-
-        for genre in genres:
-            # Check exact match first
-            if genre.name.lower() == genre_name_lower:
-                return genre
-
-            # Check fuzzy match
-            ratio = SequenceMatcher(None, genre_name_lower, genre.name.lower()).ratio()
-            if ratio > best_ratio and ratio >= threshold:
-                best_ratio = ratio
-                best_match = genre
+        # Check exact match first
+        graph = self._get_genre_graph()
+        exact = graph.index_by_name.get(genre_name.lower())
+        if exact is not None:
+            return genres[exact]
 
-        if best_match:
-            logger.info(f"Fuzzy matched '{genre_name}' to '{best_match.name}' (similarity: {best_ratio:.2f})")
+        # Check fuzzy match against names sharing a trigram
+        match = graph.fuzzy_find(genre_name, threshold)
+        if match is None:
+            return None
 
+        index, ratio = match
+        best_match = genres[index]
+        logger.info(f"Fuzzy matched '{genre_name}' to '{best_match.name}' (similarity: {ratio:.2f})")
         return best_match
 
     def _get_fallback_mappings(self) -> Dict[str, List[str]]:
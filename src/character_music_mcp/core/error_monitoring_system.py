@@ -15,7 +15,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from memory_diagnostics import get_memory_diagnostics
+from metrics_exposition import MetricsBuilder, get_metrics_registry
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -192,6 +195,12 @@ class ErrorMonitoringSystem:
             'last_success': None,
             'last_failure': None
         })
+        # Logged errors since start-up by (error type, severity), unlike error_events never trimmed
+        self.error_counts: Dict[Tuple[str, str], int] = defaultdict(int)
+
+        get_metrics_registry().register(self)
+        get_memory_diagnostics().register(self, "error_events", "error_patterns", "active_alerts",
+                                          "health_history", "operation_metrics", "error_counts")
 
     async def initialize(self) -> None:
         """Initialize the error monitoring system"""
@@ -242,6 +251,7 @@ class ErrorMonitoringSystem:
 
         # Add to event queue
         self.error_events.append(error_event)
+        self.error_counts[(error_event.error_type, severity.value)] += 1
 
         # Update operation metrics
         self.operation_metrics[operation]['failed_operations'] += 1
@@ -273,6 +283,24 @@ class ErrorMonitoringSystem:
         metrics['total_response_time'] += response_time
         metrics['last_success'] = datetime.now()
 
+    def collect_metrics(self, builder: MetricsBuilder) -> None:
+        """Write error counts and per-operation failure rates into a metrics scrape"""
+        for (error_type, severity), count in list(self.error_counts.items()):
+            builder.counter("character_music_errors", "Logged errors by error type and severity",
+                            count, error_type=error_type, severity=severity)
+        for operation, metrics in list(self.operation_metrics.items()):
+            successful, failed = metrics['successful_operations'], metrics['failed_operations']
+            builder.counter("character_music_monitored_operations", "Operations logged to error monitoring by outcome",
+                            successful, operation=operation, outcome="success")
+            builder.counter("character_music_monitored_operations", "Operations logged to error monitoring by outcome",
+                            failed, operation=operation, outcome="error")
+            if successful + failed:
+                builder.gauge("character_music_operation_failure_ratio",
+                              "Fraction of an operation's logged outcomes that were failures",
+                              failed / (successful + failed), operation=operation)
+        builder.gauge("character_music_active_alerts", "Unresolved error monitoring alerts",
+                      sum(1 for alert in list(self.active_alerts.values()) if not alert.resolved))
+
     def add_alert_callback(self, callback: Callable[[Alert], None]) -> None:
         """Add a callback function to be called when alerts are generated"""
         self.alert_callbacks.append(callback)
@@ -6,10 +6,11 @@ This module provides graceful degradation mechanisms that ensure the system
 continues to function even when wiki data is unavailable or partially corrupted.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 from error_recovery_manager import DataSource, ErrorRecoveryManager
 from wiki_data_system import Genre, MetaTag, Technique, WikiDataManager
@@ -58,6 +59,13 @@ class DegradationLevel:
         """Check if system is in degraded state"""
         return self.level > 0
 
+@dataclass(frozen=True)
+class ResolvedDataView:
+    """Immutable merge of wiki, cached and fallback data shared by concurrent readers"""
+    items: Tuple[Any, ...]
+    quality_metrics: DataQualityMetrics
+    wiki_available: bool = True
+
 # ================================================================================================
 # GRACEFUL DEGRADATION SYSTEM
 # ================================================================================================
@@ -74,6 +82,14 @@ class GracefulDegradationSystem:
         self.fallback_strategies: Dict[str, List[str]] = {}
         self.initialized = False
 
+        # Resolved views per (data type, filter, max age), with the key of the
+        # sources each was merged from
+        self._resolved_views: Dict[Tuple[str, Optional[str], int], Tuple[Tuple[Any, ...], ResolvedDataView]] = {}
+        self._view_locks: Dict[Tuple[str, Optional[str], int], asyncio.Lock] = {}
+        self._cached_data_version = 0
+        self.resolved_view_hits = 0
+        self.resolved_view_misses = 0
+
         # Setup fallback strategies
         self._setup_fallback_strategies()
 
@@ -91,63 +107,28 @@ class GracefulDegradationSystem:
         self.initialized = True
         logger.info(f"GracefulDegradationSystem initialized (degradation level: {self.current_degradation.level})")
 
-    async def get_genres_with_fallback(self, max_age_hours: int = 24) -> Tuple[List[Genre], DataQualityMetrics]:
+    async def get_genres_with_fallback(self, max_age_hours: int = 24) -> Tuple[Sequence[Genre], DataQualityMetrics]:
         """
         Get genres with graceful fallback to cached and hardcoded data
 
+        The merged genres are a snapshot shared with every other caller until
+        wiki, cached or fallback data changes, so it is returned as a tuple.
+
         Args:
             max_age_hours: Maximum age for cached data
 
         Returns:
-            Tuple of (genres_list, quality_metrics)
+            Tuple of (genres, quality_metrics)
         """
         logger.debug("Getting genres with fallback support")
 
-        wiki_genres = []
-        cached_genres = []
-        fallback_genres = []
-
-        # Try to get fresh wiki data
-        try:
-            wiki_genres = await self.wiki_data_manager.get_genres()
-            logger.info(f"Retrieved {len(wiki_genres)} genres from wiki")
-        except Exception as e:
-            logger.warning(f"Failed to get wiki genres: {e}")
-
-            # Handle the failure through error recovery
-            recovery_result = await self.error_recovery_manager.handle_download_failure(
-                "genres", e, {"operation": "get_genres"}
-            )
-
-            if recovery_result.success and recovery_result.data:
-                if recovery_result.source == DataSource.WIKI_CACHED:
-                    cached_genres = recovery_result.data
-                elif recovery_result.source == DataSource.HARDCODED_FALLBACK:
-                    fallback_genres = recovery_result.data
-
-        # If we have no wiki data, try to get cached data
-        if not wiki_genres and not cached_genres:
-            cached_genres = await self._get_cached_genres(max_age_hours)
-
-        # If we still have no data, use hardcoded fallbacks
-        if not wiki_genres and not cached_genres:
-            fallback_data = self.error_recovery_manager.get_fallback_data('genres')
-            if fallback_data:
-                fallback_genres = self._convert_to_genre_objects(fallback_data.data)
-
-        # Combine data sources intelligently
-        combined_genres, quality_metrics = self._combine_genre_sources(
-            wiki_genres, cached_genres, fallback_genres
-        )
-
-        # Update degradation level based on data quality
-        await self._update_degradation_level('genres', quality_metrics)
+        view = await self._get_resolved_view('genres', None, max_age_hours, self._resolve_genres)
 
-        logger.info(f"Returning {len(combined_genres)} genres (quality: {quality_metrics.overall_score:.2f})")
-        return combined_genres, quality_metrics
+        logger.info(f"Returning {len(view.items)} genres (quality: {view.quality_metrics.overall_score:.2f})")
+        return view.items, view.quality_metrics
 
     async def get_meta_tags_with_fallback(self, category: str = None,
-                                        max_age_hours: int = 24) -> Tuple[List[MetaTag], DataQualityMetrics]:
+                                        max_age_hours: int = 24) -> Tuple[Sequence[MetaTag], DataQualityMetrics]:
         """
         Get meta tags with graceful fallback to cached and hardcoded data
 
@@ -156,60 +137,17 @@ class GracefulDegradationSystem:
             max_age_hours: Maximum age for cached data
 
         Returns:
-            Tuple of (meta_tags_list, quality_metrics)
+            Tuple of (meta_tags, quality_metrics)
         """
         logger.debug(f"Getting meta tags with fallback support (category: {category})")
 
-        wiki_meta_tags = []
-        cached_meta_tags = []
-        fallback_meta_tags = []
-
-        # Try to get fresh wiki data
-        try:
-            wiki_meta_tags = await self.wiki_data_manager.get_meta_tags(category)
-            logger.info(f"Retrieved {len(wiki_meta_tags)} meta tags from wiki")
-        except Exception as e:
-            logger.warning(f"Failed to get wiki meta tags: {e}")
-
-            # Handle the failure through error recovery
-            recovery_result = await self.error_recovery_manager.handle_download_failure(
-                "meta_tags", e, {"operation": "get_meta_tags", "category": category}
-            )
+        view = await self._get_resolved_view('meta_tags', category, max_age_hours, self._resolve_meta_tags)
 
-            if recovery_result.success and recovery_result.data:
-                if recovery_result.source == DataSource.WIKI_CACHED:
-                    cached_meta_tags = recovery_result.data
-                elif recovery_result.source == DataSource.HARDCODED_FALLBACK:
-                    fallback_meta_tags = recovery_result.data
-
-        # If we have no wiki data, try to get cached data
-        if not wiki_meta_tags and not cached_meta_tags:
-            cached_meta_tags = await self._get_cached_meta_tags(category, max_age_hours)
-
-        # If we still have no data, use hardcoded fallbacks
-        if not wiki_meta_tags and not cached_meta_tags:
-            fallback_data = self.error_recovery_manager.get_fallback_data('meta_tags')
-            if fallback_data:
-                fallback_meta_tags = self._convert_to_meta_tag_objects(fallback_data.data)
-
-                # Filter by category if specified
-                if category:
-                    fallback_meta_tags = [tag for tag in fallback_meta_tags
-                                        if tag.category.lower() == category.lower()]
-
-        # Combine data sources intelligently
-        combined_meta_tags, quality_metrics = self._combine_meta_tag_sources(
-            wiki_meta_tags, cached_meta_tags, fallback_meta_tags
-        )
-
-        # Update degradation level based on data quality
-        await self._update_degradation_level('meta_tags', quality_metrics)
-
-        logger.info(f"Returning {len(combined_meta_tags)} meta tags (quality: {quality_metrics.overall_score:.2f})")
-        return combined_meta_tags, quality_metrics
+        logger.info(f"Returning {len(view.items)} meta tags (quality: {view.quality_metrics.overall_score:.2f})")
+        return view.items, view.quality_metrics
 
     async def get_techniques_with_fallback(self, technique_type: str = None,
-                                         max_age_hours: int = 24) -> Tuple[List[Technique], DataQualityMetrics]:
+                                         max_age_hours: int = 24) -> Tuple[Sequence[Technique], DataQualityMetrics]:
         """
         Get techniques with graceful fallback to cached and hardcoded data
 
@@ -218,52 +156,18 @@ class GracefulDegradationSystem:
             max_age_hours: Maximum age for cached data
 
         Returns:
-            Tuple of (techniques_list, quality_metrics)
+            Tuple of (techniques, quality_metrics)
         """
         logger.debug(f"Getting techniques with fallback support (type: {technique_type})")
 
-        wiki_techniques = []
-        cached_techniques = []
-        fallback_techniques = []
+        view = await self._get_resolved_view('techniques', technique_type, max_age_hours, self._resolve_techniques)
 
-        # Try to get fresh wiki data
-        try:
-            wiki_techniques = await self.wiki_data_manager.get_techniques(technique_type)
-            logger.info(f"Retrieved {len(wiki_techniques)} techniques from wiki")
-        except Exception as e:
-            logger.warning(f"Failed to get wiki techniques: {e}")
-
-            # Handle the failure through error recovery
-            recovery_result = await self.error_recovery_manager.handle_download_failure(
-                "techniques", e, {"operation": "get_techniques", "technique_type": technique_type}
-            )
+        logger.info(f"Returning {len(view.items)} techniques (quality: {view.quality_metrics.overall_score:.2f})")
+        return view.items, view.quality_metrics
 
-            if recovery_result.success and recovery_result.data:
-                if recovery_result.source == DataSource.WIKI_CACHED:
-                    cached_techniques = recovery_result.data
-                elif recovery_result.source == DataSource.HARDCODED_FALLBACK:
-                    fallback_techniques = recovery_result.data
-
-        # If we have no wiki data, try to get cached data
-        if not wiki_techniques and not cached_techniques:
-            cached_techniques = await self._get_cached_techniques(technique_type, max_age_hours)
-
-        # If we still have no data, use hardcoded fallbacks
-        if not wiki_techniques and not cached_techniques:
-            fallback_data = self.error_recovery_manager.get_fallback_data('techniques')
-            if fallback_data:
-                fallback_techniques = self._convert_to_technique_objects(fallback_data.data)
-
-        # Combine data sources intelligently
-        combined_techniques, quality_metrics = self._combine_technique_sources(
-            wiki_techniques, cached_techniques, fallback_techniques
-        )
-
-        # Update degradation level based on data quality
-        await self._update_degradation_level('techniques', quality_metrics)
-
-        logger.info(f"Returning {len(combined_techniques)} techniques (quality: {quality_metrics.overall_score:.2f})")
-        return combined_techniques, quality_metrics
+    def mark_cached_data_changed(self) -> None:
+        """Record that cached data changed so resolved views are merged again"""
+        self._cached_data_version += 1
 
     async def handle_partial_data_failure(self, data_type: str, partial_data: Any,
                                         error: Exception) -> Tuple[Any, DataQualityMetrics]:
@@ -465,6 +369,194 @@ class GracefulDegradationSystem:
 
                 logger.info(f"Degradation level updated to {new_level}: {description}")
 
+    async def _get_resolved_view(self, data_type: str, filter_value: Optional[str], max_age_hours: int,
+                                 resolve: Callable[[Optional[str], int], Awaitable[ResolvedDataView]]) -> ResolvedDataView:
+        """
+        Return the resolved view for a request, merging sources only when one changed
+
+        Readers arriving while a view is being resolved wait for it rather than
+        merging the same sources again. Views are only kept while the wiki data
+        manager reports a data version; failed or unversioned wiki reads are
+        resolved again on every call, as before.
+        """
+        slot = (data_type, filter_value, max_age_hours)
+        view = self._current_view(slot)
+        if view is not None:
+            self.resolved_view_hits += 1
+        else:
+            async with self._view_locks.setdefault(slot, asyncio.Lock()):
+                view = self._current_view(slot)
+                if view is not None:
+                    self.resolved_view_hits += 1
+                else:
+                    self.resolved_view_misses += 1
+                    view = await resolve(filter_value, max_age_hours)
+                    key = self._view_key(data_type)
+                    if view.wiki_available and key[0] is not None:
+                        self._resolved_views[slot] = (key, view)
+                    else:
+                        self._resolved_views.pop(slot, None)
+
+        # Alternating filters share one quality entry per data type
+        if self.data_quality_cache.get(data_type) is not view.quality_metrics:
+            await self._update_degradation_level(data_type, view.quality_metrics)
+
+        return view
+
+    def _current_view(self, slot: Tuple[str, Optional[str], int]) -> Optional[ResolvedDataView]:
+        """Get the stored view for a slot if none of its sources changed since"""
+        stored = self._resolved_views.get(slot)
+        if stored is None:
+            return None
+        key, view = stored
+        if key[0] is None or key != self._view_key(slot[0]):
+            return None
+        return view
+
+    def _view_key(self, data_type: str) -> Tuple[Any, ...]:
+        """Key of the (wiki data version, cache state, fallback state) a view was resolved from"""
+        wiki_version = getattr(self.wiki_data_manager, 'data_version', None)
+        if not isinstance(wiki_version, int):
+            wiki_version = None
+
+        # Fallback entries are replaced rather than edited; the view holds the
+        # entry through its key, so its id cannot be reused while compared
+        fallback = self.error_recovery_manager.fallback_data_cache.get(data_type)
+        fallback_state = (fallback, fallback.last_updated) if fallback is not None else None
+
+        return wiki_version, self._cached_data_version, fallback_state
+
+    async def _resolve_genres(self, _filter_value: Optional[str], max_age_hours: int) -> ResolvedDataView:
+        """Read and merge genres from wiki, cached and fallback sources"""
+        wiki_genres = []
+        cached_genres = []
+        fallback_genres = []
+        wiki_available = True
+
+        # Try to get fresh wiki data
+        try:
+            wiki_genres = await self.wiki_data_manager.get_genres()
+            logger.info(f"Retrieved {len(wiki_genres)} genres from wiki")
+        except Exception as e:
+            logger.warning(f"Failed to get wiki genres: {e}")
+            wiki_available = False
+
+            # Handle the failure through error recovery
+            recovery_result = await self.error_recovery_manager.handle_download_failure(
+                "genres", e, {"operation": "get_genres"}
+            )
+
+            if recovery_result.success and recovery_result.data:
+                if recovery_result.source == DataSource.WIKI_CACHED:
+                    cached_genres = recovery_result.data
+                elif recovery_result.source == DataSource.HARDCODED_FALLBACK:
+                    fallback_genres = recovery_result.data
+
+        # If we have no wiki data, try to get cached data
+        if not wiki_genres and not cached_genres:
+            cached_genres = await self._get_cached_genres(max_age_hours)
+
+        # If we still have no data, use hardcoded fallbacks
+        if not wiki_genres and not cached_genres:
+            fallback_data = self.error_recovery_manager.get_fallback_data('genres')
+            if fallback_data:
+                fallback_genres = self._convert_to_genre_objects(fallback_data.data)
+
+        # Combine data sources intelligently
+        combined_genres, quality_metrics = self._combine_genre_sources(
+            wiki_genres, cached_genres, fallback_genres
+        )
+        return ResolvedDataView(tuple(combined_genres), quality_metrics, wiki_available)
+
+    async def _resolve_meta_tags(self, category: Optional[str], max_age_hours: int) -> ResolvedDataView:
+        """Read and merge meta tags from wiki, cached and fallback sources"""
+        wiki_meta_tags = []
+        cached_meta_tags = []
+        fallback_meta_tags = []
+        wiki_available = True
+
+        # Try to get fresh wiki data
+        try:
+            wiki_meta_tags = await self.wiki_data_manager.get_meta_tags(category)
+            logger.info(f"Retrieved {len(wiki_meta_tags)} meta tags from wiki")
+        except Exception as e:
+            logger.warning(f"Failed to get wiki meta tags: {e}")
+            wiki_available = False
+
+            # Handle the failure through error recovery
+            recovery_result = await self.error_recovery_manager.handle_download_failure(
+                "meta_tags", e, {"operation": "get_meta_tags", "category": category}
+            )
+
+            if recovery_result.success and recovery_result.data:
+                if recovery_result.source == DataSource.WIKI_CACHED:
+                    cached_meta_tags = recovery_result.data
+                elif recovery_result.source == DataSource.HARDCODED_FALLBACK:
+                    fallback_meta_tags = recovery_result.data
+
+        # If we have no wiki data, try to get cached data
+        if not wiki_meta_tags and not cached_meta_tags:
+            cached_meta_tags = await self._get_cached_meta_tags(category, max_age_hours)
+
+        # If we still have no data, use hardcoded fallbacks
+        if not wiki_meta_tags and not cached_meta_tags:
+            fallback_data = self.error_recovery_manager.get_fallback_data('meta_tags')
+            if fallback_data:
+                fallback_meta_tags = self._convert_to_meta_tag_objects(fallback_data.data)
+
+                # Filter by category if specified
+                if category:
+                    fallback_meta_tags = [tag for tag in fallback_meta_tags
+                                        if tag.category.lower() == category.lower()]
+
+        # Combine data sources intelligently
+        combined_meta_tags, quality_metrics = self._combine_meta_tag_sources(
+            wiki_meta_tags, cached_meta_tags, fallback_meta_tags
+        )
+        return ResolvedDataView(tuple(combined_meta_tags), quality_metrics, wiki_available)
+
+    async def _resolve_techniques(self, technique_type: Optional[str], max_age_hours: int) -> ResolvedDataView:
+        """Read and merge techniques from wiki, cached and fallback sources"""
+        wiki_techniques = []
+        cached_techniques = []
+        fallback_techniques = []
+        wiki_available = True
+
+        # Try to get fresh wiki data
+        try:
+            wiki_techniques = await self.wiki_data_manager.get_techniques(technique_type)
+            logger.info(f"Retrieved {len(wiki_techniques)} techniques from wiki")
+        except Exception as e:
+            logger.warning(f"Failed to get wiki techniques: {e}")
+            wiki_available = False
+
+            # Handle the failure through error recovery
+            recovery_result = await self.error_recovery_manager.handle_download_failure(
+                "techniques", e, {"operation": "get_techniques", "technique_type": technique_type}
+            )
+
+            if recovery_result.success and recovery_result.data:
+                if recovery_result.source == DataSource.WIKI_CACHED:
+                    cached_techniques = recovery_result.data
+                elif recovery_result.source == DataSource.HARDCODED_FALLBACK:
+                    fallback_techniques = recovery_result.data
+
+        # If we have no wiki data, try to get cached data
+        if not wiki_techniques and not cached_techniques:
+            cached_techniques = await self._get_cached_techniques(technique_type, max_age_hours)
+
+        # If we still have no data, use hardcoded fallbacks
+        if not wiki_techniques and not cached_techniques:
+            fallback_data = self.error_recovery_manager.get_fallback_data('techniques')
+            if fallback_data:
+                fallback_techniques = self._convert_to_technique_objects(fallback_data.data)
+
+        # Combine data sources intelligently
+        combined_techniques, quality_metrics = self._combine_technique_sources(
+            wiki_techniques, cached_techniques, fallback_techniques
+        )
+        return ResolvedDataView(tuple(combined_techniques), quality_metrics, wiki_available)
+
     def _combine_genre_sources(self, wiki_genres: List[Genre], cached_genres: List[Genre],
                              fallback_genres: List[Genre]) -> Tuple[List[Genre], DataQualityMetrics]:
         """Combine genre data from multiple sources"""
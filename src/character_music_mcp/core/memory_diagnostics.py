@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Memory Diagnostics for the Long-Running Server
+
+This module tracks the state that components keep for the life of the process
+(usage records, download and retry history, caches, metric deques) so memory
+growth can be traced to its owner before it turns into a restart.
+
+Components register themselves as owners of the attributes that hold that
+state. A diagnostics snapshot then reports, per owner:
+
+- an estimate of the bytes retained by each registered attribute, from a
+  bounded walk of the objects it references
+- when tracemalloc is tracing, the allocation growth since the previous and
+  the first snapshot, attributed to an owner by the innermost traceback
+  frame in the owner's module
+
+Attributes whose retained size grew in each of the last few snapshots, by
+more than a minimum, are reported as leak suspects.
+
+Diagnostics are off by default; start() begins tracemalloc and takes
+snapshots periodically from a daemon thread, and snapshot() takes one on
+demand.
+"""
+
+import logging
+import sys
+import threading
+import tracemalloc
+import weakref
+from collections import deque
+from datetime import datetime
+from itertools import pairwise
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from metrics_exposition import MetricsBuilder, get_metrics_registry
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Traceback frames tracemalloc keeps per allocation when diagnostics start it
+DEFAULT_TRACEMALLOC_FRAMES = 16
+
+# Seconds between periodic snapshots
+DEFAULT_SNAPSHOT_INTERVAL = 300.0
+
+# Items of a larger container walked when estimating its retained size; the rest are extrapolated
+SAMPLED_CONTAINER_ITEMS = 200
+
+# Most objects visited when estimating one attribute's retained size
+MAX_OBJECTS_PER_ESTIMATE = 100_000
+
+# Copies of a container the event loop keeps changing tried before it is counted as empty
+CONTAINER_COPY_ATTEMPTS = 3
+
+# Snapshot reports kept in memory
+MAX_REPORTS = 48
+
+# An attribute growing in this many consecutive snapshots, by at least this many bytes, is a leak suspect
+SUSPECT_SNAPSHOTS = 4
+SUSPECT_MIN_GROWTH_BYTES = 1024 * 1024
+
+# Allocation sites listed in a report
+TOP_GROWTH_SITES = 10
+
+# Owner name for allocation growth outside every registered owner's module
+UNATTRIBUTED_OWNER = "other"
+
+# Objects never walked into: code and modules are shared, not retained by one component
+_OPAQUE_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType,
+                 weakref.ReferenceType, threading.Thread)
+
+# ================================================================================================
+# RETAINED SIZE
+# ================================================================================================
+
+def estimate_retained_size(root: Any, sample_items: int = SAMPLED_CONTAINER_ITEMS,
+                           max_objects: int = MAX_OBJECTS_PER_ESTIMATE) -> Tuple[int, bool]:
+    """
+    Estimate the bytes retained by an object and everything it references
+
+    Follows container items, instance __dict__ and __slots__; each object
+    is counted once. Containers with more than sample_items items are
+    estimated from an evenly spaced sample of them, scaled up, which keeps
+    the walk (and what tracemalloc has to trace during it) short. Objects
+    shared with the rest of the process (interned strings, small ints) are
+    counted too, so this is an upper bound on what releasing the object
+    would free.
+
+    Returns:
+        (bytes, truncated), where truncated is True if max_objects was reached
+    """
+    seen = set()
+    stack: List[Tuple[Any, float]] = [(root, 1.0)]
+    total = 0.0
+    while stack:
+        obj, weight = stack.pop()
+        if id(obj) in seen or isinstance(obj, _OPAQUE_TYPES):
+            continue
+        if len(seen) >= max_objects:
+            return int(total), True
+        seen.add(id(obj))
+        total += sys.getsizeof(obj, 0) * weight
+
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool, complex)) or obj is None:
+            continue
+        if isinstance(obj, (dict, list, tuple, set, frozenset, deque)):
+            items = _copy_items(obj)
+            step = max(1, len(items) // sample_items)
+            child_weight = weight * len(items) / len(range(0, len(items), step)) if items else weight
+            for item in items[::step]:
+                if isinstance(obj, dict):
+                    stack.append((item[0], child_weight))
+                    stack.append((item[1], child_weight))
+                else:
+                    stack.append((item, child_weight))
+        else:
+            instance_dict = getattr(obj, "__dict__", None)
+            if isinstance(instance_dict, dict):
+                stack.append((instance_dict, weight))
+            for slot in getattr(type(obj), "__slots__", ()):
+                value = getattr(obj, slot, None)
+                if value is not None:
+                    stack.append((value, weight))
+    return int(total), False
+
+def _copy_items(container: Any) -> List[Any]:
+    """
+    Items (key-value pairs of a dict) of a container, copied in one pass
+
+    Owners' containers are changed by the event loop while a snapshot walks
+    them from another thread; iterating a copy keeps that from failing the
+    walk halfway, and a copy that fails is retried.
+    """
+    for _ in range(CONTAINER_COPY_ATTEMPTS):
+        try:
+            return list(container.items()) if isinstance(container, dict) else list(container)
+        except RuntimeError:  # Changed size during iteration
+            continue
+    return []
+
+def _item_count(value: Any) -> Optional[int]:
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+# ================================================================================================
+# DIAGNOSTICS
+# ================================================================================================
+
+class MemoryDiagnostics:
+    """Per-owner retained sizes and tracemalloc growth attribution"""
+
+    def __init__(self):
+        # Weak, so registering never keeps a component alive
+        self._owners: "weakref.WeakKeyDictionary[Any, Tuple[str, ...]]" = weakref.WeakKeyDictionary()
+        self._owner_modules: Dict[str, str] = {}  # Module file -> owner name
+        self._lock = threading.Lock()
+
+        # Live allocations of the previous snapshot by (owner, allocation site), and traced bytes at the first
+        self._previous_sites: Optional[Dict[Tuple[str, str], Tuple[int, int]]] = None
+        self._baseline_bytes: Optional[int] = None
+        self.reports: Deque[Dict[str, Any]] = deque(maxlen=MAX_REPORTS)
+        self._size_history: Dict[Tuple[str, str], Deque[int]] = {}
+        self._flagged: set = set()
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        get_metrics_registry().register(self)
+
+    def register(self, owner: Any, *attributes: str) -> None:
+        """
+        Track the state an owner keeps for the life of the process
+
+        Args:
+            owner: Component instance, reported under its class name
+            attributes: Names of its attributes holding accumulated state
+                (added to those already registered for it, e.g. by a base class)
+        """
+        with self._lock:
+            self._owners[owner] = self._owners.get(owner, ()) + attributes
+            # Allocations in each class's module are attributed to that class
+            for owner_class in type(owner).__mro__[:-1]:
+                module_file = getattr(sys.modules.get(owner_class.__module__), "__file__", None)
+                if module_file:
+                    self._owner_modules.setdefault(module_file, owner_class.__name__)
+
+    def component_sizes(self) -> Dict[str, Dict[str, Any]]:
+        """Retained-size estimate of every registered attribute, summed per owner class"""
+        with self._lock:
+            owners = list(self._owners.items())
+
+        components: Dict[str, Dict[str, Any]] = {}
+        for owner, attributes in owners:
+            component = components.setdefault(type(owner).__name__,
+                                              {"retained_bytes": 0, "instances": 0, "attributes": {}})
+            component["instances"] += 1
+            for attribute in attributes:
+                value = getattr(owner, attribute, None)
+                size, truncated = estimate_retained_size(value)
+                entry = component["attributes"].setdefault(attribute, {"bytes": 0, "items": 0})
+                entry["bytes"] += size
+                entry["items"] += _item_count(value) or 0
+                if truncated:
+                    entry["truncated"] = True
+                component["retained_bytes"] += size
+        return components
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Measure the registered owners (and tracemalloc growth if tracing) and keep the report"""
+        report: Dict[str, Any] = {
+            "taken_at": datetime.now().isoformat(),
+            "components": self.component_sizes()
+        }
+        if tracemalloc.is_tracing():
+            report["tracemalloc"] = self._allocation_growth()
+        report["suspects"] = self._update_suspects(report["components"])
+        self.reports.append(report)
+        return report
+
+    def latest_report(self) -> Optional[Dict[str, Any]]:
+        """Most recent snapshot report, if any"""
+        return self.reports[-1] if self.reports else None
+
+    def _allocation_growth(self) -> Dict[str, Any]:
+        # Only the per-site totals are kept; full snapshots are large and slow to compare
+        sites = self._allocation_sites(tracemalloc.take_snapshot())
+        traced_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        if self._baseline_bytes is None:
+            self._baseline_bytes = traced_bytes
+        growth: Dict[str, Any] = {
+            "traced_bytes": traced_bytes,
+            "peak_bytes": peak_bytes,
+            "growth_since_baseline_bytes": traced_bytes - self._baseline_bytes
+        }
+
+        previous, self._previous_sites = self._previous_sites, sites
+        if previous is None:
+            return growth
+
+        diffs = []
+        for key in sites.keys() | previous.keys():
+            size, count = sites.get(key, (0, 0))
+            previous_size, previous_count = previous.get(key, (0, 0))
+            if size != previous_size:
+                diffs.append((key, size - previous_size, count - previous_count))
+
+        by_owner: Dict[str, int] = {}
+        for (owner, _), size_diff, _ in diffs:
+            by_owner[owner] = by_owner.get(owner, 0) + size_diff
+        diffs.sort(key=lambda diff: diff[1], reverse=True)
+
+        growth["growth_since_previous_bytes"] = sum(size_diff for _, size_diff, _ in diffs)
+        growth["growth_by_owner"] = dict(sorted(by_owner.items(), key=lambda item: item[1], reverse=True))
+        growth["top_growth_sites"] = [{
+            "location": location,
+            "owner": owner,
+            "size_diff_bytes": size_diff,
+            "count_diff": count_diff
+        } for (owner, location), size_diff, count_diff in diffs[:TOP_GROWTH_SITES] if size_diff > 0]
+        return growth
+
+    def _allocation_sites(self, snapshot: tracemalloc.Snapshot) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """Live bytes and blocks by (owner, allocation site)"""
+        sites: Dict[Tuple[str, str], Tuple[int, int]] = {}
+        for statistic in snapshot.statistics("traceback"):
+            site = statistic.traceback[-1]  # Most recent frame
+            if site.filename == tracemalloc.__file__:
+                continue
+            key = (self._owner_of(statistic.traceback), f"{site.filename}:{site.lineno}")
+            size, count = sites.get(key, (0, 0))
+            sites[key] = (size + statistic.size, count + statistic.count)
+        return sites
+
+    def _owner_of(self, traceback: tracemalloc.Traceback) -> str:
+        for frame in reversed(traceback):  # Innermost frame first
+            owner = self._owner_modules.get(frame.filename)
+            if owner is not None:
+                return owner
+        return UNATTRIBUTED_OWNER
+
+    def _update_suspects(self, components: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        suspects = []
+        for component, details in components.items():
+            for attribute, entry in details["attributes"].items():
+                key = (component, attribute)
+                history = self._size_history.get(key)
+                if history is None:
+                    history = self._size_history[key] = deque(maxlen=SUSPECT_SNAPSHOTS + 1)
+                history.append(entry["bytes"])
+
+                growing = len(history) == history.maxlen and all(
+                    later > earlier for earlier, later in pairwise(history))
+                growth = history[-1] - history[0]
+                if growing and growth >= SUSPECT_MIN_GROWTH_BYTES:
+                    suspects.append({"component": component, "attribute": attribute,
+                                     "growth_bytes": growth, "snapshots": len(history)})
+                    if key not in self._flagged:
+                        logger.warning(f"{component}.{attribute} grew by {growth} bytes over "
+                                       f"{len(history)} memory snapshots; possible leak")
+                    self._flagged.add(key)
+                else:
+                    self._flagged.discard(key)
+        return suspects
+
+    def start(self, interval: float = DEFAULT_SNAPSHOT_INTERVAL,
+              frames: int = DEFAULT_TRACEMALLOC_FRAMES) -> None:
+        """Start tracemalloc and take a snapshot every interval seconds from a daemon thread"""
+        if self._thread is not None:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="memory-diagnostics",
+                                        daemon=True)
+        self._thread.start()
+        logger.info(f"Memory diagnostics taking snapshots every {interval:g}s")
+
+    def stop(self) -> None:
+        """Stop periodic snapshots (tracemalloc keeps running if it was running before start)"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, interval: float) -> None:
+        while True:
+            try:
+                self.snapshot()
+            except Exception as e:
+                logger.error(f"Memory snapshot failed: {e}")
+            if self._stop.wait(interval):
+                return
+
+    def collect_metrics(self, builder: MetricsBuilder) -> None:
+        """Write the latest snapshot's retained sizes into a scrape (snapshots are not taken here)"""
+        report = self.latest_report()
+        if report is None:
+            return
+        for component, details in report["components"].items():
+            for attribute, entry in details["attributes"].items():
+                builder.gauge("character_music_component_retained_bytes",
+                              "Estimated bytes retained by long-lived component state",
+                              entry["bytes"], component=component, attribute=attribute)
+        if "tracemalloc" in report:
+            builder.gauge("character_music_traced_memory_bytes", "Memory traced by tracemalloc",
+                          report["tracemalloc"]["traced_bytes"])
+
+# Global memory diagnostics
+_memory_diagnostics: Optional[MemoryDiagnostics] = None
+
+def get_memory_diagnostics() -> MemoryDiagnostics:
+    """Get or create the global memory diagnostics"""
+    global _memory_diagnostics
+    if _memory_diagnostics is None:
+        _memory_diagnostics = MemoryDiagnostics()
+    return _memory_diagnostics
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+OpenMetrics / Prometheus Text Exposition
+
+This module renders the server's counters, gauges and latency histograms in
+the OpenMetrics text format (or the older Prometheus 0.0.4 text format) for
+scraping. Components that keep statistics register with the global
+MetricsRegistry and implement collect_metrics(builder), writing their
+current values into a MetricsBuilder. Rendering only walks those running
+aggregates, so a scrape costs O(series), never O(recorded events).
+Scrapes may come from the HTTP thread, so collect_metrics iterates over
+copies of the containers it reads.
+
+The same text is served as an MCP resource and, optionally, from a small
+local HTTP endpoint started with start_metrics_server().
+"""
+
+import bisect
+import logging
+import math
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_OPENMETRICS = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+CONTENT_TYPE_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram upper bounds (seconds) for tool and operation latencies
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Path served by the HTTP endpoint
+METRICS_HTTP_PATH = "/metrics"
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+# ================================================================================================
+# METRIC TYPES
+# ================================================================================================
+
+class Histogram:
+    """Cumulative latency histogram with fixed bucket bounds"""
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Count one observation"""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def merged(self, other: 'Histogram') -> 'Histogram':
+        """New histogram holding the observations of both"""
+        if other.bounds != self.bounds:
+            raise ValueError("Cannot merge histograms with different bucket bounds")
+        result = Histogram(self.bounds)
+        result.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        result.count = self.count + other.count
+        result.sum = self.sum + other.sum
+        return result
+
+class _Family:
+    """Samples of one metric family gathered during a scrape"""
+    __slots__ = ("name", "kind", "help_text", "samples")
+
+    def __init__(self, name: str, kind: str, help_text: str):
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.samples: Dict[LabelSet, Any] = {}
+
+class MetricsBuilder:
+    """
+    Collects the samples of one scrape
+
+    Samples with the same name and labels from several sources (e.g. two
+    cache managers of the same class) are added together.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+
+    def counter(self, name: str, help_text: str, value: float, **labels: Any) -> None:
+        """Add a monotonically increasing count (name without the _total suffix)"""
+        self._add(name, "counter", help_text, value, labels)
+
+    def gauge(self, name: str, help_text: str, value: float, **labels: Any) -> None:
+        """Add a current value"""
+        self._add(name, "gauge", help_text, value, labels)
+
+    def histogram(self, name: str, help_text: str, histogram: Histogram, **labels: Any) -> None:
+        """Add a latency histogram"""
+        self._add(name, "histogram", help_text, histogram, labels)
+
+    def _add(self, name: str, kind: str, help_text: str, value: Any, labels: Dict[str, Any]) -> None:
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = _Family(name, kind, help_text)
+        elif family.kind != kind:
+            raise ValueError(f"Metric {name} registered as {family.kind}, not {kind}")
+
+        key = tuple((label, str(label_value)) for label, label_value in labels.items())
+        previous = family.samples.get(key)
+        if previous is None:
+            family.samples[key] = value
+        elif kind == "histogram":
+            family.samples[key] = previous.merged(value)
+        else:
+            family.samples[key] = previous + value
+
+    def render(self, openmetrics: bool = True) -> str:
+        """Text exposition of the collected families, sorted by name"""
+        lines: List[str] = []
+        for name in sorted(self._families):
+            family = self._families[name]
+            if family.kind == "counter" and not openmetrics:
+                header_name = f"{name}_total"  # Prometheus text names the family by its sample
+            else:
+                header_name = name
+            lines.append(f"# HELP {header_name} {_escape_help(family.help_text)}")
+            lines.append(f"# TYPE {header_name} {family.kind}")
+            for labels, value in family.samples.items():
+                if family.kind == "histogram":
+                    _render_histogram(lines, name, labels, value)
+                elif family.kind == "counter":
+                    lines.append(f"{name}_total{_format_labels(labels)} {_format_value(value)}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+# ================================================================================================
+# REGISTRY
+# ================================================================================================
+
+class MetricsRegistry:
+    """Components whose statistics are exposed on each scrape"""
+
+    def __init__(self):
+        # Weak, so registering never keeps a component alive
+        self._sources: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    def register(self, source: Any) -> None:
+        """Expose a component that implements collect_metrics(builder)"""
+        self._sources.add(source)
+
+    def unregister(self, source: Any) -> None:
+        """Stop exposing a component"""
+        self._sources.discard(source)
+
+    def collect(self) -> MetricsBuilder:
+        """Gather the current samples of every registered component"""
+        builder = MetricsBuilder()
+        for source in list(self._sources):
+            try:
+                source.collect_metrics(builder)
+            except Exception as e:
+                logger.error(f"Error collecting metrics from {type(source).__name__}: {e}")
+        return builder
+
+    def render(self, openmetrics: bool = True) -> str:
+        """Text exposition of every registered component"""
+        return self.collect().render(openmetrics)
+
+# Global metrics registry
+_metrics_registry: Optional[MetricsRegistry] = None
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get or create the global metrics registry"""
+    global _metrics_registry
+    if _metrics_registry is None:
+        _metrics_registry = MetricsRegistry()
+    return _metrics_registry
+
+# ================================================================================================
+# HTTP ENDPOINT
+# ================================================================================================
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Answers GET and HEAD for /metrics"""
+    registry: MetricsRegistry
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def _respond(self, send_body: bool) -> None:
+        if urlsplit(self.path).path != METRICS_HTTP_PATH:
+            self.send_error(404)
+            return
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+        payload = self.registry.render(openmetrics).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE_OPENMETRICS if openmetrics else CONTENT_TYPE_PROMETHEUS)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"Metrics scrape: {format % args}")
+
+def start_metrics_server(port: int, host: str = "127.0.0.1",
+                         registry: Optional[MetricsRegistry] = None) -> ThreadingHTTPServer:
+    """
+    Serve the exposition over HTTP at /metrics from a daemon thread
+
+    The server runs beside whatever event loop the MCP transport uses and
+    binds to the loopback interface by default. Scrapers that send
+    "Accept: application/openmetrics-text" get OpenMetrics, others the
+    Prometheus 0.0.4 text format.
+
+    Args:
+        port: Port to listen on (0 picks a free one, see server_address)
+        host: Interface to bind
+        registry: Registry to expose (the global one by default)
+
+    Returns:
+        The running server; shutdown() stops it
+    """
+    handler = type("MetricsRequestHandler", (_MetricsRequestHandler,),
+                   {"registry": registry or get_metrics_registry()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_address[1]}{METRICS_HTTP_PATH}")
+    return server
+
+# ================================================================================================
+# FORMATTING
+# ================================================================================================
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{label}="{_escape_label_value(value)}"' for label, value in labels) + "}"
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+def _render_histogram(lines: List[str], name: str, labels: LabelSet, histogram: Histogram) -> None:
+    cumulative = 0
+    for bound, count in zip((*histogram.bounds, math.inf), histogram.counts, strict=True):
+        cumulative += count
+        bucket_labels = labels + (("le", _format_value(float(bound))),)
+        lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
@@ -52,7 +52,11 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from memory_diagnostics import get_memory_diagnostics
+from metrics_exposition import Histogram, MetricsBuilder, get_metrics_registry
+from timeseries_store import TimeSeriesStore
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -183,6 +187,8 @@ class PerformanceMonitor:
         self.storage_path = Path(storage_path)
         self.metrics: deque = deque(maxlen=50000)  # Keep last 50k metrics
         self.operation_stats: Dict[str, OperationStats] = defaultdict(lambda: OperationStats(operation="default"))
+        self.duration_histograms: Dict[str, Histogram] = {}
+        self.downloaded_bytes = 0
         self.system_metrics_history: deque = deque(maxlen=1440)  # 24 hours of minute data
         self.alert_callbacks: List[Callable[[str, Dict[str, Any]], None]] = []
         self.initialized = False
@@ -197,11 +203,19 @@ class PerformanceMonitor:
         self.system_metrics_interval = 60  # seconds
         self.cleanup_interval = 3600  # seconds
         self.report_interval = 300  # seconds (5 minutes)
+        self.timeseries_flush_interval = 10  # seconds
+
+        # Persistent latency history, written off the event loop
+        self.timeseries = TimeSeriesStore(self.storage_path / "timeseries")
 
         # Process monitoring
         self.process = psutil.Process() if PSUTIL_AVAILABLE else None
         self._lock = threading.Lock()
 
+        get_metrics_registry().register(self)
+        get_memory_diagnostics().register(self, "metrics", "operation_stats", "duration_histograms",
+                                          "system_metrics_history", "timeseries")
+
     async def initialize(self) -> None:
         """Initialize the performance monitoring system"""
         logger.info("Initializing PerformanceMonitor")
@@ -217,6 +231,7 @@ class PerformanceMonitor:
         asyncio.create_task(self._performance_analyzer())
         asyncio.create_task(self._cleanup_old_data())
         asyncio.create_task(self._generate_reports())
+        asyncio.create_task(self._flush_timeseries())
 
         self.initialized = True
         logger.info("PerformanceMonitor initialized successfully")
@@ -326,6 +341,9 @@ class PerformanceMonitor:
     async def record_download_metrics(self, url: str, duration: float, success: bool,
                                     file_size: int = 0, status_code: int = None) -> None:
         """Record specific download performance metrics"""
+        if self.initialized and success:
+            self.downloaded_bytes += file_size
+
         context = {
             'url': url,
             'file_size_bytes': file_size,
@@ -531,6 +549,27 @@ class PerformanceMonitor:
             'health_status': 'healthy' if not issues else 'degraded' if len(issues) < 3 else 'critical'
         }
 
+    async def query_timeseries(self, operation: str, start: Union[datetime, float],
+                               end: Union[datetime, float], step: float = 60.0) -> List[Dict[str, Any]]:
+        """Latency percentiles and throughput of an operation over time, from the persisted history"""
+        start = start.timestamp() if isinstance(start, datetime) else start
+        end = end.timestamp() if isinstance(end, datetime) else end
+        return await asyncio.to_thread(self.timeseries.query_range, operation, start, end, step)
+
+    def collect_metrics(self, builder: MetricsBuilder) -> None:
+        """Write operation latencies, outcomes and download volume into a metrics scrape"""
+        for operation, histogram in list(self.duration_histograms.items()):
+            builder.histogram("character_music_operation_duration_seconds",
+                              "Duration of monitored operations (wiki_download, content_parsing, ...)",
+                              histogram, operation=operation)
+        for operation, stats in list(self.operation_stats.items()):
+            builder.counter("character_music_operations", "Monitored operations by outcome",
+                            stats.successful_calls, operation=operation, outcome="success")
+            builder.counter("character_music_operations", "Monitored operations by outcome",
+                            stats.failed_calls, operation=operation, outcome="error")
+        builder.counter("character_music_download_bytes", "Bytes of wiki content downloaded successfully",
+                        self.downloaded_bytes)
+
     def add_alert_callback(self, callback: Callable[[str, Dict[str, Any]], None]) -> None:
         """Add callback for performance alerts"""
         self.alert_callbacks.append(callback)
@@ -598,6 +637,11 @@ class PerformanceMonitor:
             stats = self.operation_stats[operation]
             stats.total_calls += 1
 
+            histogram = self.duration_histograms.get(operation)
+            if histogram is None:
+                histogram = self.duration_histograms[operation] = Histogram()
+            histogram.observe(duration)
+
             if success:
                 stats.successful_calls += 1
                 stats.total_duration += duration
@@ -613,6 +657,8 @@ class PerformanceMonitor:
                 stats.avg_memory_usage = ((stats.avg_memory_usage * (stats.total_calls - 1)) + memory_usage) / stats.total_calls
                 stats.avg_cpu_usage = ((stats.avg_cpu_usage * (stats.total_calls - 1)) + cpu_usage) / stats.total_calls
 
+        self.timeseries.record(operation, metric.timestamp.timestamp(), duration, success)
+
         # Check for performance alerts
         await self._check_performance_alerts(metric, stats)
 
@@ -804,9 +850,21 @@ class PerformanceMonitor:
 
                 logger.debug(f"Cleanup: removed {len(ops_to_remove)} old operation stats")
 
+                compaction = await asyncio.to_thread(self.timeseries.compact)
+                logger.debug(f"Cleanup: time-series compaction {compaction}")
+
             except Exception as e:
                 logger.error(f"Error in cleanup task: {e}")
 
+    async def _flush_timeseries(self) -> None:
+        """Background task to write buffered time-series points to disk"""
+        while True:
+            try:
+                await asyncio.sleep(self.timeseries_flush_interval)
+                await asyncio.to_thread(self.timeseries.flush)
+            except Exception as e:
+                logger.error(f"Error flushing time-series data: {e}")
+
     async def _generate_reports(self) -> None:
         """Background task to generate periodic reports"""
         while True:
@@ -868,6 +926,9 @@ class PerformanceMonitor:
         with open(stats_file, 'w') as f:
             json.dump(stats_data, f, indent=2)
 
+        # Write buffered points and every open rollup window
+        await asyncio.to_thread(self.timeseries.flush, True)
+
         logger.debug("Saved performance monitoring state to disk")
 
 # ================================================================================================
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Precompiled Regular Expression Registry
+
+This module holds the regular expressions shared by the analyzers and parsers:
+- Module-level precompiled patterns used across several modules
+- A small bounded LRU for patterns built at run time from character names
+- Combined alternations used to skip a sequence of pattern tests when none of
+  them can match
+
+Patterns that belong to a single module are compiled as constants in that
+module; this registry only keeps the ones that are shared.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Pattern
+
+# Per-name patterns seen by one process are bounded by the names in the
+# texts being analyzed; 256 keeps a few requests' worth of names warm
+DYNAMIC_PATTERN_CACHE_SIZE = 256
+
+# Sentence boundaries used to split text into sentences
+SENTENCE_BOUNDARY = re.compile(r'[.!?]+')
+
+# Capitalized words and names
+CAPITALIZED_WORD = re.compile(r'\b[A-Z][a-z]+\b')
+CAPITALIZED_NAME = re.compile(r'\b[A-Z][a-z]{2,}\b')
+
+# Runs of whitespace collapsed to a single space
+WHITESPACE_RUN = re.compile(r'\s+')
+
+# "N-year-old" ages in character descriptions
+AGE_IN_YEARS = re.compile(r'(\d+)[-\s]*year[-\s]*old')
+
+# Artist and character names in a free-form description, tried in order;
+# the first match wins
+DESCRIPTION_NAME_PATTERNS = [
+    re.compile(r'([A-Z][A-Z]+ [A-Z][a-zA-Z]+)'),  # DJ Memphis, MC Something
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-zA-Z]+)'),  # John Smith or John McKenzie
+    re.compile(r'([A-Z][a-z]+ (?:"[^"]*" )?[A-Z][a-z]+)'),  # John "Nickname" Smith
+    re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-zA-Z]+)+)'),  # Multiple names at start
+    re.compile(r'([A-Z][A-Z]+)'),  # Single names like DJ, MC (fallback)
+]
+
+# Verbs that attribute a line of dialogue to a speaker
+SPEECH_VERBS = r'(?:said|asked|replied|whispered|shouted|exclaimed)'
+
+
+@lru_cache(maxsize=DYNAMIC_PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    """
+    Compile a pattern built at run time, such as one containing a character name
+
+    Static patterns are compiled once at import and never go back through the
+    stdlib re cache; patterns built from names are kept here instead, in a
+    cache of their own that a burst of new names can only cycle within.
+    """
+    return re.compile(pattern, flags)
+
+
+def compile_all(patterns: Iterable[str], flags: int = 0) -> List[Pattern]:
+    """Compile a sequence of patterns that are tried one after another"""
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
+def compile_table(patterns: Dict[str, str], flags: int = 0) -> Dict[str, Pattern]:
+    """Compile a table of named patterns"""
+    return {name: re.compile(pattern, flags) for name, pattern in patterns.items()}
+
+
+def compile_alternation(patterns: Iterable[str], flags: int = 0) -> Pattern:
+    """
+    Compile one pattern matching wherever any of patterns would match
+
+    Capturing groups are kept, so the result is meant for search() gating
+    (does any of the patterns occur?) rather than for reading groups.
+    """
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+
+
+def dynamic_pattern_cache_info():
+    """Hit/miss statistics of the per-name pattern cache"""
+    return compile_pattern.cache_info()
@@ -3,22 +3,92 @@
 Retry System for Dynamic Suno Data Integration
 
 This module provides automatic retry logic for failed operations with exponential backoff,
-circuit breaker patterns, and comprehensive error monitoring.
+circuit breaker patterns, and comprehensive error monitoring. Retries respect the latency
+budget of the enclosing tool call, and policies can opt in to hedged attempts.
+
+State stays a constant size however long the server runs: completed sessions go into a
+fixed-size ring of compact records plus running totals per operation type, circuit
+breakers move from OPEN to HALF_OPEN when next looked at rather than on a timer, and
+save_state appends only what changed to compacted log files.
 """
 
 import asyncio
 import json
 import logging
+import math
+import os
 import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Set
+
+from memory_diagnostics import get_memory_diagnostics
+from metrics_exposition import MetricsBuilder, get_metrics_registry
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Successful attempt latencies kept per operation type for hedge delays
+HEDGE_LATENCY_WINDOW = 200
+
+# Completed retry sessions kept in memory; older ones are only in the session log
+MAX_RETRY_SESSIONS = 1000
+
+# A log is compacted once it holds this many lines per entry it needs to keep
+LOG_COMPACTION_FACTOR = 4
+
+# Circuit count below which the circuit log is not compacted
+MIN_COMPACTED_CIRCUITS = 16
+
+# ================================================================================================
+# LATENCY BUDGETS
+# ================================================================================================
+
+# time.monotonic() deadline of the current call, or None when it has no budget
+_deadline: ContextVar[Optional[float]] = ContextVar("retry_deadline", default=None)
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when an operation runs out of its latency budget"""
+
+@contextmanager
+def latency_budget(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Run the enclosed code with a latency budget
+
+    The deadline is carried in a context variable, so tasks started inside
+    the block inherit it. A nested budget can only bring the deadline
+    forward, never extend the one it runs under; None leaves it unchanged.
+
+    Yields:
+        The monotonic deadline in effect inside the block, or None
+    """
+    current = _deadline.get()
+    if seconds is None:
+        yield current
+        return
+
+    deadline = time.monotonic() + seconds
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+def remaining_budget() -> Optional[float]:
+    """Seconds left in the current latency budget, or None when there is no budget"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
 # ================================================================================================
 # ENUMS AND DATA MODELS
 # ================================================================================================
@@ -61,6 +131,12 @@ class RetryPolicy:
     recovery_timeout: int = 30  # Seconds before trying half-open
     success_threshold: int = 2  # Successes needed to close circuit
 
+    # Hedged attempts - only for idempotent operations
+    hedge: bool = False  # Launch a second attempt when the first is slow
+    hedge_quantile: float = 0.95  # Latency quantile after which the second attempt starts
+    hedge_min_samples: int = 20  # Latencies needed before the quantile is used
+    hedge_delay: Optional[float] = None  # Delay used until then; None means no hedge yet
+
     # Retry conditions
     retryable_exceptions: List[str] = field(default_factory=lambda: [
         'ConnectionError', 'TimeoutError', 'HTTPError', 'NetworkError'
@@ -78,6 +154,7 @@ class RetryAttempt:
     error: Optional[str] = None
     success: bool = False
     response_time: float = 0.0
+    hedged: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -87,9 +164,54 @@ class RetryAttempt:
             'delay_before': self.delay_before,
             'error': self.error,
             'success': self.success,
-            'response_time': self.response_time
+            'response_time': self.response_time,
+            'hedged': self.hedged
         }
 
+@dataclass(frozen=True, slots=True)
+class RetrySessionRecord:
+    """Compact summary of a completed retry session"""
+    operation_id: str
+    operation_type: OperationType
+    start_time: datetime
+    duration_seconds: float
+    total_attempts: int
+    final_success: bool
+    hedged: bool = False
+    final_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'operation_id': self.operation_id,
+            'operation_type': self.operation_type.value,
+            'start_time': self.start_time.isoformat(),
+            'duration_seconds': self.duration_seconds,
+            'total_attempts': self.total_attempts,
+            'final_success': self.final_success,
+            'hedged': self.hedged,
+            'final_error': self.final_error
+        }
+
+@dataclass(slots=True)
+class OperationRetryStats:
+    """Running totals of completed retry sessions for one operation type"""
+    sessions: int = 0
+    successful: int = 0
+    failed: int = 0
+    attempts: int = 0
+    total_duration: float = 0.0
+
+    def add(self, record: RetrySessionRecord) -> None:
+        """Count one completed session"""
+        self.sessions += 1
+        if record.final_success:
+            self.successful += 1
+        else:
+            self.failed += 1
+        self.attempts += record.total_attempts
+        self.total_duration += record.duration_seconds
+
 @dataclass
 class RetrySession:
     """Complete retry session for an operation"""
@@ -122,6 +244,20 @@ class RetrySession:
             'duration_seconds': self.duration.total_seconds() if self.duration else None
         }
 
+    def to_record(self) -> RetrySessionRecord:
+        """Compact summary of the session, dropping the per-attempt detail"""
+        duration = self.duration
+        return RetrySessionRecord(
+            operation_id=self.operation_id,
+            operation_type=self.operation_type,
+            start_time=self.start_time,
+            duration_seconds=duration.total_seconds() if duration else 0.0,
+            total_attempts=self.total_attempts,
+            final_success=self.final_success,
+            hedged=any(attempt.hedged for attempt in self.attempts),
+            final_error=None if self.final_success or not self.attempts else self.attempts[-1].error
+        )
+
 @dataclass
 class CircuitBreakerState:
     """State of a circuit breaker"""
@@ -131,6 +267,7 @@ class CircuitBreakerState:
     last_failure_time: Optional[datetime] = None
     last_success_time: Optional[datetime] = None
     next_attempt_time: Optional[datetime] = None
+    open_until: Optional[float] = None  # time.monotonic() after which an OPEN circuit is probed
 
 # ================================================================================================
 # RETRY SYSTEM
@@ -143,13 +280,26 @@ class RetrySystem:
         self.storage_path = Path(storage_path)
         self.retry_policies: Dict[str, RetryPolicy] = {}
         self.circuit_breakers: Dict[str, CircuitBreakerState] = {}
-        self.retry_sessions: List[RetrySession] = []
+        self.retry_sessions: Deque[RetrySessionRecord] = deque(maxlen=MAX_RETRY_SESSIONS)
+        self.operation_stats: Dict[str, OperationRetryStats] = {}
         self.active_sessions: Dict[str, RetrySession] = {}
+        self.latency_samples: Dict[str, Deque[float]] = {}
+        self.hedge_stats = {'hedges_launched': 0, 'hedge_wins': 0}
         self.initialized = False
 
+        # Changes not yet appended to the logs by save_state
+        self._unsaved_sessions: Deque[RetrySessionRecord] = deque(maxlen=MAX_RETRY_SESSIONS)
+        self._dirty_circuits: Set[str] = set()
+        self._session_log_lines = 0
+        self._circuit_log_lines = 0
+
         # Setup default policies
         self._setup_default_policies()
 
+        get_metrics_registry().register(self)
+        get_memory_diagnostics().register(self, "retry_sessions", "_unsaved_sessions", "operation_stats",
+                                          "circuit_breakers", "active_sessions", "latency_samples")
+
     async def initialize(self) -> None:
         """Initialize the retry system"""
         logger.info("Initializing RetrySystem")
@@ -157,13 +307,9 @@ class RetrySystem:
         # Create storage directory
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
-        # Load previous state
+        # Load previous state; circuits recover on access, so no background tasks are needed
         await self._load_state()
 
-        # Start background tasks
-        asyncio.create_task(self._circuit_breaker_monitor())
-        asyncio.create_task(self._cleanup_old_sessions())
-
         self.initialized = True
         logger.info("RetrySystem initialized successfully")
 
@@ -175,6 +321,12 @@ class RetrySystem:
         """
         Execute an operation with retry logic
 
+        Attempts and backoff are clipped to the latency budget of the caller
+        (see latency_budget): an attempt is cut off when the budget runs out,
+        and a retry whose backoff would not finish within the budget is not
+        made. Policies with hedge set race a second attempt against a slow
+        first one and take whichever succeeds first.
+
         Args:
             operation: Async function to execute
             operation_id: Unique identifier for the operation
@@ -212,6 +364,11 @@ class RetrySystem:
             # Calculate delay for this attempt
             if attempt_num > 1:
                 delay = self._calculate_delay(attempt_num - 1, policy)
+                remaining = remaining_budget()
+                if remaining is not None and delay >= remaining:
+                    logger.warning(f"Latency budget leaves no time to retry {operation_id} "
+                                   f"({remaining:.2f}s left, backoff {delay:.2f}s)")
+                    break
                 logger.debug(f"Waiting {delay:.2f}s before retry attempt {attempt_num}")
                 await asyncio.sleep(delay)
             else:
@@ -227,12 +384,13 @@ class RetrySystem:
             try:
                 # Execute the operation
                 start_time = datetime.now()
-                result = await operation()
+                result = await self._run_attempt(operation, operation_type, policy, attempt)
                 end_time = datetime.now()
 
                 # Success!
                 attempt.success = True
                 attempt.response_time = (end_time - start_time).total_seconds()
+                self._record_latency(operation_type, attempt.response_time)
                 session.attempts.append(attempt)
                 session.total_attempts = attempt_num
                 session.final_success = True
@@ -242,8 +400,7 @@ class RetrySystem:
                 self._record_success(circuit_key, policy)
 
                 # Complete session
-                self.retry_sessions.append(session)
-                del self.active_sessions[operation_id]
+                self._complete_session(session)
 
                 logger.info(f"Operation {operation_id} succeeded on attempt {attempt_num}")
                 return result
@@ -254,6 +411,10 @@ class RetrySystem:
                 attempt.response_time = (datetime.now() - start_time).total_seconds()
                 session.attempts.append(attempt)
 
+                if isinstance(e, DeadlineExceededError):
+                    logger.warning(f"Latency budget exhausted for {operation_id} on attempt {attempt_num}")
+                    break
+
                 # Check if this exception is retryable
                 if not self._is_retryable_exception(e, policy):
                     logger.warning(f"Non-retryable exception for {operation_id}: {e}")
@@ -275,8 +436,7 @@ class RetrySystem:
         session.end_time = datetime.now()
 
         # Complete session
-        self.retry_sessions.append(session)
-        del self.active_sessions[operation_id]
+        self._complete_session(session)
 
         logger.error(f"Operation {operation_id} failed after {session.total_attempts} attempts")
 
@@ -292,56 +452,68 @@ class RetrySystem:
 
     def get_circuit_breaker_status(self, operation_key: str) -> CircuitBreakerState:
         """Get current circuit breaker status"""
-        return self.circuit_breakers.get(operation_key, CircuitBreakerState())
+        return self._current_circuit(operation_key) or CircuitBreakerState()
 
     def reset_circuit_breaker(self, operation_key: str) -> None:
         """Manually reset a circuit breaker"""
         if operation_key in self.circuit_breakers:
             self.circuit_breakers[operation_key] = CircuitBreakerState()
+            self._dirty_circuits.add(operation_key)
             logger.info(f"Reset circuit breaker for {operation_key}")
 
+    def collect_metrics(self, builder: MetricsBuilder) -> None:
+        """Write circuit breaker states and retry outcomes into a metrics scrape"""
+        now = time.monotonic()
+        for circuit_key, circuit in list(self.circuit_breakers.items()):
+            state = circuit.state
+            if state == CircuitState.OPEN and (circuit.open_until is None or now >= circuit.open_until):
+                state = CircuitState.HALF_OPEN  # What the next access will see
+            for candidate in CircuitState:
+                builder.gauge("character_music_circuit_breaker_state", "1 for the current state of each circuit breaker",
+                              int(candidate == state), circuit=circuit_key, state=candidate.value)
+
+        for operation_type, stats in list(self.operation_stats.items()):
+            builder.counter("character_music_retry_sessions", "Completed retry sessions by outcome",
+                            stats.successful, operation_type=operation_type, outcome="success")
+            builder.counter("character_music_retry_sessions", "Completed retry sessions by outcome",
+                            stats.failed, operation_type=operation_type, outcome="error")
+            builder.counter("character_music_retry_attempts", "Attempts made by completed retry sessions",
+                            stats.attempts, operation_type=operation_type)
+        builder.counter("character_music_retry_hedges", "Hedged attempts launched", self.hedge_stats['hedges_launched'])
+
     def get_retry_statistics(self) -> Dict[str, Any]:
-        """Get comprehensive retry statistics"""
-        if not self.retry_sessions:
+        """
+        Get comprehensive retry statistics
+
+        Totals cover every session since start-up; recent failures come from
+        the last MAX_RETRY_SESSIONS sessions kept in memory.
+        """
+        total_sessions = sum(totals.sessions for totals in self.operation_stats.values())
+        if not total_sessions:
             return {'total_sessions': 0}
 
+        successful = sum(totals.successful for totals in self.operation_stats.values())
+        attempts = sum(totals.attempts for totals in self.operation_stats.values())
+        duration = sum(totals.total_duration for totals in self.operation_stats.values())
+
         stats = {
-            'total_sessions': len(self.retry_sessions),
-            'success_rate': 0.0,
-            'average_attempts': 0.0,
-            'average_duration': 0.0,
-            'operations_by_type': {},
+            'total_sessions': total_sessions,
+            'success_rate': successful / total_sessions,
+            'average_attempts': attempts / total_sessions,
+            'average_duration': duration / total_sessions,
+            'operations_by_type': {
+                op_type: {'total': totals.sessions, 'successful': totals.successful, 'failed': totals.failed}
+                for op_type, totals in self.operation_stats.items()
+            },
             'circuit_breaker_states': {},
             'recent_failures': [],
-            'retry_patterns': {}
+            'retry_patterns': {},
+            'hedging': dict(self.hedge_stats)
         }
 
-        # Calculate basic statistics
-        successful_sessions = [s for s in self.retry_sessions if s.final_success]
-        stats['success_rate'] = len(successful_sessions) / len(self.retry_sessions)
-        stats['average_attempts'] = sum(s.total_attempts for s in self.retry_sessions) / len(self.retry_sessions)
-
-        # Calculate average duration
-        durations = [s.duration.total_seconds() for s in self.retry_sessions if s.duration]
-        if durations:
-            stats['average_duration'] = sum(durations) / len(durations)
-
-        # Operations by type
-        for session in self.retry_sessions:
-            op_type = session.operation_type.value
-            if op_type not in stats['operations_by_type']:
-                stats['operations_by_type'][op_type] = {
-                    'total': 0, 'successful': 0, 'failed': 0
-                }
-
-            stats['operations_by_type'][op_type]['total'] += 1
-            if session.final_success:
-                stats['operations_by_type'][op_type]['successful'] += 1
-            else:
-                stats['operations_by_type'][op_type]['failed'] += 1
-
         # Circuit breaker states
-        for key, state in self.circuit_breakers.items():
+        for key in list(self.circuit_breakers):
+            state = self._current_circuit(key)
             stats['circuit_breaker_states'][key] = {
                 'state': state.state.value,
                 'failure_count': state.failure_count,
@@ -349,19 +521,18 @@ class RetrySystem:
                 'last_failure': state.last_failure_time.isoformat() if state.last_failure_time else None
             }
 
-        # Recent failures
-        failed_sessions = [s for s in self.retry_sessions if not s.final_success]
-        recent_failures = sorted(failed_sessions, key=lambda x: x.start_time, reverse=True)[:10]
-        stats['recent_failures'] = [
-            {
-                'operation_id': s.operation_id,
-                'operation_type': s.operation_type.value,
-                'start_time': s.start_time.isoformat(),
-                'attempts': s.total_attempts,
-                'final_error': s.attempts[-1].error if s.attempts else None
-            }
-            for s in recent_failures
-        ]
+        # Recent failures, newest first
+        for record in reversed(self.retry_sessions):
+            if len(stats['recent_failures']) == 10:
+                break
+            if not record.final_success:
+                stats['recent_failures'].append({
+                    'operation_id': record.operation_id,
+                    'operation_type': record.operation_type.value,
+                    'start_time': record.start_time.isoformat(),
+                    'attempts': record.total_attempts,
+                    'final_error': record.final_error
+                })
 
         return stats
 
@@ -395,6 +566,100 @@ class RetrySystem:
 
     # Private methods
 
+    def _complete_session(self, session: RetrySession) -> None:
+        """Fold a finished session into the session ring, the totals and the unsaved log entries"""
+        record = session.to_record()
+        self.retry_sessions.append(record)
+        self._unsaved_sessions.append(record)
+
+        totals = self.operation_stats.get(record.operation_type.value)
+        if totals is None:
+            totals = self.operation_stats[record.operation_type.value] = OperationRetryStats()
+        totals.add(record)
+
+        self.active_sessions.pop(session.operation_id, None)
+
+    def _current_circuit(self, circuit_key: str) -> Optional[CircuitBreakerState]:
+        """Circuit breaker for a key, moved from OPEN to HALF_OPEN once its recovery timeout has passed"""
+        circuit = self.circuit_breakers.get(circuit_key)
+        if (circuit is not None and circuit.state == CircuitState.OPEN and
+                (circuit.open_until is None or time.monotonic() >= circuit.open_until)):
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.success_count = 0
+            circuit.open_until = None
+            self._dirty_circuits.add(circuit_key)
+            logger.info(f"Circuit breaker for {circuit_key} moved to HALF_OPEN")
+        return circuit
+
+    async def _run_attempt(self, operation: Callable[[], Awaitable[Any]],
+                           operation_type: OperationType,
+                           policy: RetryPolicy,
+                           attempt: RetryAttempt) -> Any:
+        """
+        Run one attempt within the latency budget, hedged if the policy asks for it
+
+        A hedge is a second call of the operation launched when the first
+        has not finished after the hedge delay. The first success wins and
+        the other call is cancelled; the attempt fails only when both do.
+        """
+        hedge_delay = self._hedge_delay(operation_type, policy)
+        remaining = remaining_budget()
+        if hedge_delay is None or (remaining is not None and hedge_delay >= remaining):
+            if remaining is None:
+                return await operation()
+            try:
+                return await asyncio.wait_for(operation(), timeout=remaining)
+            except asyncio.TimeoutError:
+                # Also the builtin TimeoutError: only a spent budget is a deadline, not the operation's own timeout
+                if remaining_budget() > 0:
+                    raise
+                raise DeadlineExceededError("Latency budget exhausted during attempt") from None
+
+        primary = asyncio.ensure_future(operation())
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_delay)
+            if not done:
+                attempt.hedged = True
+                self.hedge_stats['hedges_launched'] += 1
+                pending.add(asyncio.ensure_future(operation()))
+
+            last_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining_budget(), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise DeadlineExceededError("Latency budget exhausted during hedged attempt")
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedge_stats['hedge_wins'] += 1
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _hedge_delay(self, operation_type: OperationType, policy: RetryPolicy) -> Optional[float]:
+        """Delay before a hedged attempt: the policy's latency quantile of recent successes"""
+        if not policy.hedge:
+            return None
+        samples = self.latency_samples.get(operation_type.value)
+        if not samples or len(samples) < policy.hedge_min_samples:
+            return policy.hedge_delay
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(policy.hedge_quantile * len(ordered)))
+        return ordered[rank - 1]
+
+    def _record_latency(self, operation_type: OperationType, seconds: float) -> None:
+        """Remember the latency of a successful attempt for hedge delays"""
+        samples = self.latency_samples.get(operation_type.value)
+        if samples is None:
+            samples = self.latency_samples[operation_type.value] = deque(maxlen=HEDGE_LATENCY_WINDOW)
+        samples.append(seconds)
+
     def _setup_default_policies(self) -> None:
         """Setup default retry policies"""
         # Default policy - exponential backoff
@@ -504,30 +769,12 @@ class RetrySystem:
         if policy.strategy != RetryStrategy.CIRCUIT_BREAKER:
             return True  # No circuit breaker for this policy
 
-        if circuit_key not in self.circuit_breakers:
-            self.circuit_breakers[circuit_key] = CircuitBreakerState()
-
-        circuit = self.circuit_breakers[circuit_key]
-        now = datetime.now()
-
-        if circuit.state == CircuitState.CLOSED:
-            return True
-
-        elif circuit.state == CircuitState.OPEN:
-            # Check if recovery timeout has passed
-            if (circuit.last_failure_time and
-                now - circuit.last_failure_time > timedelta(seconds=policy.recovery_timeout)):
-                # Move to half-open state
-                circuit.state = CircuitState.HALF_OPEN
-                circuit.success_count = 0
-                logger.info(f"Circuit breaker for {circuit_key} moved to HALF_OPEN")
-                return True
-            return False
-
-        elif circuit.state == CircuitState.HALF_OPEN:
-            return True  # Allow attempts in half-open state
+        circuit = self._current_circuit(circuit_key)
+        if circuit is None:
+            circuit = self.circuit_breakers[circuit_key] = CircuitBreakerState()
 
-        return False
+        # HALF_OPEN allows attempts to test whether the service recovered
+        return circuit.state != CircuitState.OPEN
 
     def _record_success(self, circuit_key: str, policy: RetryPolicy) -> None:
         """Record a successful operation for circuit breaker"""
@@ -540,6 +787,7 @@ class RetrySystem:
         circuit = self.circuit_breakers[circuit_key]
         circuit.success_count += 1
         circuit.last_success_time = datetime.now()
+        self._dirty_circuits.add(circuit_key)
 
         if circuit.state == CircuitState.HALF_OPEN:
             if circuit.success_count >= policy.success_threshold:
@@ -564,109 +812,163 @@ class RetrySystem:
         circuit = self.circuit_breakers[circuit_key]
         circuit.failure_count += 1
         circuit.last_failure_time = datetime.now()
+        self._dirty_circuits.add(circuit_key)
 
         if circuit.state == CircuitState.HALF_OPEN:
             # Failure in half-open state - go back to open
-            circuit.state = CircuitState.OPEN
-            circuit.success_count = 0
+            self._open_circuit(circuit, policy)
             logger.warning(f"Circuit breaker for {circuit_key} returned to OPEN state")
 
         elif circuit.state == CircuitState.CLOSED:
             if circuit.failure_count >= policy.failure_threshold:
                 # Open the circuit
-                circuit.state = CircuitState.OPEN
-                circuit.next_attempt_time = datetime.now() + timedelta(seconds=policy.recovery_timeout)
+                self._open_circuit(circuit, policy)
                 logger.error(f"Circuit breaker for {circuit_key} OPENED after {circuit.failure_count} failures")
 
-    async def _circuit_breaker_monitor(self) -> None:
-        """Background task to monitor circuit breaker states"""
-        while True:
-            try:
-                await asyncio.sleep(30)  # Check every 30 seconds
-
-                now = datetime.now()
-                for circuit_key, circuit in self.circuit_breakers.items():
-                    if (circuit.state == CircuitState.OPEN and
-                        circuit.next_attempt_time and
-                        now >= circuit.next_attempt_time):
-
-                        # Time to try half-open
-                        circuit.state = CircuitState.HALF_OPEN
-                        circuit.success_count = 0
-                        logger.info(f"Circuit breaker for {circuit_key} automatically moved to HALF_OPEN")
-
-            except Exception as e:
-                logger.error(f"Error in circuit breaker monitor: {e}")
-
-    async def _cleanup_old_sessions(self) -> None:
-        """Background task to cleanup old retry sessions"""
-        while True:
-            try:
-                await asyncio.sleep(3600)  # Cleanup every hour
-
-                # Keep only sessions from last 24 hours
-                cutoff_time = datetime.now() - timedelta(hours=24)
-                self.retry_sessions = [
-                    session for session in self.retry_sessions
-                    if session.start_time > cutoff_time
-                ]
-
-                logger.debug(f"Cleaned up old retry sessions, {len(self.retry_sessions)} remaining")
+    @staticmethod
+    def _open_circuit(circuit: CircuitBreakerState, policy: RetryPolicy) -> None:
+        """Open a circuit until the policy's recovery timeout has passed"""
+        circuit.state = CircuitState.OPEN
+        circuit.success_count = 0
+        circuit.open_until = time.monotonic() + policy.recovery_timeout
+        circuit.next_attempt_time = datetime.now() + timedelta(seconds=policy.recovery_timeout)
+
+    @staticmethod
+    def _circuit_to_dict(key: str, state: CircuitBreakerState) -> Dict[str, Any]:
+        """Log entry for a circuit breaker"""
+        return {
+            'key': key,
+            'state': state.state.value,
+            'failure_count': state.failure_count,
+            'success_count': state.success_count,
+            'last_failure_time': state.last_failure_time.isoformat() if state.last_failure_time else None,
+            'last_success_time': state.last_success_time.isoformat() if state.last_success_time else None,
+            'next_attempt_time': state.next_attempt_time.isoformat() if state.next_attempt_time else None
+        }
 
-            except Exception as e:
-                logger.error(f"Error in session cleanup: {e}")
+    @staticmethod
+    def _circuit_from_dict(data: Dict[str, Any]) -> CircuitBreakerState:
+        """Circuit breaker from a log entry, with its wall-clock recovery time made monotonic"""
+        state = CircuitBreakerState(
+            state=CircuitState(data['state']),
+            failure_count=data['failure_count'],
+            success_count=data['success_count'],
+            last_failure_time=datetime.fromisoformat(data['last_failure_time']) if data.get('last_failure_time') else None,
+            last_success_time=datetime.fromisoformat(data['last_success_time']) if data.get('last_success_time') else None,
+            next_attempt_time=datetime.fromisoformat(data['next_attempt_time']) if data.get('next_attempt_time') else None
+        )
+        if state.state == CircuitState.OPEN and state.next_attempt_time:
+            wait = (state.next_attempt_time - datetime.now()).total_seconds()
+            state.open_until = time.monotonic() + max(0.0, wait)
+        return state
+
+    @staticmethod
+    def _append_lines(path: Path, lines: List[str]) -> int:
+        """Append lines to a log file, returning how many were written"""
+        if lines:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(''.join(line + '\n' for line in lines))
+        return len(lines)
+
+    @staticmethod
+    def _truncate_torn_line(path: Path) -> None:
+        """Cut a log file back to its last complete line, so the next append starts on a fresh line"""
+        with open(path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                f.truncate(position)
+                logger.warning(f"Dropped a torn line at the end of {path.name}")
+
+    @staticmethod
+    def _rewrite_lines(path: Path, lines: List[str]) -> None:
+        """Replace a log file with the given lines in one step"""
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(''.join(line + '\n' for line in lines))
+        temp_path.replace(path)
 
     async def _load_state(self) -> None:
         """Load previous state from disk"""
-        # Load circuit breaker states
-        circuit_file = self.storage_path / "circuit_breakers.json"
-        if circuit_file.exists():
-            try:
-                with open(circuit_file, 'r') as f:
+        # Replay the circuit breaker log; the last entry for a key wins
+        circuit_log = self.storage_path / "circuit_breakers.jsonl"
+        legacy_file = self.storage_path / "circuit_breakers.json"
+        try:
+            if circuit_log.exists():
+                self._truncate_torn_line(circuit_log)  # Left by an interrupted append
+                with open(circuit_log, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        self._circuit_log_lines += 1
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        self.circuit_breakers[entry['key']] = self._circuit_from_dict(entry)
+            elif legacy_file.exists():
+                with open(legacy_file, 'r') as f:
                     circuit_data = json.load(f)
-
                 for key, data in circuit_data.items():
-                    state = CircuitBreakerState(
-                        state=CircuitState(data['state']),
-                        failure_count=data['failure_count'],
-                        success_count=data['success_count'],
-                        last_failure_time=datetime.fromisoformat(data['last_failure_time']) if data.get('last_failure_time') else None,
-                        last_success_time=datetime.fromisoformat(data['last_success_time']) if data.get('last_success_time') else None,
-                        next_attempt_time=datetime.fromisoformat(data['next_attempt_time']) if data.get('next_attempt_time') else None
-                    )
-                    self.circuit_breakers[key] = state
-
-                logger.debug(f"Loaded {len(self.circuit_breakers)} circuit breaker states")
-            except Exception as e:
-                logger.warning(f"Failed to load circuit breaker states: {e}")
+                    self.circuit_breakers[key] = self._circuit_from_dict(data)
+                self._dirty_circuits.update(self.circuit_breakers)
 
-    async def save_state(self) -> None:
-        """Save current state to disk"""
-        if not self.initialized:
-            return
+            logger.debug(f"Loaded {len(self.circuit_breakers)} circuit breaker states")
+        except Exception as e:
+            logger.warning(f"Failed to load circuit breaker states: {e}")
 
-        # Save circuit breaker states
-        circuit_file = self.storage_path / "circuit_breakers.json"
-        circuit_data = {}
-        for key, state in self.circuit_breakers.items():
-            circuit_data[key] = {
-                'state': state.state.value,
-                'failure_count': state.failure_count,
-                'success_count': state.success_count,
-                'last_failure_time': state.last_failure_time.isoformat() if state.last_failure_time else None,
-                'last_success_time': state.last_success_time.isoformat() if state.last_success_time else None,
-                'next_attempt_time': state.next_attempt_time.isoformat() if state.next_attempt_time else None
-            }
+        session_log = self.storage_path / "retry_sessions.jsonl"
+        if session_log.exists():
+            self._truncate_torn_line(session_log)
+            with open(session_log, 'r', encoding='utf-8') as f:
+                self._session_log_lines = sum(1 for _ in f)
 
-        with open(circuit_file, 'w') as f:
-            json.dump(circuit_data, f, indent=2)
+    async def save_state(self) -> None:
+        """
+        Save current state to disk
 
-        # Save recent retry sessions
-        sessions_file = self.storage_path / "retry_sessions.json"
-        recent_sessions = self.retry_sessions[-100:]  # Keep last 100 sessions
-        sessions_data = [session.to_dict() for session in recent_sessions]
+        Appends the sessions completed and the circuits changed since the last
+        save to retry_sessions.jsonl and circuit_breakers.jsonl. A log that has
+        grown to LOG_COMPACTION_FACTOR times what it needs to keep is rewritten:
+        the session log down to its last MAX_RETRY_SESSIONS records and the
+        circuit log to one entry per circuit.
+        """
+        if not self.initialized:
+            return
 
-        with open(sessions_file, 'w') as f:
-            json.dump(sessions_data, f, indent=2)
+        # Append changed circuit breakers
+        circuit_log = self.storage_path / "circuit_breakers.jsonl"
+        dirty = sorted(key for key in self._dirty_circuits if key in self.circuit_breakers)
+        self._circuit_log_lines += self._append_lines(circuit_log, [
+            json.dumps(self._circuit_to_dict(key, self.circuit_breakers[key]), separators=(',', ':'))
+            for key in dirty
+        ])
+        self._dirty_circuits.clear()
+
+        if self._circuit_log_lines > LOG_COMPACTION_FACTOR * max(len(self.circuit_breakers), MIN_COMPACTED_CIRCUITS):
+            self._rewrite_lines(circuit_log, [
+                json.dumps(self._circuit_to_dict(key, state), separators=(',', ':'))
+                for key, state in self.circuit_breakers.items()
+            ])
+            self._circuit_log_lines = len(self.circuit_breakers)
+
+        # Append completed retry sessions
+        session_log = self.storage_path / "retry_sessions.jsonl"
+        self._session_log_lines += self._append_lines(session_log, [
+            json.dumps(record.to_dict(), separators=(',', ':')) for record in self._unsaved_sessions
+        ])
+        self._unsaved_sessions.clear()
+
+        if self._session_log_lines > LOG_COMPACTION_FACTOR * MAX_RETRY_SESSIONS:
+            with open(session_log, 'r', encoding='utf-8') as f:
+                kept = deque((line.rstrip('\n') for line in f), maxlen=MAX_RETRY_SESSIONS)
+            self._rewrite_lines(session_log, list(kept))
+            self._session_log_lines = len(kept)
 
         logger.debug("Saved retry system state to disk")
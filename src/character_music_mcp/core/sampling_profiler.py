@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Sampling Profiler for Slow Tool Calls
+
+This module profiles a configurable fraction of MCP tool calls with a
+statistical sampler and keeps the profiles of the slow ones. While a sampled
+call runs, a background thread reads the stack of the thread running it
+(sys._current_frames) every few milliseconds, so profiles show wall-clock
+time. Samples taken while the call's own coroutine is on the stack are
+recorded under the tool's name. While the call is suspended, the event loop
+thread is either running other tasks, which include tasks the call started
+(e.g. shared single-flight work) as well as concurrent requests, recorded
+under <other tasks>, or waiting for I/O, recorded as <idle>.
+
+A call slower than the threshold keeps a collapsed-stack flamegraph file
+(flamegraph.pl / speedscope "folded" format) and a JSON summary with its top
+self-time functions. Profiles on disk are rotated by count and total size.
+
+Profiling is off by default (sample rate 0), when a call costs one attribute
+check.
+"""
+
+import asyncio
+import asyncio.events
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+from metrics_exposition import MetricsBuilder, get_metrics_registry
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Fraction of tool calls profiled (0 disables profiling)
+DEFAULT_PROFILE_SAMPLE_RATE = 0.0
+
+# Profiled calls slower than this (seconds) keep their profile
+DEFAULT_SLOW_CALL_THRESHOLD = 1.0
+
+# Seconds between stack samples
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Functions listed in a profile's self-time summary
+DEFAULT_TOP_FUNCTIONS = 20
+
+# Profiles kept on disk, and their total size, before the oldest are rotated out
+DEFAULT_MAX_PROFILES = 50
+DEFAULT_MAX_PROFILE_BYTES = 20 * 1024 * 1024
+
+# Innermost frames kept per sample
+MAX_STACK_DEPTH = 128
+
+# Frame under which samples of other event loop tasks are recorded while the call is suspended
+OTHER_TASKS_FRAME = "<other tasks>"
+
+# Frame recorded for samples taken while the call is suspended and the thread runs no task
+IDLE_FRAME = "<idle>"
+
+# Event loop frame that every task step and callback runs below
+_LOOP_CALLBACK_CODE = asyncio.events.Handle._run.__code__
+
+# Profile ids are generated by ProfileStore; anything else is rejected
+_PROFILE_ID_PATTERN = re.compile(r"^[0-9]{8}T[0-9]{6}-[A-Za-z0-9_.-]+-[0-9a-f]{8}$")
+
+# ================================================================================================
+# SAMPLING
+# ================================================================================================
+
+class ProfileSession:
+    """Stack samples of one profiled call"""
+    __slots__ = ("tool", "thread_id", "anchor", "stacks", "samples", "started_at")
+
+    def __init__(self, tool: str, anchor: FrameType):
+        self.tool = tool
+        self.thread_id = threading.get_ident()
+        self.anchor = anchor
+        self.stacks: Dict[Tuple[str, ...], int] = {}  # Root-first frame labels -> samples
+        self.samples = 0
+        self.started_at = datetime.now()
+
+    def add_sample(self, stack: Tuple[str, ...]) -> None:
+        self.stacks[stack] = self.stacks.get(stack, 0) + 1
+        self.samples += 1
+
+    def collapsed_stacks(self) -> str:
+        """One "frame;frame;frame count" line per distinct stack"""
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+    def top_functions(self, duration: float, limit: int = DEFAULT_TOP_FUNCTIONS) -> List[Dict[str, Any]]:
+        """Functions with the most self (leaf) samples, with the share of the call they account for"""
+        self_samples: Dict[str, int] = {}
+        for stack, count in self.stacks.items():
+            self_samples[stack[-1]] = self_samples.get(stack[-1], 0) + count
+
+        ranked = sorted(self_samples.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [{
+            "function": function,
+            "self_samples": count,
+            "self_percent": round(100.0 * count / self.samples, 1),
+            "self_ms": round(1000.0 * duration * count / self.samples, 1)
+        } for function, count in ranked]
+
+class StackSampler:
+    """Background thread sampling the stacks of the active profile sessions"""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self._sessions: List[ProfileSession] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._labels: Dict[CodeType, str] = {}
+
+    def add(self, session: ProfileSession) -> None:
+        """Start sampling a session, starting the thread if it is idle"""
+        with self._lock:
+            self._sessions.append(session)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tool-profiler", daemon=True)
+                self._thread.start()
+
+    def remove(self, session: ProfileSession) -> None:
+        """Stop sampling a session; its samples are complete once this returns"""
+        with self._lock:
+            self._sessions.remove(session)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._sessions:
+                    self._thread = None  # The next add() starts a new thread
+                    return
+                frames = sys._current_frames()
+                for session in self._sessions:
+                    session.add_sample(self._stack(session, frames.get(session.thread_id)))
+            del frames
+            time.sleep(self.interval)
+
+    def _stack(self, session: ProfileSession, frame: Optional[FrameType]) -> Tuple[str, ...]:
+        labels: List[str] = []
+        while frame is not None:
+            if frame is session.anchor:
+                labels.append(self._label(frame.f_code))
+                labels.append(session.tool)
+                break
+            if frame.f_code is _LOOP_CALLBACK_CODE:
+                labels.append(OTHER_TASKS_FRAME)
+                labels.append(session.tool)
+                break
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        else:
+            return (session.tool, IDLE_FRAME)
+        labels.reverse()
+        if len(labels) > MAX_STACK_DEPTH:
+            # Keep the tool label as the root and the innermost frames, where the self time is
+            labels[1:] = labels[len(labels) - MAX_STACK_DEPTH + 1:]
+        return tuple(labels)
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = self._labels[code] = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+# ================================================================================================
+# STORAGE
+# ================================================================================================
+
+class ProfileStore:
+    """Slow-call profiles on disk, rotated by count and total size"""
+
+    def __init__(self, directory: str = "./data/profiles", max_profiles: int = DEFAULT_MAX_PROFILES,
+                 max_bytes: int = DEFAULT_MAX_PROFILE_BYTES):
+        self.directory = Path(directory)
+        self.max_profiles = max_profiles
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def save(self, session: ProfileSession, duration: float,
+             top_n: int = DEFAULT_TOP_FUNCTIONS) -> Dict[str, Any]:
+        """Write a session's flamegraph and summary, then rotate; returns the summary"""
+        safe_tool = re.sub(r"[^A-Za-z0-9_.-]", "_", session.tool)
+        profile_id = f"{session.started_at.strftime('%Y%m%dT%H%M%S')}-{safe_tool}-{uuid.uuid4().hex[:8]}"
+        summary = {
+            "profile_id": profile_id,
+            "tool": session.tool,
+            "started_at": session.started_at.isoformat(),
+            "duration_ms": round(duration * 1000, 1),
+            "samples": session.samples,
+            "top_functions": session.top_functions(duration, top_n),
+            "flamegraph_file": f"{profile_id}.folded"
+        }
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / f"{profile_id}.folded").write_text(session.collapsed_stacks(), encoding="utf-8")
+            (self.directory / f"{profile_id}.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
+            self._rotate()
+        return summary
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        """Summaries of the kept profiles, newest first"""
+        summaries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                summaries.append(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue  # Rotated out or half-written meanwhile
+        summaries.sort(key=lambda summary: summary.get("started_at", ""), reverse=True)
+        return summaries
+
+    def read_flamegraph(self, profile_id: str) -> Optional[str]:
+        """Collapsed stacks of a kept profile, or None if there is no such profile"""
+        if not _PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        try:
+            return (self.directory / f"{profile_id}.folded").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _rotate(self) -> None:
+        profiles = []
+        for summary_path in self.directory.glob("*.json"):
+            files = [summary_path, summary_path.with_suffix(".folded")]
+            stats = [path.stat() for path in files if path.exists()]
+            profiles.append((stats[0].st_mtime_ns, files, sum(stat.st_size for stat in stats)))
+        profiles.sort(key=lambda profile: profile[0])  # Oldest first
+
+        total_bytes = sum(size for _, _, size in profiles)
+        while profiles and (len(profiles) > self.max_profiles or total_bytes > self.max_bytes):
+            _, files, size = profiles.pop(0)
+            for path in files:
+                path.unlink(missing_ok=True)
+            total_bytes -= size
+
+# ================================================================================================
+# TOOL PROFILER
+# ================================================================================================
+
+# Session of the call profiled in the current context, so nested profiling of the same call is skipped
+_current_session: ContextVar[Optional[ProfileSession]] = ContextVar("current_profile_session", default=None)
+
+class _ProfileScope:
+    """Profiles the awaiting coroutine for the duration of an async with block"""
+    __slots__ = ("profiler", "tool", "session", "token", "start")
+
+    def __init__(self, profiler: 'ToolProfiler', tool: str):
+        self.profiler = profiler
+        self.tool = tool
+        self.session: Optional[ProfileSession] = None
+
+    async def __aenter__(self) -> Optional[ProfileSession]:
+        if _current_session.get() is not None or random.random() >= self.profiler.sample_rate:
+            return None
+        # The coroutine running "async with": samples with its frame on the stack are the call's own work
+        self.session = ProfileSession(self.tool, sys._getframe(1))
+        self.token = _current_session.set(self.session)
+        self.profiler.sampler.add(self.session)
+        self.start = time.perf_counter()
+        return self.session
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        session = self.session
+        if session is None:
+            return
+        duration = time.perf_counter() - self.start
+        self.profiler.sampler.remove(session)
+        _current_session.reset(self.token)
+        session.anchor = None  # Frames must not outlive the call
+        await self.profiler.finish(session, duration)
+
+class _NotProfiled:
+    """Stands in for a profile scope while profiling is off"""
+    __slots__ = ()
+
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+_NOT_PROFILED = _NotProfiled()
+
+class ToolProfiler:
+    """Samples a fraction of tool calls and keeps the profiles of slow ones"""
+
+    def __init__(self, sample_rate: float = DEFAULT_PROFILE_SAMPLE_RATE,
+                 threshold_seconds: float = DEFAULT_SLOW_CALL_THRESHOLD,
+                 interval: float = DEFAULT_SAMPLE_INTERVAL,
+                 top_n: int = DEFAULT_TOP_FUNCTIONS,
+                 output_dir: str = "./data/profiles",
+                 max_profiles: int = DEFAULT_MAX_PROFILES,
+                 max_bytes: int = DEFAULT_MAX_PROFILE_BYTES):
+        self.sample_rate = sample_rate
+        self.threshold_seconds = threshold_seconds
+        self.top_n = top_n
+        self.sampler = StackSampler(interval)
+        self.store = ProfileStore(output_dir, max_profiles, max_bytes)
+
+        # Profiled calls by whether their profile was kept
+        self.calls: Dict[str, int] = {"kept": 0, "discarded": 0}
+
+        get_metrics_registry().register(self)
+
+    def configure(self, sample_rate: Optional[float] = None, threshold_seconds: Optional[float] = None,
+                  interval: Optional[float] = None, top_n: Optional[int] = None,
+                  output_dir: Optional[str] = None, max_profiles: Optional[int] = None,
+                  max_bytes: Optional[int] = None) -> None:
+        """Change the settings that are given; calls already being profiled are unaffected"""
+        if sample_rate is not None:
+            self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        if threshold_seconds is not None:
+            self.threshold_seconds = threshold_seconds
+        if interval is not None:
+            self.sampler.interval = interval
+        if top_n is not None:
+            self.top_n = top_n
+        if output_dir is not None:
+            self.store = ProfileStore(output_dir, self.store.max_profiles, self.store.max_bytes)
+        if max_profiles is not None:
+            self.store.max_profiles = max_profiles
+        if max_bytes is not None:
+            self.store.max_bytes = max_bytes
+
+    def profile(self, tool: str):
+        """
+        Async context manager profiling a sampled fraction of calls
+
+        Must be entered directly by the coroutine whose work is profiled.
+        Inside a call that is already being profiled it does nothing.
+        """
+        if self.sample_rate <= 0.0:
+            return _NOT_PROFILED
+        return _ProfileScope(self, tool)
+
+    async def finish(self, session: ProfileSession, duration: float) -> Optional[Dict[str, Any]]:
+        """Keep a finished session's profile if the call was slow"""
+        if duration < self.threshold_seconds or not session.samples:
+            self.calls["discarded"] += 1
+            return None
+        try:
+            summary = await asyncio.to_thread(self.store.save, session, duration, self.top_n)
+        except OSError as e:
+            logger.error(f"Failed to save profile of slow {session.tool} call: {e}")
+            return None
+        self.calls["kept"] += 1
+        logger.info(f"Kept profile {summary['profile_id']} of {session.tool} call taking {duration:.2f}s")
+        return summary
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        """Summaries of the kept slow-call profiles, newest first"""
+        return self.store.list_profiles()
+
+    def collect_metrics(self, builder: MetricsBuilder) -> None:
+        """Write the profiling counts into a scrape"""
+        for outcome, count in list(self.calls.items()):
+            builder.counter("character_music_profiled_tool_calls", "Sampled tool calls by whether the profile was kept",
+                            count, outcome=outcome)
+
+# Global tool profiler
+_tool_profiler: Optional[ToolProfiler] = None
+
+def get_tool_profiler() -> ToolProfiler:
+    """Get or create the global tool profiler (off until configured with a sample rate)"""
+    global _tool_profiler
+    if _tool_profiler is None:
+        _tool_profiler = ToolProfiler()
+    return _tool_profiler
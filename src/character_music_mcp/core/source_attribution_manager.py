@@ -8,15 +8,21 @@ references to wiki content and proper tracking of content usage.
 
 import json
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
+
+from memory_diagnostics import get_memory_diagnostics
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Most recent usage records kept in memory and on disk
+MAX_USAGE_RECORDS = 10000
+
 # ================================================================================================
 # DATA MODELS
 # ================================================================================================
@@ -100,7 +106,7 @@ class SourceAttributionManager:
     def __init__(self, storage_path: str = "./data/attribution"):
         self.storage_path = Path(storage_path)
         self.sources: Dict[str, ContentSource] = {}
-        self.usage_records: List[UsageRecord] = []
+        self.usage_records: Deque[UsageRecord] = deque(maxlen=MAX_USAGE_RECORDS)
         self.initialized = False
 
         # Attribution templates for different content types
@@ -112,6 +118,8 @@ class SourceAttributionManager:
             'mixed': "Information sourced from multiple wiki pages: {sources}"
         }
 
+        get_memory_diagnostics().register(self, "sources", "usage_records")
+
     async def initialize(self) -> None:
         """Initialize the attribution manager"""
         logger.info("Initializing SourceAttributionManager")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Shared Text View
+
+This module provides TextView, an immutable view of one piece of text that
+derives its lowercased form, word tokens, sentences, paragraphs and character
+counts on first use and keeps them. The concept and beat helpers each used to
+lowercase and split the same text again; they now take one TextView created
+per request, so each derived view is computed exactly once.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Iterable, Tuple, Union
+
+
+@dataclass(frozen=True)
+class TextView:
+    """Immutable text with lazily derived, cached views of it"""
+    original: str
+    _phrase_hits: Dict[str, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def of(cls, text: Union[str, 'TextView']) -> 'TextView':
+        """Return text unchanged if it is already a view, else a new view of it"""
+        return text if isinstance(text, TextView) else cls(text)
+
+    @cached_property
+    def lowered(self) -> str:
+        """Lowercased text"""
+        return self.original.lower()
+
+    @cached_property
+    def tokens(self) -> Tuple[str, ...]:
+        """Whitespace-separated words of the text"""
+        return tuple(self.original.split())
+
+    @cached_property
+    def lowered_tokens(self) -> Tuple[str, ...]:
+        """Whitespace-separated words of the lowercased text"""
+        return tuple(self.lowered.split())
+
+    @cached_property
+    def sentences(self) -> Tuple[str, ...]:
+        """Stripped, non-empty pieces of the text between periods"""
+        return tuple(sentence.strip() for sentence in self.original.split('.') if sentence.strip())
+
+    @cached_property
+    def sentence_word_counts(self) -> Tuple[int, ...]:
+        """Number of words in each of the sentences"""
+        return tuple(len(sentence.split()) for sentence in self.sentences)
+
+    @cached_property
+    def paragraphs(self) -> Tuple[str, ...]:
+        """Stripped, non-empty blocks of the text between blank lines"""
+        return tuple(paragraph.strip() for paragraph in self.original.split('\n\n') if paragraph.strip())
+
+    @cached_property
+    def _character_counts(self) -> Counter:
+        return Counter(self.original)
+
+    def __len__(self) -> int:
+        return len(self.original)
+
+    def count(self, character: str) -> int:
+        """Occurrences of a single character in the text"""
+        return self._character_counts[character]
+
+    def contains(self, phrase: str) -> bool:
+        """Whether a lowercase phrase occurs anywhere in the lowercased text"""
+        hit = self._phrase_hits.get(phrase)
+        if hit is None:
+            hit = self._phrase_hits[phrase] = phrase in self.lowered
+        return hit
+
+    def contains_any(self, phrases: Iterable[str]) -> bool:
+        """Whether any of the lowercase phrases occurs in the lowercased text"""
+        return any(self.contains(phrase) for phrase in phrases)
+
+    def count_present(self, phrases: Iterable[str]) -> int:
+        """Number of the lowercase phrases that occur in the lowercased text"""
+        return sum(1 for phrase in phrases if self.contains(phrase))
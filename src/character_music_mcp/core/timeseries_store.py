@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Local Time-Series Store for Performance Metrics
+
+This module keeps the latency and outcome of every recorded operation on disk so
+performance history survives restarts and can be queried by time range:
+
+- Raw points are buffered in memory as numeric columns and appended by flush()
+  to one segment file per operation and hour, as blocks of packed columns
+  (timestamps, durations, success flags).
+- Points are rolled up per operation into 1-minute and 1-hour summaries holding
+  counts, totals and a log-scale latency histogram. Summaries of the same
+  window merge by addition, so p50/p95/p99 can be read for any range.
+- compact() seals closed segments into a single block and drops segments and
+  rollups past their retention.
+
+record() only appends to the in-memory columns; flush(), compact() and the
+queries do file I/O and are meant to run off the event loop (asyncio.to_thread).
+"""
+
+import bisect
+import json
+import logging
+import math
+import re
+import struct
+import sys
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets: 100 us to ~1 h, x1.19 apart
+LATENCY_BUCKET_BOUNDS = tuple(1e-4 * 2 ** (i / 4) for i in range(102))
+
+# Retention of each resolution, in seconds
+RAW_RETENTION = 24 * 3600
+MINUTE_RETENTION = 7 * 24 * 3600
+HOUR_RETENTION = 90 * 24 * 3600
+
+# Most windows a single range query may return
+MAX_QUERY_WINDOWS = 10000
+
+# Segment block: magic and point count, followed by the packed columns
+BLOCK_HEADER = struct.Struct('<4sI')
+BLOCK_MAGIC = b'TSB1'
+
+# Characters allowed in the per-operation segment directory name
+UNSAFE_NAME_CHARS = re.compile(r'[^A-Za-z0-9_.-]')
+
+RESOLUTIONS = {"minute": 60, "hour": 3600}
+
+# ================================================================================================
+# DATA MODELS
+# ================================================================================================
+
+@dataclass(slots=True)
+class LatencySummary:
+    """Mergeable summary of the points of one operation in one window"""
+    count: int = 0
+    successes: int = 0
+    total_duration: float = 0.0
+    min_duration: float = math.inf
+    max_duration: float = 0.0
+    buckets: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, duration: float, success: bool) -> None:
+        """Count one point"""
+        self.count += 1
+        self.successes += success
+        self.total_duration += duration
+        self.min_duration = min(self.min_duration, duration)
+        self.max_duration = max(self.max_duration, duration)
+        index = bisect.bisect_left(LATENCY_BUCKET_BOUNDS, duration)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: 'LatencySummary') -> None:
+        """Add the points of another summary"""
+        self.count += other.count
+        self.successes += other.successes
+        self.total_duration += other.total_duration
+        self.min_duration = min(self.min_duration, other.min_duration)
+        self.max_duration = max(self.max_duration, other.max_duration)
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency quantile, accurate to one bucket (about 19%) and clipped to the observed range"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                bound = LATENCY_BUCKET_BOUNDS[index] if index < len(LATENCY_BUCKET_BOUNDS) else self.max_duration
+                return min(max(bound, self.min_duration), self.max_duration)
+        return self.max_duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'count': self.count,
+            'successes': self.successes,
+            'total_duration': self.total_duration,
+            'min_duration': self.min_duration,
+            'max_duration': self.max_duration,
+            'buckets': {str(index): count for index, count in self.buckets.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LatencySummary':
+        """Create from a dictionary written by to_dict"""
+        return cls(
+            count=data['count'],
+            successes=data['successes'],
+            total_duration=data['total_duration'],
+            min_duration=data['min_duration'],
+            max_duration=data['max_duration'],
+            buckets={int(index): count for index, count in data['buckets'].items()}
+        )
+
+class _Columns:
+    """Buffered points of one operation as packed numeric columns"""
+    __slots__ = ("timestamps", "durations", "successes")
+
+    def __init__(self):
+        self.timestamps = array('d')
+        self.durations = array('d')
+        self.successes = array('B')
+
+    def append(self, timestamp: float, duration: float, success: bool) -> None:
+        self.timestamps.append(timestamp)
+        self.durations.append(duration)
+        self.successes.append(1 if success else 0)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def points(self) -> Iterator[Tuple[float, float, bool]]:
+        return zip(self.timestamps, self.durations, map(bool, self.successes), strict=True)
+
+# ================================================================================================
+# TIME-SERIES STORE
+# ================================================================================================
+
+class TimeSeriesStore:
+    """Append-only on-disk store of operation latencies with minute and hour rollups"""
+
+    def __init__(self, root: Path,
+                 raw_retention: float = RAW_RETENTION,
+                 minute_retention: float = MINUTE_RETENTION,
+                 hour_retention: float = HOUR_RETENTION):
+        self.root = Path(root)
+        self.retention = {"raw": raw_retention, "minute": minute_retention, "hour": hour_retention}
+
+        # Points recorded since the last flush; record() only touches these
+        self._pending: Dict[str, _Columns] = {}
+        self._pending_lock = threading.Lock()
+
+        # Rollup windows still open, keyed by (operation, window start)
+        self._open: Dict[str, Dict[Tuple[str, int], LatencySummary]] = {"minute": {}, "hour": {}}
+
+        # Held while files or open rollups are read or written
+        self._io_lock = threading.Lock()
+
+        # Files appended to since start-up, so already cut back to their last complete block or line
+        self._appendable: Set[Path] = set()
+
+    def record(self, operation: str, timestamp: float, duration: float, success: bool) -> None:
+        """Buffer one point; cheap enough to call on the event loop"""
+        with self._pending_lock:
+            columns = self._pending.get(operation)
+            if columns is None:
+                columns = self._pending[operation] = _Columns()
+            columns.append(timestamp, duration, success)
+
+    def flush(self, finalize_all: bool = False, now: Optional[float] = None) -> int:
+        """
+        Append buffered points to their segments and roll them up
+
+        Rollup windows that have ended are appended to the rollup logs; with
+        finalize_all (on shutdown) the open ones are written too. A window
+        written early and continued after a restart is simply logged twice,
+        since summaries of the same window add up when read.
+
+        Returns:
+            Number of points flushed
+        """
+        now = time.time() if now is None else now
+        with self._io_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+
+            flushed = 0
+            for operation, columns in pending.items():
+                self._append_segments(operation, columns)
+                for timestamp, duration, success in columns.points():
+                    self._summary("minute", operation, timestamp).add(duration, success)
+                flushed += len(columns)
+
+            self._finalize("minute", now, finalize_all)
+            self._finalize("hour", now, finalize_all)
+        return flushed
+
+    def compact(self, now: Optional[float] = None) -> Dict[str, int]:
+        """Seal closed segments into one block each and drop data past its retention"""
+        now = time.time() if now is None else now
+        removed = sealed = 0
+        with self._io_lock:
+            raw_cutoff = now - self.retention["raw"]
+            current_hour = int(now // 3600) * 3600
+            for segment in self.root.glob("raw/*/*.seg"):
+                hour = int(segment.stem)
+                if hour + 3600 <= raw_cutoff:
+                    segment.unlink()
+                    self._appendable.discard(segment)
+                    removed += 1
+                elif hour < current_hour and self._seal_segment(segment):
+                    sealed += 1
+
+            for resolution in RESOLUTIONS:
+                cutoff_day = _day_name(now - self.retention[resolution])
+                for day_file in self.root.glob(f"{resolution}/*.jsonl"):
+                    if day_file.stem < cutoff_day:
+                        day_file.unlink()
+                        self._appendable.discard(day_file)
+                        removed += 1
+
+        return {'removed_files': removed, 'sealed_segments': sealed}
+
+    def operations(self) -> List[str]:
+        """Operations with any buffered or open data"""
+        with self._pending_lock:
+            names = set(self._pending)
+        with self._io_lock:
+            for windows in self._open.values():
+                names.update(operation for operation, _ in windows)
+        return sorted(names)
+
+    def query_range(self, operation: str, start: float, end: float, step: float = 60.0) -> List[Dict[str, Any]]:
+        """
+        Latency percentiles and throughput of an operation over time
+
+        The range [start, end) is split into windows of step seconds. Steps
+        of an hour or more read the hour rollups, steps of a minute or more
+        the minute rollups, and shorter steps the raw segments, which give
+        exact percentiles. Points not yet flushed are included.
+
+        Returns:
+            One dict per window with start, end, count, errors, error_rate,
+            throughput_per_sec and p50/p95/p99 (None for empty windows)
+        """
+        if step <= 0 or end <= start:
+            raise ValueError("query_range needs step > 0 and end > start")
+        windows = math.ceil((end - start) / step)
+        if windows > MAX_QUERY_WINDOWS:
+            raise ValueError(f"query_range would return {windows} windows (limit {MAX_QUERY_WINDOWS})")
+
+        summaries = [LatencySummary() for _ in range(windows)]
+
+        def window_of(timestamp: float) -> Optional[LatencySummary]:
+            if start <= timestamp < end:
+                return summaries[int((timestamp - start) // step)]
+            return None
+
+        if step >= RESOLUTIONS["minute"]:
+            resolution = "hour" if step >= RESOLUTIONS["hour"] else "minute"
+            for window_start, summary in self._read_rollups(operation, resolution, start, end):
+                target = window_of(window_start)
+                if target is not None:
+                    target.merge(summary)
+            for timestamp, duration, success in self._pending_points(operation):
+                target = window_of(timestamp)
+                if target is not None:
+                    target.add(duration, success)
+            results = [self._window_result(start + i * step, step, summary, summary.quantile)
+                       for i, summary in enumerate(summaries)]
+        else:
+            durations: List[List[float]] = [[] for _ in range(windows)]
+            for timestamp, duration, success in self._raw_points(operation, start, end):
+                target = window_of(timestamp)
+                if target is not None:
+                    target.add(duration, success)
+                    durations[int((timestamp - start) // step)].append(duration)
+            results = [self._window_result(start + i * step, step, summary, _exact_quantiles(window))
+                       for i, (summary, window) in enumerate(zip(summaries, durations, strict=True))]
+
+        return results
+
+    def summarize(self, operation: str, start: float, end: float) -> Dict[str, Any]:
+        """Percentiles and throughput of an operation over a whole range"""
+        return self.query_range(operation, start, end, end - start)[0]
+
+    # Private methods
+
+    def _summary(self, resolution: str, operation: str, timestamp: float) -> LatencySummary:
+        width = RESOLUTIONS[resolution]
+        key = (operation, int(timestamp // width) * width)
+        summary = self._open[resolution].get(key)
+        if summary is None:
+            summary = self._open[resolution][key] = LatencySummary()
+        return summary
+
+    def _finalize(self, resolution: str, now: float, finalize_all: bool) -> None:
+        """Append ended (or, with finalize_all, all) windows to the rollup log"""
+        width = RESOLUTIONS[resolution]
+        open_windows = self._open[resolution]
+        done = [key for key in open_windows if finalize_all or key[1] + width <= now]
+        if not done:
+            return
+
+        lines_by_day: Dict[str, List[str]] = {}
+        for key in sorted(done, key=lambda item: item[1]):
+            summary = open_windows.pop(key)
+            operation, window_start = key
+            if resolution == "minute":
+                self._summary("hour", operation, window_start).merge(summary)
+            entry = {'op': operation, 'start': window_start, **summary.to_dict()}
+            lines_by_day.setdefault(_day_name(window_start), []).append(json.dumps(entry, separators=(',', ':')))
+
+        directory = self.root / resolution
+        directory.mkdir(parents=True, exist_ok=True)
+        for day, lines in lines_by_day.items():
+            day_file = directory / f"{day}.jsonl"
+            self._prepare_append(day_file, lambda data: data.rfind(b'\n') + 1)
+            with open(day_file, 'a', encoding='utf-8') as f:
+                f.write(''.join(line + '\n' for line in lines))
+
+    def _segment_dir(self, operation: str) -> Path:
+        return self.root / "raw" / UNSAFE_NAME_CHARS.sub('_', operation)
+
+    def _append_segments(self, operation: str, columns: _Columns) -> None:
+        """Append the points of an operation to their hourly segments, one block per segment"""
+        by_hour: Dict[int, _Columns] = {}
+        for timestamp, duration, success in columns.points():
+            hour = int(timestamp // 3600) * 3600
+            block = by_hour.get(hour)
+            if block is None:
+                block = by_hour[hour] = _Columns()
+            block.append(timestamp, duration, success)
+
+        directory = self._segment_dir(operation)
+        directory.mkdir(parents=True, exist_ok=True)
+        for hour, block in by_hour.items():
+            segment = directory / f"{hour}.seg"
+            self._prepare_append(segment, _complete_blocks_length)
+            with open(segment, 'ab') as f:
+                f.write(_pack_block(block))
+
+    def _prepare_append(self, path: Path, complete_length: Callable[[bytes], int]) -> None:
+        """
+        Before the first append to a file since start-up, cut off a torn tail
+
+        An interrupted append leaves a partial block or line that readers
+        skip; anything appended after it would be skipped with it.
+        complete_length gives the length of the file's intact prefix.
+        """
+        if path in self._appendable:
+            return
+        if path.exists():
+            with open(path, 'rb+') as f:
+                data = f.read()
+                intact = complete_length(data)
+                if intact < len(data):
+                    f.truncate(intact)
+                    logger.warning(f"Dropped {len(data) - intact} torn bytes at the end of {path}")
+        self._appendable.add(path)
+
+    def _seal_segment(self, segment: Path) -> bool:
+        """Rewrite a closed segment of several blocks as one time-ordered block"""
+        with open(segment, 'rb') as f:
+            data = f.read()
+        if not data:
+            return False
+        _, count = BLOCK_HEADER.unpack_from(data)
+        if len(data) == BLOCK_HEADER.size + count * 17:
+            return False  # Already a single block
+
+        points = sorted(point for block in _unpack_blocks(data) for point in block.points())
+        sealed = _Columns()
+        for point in points:
+            sealed.append(*point)
+        temp_path = segment.with_name(segment.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(_pack_block(sealed))
+        temp_path.replace(segment)
+        return True
+
+    def _pending_points(self, operation: str) -> List[Tuple[float, float, bool]]:
+        with self._pending_lock:
+            columns = self._pending.get(operation)
+            return list(columns.points()) if columns else []
+
+    def _raw_points(self, operation: str, start: float, end: float) -> Iterator[Tuple[float, float, bool]]:
+        """Points of an operation in [start, end) from segments and the buffer"""
+        first_hour = int(start // 3600) * 3600
+        with self._io_lock:
+            directory = self._segment_dir(operation)
+            hour = first_hour
+            while hour < end:
+                segment = directory / f"{hour}.seg"
+                if segment.exists():
+                    for block in _unpack_blocks(segment.read_bytes()):
+                        yield from block.points()
+                hour += 3600
+        yield from self._pending_points(operation)
+
+    def _read_rollups(self, operation: str, resolution: str,
+                      start: float, end: float) -> Iterator[Tuple[int, LatencySummary]]:
+        """Rollup windows of an operation starting in [start, end), from the logs and still open"""
+        with self._io_lock:
+            day = int(start // 86400) * 86400
+            while day < end:
+                day_file = self.root / resolution / f"{_day_name(day)}.jsonl"
+                if day_file.exists():
+                    with open(day_file, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            try:
+                                entry = json.loads(line)
+                            except json.JSONDecodeError:
+                                continue  # Torn final line from an interrupted append
+                            if entry['op'] == operation and start <= entry['start'] < end:
+                                yield entry['start'], LatencySummary.from_dict(entry)
+                day += 86400
+
+            open_windows = list(self._open[resolution].items())
+            if resolution == "hour":
+                # Minutes not yet folded into their hour
+                open_windows += [((op, window_start // 3600 * 3600), summary)
+                                 for (op, window_start), summary in self._open["minute"].items()]
+            for (op, window_start), summary in open_windows:
+                if op == operation and start <= window_start < end:
+                    merged = LatencySummary()
+                    merged.merge(summary)
+                    yield window_start, merged
+
+    @staticmethod
+    def _window_result(window_start: float, step: float, summary: LatencySummary, quantile) -> Dict[str, Any]:
+        errors = summary.count - summary.successes
+        return {
+            'start': window_start,
+            'end': window_start + step,
+            'count': summary.count,
+            'errors': errors,
+            'error_rate': errors / summary.count if summary.count else 0.0,
+            'throughput_per_sec': summary.count / step,
+            'p50': quantile(0.50),
+            'p95': quantile(0.95),
+            'p99': quantile(0.99)
+        }
+
+# ================================================================================================
+# HELPERS
+# ================================================================================================
+
+def _day_name(timestamp: float) -> str:
+    """UTC day of a timestamp, as used for rollup log file names"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%Y%m%d')
+
+def _exact_quantiles(durations: List[float]):
+    """Quantile function over raw durations"""
+    ordered = sorted(durations)
+
+    def quantile(q: float) -> Optional[float]:
+        if not ordered:
+            return None
+        return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+    return quantile
+
+def _pack_block(columns: _Columns) -> bytes:
+    """Header followed by the timestamp, duration and success columns, little-endian"""
+    timestamps, durations = columns.timestamps, columns.durations
+    if sys.byteorder != 'little':
+        timestamps, durations = array('d', timestamps), array('d', durations)
+        timestamps.byteswap()
+        durations.byteswap()
+    return (BLOCK_HEADER.pack(BLOCK_MAGIC, len(columns)) + timestamps.tobytes() +
+            durations.tobytes() + columns.successes.tobytes())
+
+def _complete_blocks_length(data: bytes) -> int:
+    """Length of the leading run of complete blocks of a segment file"""
+    offset = 0
+    while offset + BLOCK_HEADER.size <= len(data):
+        magic, count = BLOCK_HEADER.unpack_from(data, offset)
+        end = offset + BLOCK_HEADER.size + count * 17
+        if magic != BLOCK_MAGIC or end > len(data):
+            break
+        offset = end
+    return offset
+
+def _unpack_blocks(data: bytes) -> Iterator[_Columns]:
+    """Blocks of a segment file, stopping at a torn or unrecognized block"""
+    offset = 0
+    while offset + BLOCK_HEADER.size <= len(data):
+        magic, count = BLOCK_HEADER.unpack_from(data, offset)
+        end = offset + BLOCK_HEADER.size + count * 17
+        if magic != BLOCK_MAGIC or end > len(data):
+            return
+        columns = _Columns()
+        position = offset + BLOCK_HEADER.size
+        columns.timestamps.frombytes(data[position:position + count * 8])
+        columns.durations.frombytes(data[position + count * 8:position + count * 16])
+        columns.successes.frombytes(data[position + count * 16:end])
+        if sys.byteorder != 'little':
+            columns.timestamps.byteswap()
+            columns.durations.byteswap()
+        yield columns
+        offset = end
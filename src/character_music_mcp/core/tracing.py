@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Lightweight Per-Stage Tracing
+
+This module times the stages of a request as nested spans. A trace is opt-in:
+start_trace() opens a root span in the current context, and every span() block
+or @traced function entered below it (including in tasks the request starts)
+records a child span with perf_counter_ns timestamps. Outside a trace, span()
+and @traced cost one context variable lookup and record nothing.
+
+A finished trace exports as a nested span tree or as Chrome trace-event JSON,
+which chrome://tracing and Perfetto can open.
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Most spans one trace records; further spans are counted as dropped
+MAX_TRACE_SPANS = 10000
+
+# Export formats accepted by Trace.export
+TRACE_FORMATS = ("tree", "chrome")
+
+# ================================================================================================
+# SPANS
+# ================================================================================================
+
+class Span:
+    """One timed stage and the stages nested in it"""
+    __slots__ = ("name", "start_ns", "end_ns", "attributes", "children", "lane", "trace")
+
+    def __init__(self, name: str, trace: 'Trace', attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace = trace
+        self.attributes = attributes or {}
+        self.children: List[Span] = []
+        self.lane = _current_lane()
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+
+    @property
+    def duration_ns(self) -> int:
+        """Time spent in the span so far"""
+        return (self.end_ns if self.end_ns is not None else time.perf_counter_ns()) - self.start_ns
+
+# Innermost open span of the trace running in this context, if any
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_trace_span", default=None)
+
+class _SpanScope:
+    """Opens a child span of the current one for the duration of a block"""
+    __slots__ = ("parent", "name", "attributes", "span", "token")
+
+    def __init__(self, parent: Span, name: str, attributes: Dict[str, Any]):
+        self.parent = parent
+        self.name = name
+        self.attributes = attributes
+        self.span: Optional[Span] = None
+        self.token = None
+
+    def __enter__(self) -> Optional[Span]:
+        trace = self.parent.trace
+        if trace.span_count >= MAX_TRACE_SPANS:
+            trace.dropped_spans += 1
+            return None
+        trace.span_count += 1
+        self.span = Span(self.name, trace, self.attributes)
+        self.parent.children.append(self.span)
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self.span is None:
+            return
+        self.span.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.span.attributes["error"] = exc_type.__name__
+        _current_span.reset(self.token)
+
+class _NoSpan:
+    """Stands in for a span scope outside a trace"""
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+_NO_SPAN = _NoSpan()
+
+def span(name: str, **attributes: Any):
+    """
+    Context manager timing a block as a child of the current span
+
+    Yields the new Span, or None outside a trace (or once the trace is full).
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return _NO_SPAN
+    return _SpanScope(parent, name, attributes)
+
+def annotate(**attributes: Any) -> None:
+    """Add attributes to the current span; does nothing outside a trace"""
+    current = _current_span.get()
+    if current is not None:
+        current.attributes.update(attributes)
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorator timing every call of a function or coroutine function as a span
+
+    Args:
+        name: Span name (the function's qualified name by default)
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                parent = _current_span.get()
+                if parent is None:
+                    return await func(*args, **kwargs)
+                with _SpanScope(parent, span_name, {}):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            parent = _current_span.get()
+            if parent is None:
+                return func(*args, **kwargs)
+            with _SpanScope(parent, span_name, {}):
+                return func(*args, **kwargs)
+        return sync_wrapper
+
+    return decorator
+
+# ================================================================================================
+# TRACES
+# ================================================================================================
+
+class Trace:
+    """Root span of one traced request and its export"""
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        self.span_count = 1
+        self.dropped_spans = 0
+        self.root = Span(name, self, attributes)
+
+    def export(self, trace_format: str = "tree") -> Dict[str, Any]:
+        """The trace as a span tree ("tree") or Chrome trace-event JSON ("chrome")"""
+        if trace_format == "tree":
+            return self.to_tree()
+        if trace_format == "chrome":
+            return self.to_chrome_trace()
+        raise ValueError(f"Unknown trace format {trace_format!r}; expected one of {TRACE_FORMATS}")
+
+    def to_tree(self) -> Dict[str, Any]:
+        """Nested spans with start offsets and durations in milliseconds"""
+        tree = self._span_tree(self.root)
+        if self.dropped_spans:
+            tree["dropped_spans"] = self.dropped_spans
+        return tree
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Complete ("X") trace events, one timeline row per task or thread"""
+        lanes: Dict[int, int] = {}
+        events: List[Dict[str, Any]] = []
+        pid = os.getpid()
+        origin = self.root.start_ns
+
+        stack = [self.root]
+        while stack:
+            current = stack.pop()
+            events.append({
+                "name": current.name,
+                "cat": "character_music",
+                "ph": "X",
+                "ts": (current.start_ns - origin) / 1000,
+                "dur": current.duration_ns / 1000,
+                "pid": pid,
+                "tid": lanes.setdefault(current.lane, len(lanes) + 1),
+                "args": dict(current.attributes)
+            })
+            stack.extend(reversed(current.children))
+
+        events.sort(key=lambda event: event["ts"])
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if self.dropped_spans:
+            trace["otherData"] = {"dropped_spans": self.dropped_spans}
+        return trace
+
+    def _span_tree(self, current: Span) -> Dict[str, Any]:
+        node: Dict[str, Any] = {
+            "name": current.name,
+            "start_ms": round((current.start_ns - self.root.start_ns) / 1e6, 3),
+            "duration_ms": round(current.duration_ns / 1e6, 3)
+        }
+        if current.attributes:
+            node["attributes"] = dict(current.attributes)
+        if current.children:
+            node["children"] = [self._span_tree(child)
+                                 for child in sorted(current.children, key=lambda child: child.start_ns)]
+        return node
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Trace]:
+    """Trace the block: spans opened inside it, in this context or tasks started from it, are recorded"""
+    trace = Trace(name, attributes)
+    token = _current_span.set(trace.root)
+    try:
+        yield trace
+    except BaseException as e:
+        trace.root.attributes["error"] = type(e).__name__
+        raise
+    finally:
+        trace.root.end_ns = time.perf_counter_ns()
+        _current_span.reset(token)
+
+def tracing_active() -> bool:
+    """Whether the current context is inside a trace"""
+    return _current_span.get() is not None
+
+def _current_lane() -> int:
+    """Identity of the running task, or of the thread outside a task"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return id(task) if task is not None else threading.get_ident()
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Warm Worker Pool for CPU-Heavy Tool Paths
+
+This module runs CPU-heavy work (album generation and the like) in worker
+processes that start warm:
+
+- A parent process is started once per pool and runs the warm-up hooks
+  (importing the server constructs the analyzers and compiles the shared
+  patterns; a hook loads the wiki snapshot), then freezes its objects out of
+  the garbage collector's reach
+- Workers are forked from that parent on demand, so they begin with the
+  warmed state and share its memory pages copy-on-write instead of paying
+  for the imports and the wiki JSON again
+- A worker is recycled after a number of tasks or once its resident memory
+  passes a limit, and a worker that dies takes only its current task down
+
+The parent is started as a fresh interpreter rather than forked from the
+server, which runs an event loop and helper threads that must not be forked.
+
+Tasks are module-level functions, passed by reference and resolved in the
+worker by import, with picklable arguments. Pool utilization is exported
+through the metrics registry.
+"""
+
+import asyncio
+import gc
+import importlib
+import logging
+import os
+import queue
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing import reduction
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from metrics_exposition import MetricsBuilder, get_metrics_registry
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Tasks a worker runs before it is replaced by a fresh fork of the warm parent
+DEFAULT_MAX_TASKS_PER_WORKER = 200
+
+# Resident memory after which a worker is replaced, in megabytes
+DEFAULT_MAX_WORKER_RSS_MB = 1024
+
+# Seconds the parent may take to run its warm-up hooks
+WARMUP_TIMEOUT = 300.0
+
+# Message from the parent once warm-up is done
+_READY = "ready"
+
+
+class WorkerLostError(RuntimeError):
+    """A worker process exited while running a task"""
+
+
+def task_reference(function: Callable) -> str:
+    """
+    "module:qualname" reference a worker resolves a task function from
+
+    Functions of a module run as a script (__main__) are referenced by the
+    script's file name, the name the module is imported under elsewhere.
+    """
+    module = function.__module__
+    if module == "__main__":
+        module = Path(sys.modules["__main__"].__file__).stem
+    if "<" in function.__qualname__:
+        raise ValueError(f"{function.__qualname__} is not a module-level function and cannot run in a worker")
+    return f"{module}:{function.__qualname__}"
+
+
+def _resolve(reference: str) -> Callable:
+    module_name, _, qualname = reference.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        target = getattr(target, name)
+    return target
+
+
+def _rss_bytes() -> int:
+    """Resident memory of this process"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        # Peak rather than current where /proc is missing; ru_maxrss is bytes on macOS, KB elsewhere
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+# ================================================================================================
+# PARENT AND WORKER PROCESSES
+# ================================================================================================
+
+def _parent_main(control_fd: int, warmup: Sequence[str]) -> None:
+    """Run the warm-up hooks, then fork a worker for every request on the control connection"""
+    control = Connection(control_fd)
+    started = time.perf_counter()
+    for reference in warmup:
+        _resolve(reference)()
+    # Keep the collector from touching (and so un-sharing) the warmed objects in every worker
+    gc.collect()
+    gc.freeze()
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # Workers are reaped automatically
+    control.send((_READY, time.perf_counter() - started, _rss_bytes(), threading.active_count()))
+
+    while True:
+        try:
+            request = control.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        pool_end, worker_end = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            control.close()
+            pool_end.close()
+            exit_code = 0
+            try:
+                _worker_main(Connection(worker_end.detach()))
+            except BaseException:
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        worker_end.close()
+        reduction.send_handle(control, pool_end.fileno(), None)
+        control.send(pid)
+        pool_end.close()
+
+
+def _worker_main(connection: Connection) -> None:
+    """Run tasks until the pool closes the connection"""
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+
+        reference, args, kwargs = task
+        try:
+            outcome = (True, _resolve(reference)(*args, **kwargs))
+        except Exception as e:
+            outcome = (False, e)
+        try:
+            connection.send(outcome + (_rss_bytes(),))
+        except Exception as e:
+            # The result or exception could not be pickled
+            connection.send((False, RuntimeError(f"Task result could not be returned: {e!r}"), _rss_bytes()))
+
+# ================================================================================================
+# POOL
+# ================================================================================================
+
+@dataclass
+class _Worker:
+    """A worker process as seen from the pool"""
+    pid: int
+    connection: Connection
+    tasks: int = 0
+    rss_bytes: int = 0
+
+
+class WarmWorkerPool:
+    """Worker processes forked from a warmed parent, recycled by task count and memory"""
+
+    def __init__(self, warmup: Sequence[str] = (), max_workers: Optional[int] = None,
+                 max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER,
+                 max_worker_rss_mb: float = DEFAULT_MAX_WORKER_RSS_MB):
+        """
+        Args:
+            warmup: "module:function" references the parent calls before forking workers
+            max_workers: Worker processes (defaults to the number of CPUs)
+            max_tasks_per_worker: Tasks after which a worker is replaced
+            max_worker_rss_mb: Resident memory after which a worker is replaced
+        """
+        self.warmup = tuple(warmup)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_worker_rss_bytes = int(max_worker_rss_mb * 1024 * 1024)
+
+        self._tasks: "queue.SimpleQueue[Optional[tuple]]" = queue.SimpleQueue()
+        self._start_lock = threading.Lock()  # Starting, stopping and configuring
+        self._lock = threading.Lock()  # Utilization counters
+        self._control_lock = threading.Lock()  # One fork request at a time
+        self._parent: Optional[subprocess.Popen] = None
+        self._control: Optional[Connection] = None
+        self._slots: List[threading.Thread] = []
+
+        # Utilization
+        self.warmup_seconds: Optional[float] = None
+        self.parent_rss_bytes: Optional[int] = None
+        self.tasks = {"completed": 0, "failed": 0, "lost": 0}
+        self.recycled = {"tasks": 0, "rss": 0, "lost": 0}
+        self.workers_started = 0
+        self.busy_workers = 0
+        self.busy_seconds = 0.0
+        self.queued = 0
+        self._started_at: Optional[float] = None
+
+        get_metrics_registry().register(self)
+
+    @property
+    def running(self) -> bool:
+        return self._parent is not None
+
+    def configure(self, warmup: Optional[Sequence[str]] = None, max_workers: Optional[int] = None,
+                  max_tasks_per_worker: Optional[int] = None, max_worker_rss_mb: Optional[float] = None) -> None:
+        """Change the pool's settings; only possible before it starts"""
+        with self._start_lock:
+            if self._parent is not None:
+                raise RuntimeError("Worker pool settings cannot change while it is running")
+            if warmup is not None:
+                self.warmup = tuple(warmup)
+            if max_workers is not None:
+                self.max_workers = max_workers
+            if max_tasks_per_worker is not None:
+                self.max_tasks_per_worker = max_tasks_per_worker
+            if max_worker_rss_mb is not None:
+                self.max_worker_rss_bytes = int(max_worker_rss_mb * 1024 * 1024)
+
+    def start(self) -> None:
+        """Start the parent and wait for its warm-up (done on the first submit if not called)"""
+        with self._start_lock:
+            if self._parent is not None:
+                return
+            pool_end, parent_end = socket.socketpair()
+            # The parent imports the same flat modules as this process
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+            command = [sys.executable, "-c",
+                       "import sys, warm_worker_pool; warm_worker_pool._parent_main(int(sys.argv[1]), sys.argv[2:])",
+                       str(parent_end.fileno()), *self.warmup]
+            parent = subprocess.Popen(command, pass_fds=[parent_end.fileno()], env=env)
+            parent_end.close()
+            control = Connection(pool_end.detach())
+
+            if not control.poll(WARMUP_TIMEOUT):
+                parent.kill()
+                control.close()
+                raise RuntimeError(f"Worker pool parent did not warm up within {WARMUP_TIMEOUT:g}s")
+            try:
+                _, self.warmup_seconds, self.parent_rss_bytes, threads = control.recv()
+            except EOFError as e:
+                parent.wait()
+                control.close()
+                raise RuntimeError(f"Worker pool parent exited during warm-up (exit code {parent.returncode})") from e
+            if threads > 1:
+                logger.warning(f"Worker pool parent runs {threads} threads after warm-up; forked workers get only one")
+
+            self._parent, self._control = parent, control
+            self._started_at = time.monotonic()
+            self._slots = [threading.Thread(target=self._run_slot, name=f"warm-worker-{slot}", daemon=True)
+                           for slot in range(self.max_workers)]
+            for slot in self._slots:
+                slot.start()
+            logger.info(f"Warm worker pool ready: {self.max_workers} workers, parent warmed up in "
+                        f"{self.warmup_seconds:.2f}s ({self.parent_rss_bytes / 1024 / 1024:.0f} MB)")
+
+    def submit(self, function: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Queue function(*args, **kwargs) for a worker; function must be defined at module level"""
+        reference = task_reference(function)
+        if self._parent is None:
+            self.start()
+        future: Future = Future()
+        with self._lock:
+            self.queued += 1
+        self._tasks.put((reference, args, kwargs, future))
+        return future
+
+    async def run(self, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run function(*args, **kwargs) in a worker and return its result"""
+        if self._parent is None:
+            await asyncio.to_thread(self.start)  # Warm-up takes seconds; keep the event loop free
+        return await asyncio.wrap_future(self.submit(function, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Stop the workers and the parent; queued tasks not yet started are cancelled"""
+        with self._start_lock:
+            if self._parent is None:
+                return
+            slots, self._slots = self._slots, []
+        for _ in slots:
+            self._tasks.put(None)
+        for slot in slots:
+            slot.join()
+        while True:
+            try:
+                task = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is not None:
+                task[3].cancel()
+
+        with self._start_lock:
+            try:
+                self._control.send(None)
+            except OSError:
+                pass
+            self._control.close()
+            self._parent.wait()
+            self._parent = self._control = None
+        with self._lock:
+            self.queued = 0
+
+    def _run_slot(self) -> None:
+        worker: Optional[_Worker] = None
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+            reference, args, kwargs, future = task
+            with self._lock:
+                self.queued -= 1
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if worker is None:
+                    worker = self._fork_worker()
+                try:
+                    worker.connection.send((reference, args, kwargs))
+                except OSError:
+                    # The worker died while idle (killed between tasks); the task never reached it
+                    self._retire(worker, "lost")
+                    worker = None
+                    worker = self._fork_worker()
+                    worker.connection.send((reference, args, kwargs))
+            except Exception as e:
+                # Unpicklable arguments, or the parent is gone
+                future.set_exception(e)
+                continue
+
+            with self._lock:
+                self.busy_workers += 1
+            started = time.perf_counter()
+            try:
+                succeeded, value, worker.rss_bytes = worker.connection.recv()
+            except (EOFError, OSError):
+                self._account(started, "lost")
+                self._retire(worker, "lost")
+                worker = None
+                future.set_exception(WorkerLostError(f"Worker process exited while running {reference}"))
+                continue
+
+            worker.tasks += 1
+            self._account(started, "completed" if succeeded else "failed")
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+            if worker.tasks >= self.max_tasks_per_worker:
+                self._retire(worker, "tasks")
+                worker = None
+            elif worker.rss_bytes > self.max_worker_rss_bytes:
+                self._retire(worker, "rss")
+                worker = None
+
+        if worker is not None:
+            self._retire(worker, None)
+
+    def _fork_worker(self) -> _Worker:
+        with self._control_lock:
+            self._control.send("fork")
+            handle = reduction.recv_handle(self._control)
+            pid = self._control.recv()
+        with self._lock:
+            self.workers_started += 1
+        return _Worker(pid=pid, connection=Connection(handle))
+
+    def _retire(self, worker: _Worker, reason: Optional[str]) -> None:
+        if reason is not None:
+            with self._lock:
+                self.recycled[reason] += 1
+            logger.debug(f"Recycling worker {worker.pid} ({reason}) after {worker.tasks} tasks, "
+                         f"{worker.rss_bytes / 1024 / 1024:.0f} MB")
+        try:
+            worker.connection.send(None)
+        except OSError:
+            pass
+        worker.connection.close()
+
+    def _account(self, started: float, outcome: str) -> None:
+        with self._lock:
+            self.busy_workers -= 1
+            self.busy_seconds += time.perf_counter() - started
+            self.tasks[outcome] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, utilization and recycling counts"""
+        with self._lock:
+            uptime = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+            return {
+                "running": self.running,
+                "workers": self.max_workers,
+                "busy_workers": self.busy_workers,
+                "queued_tasks": self.queued,
+                "utilization": self.busy_seconds / (uptime * self.max_workers) if uptime > 0 else 0.0,
+                "busy_seconds": self.busy_seconds,
+                "tasks": dict(self.tasks),
+                "workers_started": self.workers_started,
+                "recycled": dict(self.recycled),
+                "warmup_seconds": self.warmup_seconds,
+                "parent_rss_bytes": self.parent_rss_bytes,
+            }
+
+    def collect_metrics(self, builder: MetricsBuilder) -> None:
+        """Write pool utilization into a scrape"""
+        stats = self.stats()
+        if not stats["running"]:
+            return
+        builder.gauge("character_music_worker_pool_workers", "Worker processes in the warm pool", stats["workers"])
+        builder.gauge("character_music_worker_pool_busy_workers", "Warm pool workers running a task",
+                      stats["busy_workers"])
+        builder.gauge("character_music_worker_pool_queued_tasks", "Tasks waiting for a warm pool worker",
+                      stats["queued_tasks"])
+        builder.counter("character_music_worker_pool_busy_seconds", "Time warm pool workers spent on tasks",
+                        stats["busy_seconds"])
+        for outcome, count in stats["tasks"].items():
+            builder.counter("character_music_worker_pool_tasks", "Warm pool tasks by outcome", count, outcome=outcome)
+        for reason, count in stats["recycled"].items():
+            builder.counter("character_music_worker_pool_recycled_workers", "Warm pool workers replaced, by reason",
+                            count, reason=reason)
+
+# Global warm worker pool
+_warm_worker_pool: Optional[WarmWorkerPool] = None
+
+def get_warm_worker_pool() -> WarmWorkerPool:
+    """Get or create the global warm worker pool (started on first use)"""
+    global _warm_worker_pool
+    if _warm_worker_pool is None:
+        _warm_worker_pool = WarmWorkerPool()
+    return _warm_worker_pool
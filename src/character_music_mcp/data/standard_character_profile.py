@@ -7,12 +7,39 @@ to prevent format mismatches and initialization errors.
 """
 
 import logging
-from dataclasses import asdict, dataclass, field
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Labels up to this length (names, genres, emotions, vocal styles) are interned
+MAX_INTERNED_LABEL_LENGTH = 64
+
+
+def intern_label(value: Any) -> Any:
+    """
+    Intern a short label so equal labels across many objects share one string
+
+    Args:
+        value: Label to intern; non-strings and long text are returned unchanged
+
+    Returns:
+        Interned string, or the original value
+    """
+    if type(value) is str and len(value) <= MAX_INTERNED_LABEL_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def intern_labels(values: List[Any]) -> List[Any]:
+    """Intern every short label in a list; anything other than a list is returned unchanged"""
+    if not isinstance(values, list):
+        return values
+    return [intern_label(value) for value in values]
+
+
+@dataclass(slots=True)
 class StandardCharacterProfile:
     """
     Standardized character profile for all MCP tools
@@ -73,14 +100,14 @@ class StandardCharacterProfile:
         self.importance_score = max(0.0, min(1.0, self.importance_score))
 
         # Clean up string fields
-        self.name = self.name.strip()
+        self.name = intern_label(self.name.strip())
         self.physical_description = self.physical_description.strip()
         self.backstory = self.backstory.strip()
         self.first_appearance = self.first_appearance.strip()
 
         # Clean up optional conceptual fields
         if self.content_type:
-            self.content_type = self.content_type.strip()
+            self.content_type = intern_label(self.content_type.strip())
         if self.processing_notes:
             self.processing_notes = self.processing_notes.strip()
         if self.conceptual_basis:
@@ -183,7 +210,31 @@ class StandardCharacterProfile:
         Returns:
             Dictionary representation of the character profile
         """
-        return asdict(self)
+        # Hand-written instead of asdict(): lists hold strings, so shallow copies are enough
+        return {
+            'name': self.name,
+            'aliases': list(self.aliases),
+            'physical_description': self.physical_description,
+            'mannerisms': list(self.mannerisms),
+            'speech_patterns': list(self.speech_patterns),
+            'behavioral_traits': list(self.behavioral_traits),
+            'backstory': self.backstory,
+            'relationships': list(self.relationships),
+            'formative_experiences': list(self.formative_experiences),
+            'social_connections': list(self.social_connections),
+            'motivations': list(self.motivations),
+            'fears': list(self.fears),
+            'desires': list(self.desires),
+            'conflicts': list(self.conflicts),
+            'personality_drivers': list(self.personality_drivers),
+            'confidence_score': self.confidence_score,
+            'text_references': list(self.text_references),
+            'first_appearance': self.first_appearance,
+            'importance_score': self.importance_score,
+            'conceptual_basis': list(self.conceptual_basis) if self.conceptual_basis is not None else None,
+            'content_type': self.content_type,
+            'processing_notes': self.processing_notes
+        }
 
     def to_legacy_format(self, format_type: str = "simple") -> Dict[str, Any]:
         """
@@ -3,9 +3,15 @@
 Working Universal Content Processor - Simplified for Testing
 """
 
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from regex_registry import AGE_IN_YEARS, DESCRIPTION_NAME_PATTERNS, compile_all
 
 
 @dataclass
@@ -19,19 +25,122 @@ class UniversalMusicCommand:
     suno_command: str
     effectiveness_score: float
 
+# Past tense verbs that suggest narrative fiction
+PAST_TENSE_PATTERNS = compile_all([r'\b\w+ed\b', r'\bwas\b', r'\bwere\b', r'\bhad\b', r'\bdid\b'])
+
+# Concept headers (1., 2., A., B., bullets) in conceptual content
+CONCEPT_HEADER = re.compile(r'^[1-9A-Z]\.|^[•-]\s*[A-Z]')
+CONCEPT_HEADER_PREFIX = re.compile(r'^[1-9A-Z•-]\.\s*')
+
+# Proper names in narrative fiction
+PROPER_NAME = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+NICKNAMED_FULL_NAME = re.compile(r'[A-Z][a-z]+ (?:"[^"]*" )?[A-Z][a-z]+')
+
+# Parsed character worldviews kept for reuse across processors
+WORLDVIEW_CACHE_SIZE = 256
+
+
+def freeze_worldview(value: Any) -> Any:
+    """Read-only copy of a worldview: dicts become mapping proxies and lists become tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_worldview(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_worldview(item) for item in value)
+    return value
+
+
+class WorldviewCache:
+    """
+    Bounded LRU cache of parsed character worldviews keyed by description hash
+
+    Cached worldviews are frozen, so one parse is shared by every processor
+    (and thread) created for the same description. A description is parsed
+    outside the lock; two threads missing at once may both parse it, and the
+    first result stored wins.
+    """
+
+    def __init__(self, maxsize: int = WORLDVIEW_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Mapping[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(description: Optional[str]) -> str:
+        """Hash identifying a character description"""
+        return hashlib.sha256((description or "").encode('utf-8')).hexdigest()
+
+    def get_or_parse(self, description: Optional[str],
+                     parse: Callable[[Optional[str]], Dict[str, Any]]) -> Mapping[str, Any]:
+        """Return the cached worldview for description, parsing and caching it on a miss"""
+        key = self.key_for(description)
+        with self._lock:
+            worldview = self._entries.get(key)
+            if worldview is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return worldview
+            self.misses += 1
+
+        worldview = freeze_worldview(parse(description))
+        with self._lock:
+            worldview = self._entries.setdefault(key, worldview)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return worldview
+
+    def clear(self) -> None:
+        """Drop every cached worldview and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Snapshot of the cache size and hit counters"""
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize,
+                    "hits": self.hits, "misses": self.misses}
+
+
+# Global worldview cache shared by all processors
+_worldview_cache: Optional[WorldviewCache] = None
+
+
+def get_worldview_cache() -> WorldviewCache:
+    """Get or create the global worldview cache"""
+    global _worldview_cache
+    if _worldview_cache is None:
+        _worldview_cache = WorldviewCache()
+    return _worldview_cache
+
+
 class WorkingUniversalProcessor:
-    """Enhanced processor that intelligently handles different content types through character lens"""
+    """
+    Enhanced processor that intelligently handles different content types through character lens
+
+    character_worldview starts out as the shared, read-only worldview for the
+    description. Adapting to content rebinds it on this processor only, so
+    the shared worldview is never modified.
+    """
 
     def __init__(self, character_description: str = None):
-        # Parse character description with validation
+        self.character_worldview = get_worldview_cache().get_or_parse(
+            character_description, self._build_worldview
+        )
+
+    def _build_worldview(self, character_description: Optional[str]) -> Dict[str, Any]:
+        """Parse a character description into a worldview, with validation"""
         if character_description and self._validate_character_description(character_description):
-            self.character_worldview = self._parse_character_description(character_description)
+            return self._parse_character_description(character_description)
         elif character_description:
             # If description provided but invalid, create generic character
-            self.character_worldview = self._create_generic_character(character_description)
+            return self._create_generic_character(character_description)
         else:
             # No description provided - create truly generic character
-            self.character_worldview = self._create_default_character()
+            return self._create_default_character()
 
     def detect_content_type(self, text: str) -> Dict[str, Any]:
         """
@@ -80,15 +189,14 @@ class WorkingUniversalProcessor:
             "dialogue": ["he said", "she said", "they said", "asked", "replied", "whispered", "shouted"],
             "narrative_elements": ["protagonist", "character", "plot", "scene", "setting"],
             "action_verbs": ["walked", "looked", "saw", "felt", "thought", "remembered", "realized", "noticed", "heard"],
-            "past_tense_patterns": [r'\b\w+ed\b', r'\bwas\b', r'\bwere\b', r'\bhad\b', r'\bdid\b']
+            "past_tense_patterns": PAST_TENSE_PATTERNS
         }
 
         narrative_score = 0
         for category, indicators in narrative_indicators.items():
             if category == "past_tense_patterns":
-                import re
                 for pattern in indicators:
-                    matches = len(re.findall(pattern, text_lower))
+                    matches = len(pattern.findall(text_lower))
                     if matches > 3:  # Multiple past tense verbs suggest narrative
                         narrative_score += min(matches / 5.0, 2.0)
             else:
@@ -354,12 +462,12 @@ class WorkingUniversalProcessor:
                 continue
 
             # Check for main concept headers (1., 2., A., B., etc.)
-            if re.match(r'^[1-9A-Z]\.|^[•-]\s*[A-Z]', line):
+            if CONCEPT_HEADER.match(line):
                 if current_concept:
                     concepts.append(current_concept)
 
                 current_concept = {
-                    "title": re.sub(r'^[1-9A-Z•-]\.\s*', '', line),
+                    "title": CONCEPT_HEADER_PREFIX.sub('', line),
                     "details": [],
                     "themes": []
                 }
@@ -498,11 +606,8 @@ class WorkingUniversalProcessor:
         characters = []
 
         # Look for proper names that appear multiple times (likely characters)
-        import re
-
         # Find potential character names (capitalized words that aren't common nouns)
-        name_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b'
-        potential_names = re.findall(name_pattern, text)
+        potential_names = PROPER_NAME.findall(text)
 
         # Filter out common words that aren't names
         common_words = {
@@ -847,7 +952,7 @@ class WorkingUniversalProcessor:
         }
 
         # Infer age
-        age_match = re.search(r'(\d+)[-\s]*year[-\s]*old', context_lower)
+        age_match = AGE_IN_YEARS.search(context_lower)
         if age_match:
             traits["age"] = int(age_match.group(1))
 
@@ -867,7 +972,7 @@ class WorkingUniversalProcessor:
             return False
 
         # Check for basic character elements
-        has_name = bool(re.search(r'[A-Z][a-z]+ (?:"[^"]*" )?[A-Z][a-z]+', description))
+        has_name = bool(NICKNAMED_FULL_NAME.search(description))
         has_age_or_context = any(word in description.lower() for word in ['year', 'old', 'age', 'artist', 'producer', 'musician'])
         has_genre_or_style = any(word in description.lower() for word in ['music', 'genre', 'style', 'sound', 'artist', 'producer'])
 
@@ -881,27 +986,19 @@ class WorkingUniversalProcessor:
         name_match = None
 
         # Try multiple name patterns - order matters!
-        name_patterns = [
-            r'([A-Z][A-Z]+ [A-Z][a-zA-Z]+)',  # DJ Memphis, MC Something
-            r'([A-Z][a-z]+ [A-Z][a-zA-Z]+)',  # John Smith or John McKenzie
-            r'([A-Z][a-z]+ (?:"[^"]*" )?[A-Z][a-z]+)',  # John "Nickname" Smith
-            r'^([A-Z][a-z]+(?:\s+[A-Z][a-zA-Z]+)+)',  # Multiple names at start
-            r'([A-Z][A-Z]+)',  # Single names like DJ, MC (fallback)
-        ]
-
         # First try to find name in the first sentence
         first_sentence = description.split('.')[0] if '.' in description else description.split('\n')[0]
 
-        for pattern in name_patterns:
-            match = re.search(pattern, first_sentence)
+        for pattern in DESCRIPTION_NAME_PATTERNS:
+            match = pattern.search(first_sentence)
             if match:
                 name_match = match.group(1)
                 break
 
         # If still no match, try the whole description
         if not name_match:
-            for pattern in name_patterns:
-                match = re.search(pattern, description)
+            for pattern in DESCRIPTION_NAME_PATTERNS:
+                match = pattern.search(description)
                 if match:
                     name_match = match.group(1)
                     break
@@ -909,7 +1006,7 @@ class WorkingUniversalProcessor:
         name_match = name_match if name_match else "Independent Artist"
 
         # Extract age
-        age_match = re.search(r'(\d+)[-\s]*year[-\s]*old', desc_lower)
+        age_match = AGE_IN_YEARS.search(desc_lower)
         age = int(age_match.group(1)) if age_match else 30
 
         # Extract location dynamically from description
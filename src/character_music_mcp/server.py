@@ -7,19 +7,52 @@ integrating narrative text analysis with musical artist personas for Suno AI com
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import os
 import re
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from enhanced_character_analyzer import EnhancedCharacterAnalyzer
 from fastmcp import Context, FastMCP
+from mcp_single_flight import single_flight_tool
+from mcp_tool_activity import get_tool_activity_tracker
+from mcp_tool_metrics import get_tool_metrics, is_error_response
+from memory_diagnostics import get_memory_diagnostics
+from metrics_exposition import get_metrics_registry, start_metrics_server
 from pydantic import BaseModel
+from regex_registry import (
+    CAPITALIZED_NAME,
+    CAPITALIZED_WORD,
+    DESCRIPTION_NAME_PATTERNS,
+    SENTENCE_BOUNDARY,
+    SPEECH_VERBS,
+    compile_alternation,
+    compile_pattern,
+)
+from sampling_profiler import get_tool_profiler
 
 # Enhanced character analysis imports
-from standard_character_profile import StandardCharacterProfile
+from standard_character_profile import StandardCharacterProfile, intern_label, intern_labels
+from text_view import TextView
+from tracing import TRACE_FORMATS, annotate, span, start_trace, traced
+from warm_worker_pool import get_warm_worker_pool, task_reference
 from working_universal_processor import WorkingUniversalProcessor
 
 # Wiki data integration imports
@@ -27,19 +60,83 @@ from working_universal_processor import WorkingUniversalProcessor
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-try:
-    from enhanced_genre_mapper import EnhancedGenreMapper, GenreMatch
+if TYPE_CHECKING:
+    from enhanced_genre_mapper import EnhancedGenreMapper
     from source_attribution_manager import SourceAttributionManager
     from wiki_data_models import WikiConfig
     from wiki_data_system import WikiDataManager
-    WIKI_INTEGRATION_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Wiki integration not available: {e}")
-    WIKI_INTEGRATION_AVAILABLE = False
+
+# The wiki stack pulls in aiohttp, BeautifulSoup and psutil, so it is only
+# imported once something needs it (see _load_wiki_integration)
+_WIKI_INTEGRATION_NAMES = ('EnhancedGenreMapper', 'GenreMatch', 'SourceAttributionManager', 'WikiConfig', 'WikiDataManager')
+
+
+def _load_wiki_integration() -> bool:
+    """
+    Import the wiki integration classes on first use
+
+    Names already bound on the module (e.g. patched in tests) are left alone.
+
+    Returns:
+        True if the wiki integration is available
+    """
+    global WIKI_INTEGRATION_AVAILABLE
+
+    if 'WIKI_INTEGRATION_AVAILABLE' in globals():
+        return WIKI_INTEGRATION_AVAILABLE
+
+    try:
+        from enhanced_genre_mapper import EnhancedGenreMapper, GenreMatch
+        from source_attribution_manager import SourceAttributionManager
+        from wiki_data_models import WikiConfig
+        from wiki_data_system import WikiDataManager
+        loaded = {
+            'EnhancedGenreMapper': EnhancedGenreMapper,
+            'GenreMatch': GenreMatch,
+            'SourceAttributionManager': SourceAttributionManager,
+            'WikiConfig': WikiConfig,
+            'WikiDataManager': WikiDataManager,
+        }
+        for name, value in loaded.items():
+            globals().setdefault(name, value)
+        WIKI_INTEGRATION_AVAILABLE = True
+    except ImportError as e:
+        logger.warning(f"Wiki integration not available: {e}")
+        WIKI_INTEGRATION_AVAILABLE = False
+
+    return WIKI_INTEGRATION_AVAILABLE
+
+
+def __getattr__(name: str) -> Any:
+    # Keep server.WikiDataManager and friends importable for callers and tests
+    if name == 'WIKI_INTEGRATION_AVAILABLE':
+        return _load_wiki_integration()
+    if name in _WIKI_INTEGRATION_NAMES and _load_wiki_integration():
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Initialize FastMCP server
 mcp = FastMCP("Character Music Generator")
 
+try:
+    from fastmcp.server.middleware import Middleware
+except ImportError:  # fastmcp < 2.9 has no middleware
+    Middleware = None
+
+if Middleware is not None:
+    class ToolActivityMiddleware(Middleware):
+        """Mark tool calls in flight so background work can wait for idle periods, time and sample-profile them"""
+
+        async def on_call_tool(self, context, call_next):
+            with get_tool_activity_tracker().tool_call(), get_tool_metrics().track(context.message.name) as call:
+                async with get_tool_profiler().profile(context.message.name):
+                    result = await call_next(context)
+                if is_error_response(result):
+                    call.failed = True
+                return result
+
+    mcp.add_middleware(ToolActivityMiddleware())
+
 # ================================================================================================
 # DATA MODELS AND SCHEMAS
 # ================================================================================================
@@ -99,7 +196,7 @@ class CharacterProfile:
             'importance_score': self.importance_score
         }
 
-@dataclass
+@dataclass(slots=True)
 class ArtistPersona:
     """Musical artist persona derived from character analysis"""
     character_name: str
@@ -133,20 +230,20 @@ class ArtistPersona:
         # Normalize confidence score
         self.character_mapping_confidence = max(0.0, min(1.0, self.character_mapping_confidence))
 
-        # Clean up string fields
-        self.character_name = self.character_name.strip()
-        self.artist_name = self.artist_name.strip()
-        self.primary_genre = self.primary_genre.strip()
-        self.vocal_style = self.vocal_style.strip()
-        self.collaboration_style = self.collaboration_style.strip()
+        # Clean up string fields, interning the short labels shared across personas
+        self.character_name = intern_label(self.character_name.strip())
+        self.artist_name = intern_label(self.artist_name.strip())
+        self.primary_genre = intern_label(self.primary_genre.strip())
+        self.vocal_style = intern_label(self.vocal_style.strip())
+        self.collaboration_style = intern_label(self.collaboration_style.strip())
         self.genre_justification = self.genre_justification.strip()
         self.persona_description = self.persona_description.strip()
 
         # Remove empty strings from lists
-        self.secondary_genres = [item.strip() for item in self.secondary_genres if item and item.strip()]
-        self.instrumental_preferences = [item.strip() for item in self.instrumental_preferences if item and item.strip()]
+        self.secondary_genres = [intern_label(item.strip()) for item in self.secondary_genres if item and item.strip()]
+        self.instrumental_preferences = [intern_label(item.strip()) for item in self.instrumental_preferences if item and item.strip()]
         self.lyrical_themes = [item.strip() for item in self.lyrical_themes if item and item.strip()]
-        self.emotional_palette = [item.strip() for item in self.emotional_palette if item and item.strip()]
+        self.emotional_palette = [intern_label(item.strip()) for item in self.emotional_palette if item and item.strip()]
         self.artistic_influences = [item.strip() for item in self.artistic_influences if item and item.strip()]
 
     @classmethod
@@ -236,7 +333,7 @@ class ArtistPersona:
             'persona_description': self.persona_description
         }
 
-@dataclass
+@dataclass(slots=True)
 class SunoCommand:
     """Optimized Suno AI command with metadata"""
     command_type: str  # "simple", "custom", "bracket_notation"
@@ -253,6 +350,16 @@ class SunoCommand:
     estimated_effectiveness: float
     variations: List[str]
 
+    def __post_init__(self):
+        """Intern the tag and source labels shared across many commands"""
+        self.command_type = intern_label(self.command_type)
+        self.style_tags = intern_labels(self.style_tags)
+        self.structure_tags = intern_labels(self.structure_tags)
+        self.sound_effect_tags = intern_labels(self.sound_effect_tags)
+        self.vocal_tags = intern_labels(self.vocal_tags)
+        self.character_source = intern_label(self.character_source)
+        self.artist_persona = intern_label(self.artist_persona)
+
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
         return {
@@ -295,7 +402,7 @@ class MusicGenerationResult(BaseModel):
 # EMOTIONAL FRAMEWORK COMPONENTS
 # ================================================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EmotionalState:
     """Represents a complex emotional state with meta-narrative context"""
     primary_emotion: str
@@ -305,6 +412,13 @@ class EmotionalState:
     internal_conflict: Optional[str]
     defense_mechanism: Optional[str]
     authenticity_score: float  # How genuine vs performative
+    occurrences: int = 1  # Nearby matches of the same fact folded into this state
+
+    def __post_init__(self):
+        """Intern emotion labels shared across many states"""
+        self.primary_emotion = intern_label(self.primary_emotion)
+        self.secondary_emotions = intern_labels(self.secondary_emotions)
+        self.defense_mechanism = intern_label(self.defense_mechanism)
 
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
@@ -315,10 +429,11 @@ class EmotionalState:
             'factual_triggers': self.factual_triggers,
             'internal_conflict': self.internal_conflict,
             'defense_mechanism': self.defense_mechanism,
-            'authenticity_score': self.authenticity_score
+            'authenticity_score': self.authenticity_score,
+            'occurrences': self.occurrences
         }
 
-@dataclass
+@dataclass(slots=True)
 class BeatPattern:
     """Emotional beat pattern for production"""
     tempo_range: Tuple[int, int]  # BPM range
@@ -328,6 +443,11 @@ class BeatPattern:
     emotional_mapping: str  # Which emotion it represents
     intensity_automation: List[Dict[str, float]]  # Time-based intensity changes
 
+    def __post_init__(self):
+        """Intern percussion and emotion labels shared across many patterns"""
+        self.percussion_elements = intern_labels(self.percussion_elements)
+        self.emotional_mapping = intern_label(self.emotional_mapping)
+
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
         return {
@@ -339,6 +459,50 @@ class BeatPattern:
             'intensity_automation': self.intensity_automation
         }
 
+# Enhanced thematic keywords mapping with more comprehensive coverage
+CONCEPT_THEME_KEYWORDS = {
+    "transformation": ["change", "transform", "evolve", "become", "growth", "metamorphosis", "transition", "shift"],
+    "journey": ["travel", "path", "journey", "road", "adventure", "quest", "voyage", "walk", "move", "go"],
+    "conflict": ["struggle", "fight", "battle", "conflict", "tension", "opposition", "war", "clash", "chaos"],
+    "love": ["love", "romance", "heart", "passion", "affection", "devotion", "relationship", "together"],
+    "loss": ["loss", "grief", "sorrow", "missing", "gone", "departed", "empty", "alone", "lost"],
+    "hope": ["hope", "dream", "aspire", "wish", "future", "possibility", "bright", "light", "tomorrow"],
+    "memory": ["remember", "memory", "past", "nostalgia", "recall", "reminisce", "childhood", "yesterday"],
+    "nature": ["nature", "earth", "sky", "water", "forest", "mountain", "ocean", "tree", "wind", "rain"],
+    "time": ["time", "moment", "eternity", "forever", "instant", "duration", "clock", "hour", "day"],
+    "identity": ["self", "identity", "who", "being", "existence", "soul", "person", "individual"],
+    "peace": ["peace", "calm", "quiet", "still", "serene", "tranquil", "meditation", "rest"],
+    "energy": ["energy", "power", "force", "dynamic", "vibrant", "alive", "electric", "intense"],
+    "urban": ["city", "urban", "street", "building", "traffic", "crowd", "metropolitan", "downtown"],
+    "family": ["family", "home", "mother", "father", "child", "parent", "sibling", "house"],
+    "freedom": ["freedom", "free", "escape", "liberation", "independent", "open", "release"],
+    "mystery": ["mystery", "unknown", "secret", "hidden", "enigma", "puzzle", "strange"],
+    "celebration": ["celebration", "party", "joy", "festival", "dance", "music", "happy"],
+    "solitude": ["alone", "solitude", "lonely", "isolated", "single", "individual", "solo"],
+    "decision": ["decision", "choice", "choose", "decide", "crossroads", "option", "path"],
+    "awakening": ["wake", "awaken", "dawn", "morning", "sunrise", "beginning", "start"]
+}
+
+CONCEPT_EMOTION_KEYWORDS = {
+    "melancholy": ["sad", "sorrow", "melancholy", "wistful", "longing", "empty", "loss", "grief"],
+    "euphoria": ["joy", "ecstasy", "bliss", "elation", "euphoria", "celebration", "happy", "delight"],
+    "anxiety": ["worry", "fear", "anxious", "nervous", "uncertain", "tension", "stress", "edge"],
+    "anger": ["anger", "rage", "fury", "mad", "frustrated", "chaos", "battle", "fight"],
+    "wonder": ["wonder", "awe", "amazement", "mystery", "magical", "dawn", "awakening", "discovery"],
+    "nostalgia": ["memory", "past", "remember", "nostalgia", "childhood", "house", "family", "home"],
+    "determination": ["will", "strength", "determined", "resolve", "persevere", "decision", "choice"],
+    "serenity": ["peace", "calm", "serene", "tranquil", "still", "quiet", "meditation", "gentle"],
+    "excitement": ["energy", "dynamic", "vibrant", "electric", "intense", "powerful", "alive"],
+    "loneliness": ["alone", "lonely", "solitude", "isolated", "single", "empty", "echoing"],
+    "hope": ["hope", "dream", "future", "possibility", "light", "bright", "tomorrow"],
+    "curiosity": ["explore", "discover", "unknown", "question", "search", "find", "seek"]
+}
+
+
+# First number in a BPM range such as "90-110 BPM"
+BPM_NUMBER = re.compile(r'(\d+)')
+
+
 class CreativeMusicEngine:
     """Engine for meaningful creative music generation with musical analysis"""
 
@@ -352,19 +516,20 @@ class CreativeMusicEngine:
         except:
             pass
 
-    def analyze_musical_concept(self, concept: str) -> Dict[str, Any]:
+    def analyze_musical_concept(self, concept: Union[str, TextView]) -> Dict[str, Any]:
         """Analyze concept for musical elements instead of just repeating text"""
-        concept.lower()
+        # One view of the concept is shared by every helper below
+        view = TextView.of(concept)
 
         # Extract musical elements from concept
         musical_elements = {
-            "core_themes": self._extract_themes(concept),
-            "emotional_qualities": self._analyze_emotional_qualities(concept),
-            "rhythmic_implications": self._analyze_rhythmic_elements(concept),
-            "harmonic_suggestions": self._analyze_harmonic_elements(concept),
-            "textural_elements": self._analyze_textural_elements(concept),
-            "structural_implications": self._analyze_structural_elements(concept),
-            "sonic_palette": self._extract_sonic_palette(concept)
+            "core_themes": self._extract_themes(view),
+            "emotional_qualities": self._analyze_emotional_qualities(view),
+            "rhythmic_implications": self._analyze_rhythmic_elements(view),
+            "harmonic_suggestions": self._analyze_harmonic_elements(view),
+            "textural_elements": self._analyze_textural_elements(view),
+            "structural_implications": self._analyze_structural_elements(view),
+            "sonic_palette": self._extract_sonic_palette(view)
         }
 
         return musical_elements
@@ -414,39 +579,15 @@ class CreativeMusicEngine:
 
         return commands
 
-    def _extract_themes(self, concept: str) -> List[str]:
+    def _extract_themes(self, concept: Union[str, TextView]) -> List[str]:
         """Extract core thematic elements from concept"""
         themes = []
-        concept_lower = concept.lower()
-
-        # Enhanced thematic keywords mapping with more comprehensive coverage
-        theme_patterns = {
-            "transformation": ["change", "transform", "evolve", "become", "growth", "metamorphosis", "transition", "shift"],
-            "journey": ["travel", "path", "journey", "road", "adventure", "quest", "voyage", "walk", "move", "go"],
-            "conflict": ["struggle", "fight", "battle", "conflict", "tension", "opposition", "war", "clash", "chaos"],
-            "love": ["love", "romance", "heart", "passion", "affection", "devotion", "relationship", "together"],
-            "loss": ["loss", "grief", "sorrow", "missing", "gone", "departed", "empty", "alone", "lost"],
-            "hope": ["hope", "dream", "aspire", "wish", "future", "possibility", "bright", "light", "tomorrow"],
-            "memory": ["remember", "memory", "past", "nostalgia", "recall", "reminisce", "childhood", "yesterday"],
-            "nature": ["nature", "earth", "sky", "water", "forest", "mountain", "ocean", "tree", "wind", "rain"],
-            "time": ["time", "moment", "eternity", "forever", "instant", "duration", "clock", "hour", "day"],
-            "identity": ["self", "identity", "who", "being", "existence", "soul", "person", "individual"],
-            "peace": ["peace", "calm", "quiet", "still", "serene", "tranquil", "meditation", "rest"],
-            "energy": ["energy", "power", "force", "dynamic", "vibrant", "alive", "electric", "intense"],
-            "urban": ["city", "urban", "street", "building", "traffic", "crowd", "metropolitan", "downtown"],
-            "family": ["family", "home", "mother", "father", "child", "parent", "sibling", "house"],
-            "freedom": ["freedom", "free", "escape", "liberation", "independent", "open", "release"],
-            "mystery": ["mystery", "unknown", "secret", "hidden", "enigma", "puzzle", "strange"],
-            "celebration": ["celebration", "party", "joy", "festival", "dance", "music", "happy"],
-            "solitude": ["alone", "solitude", "lonely", "isolated", "single", "individual", "solo"],
-            "decision": ["decision", "choice", "choose", "decide", "crossroads", "option", "path"],
-            "awakening": ["wake", "awaken", "dawn", "morning", "sunrise", "beginning", "start"]
-        }
+        view = TextView.of(concept)
 
         # Score themes based on keyword matches
         theme_scores = {}
-        for theme, keywords in theme_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in concept_lower)
+        for theme, keywords in CONCEPT_THEME_KEYWORDS.items():
+            score = view.count_present(keywords)
             if score > 0:
                 theme_scores[theme] = score
 
@@ -457,16 +598,16 @@ class CreativeMusicEngine:
 
         # Enhanced fallback logic - analyze concept structure and content
         if not themes:
-            words = concept_lower.split()
+            words = view.lowered_tokens
 
             # Analyze sentence structure for themes
-            if any(word in concept_lower for word in ["feeling", "emotion", "sense"]):
+            if view.contains_any(["feeling", "emotion", "sense"]):
                 themes.append("emotional_exploration")
-            elif any(word in concept_lower for word in ["standing", "sitting", "walking", "moving"]):
+            elif view.contains_any(["standing", "sitting", "walking", "moving"]):
                 themes.append("physical_experience")
-            elif any(word in concept_lower for word in ["watching", "seeing", "looking", "observing"]):
+            elif view.contains_any(["watching", "seeing", "looking", "observing"]):
                 themes.append("observation")
-            elif any(word in concept_lower for word in ["thinking", "contemplating", "wondering", "considering"]):
+            elif view.contains_any(["thinking", "contemplating", "wondering", "considering"]):
                 themes.append("contemplation")
             elif len(words) > 15:
                 themes.append("complex_narrative")
@@ -481,9 +622,9 @@ class CreativeMusicEngine:
 
         return themes[:3]  # Limit to top 3 themes
 
-    def _analyze_emotional_qualities(self, concept: str) -> Dict[str, Any]:
+    def _analyze_emotional_qualities(self, concept: Union[str, TextView]) -> Dict[str, Any]:
         """Analyze emotional qualities with varied responses"""
-        concept_lower = concept.lower()
+        view = TextView.of(concept)
 
         # Emotional intensity analysis
         intensity_indicators = {
@@ -494,7 +635,7 @@ class CreativeMusicEngine:
 
         intensity = "medium"  # default
         for level, indicators in intensity_indicators.items():
-            if any(indicator in concept_lower for indicator in indicators):
+            if view.contains_any(indicators):
                 intensity = level
                 break
 
@@ -502,8 +643,8 @@ class CreativeMusicEngine:
         positive_words = ["joy", "happy", "love", "hope", "bright", "light", "celebration"]
         negative_words = ["sad", "dark", "loss", "pain", "sorrow", "grief", "struggle"]
 
-        positive_count = sum(1 for word in positive_words if word in concept_lower)
-        negative_count = sum(1 for word in negative_words if word in concept_lower)
+        positive_count = view.count_present(positive_words)
+        negative_count = view.count_present(negative_words)
 
         if positive_count > negative_count:
             valence = "positive"
@@ -514,40 +655,27 @@ class CreativeMusicEngine:
 
         # Emotional progression analysis
         progression = "static"
-        if any(word in concept_lower for word in ["become", "transform", "change", "evolve"]):
+        if view.contains_any(["become", "transform", "change", "evolve"]):
             progression = "transformative"
-        elif any(word in concept_lower for word in ["journey", "path", "through", "across"]):
+        elif view.contains_any(["journey", "path", "through", "across"]):
             progression = "developmental"
 
         return {
             "intensity": intensity,
             "valence": valence,
             "progression": progression,
-            "primary_emotion": self._identify_primary_emotion(concept_lower),
-            "emotional_complexity": "high" if len(concept.split()) > 10 else "medium"
+            "primary_emotion": self._identify_primary_emotion(view),
+            "emotional_complexity": "high" if len(view.tokens) > 10 else "medium"
         }
 
-    def _identify_primary_emotion(self, concept_lower: str) -> str:
+    def _identify_primary_emotion(self, concept: Union[str, TextView]) -> str:
         """Identify primary emotion beyond just 'contemplative'"""
-        emotion_patterns = {
-            "melancholy": ["sad", "sorrow", "melancholy", "wistful", "longing", "empty", "loss", "grief"],
-            "euphoria": ["joy", "ecstasy", "bliss", "elation", "euphoria", "celebration", "happy", "delight"],
-            "anxiety": ["worry", "fear", "anxious", "nervous", "uncertain", "tension", "stress", "edge"],
-            "anger": ["anger", "rage", "fury", "mad", "frustrated", "chaos", "battle", "fight"],
-            "wonder": ["wonder", "awe", "amazement", "mystery", "magical", "dawn", "awakening", "discovery"],
-            "nostalgia": ["memory", "past", "remember", "nostalgia", "childhood", "house", "family", "home"],
-            "determination": ["will", "strength", "determined", "resolve", "persevere", "decision", "choice"],
-            "serenity": ["peace", "calm", "serene", "tranquil", "still", "quiet", "meditation", "gentle"],
-            "excitement": ["energy", "dynamic", "vibrant", "electric", "intense", "powerful", "alive"],
-            "loneliness": ["alone", "lonely", "solitude", "isolated", "single", "empty", "echoing"],
-            "hope": ["hope", "dream", "future", "possibility", "light", "bright", "tomorrow"],
-            "curiosity": ["explore", "discover", "unknown", "question", "search", "find", "seek"]
-        }
+        view = TextView.of(concept)
 
         # Score emotions based on keyword matches
         emotion_scores = {}
-        for emotion, keywords in emotion_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in concept_lower)
+        for emotion, keywords in CONCEPT_EMOTION_KEYWORDS.items():
+            score = view.count_present(keywords)
             if score > 0:
                 emotion_scores[emotion] = score
 
@@ -556,20 +684,20 @@ class CreativeMusicEngine:
             return max(emotion_scores.items(), key=lambda x: x[1])[0]
 
         # Enhanced fallback based on concept characteristics
-        if "?" in concept_lower:
+        if view.contains("?"):
             return "curiosity"
-        elif "!" in concept_lower:
+        elif view.contains("!"):
             return "excitement"
-        elif len(concept_lower.split()) > 20:
+        elif len(view.lowered_tokens) > 20:
             return "contemplative"
-        elif any(word in concept_lower for word in ["the", "a", "an"]) and len(concept_lower.split()) > 10:
+        elif view.contains_any(["the", "a", "an"]) and len(view.lowered_tokens) > 10:
             return "reflective"
         else:
             return "contemplative"  # final fallback
 
-    def _analyze_rhythmic_elements(self, concept: str) -> Dict[str, Any]:
+    def _analyze_rhythmic_elements(self, concept: Union[str, TextView]) -> Dict[str, Any]:
         """Analyze rhythmic implications from concept"""
-        concept_lower = concept.lower()
+        view = TextView.of(concept)
 
         # Tempo implications
         tempo_indicators = {
@@ -580,24 +708,24 @@ class CreativeMusicEngine:
 
         tempo_feel = "moderate"
         for feel, indicators in tempo_indicators.items():
-            if any(indicator in concept_lower for indicator in indicators):
+            if view.contains_any(indicators):
                 tempo_feel = feel
                 break
 
         # Rhythmic character
         rhythm_character = "steady"
-        if any(word in concept_lower for word in ["broken", "fragmented", "chaos", "irregular"]):
+        if view.contains_any(["broken", "fragmented", "chaos", "irregular"]):
             rhythm_character = "irregular"
-        elif any(word in concept_lower for word in ["flow", "wave", "organic", "natural"]):
+        elif view.contains_any(["flow", "wave", "organic", "natural"]):
             rhythm_character = "flowing"
-        elif any(word in concept_lower for word in ["pulse", "heartbeat", "steady", "constant"]):
+        elif view.contains_any(["pulse", "heartbeat", "steady", "constant"]):
             rhythm_character = "pulsing"
 
         return {
             "tempo_feel": tempo_feel,
             "rhythm_character": rhythm_character,
             "suggested_bpm_range": self._suggest_bpm_range(tempo_feel),
-            "rhythmic_complexity": "complex" if "complex" in concept_lower else "moderate"
+            "rhythmic_complexity": "complex" if view.contains("complex") else "moderate"
         }
 
     def _suggest_bpm_range(self, tempo_feel: str) -> str:
@@ -610,94 +738,96 @@ class CreativeMusicEngine:
         }
         return bpm_ranges.get(tempo_feel, "90-110 BPM")
 
-    def _analyze_harmonic_elements(self, concept: str) -> Dict[str, Any]:
+    def _analyze_harmonic_elements(self, concept: Union[str, TextView]) -> Dict[str, Any]:
         """Analyze harmonic implications"""
-        concept_lower = concept.lower()
+        view = TextView.of(concept)
 
         # Harmonic complexity
         complexity = "moderate"
-        if any(word in concept_lower for word in ["complex", "layered", "deep", "intricate"]):
+        if view.contains_any(["complex", "layered", "deep", "intricate"]):
             complexity = "complex"
-        elif any(word in concept_lower for word in ["simple", "pure", "clean", "minimal"]):
+        elif view.contains_any(["simple", "pure", "clean", "minimal"]):
             complexity = "simple"
 
         # Harmonic color
         color = "warm"
-        if any(word in concept_lower for word in ["dark", "shadow", "night", "deep"]):
+        if view.contains_any(["dark", "shadow", "night", "deep"]):
             color = "dark"
-        elif any(word in concept_lower for word in ["bright", "light", "sun", "clear"]):
+        elif view.contains_any(["bright", "light", "sun", "clear"]):
             color = "bright"
-        elif any(word in concept_lower for word in ["cold", "ice", "winter", "distant"]):
+        elif view.contains_any(["cold", "ice", "winter", "distant"]):
             color = "cool"
 
         # Modal suggestions
         modal_suggestions = []
-        if "sad" in concept_lower or "sorrow" in concept_lower:
+        if view.contains("sad") or view.contains("sorrow"):
             modal_suggestions.append("minor_modes")
-        if "mysterious" in concept_lower or "unknown" in concept_lower:
+        if view.contains("mysterious") or view.contains("unknown"):
             modal_suggestions.append("modal_scales")
-        if "joy" in concept_lower or "celebration" in concept_lower:
+        if view.contains("joy") or view.contains("celebration"):
             modal_suggestions.append("major_modes")
 
         return {
             "complexity": complexity,
             "harmonic_color": color,
             "modal_suggestions": modal_suggestions,
-            "chord_progression_style": self._suggest_chord_style(concept_lower)
+            "chord_progression_style": self._suggest_chord_style(view)
         }
 
-    def _suggest_chord_style(self, concept_lower: str) -> str:
+    def _suggest_chord_style(self, concept: Union[str, TextView]) -> str:
         """Suggest chord progression style"""
-        if any(word in concept_lower for word in ["classical", "traditional", "formal"]):
+        view = TextView.of(concept)
+        if view.contains_any(["classical", "traditional", "formal"]):
             return "classical_progressions"
-        elif any(word in concept_lower for word in ["jazz", "sophisticated", "complex"]):
+        elif view.contains_any(["jazz", "sophisticated", "complex"]):
             return "jazz_progressions"
-        elif any(word in concept_lower for word in ["folk", "simple", "acoustic"]):
+        elif view.contains_any(["folk", "simple", "acoustic"]):
             return "folk_progressions"
-        elif any(word in concept_lower for word in ["modern", "contemporary", "new"]):
+        elif view.contains_any(["modern", "contemporary", "new"]):
             return "contemporary_progressions"
         else:
             return "versatile_progressions"
 
-    def _analyze_textural_elements(self, concept: str) -> Dict[str, Any]:
+    def _analyze_textural_elements(self, concept: Union[str, TextView]) -> Dict[str, Any]:
         """Analyze textural implications"""
-        concept_lower = concept.lower()
+        view = TextView.of(concept)
 
         # Texture density
         density = "medium"
-        if any(word in concept_lower for word in ["thick", "dense", "layered", "full"]):
+        if view.contains_any(["thick", "dense", "layered", "full"]):
             density = "dense"
-        elif any(word in concept_lower for word in ["thin", "sparse", "minimal", "empty"]):
+        elif view.contains_any(["thin", "sparse", "minimal", "empty"]):
             density = "sparse"
 
         # Texture character
         character = "smooth"
-        if any(word in concept_lower for word in ["rough", "harsh", "gritty", "raw"]):
+        if view.contains_any(["rough", "harsh", "gritty", "raw"]):
             character = "rough"
-        elif any(word in concept_lower for word in ["soft", "gentle", "flowing", "silk"]):
+        elif view.contains_any(["soft", "gentle", "flowing", "silk"]):
             character = "soft"
-        elif any(word in concept_lower for word in ["sharp", "crisp", "clear", "defined"]):
+        elif view.contains_any(["sharp", "crisp", "clear", "defined"]):
             character = "crisp"
 
         return {
             "density": density,
             "character": character,
-            "suggested_instruments": self._suggest_instruments(concept_lower),
-            "production_style": self._suggest_production_style(concept_lower)
+            "suggested_instruments": self._suggest_instruments(view),
+            "production_style": self._suggest_production_style(view)
         }
 
-    def _suggest_instruments(self, concept_lower: str) -> List[str]:
+    def _suggest_instruments(self, concept: Union[str, TextView]) -> List[str]:
         """Suggest instruments based on concept"""
+        view = TextView.of(concept)
         instruments = []
 
         # Instrument associations
-        if any(word in concept_lower for word in ["nature", "forest", "earth"]):
+        if view.contains_any(["nature", "forest", "earth"]):
             instruments.extend(["acoustic_guitar", "flute", "strings"])
-        if any(word in concept_lower for word in ["urban", "city", "modern"]):
+        if view.contains_any(["urban", "city", "modern"]):
             instruments.extend(["synthesizer", "electric_guitar", "electronic_drums"])
-        if any(word in concept_lower for word in ["classical", "elegant", "formal"]):
+        if view.contains_any(["classical", "elegant", "formal"]):
             instruments.extend(["piano", "violin", "cello"])
-        if any(word in concept_lower for word in ["folk", "traditional", "acoustic"]):
+        if view.contains_any(["folk", "traditional", "acoustic"]):
             instruments.extend(["acoustic_guitar", "harmonica", "banjo"])
 
         # Default if no specific associations
@@ -706,45 +836,46 @@ class CreativeMusicEngine:
 
         return instruments[:4]  # Limit to 4 instruments
 
-    def _suggest_production_style(self, concept_lower: str) -> str:
+    def _suggest_production_style(self, concept: Union[str, TextView]) -> str:
         """Suggest production style"""
-        if any(word in concept_lower for word in ["intimate", "close", "personal"]):
+        view = TextView.of(concept)
+        if view.contains_any(["intimate", "close", "personal"]):
             return "intimate_production"
-        elif any(word in concept_lower for word in ["grand", "epic", "vast", "huge"]):
+        elif view.contains_any(["grand", "epic", "vast", "huge"]):
             return "epic_production"
-        elif any(word in concept_lower for word in ["clean", "pure", "minimal"]):
+        elif view.contains_any(["clean", "pure", "minimal"]):
             return "clean_production"
-        elif any(word in concept_lower for word in ["atmospheric", "ambient", "space"]):
+        elif view.contains_any(["atmospheric", "ambient", "space"]):
             return "atmospheric_production"
         else:
             return "balanced_production"
 
-    def _analyze_structural_elements(self, concept: str) -> Dict[str, Any]:
+    def _analyze_structural_elements(self, concept: Union[str, TextView]) -> Dict[str, Any]:
         """Analyze structural implications"""
-        concept_lower = concept.lower()
+        view = TextView.of(concept)
 
         # Structure type
         structure_type = "traditional"
-        if any(word in concept_lower for word in ["journey", "story", "narrative"]):
+        if view.contains_any(["journey", "story", "narrative"]):
             structure_type = "narrative"
-        elif any(word in concept_lower for word in ["cycle", "circular", "return"]):
+        elif view.contains_any(["cycle", "circular", "return"]):
             structure_type = "cyclical"
-        elif any(word in concept_lower for word in ["build", "grow", "develop"]):
+        elif view.contains_any(["build", "grow", "develop"]):
             structure_type = "developmental"
-        elif any(word in concept_lower for word in ["fragment", "piece", "broken"]):
+        elif view.contains_any(["fragment", "piece", "broken"]):
             structure_type = "fragmented"
 
         # Suggested sections
-        sections = self._suggest_sections(concept_lower, structure_type)
+        sections = self._suggest_sections(view, structure_type)
 
         return {
             "structure_type": structure_type,
             "suggested_sections": sections,
-            "overall_arc": self._suggest_overall_arc(concept_lower),
-            "dynamic_progression": self._suggest_dynamic_progression(concept_lower)
+            "overall_arc": self._suggest_overall_arc(view),
+            "dynamic_progression": self._suggest_dynamic_progression(view)
         }
 
-    def _suggest_sections(self, concept_lower: str, structure_type: str) -> List[str]:
+    def _suggest_sections(self, concept: Union[str, TextView], structure_type: str) -> List[str]:
         """Suggest song sections based on concept"""
         if structure_type == "narrative":
             return ["intro_setting", "verse_development", "chorus_climax", "bridge_reflection", "outro_resolution"]
@@ -757,57 +888,59 @@ class CreativeMusicEngine:
         else:
             return ["intro", "verse", "chorus", "verse", "chorus", "bridge", "chorus", "outro"]
 
-    def _suggest_overall_arc(self, concept_lower: str) -> str:
+    def _suggest_overall_arc(self, concept: Union[str, TextView]) -> str:
         """Suggest overall emotional/dynamic arc"""
-        if any(word in concept_lower for word in ["rise", "build", "grow", "ascend"]):
+        view = TextView.of(concept)
+        if view.contains_any(["rise", "build", "grow", "ascend"]):
             return "ascending"
-        elif any(word in concept_lower for word in ["fall", "descend", "fade", "diminish"]):
+        elif view.contains_any(["fall", "descend", "fade", "diminish"]):
             return "descending"
-        elif any(word in concept_lower for word in ["wave", "cycle", "ebb", "flow"]):
+        elif view.contains_any(["wave", "cycle", "ebb", "flow"]):
             return "wave_like"
         else:
             return "balanced"
 
-    def _suggest_dynamic_progression(self, concept_lower: str) -> str:
+    def _suggest_dynamic_progression(self, concept: Union[str, TextView]) -> str:
         """Suggest dynamic progression"""
-        if any(word in concept_lower for word in ["explosive", "dramatic", "intense"]):
+        view = TextView.of(concept)
+        if view.contains_any(["explosive", "dramatic", "intense"]):
             return "dramatic_build"
-        elif any(word in concept_lower for word in ["gentle", "gradual", "slow"]):
+        elif view.contains_any(["gentle", "gradual", "slow"]):
             return "gradual_evolution"
-        elif any(word in concept_lower for word in ["sudden", "shift", "change"]):
+        elif view.contains_any(["sudden", "shift", "change"]):
             return "sudden_changes"
         else:
             return "organic_flow"
 
-    def _extract_sonic_palette(self, concept: str) -> List[str]:
+    def _extract_sonic_palette(self, concept: Union[str, TextView]) -> List[str]:
         """Extract sonic palette suggestions from concept imagery"""
-        concept_lower = concept.lower()
+        view = TextView.of(concept)
         sonic_elements = []
 
         # Natural sounds
-        if any(word in concept_lower for word in ["water", "ocean", "rain", "river"]):
+        if view.contains_any(["water", "ocean", "rain", "river"]):
             sonic_elements.append("water_textures")
-        if any(word in concept_lower for word in ["wind", "air", "breath", "breeze"]):
+        if view.contains_any(["wind", "air", "breath", "breeze"]):
             sonic_elements.append("wind_elements")
-        if any(word in concept_lower for word in ["fire", "flame", "burn", "heat"]):
+        if view.contains_any(["fire", "flame", "burn", "heat"]):
             sonic_elements.append("fire_textures")
-        if any(word in concept_lower for word in ["earth", "stone", "rock", "ground"]):
+        if view.contains_any(["earth", "stone", "rock", "ground"]):
             sonic_elements.append("earth_tones")
 
         # Atmospheric elements
-        if any(word in concept_lower for word in ["space", "vast", "infinite", "cosmos"]):
+        if view.contains_any(["space", "vast", "infinite", "cosmos"]):
             sonic_elements.append("spatial_reverb")
-        if any(word in concept_lower for word in ["intimate", "close", "whisper", "personal"]):
+        if view.contains_any(["intimate", "close", "whisper", "personal"]):
             sonic_elements.append("intimate_ambience")
-        if any(word in concept_lower for word in ["echo", "distant", "far", "memory"]):
+        if view.contains_any(["echo", "distant", "far", "memory"]):
             sonic_elements.append("echo_effects")
 
         # Textural elements
-        if any(word in concept_lower for word in ["smooth", "silk", "flowing", "liquid"]):
+        if view.contains_any(["smooth", "silk", "flowing", "liquid"]):
             sonic_elements.append("smooth_textures")
-        if any(word in concept_lower for word in ["rough", "gritty", "harsh", "raw"]):
+        if view.contains_any(["rough", "gritty", "harsh", "raw"]):
             sonic_elements.append("rough_textures")
-        if any(word in concept_lower for word in ["shimmer", "sparkle", "glitter", "bright"]):
+        if view.contains_any(["shimmer", "sparkle", "glitter", "bright"]):
             sonic_elements.append("shimmer_effects")
 
         # Default if no specific elements found
@@ -886,7 +1019,7 @@ class CreativeMusicEngine:
         bpm_range = concept_analysis["rhythmic_implications"]["suggested_bpm_range"]
         if "BPM" in bpm_range:
             # Extract BPM number for Suno format
-            bpm_match = re.search(r'(\d+)', bpm_range)
+            bpm_match = BPM_NUMBER.search(bpm_range)
             if bpm_match:
                 command_parts.append(f"{bpm_match.group(1)}bpm")
 
@@ -1314,6 +1447,158 @@ class CreativeMusicEngine:
             return "low"
 
 
+# Matches of the same fact type closer than this are one occurrence
+FACT_CLUSTER_WINDOW_CHARS = 200
+# Emotional states kept per fact type, however long the text
+MAX_STATES_PER_FACT_TYPE = 3
+
+FACT_ACTION_PATTERNS = {
+    'loss': re.compile(r'(?:lost|died|gone|left|abandoned|departed)', re.IGNORECASE),
+    'achievement': re.compile(r'(?:won|succeeded|accomplished|achieved|mastered)', re.IGNORECASE),
+    'conflict': re.compile(r'(?:fought|argued|confronted|challenged|opposed)', re.IGNORECASE),
+    'connection': re.compile(r'(?:loved|befriended|trusted|bonded|united)', re.IGNORECASE),
+    'betrayal': re.compile(r'(?:betrayed|lied|deceived|broken|failed)', re.IGNORECASE)
+}
+
+FACTUAL_EVENT_PATTERNS = [
+    re.compile(r'(?:he|she|they|I)\s+(died|left|arrived|discovered|realized|decided|fought|won|lost|created|destroyed|built|broke|learned|found|met|became|changed)', re.IGNORECASE),
+    re.compile(r'(?:was|were|became|got)\s+([a-z]+(?:ed|ing)?)', re.IGNORECASE),
+    re.compile(r'(?:happened|occurred|took place|resulted in|led to|caused)\s+([^.]+)', re.IGNORECASE),
+    re.compile(r'(?:felt|experienced|witnessed|saw|heard|found)\s+([^.]+)', re.IGNORECASE),
+    re.compile(r'\b(birth|death|marriage|divorce|graduation|promotion|failure|success|accident|illness|recovery|journey|arrival|departure)\b', re.IGNORECASE)
+]
+
+
+@dataclass(slots=True)
+class MatchCluster:
+    """Run of same-label pattern matches that sit close together in the text"""
+    label: Any
+    start: int  # Span of the first match
+    end: int
+    count: int = 1
+
+
+class MatchClusterAggregator:
+    """
+    Streams pattern matches into per-label clusters and keeps the top-k per label
+
+    Matches of one label must arrive in text order, as re.finditer yields them.
+    A match starting within window_chars of the open cluster's first match joins
+    it; otherwise that cluster is closed and competes for one of the label's
+    top_k slots by match count, earlier clusters winning ties. Memory stays at
+    top_k clusters per label however long the text is.
+    """
+
+    def __init__(self, top_k: int = MAX_STATES_PER_FACT_TYPE, window_chars: int = FACT_CLUSTER_WINDOW_CHARS):
+        self.top_k = top_k
+        self.window_chars = window_chars
+        self.total_matches = 0
+        self._open: Dict[Any, MatchCluster] = {}
+        self._kept: Dict[Any, List[Tuple[int, int, MatchCluster]]] = {}
+
+    def add(self, label: Any, start: int, end: int) -> None:
+        self.total_matches += 1
+        cluster = self._open.get(label)
+        if cluster is not None and start - cluster.start < self.window_chars:
+            cluster.count += 1
+            return
+        if cluster is not None:
+            self._close(cluster)
+        else:
+            self._kept.setdefault(label, [])  # Labels come out in the order they were first seen
+        self._open[label] = MatchCluster(label, start, end)
+
+    def add_matches(self, label: Any, matches: Iterable[re.Match]) -> None:
+        for match in matches:
+            self.add(label, match.start(), match.end())
+
+    def clusters(self) -> Dict[Any, List[MatchCluster]]:
+        """Kept clusters per label (in first-seen label order), each in text order"""
+        for cluster in self._open.values():
+            self._close(cluster)
+        self._open.clear()
+        return {label: sorted((cluster for _, _, cluster in kept), key=lambda cluster: cluster.start)
+                for label, kept in self._kept.items()}
+
+    def _close(self, cluster: MatchCluster) -> None:
+        kept = self._kept.setdefault(cluster.label, [])
+        rank = (cluster.count, -cluster.start, cluster)
+        if len(kept) < self.top_k:
+            heapq.heappush(kept, rank)
+        elif rank[:2] > kept[0][:2]:
+            heapq.heapreplace(kept, rank)
+
+
+FACT_EMOTION_MAPPINGS = {
+    'loss': {
+        'primary': 'grief',
+        'secondary': ['denial', 'anger', 'numbness'],
+        'defense': 'emotional shutdown',
+        'intensity': 0.9
+    },
+    'achievement': {
+        'primary': 'joy',
+        'secondary': ['pride', 'relief', 'anticipation'],
+        'defense': None,
+        'intensity': 0.8
+    },
+    'betrayal': {
+        'primary': 'anger',
+        'secondary': ['hurt', 'disbelief', 'shame'],
+        'defense': 'projection',
+        'intensity': 0.95
+    }
+}
+
+
+# Physical activity in the text sets the base tempo; the fastest activity present wins
+TEMPO_ACTIVITY_PATTERNS = [
+    (re.compile(r'\b(running|racing|rushing|hurrying|chasing)\b', re.IGNORECASE), 140),
+    (re.compile(r'\b(walking|moving|traveling|going)\b', re.IGNORECASE), 100),
+    (re.compile(r'\b(sitting|resting|waiting|thinking|contemplating)\b', re.IGNORECASE), 75),
+    (re.compile(r'\b(sleeping|dreaming|lying|peaceful|calm)\b', re.IGNORECASE), 60)
+]
+TEMPO_ACTIVITY_GATE = compile_alternation((pattern.pattern for pattern, _ in TEMPO_ACTIVITY_PATTERNS), re.IGNORECASE)
+
+# Emotional language around a fact
+EMOTIONAL_LANGUAGE_PATTERNS = [
+    re.compile(r'\b(felt|feeling|emotions?|mood|heart|soul|spirit|mind)\s+([a-z]+)', re.IGNORECASE),
+    re.compile(r'\b(happy|sad|angry|afraid|surprised|disgusted|excited|nervous|calm|peaceful|agitated|frustrated|hopeful|hopeless|proud|ashamed|guilty|relieved|anxious|content|bitter|sweet|tender|harsh|gentle|violent|quiet|loud|slow|fast|heavy|light|dark|bright|warm|cold|empty|full|broken|whole|lost|found)\b', re.IGNORECASE),
+    re.compile(r'\b(tears?|crying|laughing|smiling|frowning|sighing|screaming|whispering|trembling|shaking|breathing|gasping|choking|sobbing)\b', re.IGNORECASE),
+    re.compile(r'\b(love|hate|fear|hope|despair|joy|sorrow|rage|peace|chaos|freedom|prison|heaven|hell|light|darkness)\b', re.IGNORECASE)
+]
+
+# Descriptive language that sets the overall emotional tone
+TONE_PATTERNS = [
+    re.compile(r'\b(atmosphere|mood|feeling|sense|air|weight|energy|vibration|tension|calm|storm|peace|chaos)\s+(?:of|was|felt|seemed)\s+([a-z]+)', re.IGNORECASE),
+    re.compile(r'\b(dark|light|heavy|light|cold|warm|sharp|soft|harsh|gentle|loud|quiet|fast|slow|thick|thin)\b', re.IGNORECASE),
+    re.compile(r'\b(?:everything|world|life|existence|reality|truth|time|space|people|everyone|nothing|something)\s+(?:felt|seemed|appeared|looked|sounded)\s+([a-z]+)', re.IGNORECASE)
+]
+
+# Internal conflict, tried in order; the first match wins
+TEXT_CONFLICT_PATTERNS = [
+    re.compile(r'(?:but|however|yet|though|although)\s+([^.]+)', re.IGNORECASE),
+    re.compile(r'(?:torn between|conflicted|unsure|uncertain|confused)\s+([^.]+)', re.IGNORECASE)
+]
+
+# Defense mechanisms, tried in order; the first match wins
+TEXT_DEFENSE_PATTERNS = {
+    'denial': re.compile(r'(?:not|never|couldn\'t|wouldn\'t)\s+(?:true|real|happening)', re.IGNORECASE),
+    'projection': re.compile(r'(?:they|everyone|others)\s+(?:always|never|should)', re.IGNORECASE),
+    'rationalization': re.compile(r'(?:because|since|reason|logical|makes sense)', re.IGNORECASE)
+}
+TEXT_DEFENSE_GATE = compile_alternation((pattern.pattern for pattern in TEXT_DEFENSE_PATTERNS.values()), re.IGNORECASE)
+
+# Internal conflicts around a fact, tried in order; the first match wins
+FACT_CONFLICT_INDICATORS = [
+    (re.compile(r'but\s+(?:I|he|she|they)\s+(?:couldn\'t|shouldn\'t|wouldn\'t)', re.IGNORECASE), "desire vs duty"),
+    (re.compile(r'wanted\s+to\s+\w+\s+but', re.IGNORECASE), "impulse vs restraint"),
+    (re.compile(r'(?:torn|divided|conflicted)\s+between', re.IGNORECASE), "competing loyalties"),
+    (re.compile(r'(?:pretended|forced|faked)\s+(?:a|to)\s+\w+', re.IGNORECASE), "authentic vs performative")
+]
+FACT_CONFLICT_GATE = compile_alternation((pattern.pattern for pattern, _ in FACT_CONFLICT_INDICATORS), re.IGNORECASE)
+
+
 class EmotionalBeatEngine:
     """PURE EXECUTION ENGINE - Takes LLM-defined emotional maps and produces music accordingly"""
 
@@ -1399,19 +1684,17 @@ class EmotionalBeatEngine:
 
         return commands
 
-    def _generate_tempo_from_content(self, text: str, emotional_states: List[EmotionalState]) -> int:
+    def _generate_tempo_from_content(self, text: Union[str, TextView], emotional_states: List[EmotionalState]) -> int:
         """Generate BPM from actual textual content, not templates"""
+        view = TextView.of(text)
         base_tempo = 80
 
         # Physical actions mentioned in text determine tempo
-        if re.search(r'\b(running|racing|rushing|hurrying|chasing)\b', text, re.IGNORECASE):
-            base_tempo = 140
-        elif re.search(r'\b(walking|moving|traveling|going)\b', text, re.IGNORECASE):
-            base_tempo = 100
-        elif re.search(r'\b(sitting|resting|waiting|thinking|contemplating)\b', text, re.IGNORECASE):
-            base_tempo = 75
-        elif re.search(r'\b(sleeping|dreaming|lying|peaceful|calm)\b', text, re.IGNORECASE):
-            base_tempo = 60
+        if TEMPO_ACTIVITY_GATE.search(view.original):
+            for pattern, tempo in TEMPO_ACTIVITY_PATTERNS:
+                if pattern.search(view.original):
+                    base_tempo = tempo
+                    break
 
         # Emotional intensity modification
         if emotional_states:
@@ -1419,9 +1702,9 @@ class EmotionalBeatEngine:
             base_tempo += int(avg_intensity * 30)  # 0-30 BPM boost from intensity
 
         # Textual rhythm (sentence length affects tempo)
-        sentences = [s.strip() for s in text.split('.') if s.strip()]
-        if sentences:
-            avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
+        sentence_lengths = view.sentence_word_counts
+        if sentence_lengths:
+            avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths)
             if avg_sentence_length > 20:  # Long sentences = slower tempo
                 base_tempo -= 10
             elif avg_sentence_length < 5:  # Short sentences = faster tempo
@@ -1429,13 +1712,14 @@ class EmotionalBeatEngine:
 
         return max(50, min(180, base_tempo))
 
-    def _generate_rhythm_from_content(self, text: str, emotional_states: List[EmotionalState]) -> str:
+    def _generate_rhythm_from_content(self, text: Union[str, TextView], emotional_states: List[EmotionalState]) -> str:
         """Generate rhythm pattern from actual content, not templates"""
+        view = TextView.of(text)
 
         # Text structure influences rhythm
-        punctuation_density = (text.count(',') + text.count(';') + text.count(':')) / len(text) * 1000
-        question_density = text.count('?') / len(text) * 1000
-        exclamation_density = text.count('!') / len(text) * 1000
+        punctuation_density = (view.count(',') + view.count(';') + view.count(':')) / len(view) * 1000
+        question_density = view.count('?') / len(view) * 1000
+        exclamation_density = view.count('!') / len(view) * 1000
 
         if question_density > 5:
             rhythm_base = "questioning_syncopation"
@@ -1464,8 +1748,9 @@ class EmotionalBeatEngine:
 
         return rhythm_base + rhythm_modifier
 
-    def _design_sounds_from_content(self, text: str, emotional_states: List[EmotionalState]) -> List[str]:
+    def _design_sounds_from_content(self, text: Union[str, TextView], emotional_states: List[EmotionalState]) -> List[str]:
         """Design sonic elements based on textual content"""
+        view = TextView.of(text)
         sounds = []
 
         # Extract sound-related words from text
@@ -1481,7 +1766,7 @@ class EmotionalBeatEngine:
         }
 
         for sound_source, sound_elements in sound_mapping.items():
-            if sound_source in text.lower():
+            if view.contains(sound_source):
                 sounds.extend(sound_elements)
 
         # Add emotional sound design
@@ -1501,21 +1786,23 @@ class EmotionalBeatEngine:
         if not sounds and emotional_states:
             for state in emotional_states:
                 for trigger in state.factual_triggers:
-                    if any(word in trigger.lower() for word in ['home', 'house', 'room']):
+                    trigger_view = TextView(trigger)
+                    if trigger_view.contains_any(['home', 'house', 'room']):
                         sounds.append('domestic_ambience')
-                    elif any(word in trigger.lower() for word in ['street', 'city', 'urban']):
+                    elif trigger_view.contains_any(['street', 'city', 'urban']):
                         sounds.append('urban_texture')
-                    elif any(word in trigger.lower() for word in ['nature', 'forest', 'outdoor']):
+                    elif trigger_view.contains_any(['nature', 'forest', 'outdoor']):
                         sounds.append('natural_environment')
 
         return sounds[:5] if sounds else ['contextual_ambience']  # Limit to 5 elements
 
-    def _generate_structure_from_content(self, text: str, emotional_states: List[EmotionalState]) -> Dict[str, str]:
+    def _generate_structure_from_content(self, text: Union[str, TextView], emotional_states: List[EmotionalState]) -> Dict[str, str]:
         """Generate track structure from narrative flow"""
+        view = TextView.of(text)
 
         # Analyze text structure
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-        sentences = [s.strip() for s in text.split('.') if s.strip()]
+        paragraphs = view.paragraphs
+        sentences = view.sentences
 
         if len(paragraphs) >= 3:
             structure = {
@@ -1529,14 +1816,15 @@ class EmotionalBeatEngine:
         else:
             structure = {
                 'intro': "Brief atmospheric introduction",
-                'main_section': f"Carries the emotional weight of: {text[:150]}...",
+                'main_section': f"Carries the emotional weight of: {view.original[:150]}...",
                 'outro': "Natural conclusion"
             }
 
         return structure
 
-    def _create_production_commands(self, tempo: int, rhythm: str, sounds: List[str], structure: Dict[str, str], text: str, emotional_states: List[EmotionalState]) -> List[str]:
+    def _create_production_commands(self, tempo: int, rhythm: str, sounds: List[str], structure: Dict[str, str], text: Union[str, TextView], emotional_states: List[EmotionalState]) -> List[str]:
         """Create actual production commands for Suno"""
+        view = TextView.of(text)
         commands = []
 
         # Main production command
@@ -1545,7 +1833,7 @@ class EmotionalBeatEngine:
         main_command = f"[{tempo}bpm] [{rhythm}] "
         main_command += f"Emotional core: {primary_emotion} | "
         main_command += f"Sonic palette: {', '.join(sounds[:3])} | "
-        main_command += f"Based on: {text[:100]}..."
+        main_command += f"Based on: {view.original[:100]}..."
 
         commands.append(main_command)
 
@@ -1585,31 +1873,27 @@ class EmotionalBeatEngine:
 
         return emotional_states
 
-    def _extract_factual_events(self, text: str) -> List[Dict[str, str]]:
-        """Extract concrete events/facts from text"""
+    def _extract_factual_events(self, text: str, top_k: int = MAX_STATES_PER_FACT_TYPE) -> List[Dict[str, str]]:
+        """Extract concrete events/facts from text, at most top_k clusters per action pattern"""
         events = []
 
         # Action patterns - things that actually happened
-        action_patterns = [
-            r'(?:he|she|they|I)\s+(died|left|arrived|discovered|realized|decided|fought|won|lost|created|destroyed|built|broke|learned|found|met|became|changed)',
-            r'(?:was|were|became|got)\s+([a-z]+(?:ed|ing)?)',
-            r'(?:happened|occurred|took place|resulted in|led to|caused)\s+([^.]+)',
-            r'(?:felt|experienced|witnessed|saw|heard|found)\s+([^.]+)',
-            r'\b(birth|death|marriage|divorce|graduation|promotion|failure|success|accident|illness|recovery|journey|arrival|departure)\b'
-        ]
-
-        for pattern in action_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                context_start = max(0, match.start() - 100)
-                context_end = min(len(text), match.end() + 100)
+        aggregator = MatchClusterAggregator(top_k)
+        for pattern_index, pattern in enumerate(FACTUAL_EVENT_PATTERNS):
+            aggregator.add_matches(pattern_index, pattern.finditer(text))
+
+        for clusters in aggregator.clusters().values():
+            for cluster in clusters:
+                context_start = max(0, cluster.start - 100)
+                context_end = min(len(text), cluster.end + 100)
                 context = text[context_start:context_end].strip()
 
                 events.append({
-                    'action': match.group(),
+                    'action': text[cluster.start:cluster.end],
                     'context': context,
                     'type': 'factual_event',
-                    'position': match.start()
+                    'position': cluster.start,
+                    'occurrences': cluster.count
                 })
 
         return events
@@ -1618,6 +1902,7 @@ class EmotionalBeatEngine:
         """Derive emotional state from actual factual content"""
         action = event['action'].lower()
         context = event['context']
+        context_view = TextView(context)
 
         # Analyze the emotional weight of this specific fact
         emotional_indicators = self._find_emotional_language_around_fact(context, full_text)
@@ -1628,7 +1913,7 @@ class EmotionalBeatEngine:
         # Build emotion from the actual content, not templates
         primary_emotion = self._determine_primary_emotion_from_indicators(emotional_indicators, action)
         secondary_emotions = self._extract_secondary_emotions(emotional_indicators)
-        intensity = self._calculate_emotional_intensity_from_context(emotional_indicators, context)
+        intensity = self._calculate_emotional_intensity_from_context(emotional_indicators, context_view)
 
         return EmotionalState(
             primary_emotion=primary_emotion,
@@ -1637,7 +1922,8 @@ class EmotionalBeatEngine:
             factual_triggers=[action, context[:100]],
             internal_conflict=self._detect_internal_conflict_in_text(context),
             defense_mechanism=self._detect_defense_mechanism_in_text(context),
-            authenticity_score=self._score_emotional_authenticity_from_text(emotional_indicators, context)
+            authenticity_score=self._score_emotional_authenticity_from_text(emotional_indicators, context_view),
+            occurrences=event.get('occurrences', 1)
         )
 
     def _find_emotional_language_around_fact(self, context: str, full_text: str) -> List[str]:
@@ -1645,15 +1931,8 @@ class EmotionalBeatEngine:
         emotional_words = []
 
         # Emotional descriptors that appear near the fact
-        emotion_patterns = [
-            r'\b(felt|feeling|emotions?|mood|heart|soul|spirit|mind)\s+([a-z]+)',
-            r'\b(happy|sad|angry|afraid|surprised|disgusted|excited|nervous|calm|peaceful|agitated|frustrated|hopeful|hopeless|proud|ashamed|guilty|relieved|anxious|content|bitter|sweet|tender|harsh|gentle|violent|quiet|loud|slow|fast|heavy|light|dark|bright|warm|cold|empty|full|broken|whole|lost|found)\b',
-            r'\b(tears?|crying|laughing|smiling|frowning|sighing|screaming|whispering|trembling|shaking|breathing|gasping|choking|sobbing)\b',
-            r'\b(love|hate|fear|hope|despair|joy|sorrow|rage|peace|chaos|freedom|prison|heaven|hell|light|darkness)\b'
-        ]
-
-        for pattern in emotion_patterns:
-            matches = re.findall(pattern, context, re.IGNORECASE)
+        for pattern in EMOTIONAL_LANGUAGE_PATTERNS:
+            matches = pattern.findall(context)
             for match in matches:
                 if isinstance(match, tuple):
                     emotional_words.extend([word for word in match if word and len(word) > 2])
@@ -1706,14 +1985,8 @@ class EmotionalBeatEngine:
         tone_indicators = []
 
         # Extract descriptive language that sets emotional tone
-        tone_patterns = [
-            r'\b(atmosphere|mood|feeling|sense|air|weight|energy|vibration|tension|calm|storm|peace|chaos)\s+(?:of|was|felt|seemed)\s+([a-z]+)',
-            r'\b(dark|light|heavy|light|cold|warm|sharp|soft|harsh|gentle|loud|quiet|fast|slow|thick|thin)\b',
-            r'\b(?:everything|world|life|existence|reality|truth|time|space|people|everyone|nothing|something)\s+(?:felt|seemed|appeared|looked|sounded)\s+([a-z]+)'
-        ]
-
-        for pattern in tone_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in TONE_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, tuple):
                     tone_indicators.extend([word for word in match if word and len(word) > 2])
@@ -1738,26 +2011,22 @@ class EmotionalBeatEngine:
         """Extract secondary emotions from indicators"""
         return indicators[:3]  # Return up to 3 secondary emotions
 
-    def _calculate_emotional_intensity_from_context(self, indicators: List[str], context: str) -> float:
+    def _calculate_emotional_intensity_from_context(self, indicators: List[str], context: Union[str, TextView]) -> float:
         """Calculate emotional intensity based on context"""
+        view = TextView.of(context)
         intensity_words = ['extremely', 'very', 'deeply', 'profoundly', 'completely', 'utterly', 'overwhelming']
         intensity_score = 0.5  # Base intensity
 
         for word in intensity_words:
-            if word in context.lower():
+            if view.contains(word):
                 intensity_score += 0.1
 
         return min(intensity_score, 1.0)
 
     def _detect_internal_conflict_in_text(self, context: str) -> Optional[str]:
         """Detect internal conflict from context"""
-        conflict_patterns = [
-            r'(?:but|however|yet|though|although)\s+([^.]+)',
-            r'(?:torn between|conflicted|unsure|uncertain|confused)\s+([^.]+)'
-        ]
-
-        for pattern in conflict_patterns:
-            match = re.search(pattern, context, re.IGNORECASE)
+        for pattern in TEXT_CONFLICT_PATTERNS:
+            match = pattern.search(context)
             if match:
                 return match.group(1)[:100]
 
@@ -1765,25 +2034,24 @@ class EmotionalBeatEngine:
 
     def _detect_defense_mechanism_in_text(self, context: str) -> Optional[str]:
         """Detect defense mechanisms from context"""
-        defense_patterns = {
-            'denial': r'(?:not|never|couldn\'t|wouldn\'t)\s+(?:true|real|happening)',
-            'projection': r'(?:they|everyone|others)\s+(?:always|never|should)',
-            'rationalization': r'(?:because|since|reason|logical|makes sense)'
-        }
 
-        for mechanism, pattern in defense_patterns.items():
-            if re.search(pattern, context, re.IGNORECASE):
+        if not TEXT_DEFENSE_GATE.search(context):
+            return None
+
+        for mechanism, pattern in TEXT_DEFENSE_PATTERNS.items():
+            if pattern.search(context):
                 return mechanism
 
         return None
 
-    def _score_emotional_authenticity_from_text(self, indicators: List[str], context: str) -> float:
+    def _score_emotional_authenticity_from_text(self, indicators: List[str], context: Union[str, TextView]) -> float:
         """Score emotional authenticity based on text evidence"""
+        view = TextView.of(context)
         authenticity_markers = ['felt', 'feeling', 'emotion', 'heart', 'soul', 'deep', 'real', 'true']
         performance_markers = ['should', 'supposed', 'expected', 'proper', 'appropriate']
 
-        authentic_count = sum(1 for marker in authenticity_markers if marker in context.lower())
-        performance_count = sum(1 for marker in performance_markers if marker in context.lower())
+        authentic_count = view.count_present(authenticity_markers)
+        performance_count = view.count_present(performance_markers)
 
         # Base score on evidence of genuine vs performed emotion
         if authentic_count > performance_count:
@@ -1791,59 +2059,42 @@ class EmotionalBeatEngine:
         else:
             return max(0.3, 0.7 - (performance_count * 0.1))
 
-    def analyze_emotional_facts(self, text: str, character: Optional[CharacterProfile] = None) -> List[EmotionalState]:
-        """Extract fact-based emotional states from text"""
+    def analyze_emotional_facts(self, text: str, character: Optional[CharacterProfile] = None,
+                                top_k: int = MAX_STATES_PER_FACT_TYPE) -> List[EmotionalState]:
+        """
+        Extract fact-based emotional states from text
+
+        Nearby matches of the same fact type are folded into one state (counted
+        in occurrences) and only the top_k most reinforced states per fact type
+        are built, so the result stays bounded on long texts.
+        """
         emotional_states = []
 
-        # Fact extraction patterns
-        action_patterns = {
-            'loss': r'(?:lost|died|gone|left|abandoned|departed)',
-            'achievement': r'(?:won|succeeded|accomplished|achieved|mastered)',
-            'conflict': r'(?:fought|argued|confronted|challenged|opposed)',
-            'connection': r'(?:loved|befriended|trusted|bonded|united)',
-            'betrayal': r'(?:betrayed|lied|deceived|broken|failed)'
-        }
+        # Cluster matches first; states are only built for the clusters kept
+        aggregator = MatchClusterAggregator(top_k)
+        for emotion_type, pattern in FACT_ACTION_PATTERNS.items():
+            aggregator.add_matches(emotion_type, pattern.finditer(text))
 
-        for emotion_type, pattern in action_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for emotion_type, clusters in aggregator.clusters().items():
+            for cluster in clusters:
                 # Extract surrounding context
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
+                start = max(0, cluster.start - 100)
+                end = min(len(text), cluster.end + 100)
                 context = text[start:end]
 
                 # Determine emotional response based on facts
                 emotional_state = self._map_fact_to_emotion(emotion_type, context, character)
                 if emotional_state:
+                    emotional_state.occurrences = cluster.count
                     emotional_states.append(emotional_state)
 
         return emotional_states
 
     def _map_fact_to_emotion(self, fact_type: str, context: str, character: Optional[CharacterProfile]) -> Optional[EmotionalState]:
         """Map factual events to complex emotional states"""
-        emotion_mappings = {
-            'loss': {
-                'primary': 'grief',
-                'secondary': ['denial', 'anger', 'numbness'],
-                'defense': 'emotional shutdown',
-                'intensity': 0.9
-            },
-            'achievement': {
-                'primary': 'joy',
-                'secondary': ['pride', 'relief', 'anticipation'],
-                'defense': None,
-                'intensity': 0.8
-            },
-            'betrayal': {
-                'primary': 'anger',
-                'secondary': ['hurt', 'disbelief', 'shame'],
-                'defense': 'projection',
-                'intensity': 0.95
-            }
-        }
 
-        if fact_type in emotion_mappings:
-            mapping = emotion_mappings[fact_type]
+        if fact_type in FACT_EMOTION_MAPPINGS:
+            mapping = FACT_EMOTION_MAPPINGS[fact_type]
             return EmotionalState(
                 primary_emotion=mapping['primary'],
                 secondary_emotions=mapping['secondary'],
@@ -1857,26 +2108,25 @@ class EmotionalBeatEngine:
 
     def _detect_internal_conflict(self, context: str, character: Optional[CharacterProfile]) -> Optional[str]:
         """Detect internal emotional conflicts from context"""
-        conflict_indicators = [
-            (r'but\s+(?:I|he|she|they)\s+(?:couldn\'t|shouldn\'t|wouldn\'t)', "desire vs duty"),
-            (r'wanted\s+to\s+\w+\s+but', "impulse vs restraint"),
-            (r'(?:torn|divided|conflicted)\s+between', "competing loyalties"),
-            (r'(?:pretended|forced|faked)\s+(?:a|to)\s+\w+', "authentic vs performative")
-        ]
 
-        for pattern, conflict_type in conflict_indicators:
-            if re.search(pattern, context, re.IGNORECASE):
+        if not FACT_CONFLICT_GATE.search(context):
+            return None
+
+        for pattern, conflict_type in FACT_CONFLICT_INDICATORS:
+            if pattern.search(context):
                 return conflict_type
         return None
 
-    def _calculate_authenticity(self, context: str) -> float:
+    def _calculate_authenticity(self, context: Union[str, TextView]) -> float:
         """Calculate emotional authenticity score"""
+        view = TextView.of(context)
+
         # Higher score = more authentic emotion
         performative_indicators = ['pretended', 'forced', 'faked', 'acted', 'seemed']
         authentic_indicators = ['truly', 'genuinely', 'really', 'actually', 'honestly']
 
-        performative_count = sum(1 for word in performative_indicators if word in context.lower())
-        authentic_count = sum(1 for word in authentic_indicators if word in context.lower())
+        performative_count = view.count_present(performative_indicators)
+        authentic_count = view.count_present(authentic_indicators)
 
         if performative_count > authentic_count:
             return 0.3 + (authentic_count * 0.1)
@@ -1961,25 +2211,33 @@ class EmotionalBeatEngine:
 
 
 
+# Actions that contradict the emotion shown alongside them
+ACTION_EMOTION_CONTRADICTIONS = [
+    (re.compile(r'smiled\s+(?:while|as|when)\s+(?:crying|tears)', re.IGNORECASE), 'joy vs sadness'),
+    (re.compile(r'laughed\s+(?:but|though|even though)\s+(?:hurt|pain)', re.IGNORECASE), 'humor vs pain'),
+    (re.compile(r'calm\s+(?:despite|even with|while)\s+(?:rage|fury|anger)', re.IGNORECASE), 'peace vs anger')
+]
+
+
 class MetaNarrativeProcessor:
     """Processes meta-narrative elements and emotional subtext"""
 
     def __init__(self):
         self.subtext_patterns = {
             'suppressed_emotion': [
-                r'(?:forced|managed|mustered)\s+a\s+(?:smile|laugh)',
-                r'(?:held|bit|swallowed)\s+(?:back|down|their)',
-                r'(?:pretended|acted)\s+(?:not|as if|like)'
+                re.compile(r'(?:forced|managed|mustered)\s+a\s+(?:smile|laugh)', re.IGNORECASE),
+                re.compile(r'(?:held|bit|swallowed)\s+(?:back|down|their)', re.IGNORECASE),
+                re.compile(r'(?:pretended|acted)\s+(?:not|as if|like)', re.IGNORECASE)
             ],
             'emotional_turning_point': [
-                r'(?:realized|understood|saw)\s+(?:that|how|why)',
-                r'(?:suddenly|finally|at last)\s+(?:felt|knew|understood)',
-                r'(?:everything|nothing)\s+would\s+(?:ever\s+)?be\s+the\s+same'
+                re.compile(r'(?:realized|understood|saw)\s+(?:that|how|why)', re.IGNORECASE),
+                re.compile(r'(?:suddenly|finally|at last)\s+(?:felt|knew|understood)', re.IGNORECASE),
+                re.compile(r'(?:everything|nothing)\s+would\s+(?:ever\s+)?be\s+the\s+same', re.IGNORECASE)
             ],
             'identity_crisis': [
-                r'(?:who|what)\s+(?:am|was|had)\s+(?:I|he|she|they)\s+become',
-                r'(?:lost|found)\s+(?:himself|herself|themselves)',
-                r'(?:questioned|doubted)\s+everything'
+                re.compile(r'(?:who|what)\s+(?:am|was|had)\s+(?:I|he|she|they)\s+become', re.IGNORECASE),
+                re.compile(r'(?:lost|found)\s+(?:himself|herself|themselves)', re.IGNORECASE),
+                re.compile(r'(?:questioned|doubted)\s+everything', re.IGNORECASE)
             ]
         }
 
@@ -1989,7 +2247,7 @@ class MetaNarrativeProcessor:
 
         for subtext_type, patterns in self.subtext_patterns.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 for match in matches:
                     context_start = max(0, match.start() - 200)
                     context_end = min(len(text), match.end() + 200)
@@ -2030,14 +2288,8 @@ class MetaNarrativeProcessor:
         contradictions = []
 
         # Look for action-emotion mismatches
-        action_emotion_patterns = [
-            (r'smiled\s+(?:while|as|when)\s+(?:crying|tears)', 'joy vs sadness'),
-            (r'laughed\s+(?:but|though|even though)\s+(?:hurt|pain)', 'humor vs pain'),
-            (r'calm\s+(?:despite|even with|while)\s+(?:rage|fury|anger)', 'peace vs anger')
-        ]
-
-        for pattern, contradiction_type in action_emotion_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern, contradiction_type in ACTION_EMOTION_CONTRADICTIONS:
+            matches = pattern.finditer(text)
             for match in matches:
                 contradictions.append({
                     'type': contradiction_type,
@@ -2682,25 +2934,34 @@ class EmotionalCoherenceValidator:
             'recommendations': recommendations
         }
 
+# Psychological defense mechanisms in introspective text
+DEFENSE_MECHANISM_PATTERNS = {
+    'denial': re.compile(r'(?:couldn\'t|wouldn\'t|refused to)\s+(?:believe|accept|see)', re.IGNORECASE),
+    'projection': re.compile(r'(?:blamed|accused)\s+(?:everyone|them|others)', re.IGNORECASE),
+    'rationalization': re.compile(r'(?:told\s+(?:myself|himself|herself|themselves)|reasoned that|justified)', re.IGNORECASE),
+    'displacement': re.compile(r'(?:took\s+out|vented|directed)\s+(?:anger|frustration|pain)\s+(?:on|at)', re.IGNORECASE)
+}
+
+
 class SelfReflectionAnalyzer:
     """Analyzes self-reflective and introspective content"""
 
     def __init__(self):
         self.reflection_indicators = {
             'self_awareness': [
-                r'(?:I|he|she|they)\s+(?:realized|understood|knew)\s+(?:that|how)',
-                r'(?:looking|looked)\s+(?:back|within|inside)',
-                r'(?:reflected|pondered|contemplated)\s+(?:on|upon)'
+                re.compile(r'(?:I|he|she|they)\s+(?:realized|understood|knew)\s+(?:that|how)', re.IGNORECASE),
+                re.compile(r'(?:looking|looked)\s+(?:back|within|inside)', re.IGNORECASE),
+                re.compile(r'(?:reflected|pondered|contemplated)\s+(?:on|upon)', re.IGNORECASE)
             ],
             'emotional_processing': [
-                r'(?:felt|feeling)\s+(?:like|as if|that)',
-                r'(?:emotions?|feelings?)\s+(?:washed|flooded|overwhelmed)',
-                r'(?:tried|trying)\s+to\s+(?:understand|process|cope)'
+                re.compile(r'(?:felt|feeling)\s+(?:like|as if|that)', re.IGNORECASE),
+                re.compile(r'(?:emotions?|feelings?)\s+(?:washed|flooded|overwhelmed)', re.IGNORECASE),
+                re.compile(r'(?:tried|trying)\s+to\s+(?:understand|process|cope)', re.IGNORECASE)
             ],
             'growth_recognition': [
-                r'(?:learned|grown|changed)\s+(?:from|since|after)',
-                r'(?:no longer|not anymore)\s+(?:the same|who)',
-                r'(?:became|becoming)\s+(?:someone|something)\s+(?:new|different)'
+                re.compile(r'(?:learned|grown|changed)\s+(?:from|since|after)', re.IGNORECASE),
+                re.compile(r'(?:no longer|not anymore)\s+(?:the same|who)', re.IGNORECASE),
+                re.compile(r'(?:became|becoming)\s+(?:someone|something)\s+(?:new|different)', re.IGNORECASE)
             ]
         }
 
@@ -2717,7 +2978,7 @@ class SelfReflectionAnalyzer:
         # Extract self-awareness moments
         for category, patterns in self.reflection_indicators.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 for match in matches:
                     moment = {
                         'category': category,
@@ -2783,15 +3044,9 @@ class SelfReflectionAnalyzer:
         """Identify psychological defense mechanisms in text"""
         mechanisms = []
 
-        defense_patterns = {
-            'denial': r'(?:couldn\'t|wouldn\'t|refused to)\s+(?:believe|accept|see)',
-            'projection': r'(?:blamed|accused)\s+(?:everyone|them|others)',
-            'rationalization': r'(?:told\s+(?:myself|himself|herself|themselves)|reasoned that|justified)',
-            'displacement': r'(?:took\s+out|vented|directed)\s+(?:anger|frustration|pain)\s+(?:on|at)'
-        }
 
-        for mechanism_type, pattern in defense_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for mechanism_type, pattern in DEFENSE_MECHANISM_PATTERNS.items():
+            matches = pattern.finditer(text)
             for match in matches:
                 mechanisms.append({
                     'type': mechanism_type,
@@ -2815,6 +3070,35 @@ class SelfReflectionAnalyzer:
 # CHARACTER ANALYSIS ENGINE
 # ================================================================================================
 
+NARRATIVE_THEME_KEYWORDS = {
+    'love': ['love', 'romance', 'relationship', 'heart', 'feelings'],
+    'power': ['power', 'control', 'authority', 'dominance', 'rule'],
+    'redemption': ['redemption', 'forgiveness', 'second chance', 'atonement'],
+    'betrayal': ['betrayal', 'deception', 'lie', 'cheat', 'backstab'],
+    'sacrifice': ['sacrifice', 'give up', 'loss', 'surrender'],
+    'justice': ['justice', 'fair', 'right', 'wrong', 'moral'],
+    'family': ['family', 'parent', 'child', 'brother', 'sister'],
+    'friendship': ['friend', 'companion', 'ally', 'bond'],
+    'survival': ['survive', 'escape', 'danger', 'threat', 'death'],
+    'growth': ['learn', 'grow', 'change', 'develop', 'mature']
+}
+
+EMOTIONAL_ARC_KEYWORDS = {
+    'joy': ['happy', 'joy', 'elated', 'cheerful', 'delighted'],
+    'sadness': ['sad', 'sorrow', 'grief', 'melancholy', 'despair'],
+    'anger': ['angry', 'rage', 'fury', 'mad', 'irritated'],
+    'fear': ['afraid', 'scared', 'terrified', 'anxious', 'worried'],
+    'surprise': ['surprised', 'shocked', 'amazed', 'astonished'],
+    'hope': ['hope', 'optimistic', 'confident', 'positive'],
+    'tension': ['tense', 'stressed', 'pressure', 'conflict', 'struggle']
+}
+
+
+# Full names (First Last, First Middle Last) and dialogue speakers
+FULL_NAME = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2}\b')
+DIALOGUE_SPEAKER = re.compile(r'([A-Z][a-z]+)\s+' + SPEECH_VERBS)
+
+
 class CharacterAnalyzer:
     """Advanced character analysis using NLP and pattern recognition"""
 
@@ -2842,6 +3126,7 @@ class CharacterAnalyzer:
         self.meta_narrative_processor = MetaNarrativeProcessor()
         self.self_reflection_analyzer = SelfReflectionAnalyzer()
 
+    @traced("character_analysis")
     async def analyze_text(self, text: str, ctx: Context) -> TextAnalysisResult:
         """Perform comprehensive character analysis on input text"""
         await ctx.info("Starting character analysis...")
@@ -2862,24 +3147,21 @@ class CharacterAnalyzer:
         complexity = await self._calculate_complexity(text)
 
         # NEW: Extract fact-based emotional states
-        emotional_states = []
+        emotional_state_objects = []
         primary_character = characters[0] if characters else None
         if primary_character:
-            raw_states = self.emotional_beat_engine.analyze_emotional_facts(text, primary_character)
-            emotional_states = [asdict(state) for state in raw_states]
+            emotional_state_objects = self.emotional_beat_engine.analyze_emotional_facts(text, primary_character)
+        emotional_states = [state.to_dict() for state in emotional_state_objects]
 
         # NEW: Extract emotional subtext and meta-narrative elements
         emotional_subtext = []
-        if emotional_states:
-            emotional_state_objects = [EmotionalState(**state) for state in emotional_states]
+        if emotional_state_objects:
             emotional_subtext = self.meta_narrative_processor.extract_emotional_subtext(text, emotional_state_objects)
 
         # NEW: Generate beat progression based on emotional journey
         beat_progression = None
-        if emotional_states:
-            beat_progression = self.emotional_beat_engine.generate_beat_progression(
-                [EmotionalState(**state) for state in emotional_states]
-            )
+        if emotional_state_objects:
+            beat_progression = self.emotional_beat_engine.generate_beat_progression(emotional_state_objects)
 
         # NEW: Analyze introspection and self-reflection
         introspection_analysis = None
@@ -2928,23 +3210,24 @@ class CharacterAnalyzer:
             }
         }
 
+    @traced("character_detection")
     async def _extract_characters(self, text: str, ctx: Context) -> List[CharacterProfile]:
         """Extract and analyze characters using three-layer methodology"""
         # Find potential character names with improved patterns
         potential_names = set()
 
         # Pattern 1: Full names (First Last, First Middle Last)
-        full_names = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2}\b', text)
+        full_names = FULL_NAME.findall(text)
         potential_names.update(full_names)
 
         # Pattern 2: Single names that appear frequently
-        single_names = re.findall(r'\b[A-Z][a-z]{2,}\b', text)
+        single_names = CAPITALIZED_NAME.findall(text)
         for name in single_names:
             if text.count(name) >= 3:  # Single names must appear at least 3 times
                 potential_names.add(name)
 
         # Pattern 3: Names from dialogue attribution
-        dialogue_names = re.findall(r'([A-Z][a-z]+)\s+(?:said|asked|replied|whispered|shouted|exclaimed)', text)
+        dialogue_names = DIALOGUE_SPEAKER.findall(text)
         potential_names.update(dialogue_names)
 
         # Filter out common words and validate as character names
@@ -3023,7 +3306,7 @@ class CharacterAnalyzer:
 
     def _extract_character_segments(self, name: str, text: str) -> List[str]:
         """Extract text segments that mention the character"""
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_BOUNDARY.split(text)
         segments = []
 
         for sentence in sentences:
@@ -3132,7 +3415,7 @@ class CharacterAnalyzer:
         for segment in segments:
             if name.lower() in segment.lower():
                 # Look for other proper names in the same segment
-                other_names = re.findall(r'\b[A-Z][a-z]+\b', segment)
+                other_names = CAPITALIZED_WORD.findall(segment)
                 for other_name in other_names:
                     if other_name != name and len(other_name) > 2:
                         connections.append(f"Connected to {other_name}")
@@ -3262,30 +3545,19 @@ class CharacterAnalyzer:
         ]
 
         for pattern in alias_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = compile_pattern(pattern, re.IGNORECASE).findall(text)
             aliases.extend(matches)
 
         return list(set(aliases))
 
+    @traced("theme_analysis")
     async def _analyze_themes(self, text: str) -> List[str]:
         """Analyze narrative themes"""
-        theme_keywords = {
-            'love': ['love', 'romance', 'relationship', 'heart', 'feelings'],
-            'power': ['power', 'control', 'authority', 'dominance', 'rule'],
-            'redemption': ['redemption', 'forgiveness', 'second chance', 'atonement'],
-            'betrayal': ['betrayal', 'deception', 'lie', 'cheat', 'backstab'],
-            'sacrifice': ['sacrifice', 'give up', 'loss', 'surrender'],
-            'justice': ['justice', 'fair', 'right', 'wrong', 'moral'],
-            'family': ['family', 'parent', 'child', 'brother', 'sister'],
-            'friendship': ['friend', 'companion', 'ally', 'bond'],
-            'survival': ['survive', 'escape', 'danger', 'threat', 'death'],
-            'growth': ['learn', 'grow', 'change', 'develop', 'mature']
-        }
 
         themes = []
         text_lower = text.lower()
 
-        for theme, keywords in theme_keywords.items():
+        for theme, keywords in NARRATIVE_THEME_KEYWORDS.items():
             score = sum(text_lower.count(keyword) for keyword in keywords)
             if score > 0:
                 themes.append(f"{theme} (strength: {score})")
@@ -3296,17 +3568,9 @@ class CharacterAnalyzer:
 
         return [theme for theme, _ in theme_scores[:5]]
 
+    @traced("emotional_arc")
     async def _analyze_emotional_arc(self, text: str) -> List[str]:
         """Analyze the emotional progression through the text"""
-        emotions = {
-            'joy': ['happy', 'joy', 'elated', 'cheerful', 'delighted'],
-            'sadness': ['sad', 'sorrow', 'grief', 'melancholy', 'despair'],
-            'anger': ['angry', 'rage', 'fury', 'mad', 'irritated'],
-            'fear': ['afraid', 'scared', 'terrified', 'anxious', 'worried'],
-            'surprise': ['surprised', 'shocked', 'amazed', 'astonished'],
-            'hope': ['hope', 'optimistic', 'confident', 'positive'],
-            'tension': ['tense', 'stressed', 'pressure', 'conflict', 'struggle']
-        }
 
         # Divide text into sections and analyze emotional content
         sections = [text[i:i+len(text)//5] for i in range(0, len(text), len(text)//5)]
@@ -3316,7 +3580,7 @@ class CharacterAnalyzer:
             section_emotions = {}
             section_lower = section.lower()
 
-            for emotion, keywords in emotions.items():
+            for emotion, keywords in EMOTIONAL_ARC_KEYWORDS.items():
                 score = sum(section_lower.count(keyword) for keyword in keywords)
                 if score > 0:
                     section_emotions[emotion] = score
@@ -3337,10 +3601,12 @@ class CharacterAnalyzer:
         setting_segments = []
         text_lower = text.lower()
 
+        sentences = None
         for indicator in setting_indicators + time_indicators:
             if indicator in text_lower:
                 # Find sentences containing setting information
-                sentences = re.split(r'[.!?]+', text)
+                if sentences is None:
+                    sentences = SENTENCE_BOUNDARY.split(text)
                 for sentence in sentences:
                     if indicator in sentence.lower():
                         setting_segments.append(sentence.strip())
@@ -3351,7 +3617,7 @@ class CharacterAnalyzer:
     async def _calculate_complexity(self, text: str) -> float:
         """Calculate text complexity score"""
         words = text.split()
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_BOUNDARY.split(text)
 
         if not words or not sentences:
             return 0.0
@@ -3372,6 +3638,74 @@ class CharacterAnalyzer:
 # MUSICAL PERSONA GENERATOR
 # ================================================================================================
 
+# Define essential trait-to-genre mappings for absolute fallback
+FALLBACK_TRAIT_GENRES = {
+    'melancholic': ['blues', 'folk', 'indie'],
+    'mysterious': ['dark ambient', 'gothic', 'alternative'],
+    'brave': ['rock', 'metal', 'punk'],
+    'compassionate': ['soul', 'gospel', 'folk'],
+    'rebellious': ['punk', 'alternative', 'grunge'],
+    'intellectual': ['progressive', 'art rock', 'ambient'],
+    'intellectual courage': ['progressive', 'art rock', 'experimental'],
+    'creative': ['indie', 'alternative', 'art pop'],
+    'adventurous': ['electronic', 'synthwave', 'space rock'],
+    'emotional': ['blues', 'soul', 'gospel'],
+    'confident': ['rock', 'pop', 'electronic'],
+    'vulnerable': ['indie', 'singer-songwriter', 'folk'],
+    'ambitious': ['pop', 'electronic', 'rock'],
+    'perfectionist': ['progressive', 'classical', 'jazz'],
+    'authentic': ['folk', 'country', 'singer-songwriter'],
+    'introspective': ['ambient', 'post-rock', 'indie'],
+    'artistic': ['art pop', 'experimental', 'indie'],
+    'quest for meaning': ['progressive', 'ambient', 'post-rock'],
+    'commitment to life': ['soul', 'gospel', 'blues'],
+    'love transcending death': ['blues', 'soul', 'folk'],
+    'creative drive': ['indie', 'alternative', 'art pop'],
+    'fear of exposure': ['indie', 'singer-songwriter', 'alternative'],
+    'duty to crew': ['electronic', 'synthwave', 'rock'],
+    'courage under pressure': ['rock', 'electronic', 'metal'],
+    'desire for freedom': ['indie', 'alternative', 'folk'],
+    'need for authenticity': ['singer-songwriter', 'folk', 'indie'],
+    'duty to justice': ['alternative', 'rock', 'gothic'],
+    'inherited magical responsibility': ['gothic', 'dark ambient', 'alternative'],
+    'intellectual brilliance': ['progressive', 'art rock', 'classical'],
+    'determination to contribute': ['classical', 'orchestral', 'progressive']
+}
+
+# Define trait-to-vocal-style mappings
+FALLBACK_TRAIT_VOCAL_STYLES = {
+    'melancholic': 'soulful and emotional',
+    'mysterious': 'haunting and atmospheric',
+    'brave': 'powerful and commanding',
+    'compassionate': 'warm and heartfelt',
+    'rebellious': 'raw and aggressive',
+    'intellectual': 'contemplative and articulate',
+    'creative': 'expressive and artistic',
+    'adventurous': 'dynamic and energetic',
+    'emotional': 'raw and passionate',
+    'confident': 'strong and commanding',
+    'vulnerable': 'intimate and delicate',
+    'ambitious': 'powerful and determined',
+    'perfectionist': 'precise and controlled',
+    'authentic': 'honest and genuine',
+    'introspective': 'thoughtful and reflective',
+    'artistic': 'expressive and creative',
+    'quest for meaning': 'profound and contemplative',
+    'commitment to life': 'passionate and soulful',
+    'love transcending death': 'emotional and heartfelt',
+    'creative drive': 'expressive and passionate',
+    'fear of exposure': 'vulnerable and authentic',
+    'duty to crew': 'strong and reliable',
+    'courage under pressure': 'powerful and confident',
+    'desire for freedom': 'liberating and expressive',
+    'need for authenticity': 'honest and raw',
+    'duty to justice': 'determined and strong',
+    'inherited magical responsibility': 'mysterious and powerful',
+    'intellectual brilliance': 'articulate and measured',
+    'determination to contribute': 'inspiring and uplifting'
+}
+
+
 class MusicPersonaGenerator:
     """Generate musical artist personas from character profiles"""
 
@@ -3391,7 +3725,7 @@ class MusicPersonaGenerator:
 
         self._initialization_attempted = True
 
-        if not WIKI_INTEGRATION_AVAILABLE:
+        if not _load_wiki_integration():
             logger.info("Wiki integration not available, using fallback mappings")
             # Initialize SunoCommandGenerator without wiki data manager (fallback mode)
             command_generator = SunoCommandGenerator(None)
@@ -3467,9 +3801,11 @@ class MusicPersonaGenerator:
             logger.warning(f"Failed to build attributed context: {e}")
             return str(content)
 
+    @traced("persona_generation")
     async def generate_artist_persona(self, character: StandardCharacterProfile, ctx: Context,
                                      requested_genre: Optional[str] = None) -> ArtistPersona:
         """Generate a musical artist persona from character profile, optionally aligned with requested genre"""
+        annotate(character=character.name)
         await ctx.info(f"Generating artist persona for {character.name}...")
 
         # Determine primary personality traits
@@ -3531,6 +3867,7 @@ class MusicPersonaGenerator:
 
         return persona
 
+    @traced("genre_alignment")
     async def _apply_genre_alignment(self, persona: ArtistPersona, requested_genre: str, ctx: Context) -> ArtistPersona:
         """Apply genre-specific alignment to persona using genre intelligence"""
         try:
@@ -3609,6 +3946,7 @@ class MusicPersonaGenerator:
 
         return list(set(traits))[:3]  # Return top 3 unique traits
 
+    @traced("genre_mapping")
     async def _map_to_genres(self, traits: List[str]) -> Tuple[str, List[str]]:
         """Map personality traits to musical genres using enhanced wiki-based mapping"""
 
@@ -3723,48 +4061,14 @@ class MusicPersonaGenerator:
         """Final hardcoded fallback when all intelligent methods fail"""
         logger.info("Using hardcoded fallback trait mappings as last resort")
 
-        # Define essential trait-to-genre mappings for absolute fallback
-        trait_genre_map = {
-            'melancholic': ['blues', 'folk', 'indie'],
-            'mysterious': ['dark ambient', 'gothic', 'alternative'],
-            'brave': ['rock', 'metal', 'punk'],
-            'compassionate': ['soul', 'gospel', 'folk'],
-            'rebellious': ['punk', 'alternative', 'grunge'],
-            'intellectual': ['progressive', 'art rock', 'ambient'],
-            'intellectual courage': ['progressive', 'art rock', 'experimental'],
-            'creative': ['indie', 'alternative', 'art pop'],
-            'adventurous': ['electronic', 'synthwave', 'space rock'],
-            'emotional': ['blues', 'soul', 'gospel'],
-            'confident': ['rock', 'pop', 'electronic'],
-            'vulnerable': ['indie', 'singer-songwriter', 'folk'],
-            'ambitious': ['pop', 'electronic', 'rock'],
-            'perfectionist': ['progressive', 'classical', 'jazz'],
-            'authentic': ['folk', 'country', 'singer-songwriter'],
-            'introspective': ['ambient', 'post-rock', 'indie'],
-            'artistic': ['art pop', 'experimental', 'indie'],
-            'quest for meaning': ['progressive', 'ambient', 'post-rock'],
-            'commitment to life': ['soul', 'gospel', 'blues'],
-            'love transcending death': ['blues', 'soul', 'folk'],
-            'creative drive': ['indie', 'alternative', 'art pop'],
-            'fear of exposure': ['indie', 'singer-songwriter', 'alternative'],
-            'duty to crew': ['electronic', 'synthwave', 'rock'],
-            'courage under pressure': ['rock', 'electronic', 'metal'],
-            'desire for freedom': ['indie', 'alternative', 'folk'],
-            'need for authenticity': ['singer-songwriter', 'folk', 'indie'],
-            'duty to justice': ['alternative', 'rock', 'gothic'],
-            'inherited magical responsibility': ['gothic', 'dark ambient', 'alternative'],
-            'intellectual brilliance': ['progressive', 'art rock', 'classical'],
-            'determination to contribute': ['classical', 'orchestral', 'progressive']
-        }
-
         # Find best matching genre based on traits with priority weighting
         genre_scores = {}
         for i, trait in enumerate(traits):
             trait_lower = trait.lower()
-            if trait_lower in trait_genre_map:
+            if trait_lower in FALLBACK_TRAIT_GENRES:
                 # Give higher weight to first traits (more important)
                 weight = len(traits) - i
-                for genre in trait_genre_map[trait_lower]:
+                for genre in FALLBACK_TRAIT_GENRES[trait_lower]:
                     genre_scores[genre] = genre_scores.get(genre, 0) + weight
 
         # If no direct matches, use intelligent fallback mapping
@@ -3833,44 +4137,11 @@ class MusicPersonaGenerator:
             except ImportError:
                 pass
 
-        # Define trait-to-vocal-style mappings
-        trait_vocal_map = {
-            'melancholic': 'soulful and emotional',
-            'mysterious': 'haunting and atmospheric',
-            'brave': 'powerful and commanding',
-            'compassionate': 'warm and heartfelt',
-            'rebellious': 'raw and aggressive',
-            'intellectual': 'contemplative and articulate',
-            'creative': 'expressive and artistic',
-            'adventurous': 'dynamic and energetic',
-            'emotional': 'raw and passionate',
-            'confident': 'strong and commanding',
-            'vulnerable': 'intimate and delicate',
-            'ambitious': 'powerful and determined',
-            'perfectionist': 'precise and controlled',
-            'authentic': 'honest and genuine',
-            'introspective': 'thoughtful and reflective',
-            'artistic': 'expressive and creative',
-            'quest for meaning': 'profound and contemplative',
-            'commitment to life': 'passionate and soulful',
-            'love transcending death': 'emotional and heartfelt',
-            'creative drive': 'expressive and passionate',
-            'fear of exposure': 'vulnerable and authentic',
-            'duty to crew': 'strong and reliable',
-            'courage under pressure': 'powerful and confident',
-            'desire for freedom': 'liberating and expressive',
-            'need for authenticity': 'honest and raw',
-            'duty to justice': 'determined and strong',
-            'inherited magical responsibility': 'mysterious and powerful',
-            'intellectual brilliance': 'articulate and measured',
-            'determination to contribute': 'inspiring and uplifting'
-        }
-
         # Find best matching vocal style
         for trait in traits:
             trait_lower = trait.lower()
-            if trait_lower in trait_vocal_map:
-                return trait_vocal_map[trait_lower]
+            if trait_lower in FALLBACK_TRAIT_VOCAL_STYLES:
+                return FALLBACK_TRAIT_VOCAL_STYLES[trait_lower]
 
         # Default fallback
         return 'expressive and character-driven'
@@ -4220,6 +4491,44 @@ class MusicPersonaGenerator:
 # SUNO COMMAND GENERATOR
 # ================================================================================================
 
+# A tag lookup is (SunoCommandGenerator method name, hashable positional args)
+TagLookup = Tuple[str, Tuple[Any, ...]]
+
+# Tag lookups resolved ahead of command assembly for the current request
+_resolved_tag_lookups: ContextVar[Optional[Dict[TagLookup, Any]]] = ContextVar(
+    '_resolved_tag_lookups', default=None
+)
+# In-flight wiki meta tag fetches shared by concurrently resolving lookups
+_meta_tag_fetches: ContextVar[Optional[Dict[Optional[str], 'asyncio.Task']]] = ContextVar(
+    '_meta_tag_fetches', default=None
+)
+
+
+# Intelligent fallback with semantic emotion mapping
+FALLBACK_EMOTION_TAGS = {
+    'joy': ['uplifting', 'happy', 'energetic', 'bright', 'cheerful', 'positive'],
+    'happiness': ['uplifting', 'happy', 'energetic', 'bright', 'cheerful', 'positive'],
+    'sadness': ['melancholic', 'sad', 'introspective', 'minor', 'somber', 'mournful'],
+    'melancholy': ['melancholic', 'sad', 'introspective', 'minor', 'somber', 'mournful'],
+    'anger': ['aggressive', 'intense', 'powerful', 'driving', 'fierce', 'harsh'],
+    'rage': ['aggressive', 'intense', 'powerful', 'driving', 'fierce', 'harsh'],
+    'fear': ['tense', 'dark', 'mysterious', 'anxious', 'ominous', 'suspenseful'],
+    'anxiety': ['tense', 'dark', 'mysterious', 'anxious', 'ominous', 'suspenseful'],
+    'love': ['romantic', 'warm', 'intimate', 'gentle', 'tender', 'affectionate'],
+    'romance': ['romantic', 'warm', 'intimate', 'gentle', 'tender', 'affectionate'],
+    'nostalgia': ['nostalgic', 'wistful', 'reminiscent', 'vintage', 'bittersweet', 'longing'],
+    'longing': ['nostalgic', 'wistful', 'reminiscent', 'vintage', 'bittersweet', 'longing'],
+    'contemplation': ['thoughtful', 'reflective', 'meditative', 'ambient', 'introspective', 'philosophical'],
+    'reflection': ['thoughtful', 'reflective', 'meditative', 'ambient', 'introspective', 'philosophical'],
+    'excitement': ['energetic', 'fast', 'dynamic', 'upbeat', 'thrilling', 'exhilarating'],
+    'energy': ['energetic', 'fast', 'dynamic', 'upbeat', 'thrilling', 'exhilarating'],
+    'peace': ['peaceful', 'calm', 'serene', 'tranquil', 'soothing', 'gentle'],
+    'calm': ['peaceful', 'calm', 'serene', 'tranquil', 'soothing', 'gentle'],
+    'hope': ['hopeful', 'uplifting', 'inspiring', 'optimistic', 'bright', 'encouraging'],
+    'optimism': ['hopeful', 'uplifting', 'inspiring', 'optimistic', 'bright', 'encouraging']
+}
+
+
 class SunoCommandGenerator:
     """Generate optimized Suno AI commands from artist personas"""
 
@@ -4232,12 +4541,211 @@ class SunoCommandGenerator:
         # Initialize emotional lyric generator
         self.lyric_generator = EmotionalLyricGenerator()
 
+    # ------------------------------------------------------------------
+    # Wiki tag lookup planning
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _tag_lookup(method: str, *args: Any) -> TagLookup:
+        """Build a hashable lookup key, freezing list arguments into tuples"""
+        return (method, tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args))
+
+    @staticmethod
+    def _copy_tag_result(result: Any) -> Any:
+        """Copy a resolved lookup so callers can extend it without affecting other variants"""
+        if isinstance(result, dict):
+            return {key: list(value) for key, value in result.items()}
+        if isinstance(result, (list, tuple)):
+            return list(result)
+        return result
+
+    async def _fetch_wiki_meta_tags(self, category: Optional[str] = None) -> List[Any]:
+        """Fetch wiki meta tags, sharing one in-flight fetch per category while lookups resolve"""
+        fetches = _meta_tag_fetches.get()
+        if fetches is None:
+            return await self.wiki_data_manager.get_meta_tags(category=category)
+
+        task = fetches.get(category)
+        if task is None:
+            task = asyncio.ensure_future(self.wiki_data_manager.get_meta_tags(category=category))
+            fetches[category] = task
+        return await asyncio.shield(task)
+
+    async def _resolve_tag_lookup(self, lookup: TagLookup) -> Any:
+        """Return a pre-resolved lookup result, or perform the lookup directly"""
+        resolved = _resolved_tag_lookups.get()
+        if resolved is not None and lookup in resolved:
+            result = resolved[lookup]
+        else:
+            result = await self._run_tag_lookup(lookup)
+        return self._copy_tag_result(result)
+
+    async def _run_tag_lookup(self, lookup: TagLookup) -> Any:
+        method, args = lookup
+        return await getattr(self, method)(*args)
+
+    @traced("wiki_tag_lookups")
+    async def resolve_tag_lookups(self, lookups: Iterable[TagLookup]) -> Dict[TagLookup, Any]:
+        """Resolve distinct tag lookups concurrently.
+
+        Identical lookups are performed once, and lookups that need the same wiki
+        category share a single meta tag fetch. Failed lookups are left out so the
+        command builders retry them directly and surface errors as before.
+        """
+        unique_lookups = list(dict.fromkeys(lookups))
+        if not unique_lookups:
+            return {}
+
+        token = _meta_tag_fetches.set({})
+        try:
+            results = await asyncio.gather(
+                *(self._run_tag_lookup(lookup) for lookup in unique_lookups),
+                return_exceptions=True
+            )
+        finally:
+            _meta_tag_fetches.reset(token)
+
+        resolved = {}
+        for lookup, result in zip(unique_lookups, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.debug(f"Tag lookup {lookup[0]} failed during prefetch: {result}")
+                continue
+            resolved[lookup] = result
+        return resolved
+
+    @asynccontextmanager
+    async def prefetch_tag_lookups(self, lookups: Iterable[TagLookup]):
+        """Resolve lookups up front and serve them to command builders within the block.
+
+        Nested scopes only resolve lookups the enclosing scope has not already resolved,
+        so a multi-persona batch plans once and each persona reuses the shared results.
+        """
+        outer = _resolved_tag_lookups.get() or {}
+        missing = [lookup for lookup in lookups if lookup not in outer]
+        resolved = {**outer, **(await self.resolve_tag_lookups(missing))} if missing else outer
+
+        token = _resolved_tag_lookups.set(resolved)
+        try:
+            yield resolved
+        finally:
+            _resolved_tag_lookups.reset(token)
+
+    def plan_command_variants(self, artist_persona: ArtistPersona, character: StandardCharacterProfile,
+                              emotional_states: Optional[List[EmotionalState]] = None) -> List[Tuple[str, Dict[str, TagLookup]]]:
+        """Return the command variants to generate, in order, with the tag lookups each needs"""
+        variants = [
+            ('simple', self._simple_command_lookups(artist_persona, character)),
+            ('custom', self._custom_command_lookups(artist_persona, character)),
+            ('bracket', self._bracket_command_lookups(artist_persona, character)),
+        ]
+
+        if emotional_states and len(emotional_states) > 0:
+            variants.append(('emotion_beat', self._emotion_beat_command_lookups(artist_persona, character, emotional_states)))
+
+        if len(character.motivations) > 1 or len(character.conflicts) > 1:
+            variants.append(('lyric_focused', self._lyric_focused_command_lookups(artist_persona, character)))
+
+        if len(character.relationships) > 2:
+            variants.append(('collaboration', self._collaboration_command_lookups(artist_persona, character)))
+
+        return variants
+
+    def plan_tag_lookups(self, artist_persona: ArtistPersona, character: StandardCharacterProfile,
+                         emotional_states: Optional[List[EmotionalState]] = None) -> List[TagLookup]:
+        """Return every tag lookup needed to generate commands for one persona"""
+        return [
+            lookup
+            for _variant, lookups in self.plan_command_variants(artist_persona, character, emotional_states)
+            for lookup in lookups.values()
+        ]
+
+    def _simple_command_lookups(self, artist_persona: ArtistPersona, character: StandardCharacterProfile) -> Dict[str, TagLookup]:
+        emotional_core = artist_persona.emotional_palette[0] if artist_persona.emotional_palette else 'authentic expression'
+        return {
+            'style': self._tag_lookup('get_style_tags_for_genre', artist_persona.primary_genre),
+            'structure': self._tag_lookup('get_structure_tags_for_complexity', 'simple', None),
+            'vocal': self._tag_lookup('get_vocal_tags_for_style', artist_persona.vocal_style, emotional_core),
+        }
+
+    def _custom_command_lookups(self, artist_persona: ArtistPersona, character: StandardCharacterProfile) -> Dict[str, TagLookup]:
+        emotions = ', '.join(artist_persona.emotional_palette[:2])
+        primary_emotion = emotions.split(', ')[0] if emotions else None
+        complexity = 'complex' if character.confidence_score > 0.7 else 'simple'
+
+        lookups = {
+            'genre': self._tag_lookup('get_genre_specific_meta_tags', artist_persona.primary_genre, primary_emotion),
+            'structure': self._tag_lookup('get_structure_tags_for_complexity', complexity, character.personality_drivers),
+            'vocal': self._tag_lookup('get_vocal_tags_for_style', artist_persona.vocal_style, primary_emotion),
+        }
+        if primary_emotion:
+            lookups['emotion'] = self._tag_lookup(
+                'create_emotion_to_meta_tag_mapping', [primary_emotion], artist_persona.primary_genre
+            )
+        if artist_persona.instrumental_preferences:
+            lookups['instruments'] = self._tag_lookup(
+                'correlate_instruments_to_meta_tags', artist_persona.instrumental_preferences,
+                artist_persona.primary_genre, primary_emotion
+            )
+        return lookups
+
+    def _bracket_command_lookups(self, artist_persona: ArtistPersona, character: StandardCharacterProfile) -> Dict[str, TagLookup]:
+        lookups = {
+            'style': self._tag_lookup('get_style_tags_for_genre', artist_persona.primary_genre),
+            'structure': self._tag_lookup('get_structure_tags_for_complexity', 'simple', None),
+            'vocal': self._tag_lookup('get_vocal_tags_for_style', artist_persona.vocal_style, None),
+        }
+        if artist_persona.instrumental_preferences:
+            lookups['instruments'] = self._tag_lookup(
+                'get_instrumental_meta_tags', artist_persona.instrumental_preferences[:2], artist_persona.primary_genre
+            )
+        return lookups
+
+    def _lyric_focused_command_lookups(self, artist_persona: ArtistPersona, character: StandardCharacterProfile) -> Dict[str, TagLookup]:
+        return {
+            'style': self._tag_lookup('get_style_tags_for_genre', artist_persona.primary_genre),
+            'structure': self._tag_lookup('get_structure_tags_for_complexity', 'narrative', character.personality_drivers),
+            'vocal': self._tag_lookup('get_vocal_tags_for_style', artist_persona.vocal_style, None),
+        }
+
+    def _collaboration_command_lookups(self, artist_persona: ArtistPersona, character: StandardCharacterProfile) -> Dict[str, TagLookup]:
+        lookups = {
+            'style': self._tag_lookup('get_style_tags_for_genre', artist_persona.primary_genre),
+            'structure': self._tag_lookup('get_structure_tags_for_complexity', 'complex', character.personality_drivers),
+            'vocal': self._tag_lookup('get_vocal_tags_for_style', artist_persona.vocal_style, None),
+        }
+        if artist_persona.instrumental_preferences:
+            lookups['instruments'] = self._tag_lookup(
+                'get_instrumental_meta_tags', artist_persona.instrumental_preferences, artist_persona.primary_genre
+            )
+        return lookups
+
+    def _emotion_beat_command_lookups(self, artist_persona: ArtistPersona, character: StandardCharacterProfile,
+                                      emotional_states: List[EmotionalState]) -> Dict[str, TagLookup]:
+        primary_emotion = emotional_states[0].primary_emotion if emotional_states else 'contemplative'
+        complexity = 'complex' if len(emotional_states) > 2 else 'emotional'
+
+        lookups = {
+            'genre': self._tag_lookup('get_genre_specific_meta_tags', artist_persona.primary_genre, primary_emotion),
+            'emotion': self._tag_lookup(
+                'create_emotion_to_meta_tag_mapping',
+                [state.primary_emotion for state in emotional_states[:3]], artist_persona.primary_genre
+            ),
+            'structure': self._tag_lookup('get_structure_tags_for_complexity', complexity, character.personality_drivers),
+            'vocal': self._tag_lookup('get_vocal_tags_for_style', artist_persona.vocal_style, primary_emotion),
+        }
+        if artist_persona.instrumental_preferences:
+            lookups['instruments'] = self._tag_lookup(
+                'correlate_instruments_to_meta_tags', artist_persona.instrumental_preferences,
+                artist_persona.primary_genre, primary_emotion
+            )
+        return lookups
+
     async def get_style_tags_for_genre(self, genre: str) -> List[str]:
         """Get style tags for a genre from wiki data or fallback"""
         if self.wiki_data_manager:
             try:
                 # Get meta tags from wiki data
-                meta_tags = await self.wiki_data_manager.get_meta_tags(category="style")
+                meta_tags = await self._fetch_wiki_meta_tags(category="style")
 
                 # Filter tags compatible with the genre
                 compatible_tags = []
@@ -4259,7 +4767,7 @@ class SunoCommandGenerator:
         if self.wiki_data_manager:
             try:
                 # Get structural meta tags from wiki
-                meta_tags = await self.wiki_data_manager.get_meta_tags(category="structural")
+                meta_tags = await self._fetch_wiki_meta_tags(category="structural")
 
                 # Filter based on complexity and character traits
                 suitable_tags = []
@@ -4292,7 +4800,7 @@ class SunoCommandGenerator:
         if self.wiki_data_manager:
             try:
                 # Get vocal meta tags from wiki
-                meta_tags = await self.wiki_data_manager.get_meta_tags(category="vocal")
+                meta_tags = await self._fetch_wiki_meta_tags(category="vocal")
 
                 suitable_tags = []
                 for tag in meta_tags:
@@ -4322,7 +4830,7 @@ class SunoCommandGenerator:
         if self.wiki_data_manager:
             try:
                 # Get emotional meta tags from wiki
-                meta_tags = await self.wiki_data_manager.get_meta_tags(category="emotional")
+                meta_tags = await self._fetch_wiki_meta_tags(category="emotional")
 
                 suitable_tags = []
                 for tag in meta_tags:
@@ -4349,7 +4857,7 @@ class SunoCommandGenerator:
         if self.wiki_data_manager:
             try:
                 # Get instrumental meta tags from wiki
-                meta_tags = await self.wiki_data_manager.get_meta_tags(category="instrumental")
+                meta_tags = await self._fetch_wiki_meta_tags(category="instrumental")
 
                 suitable_tags = []
                 for tag in meta_tags:
@@ -4399,7 +4907,7 @@ class SunoCommandGenerator:
         if self.wiki_data_manager:
             try:
                 # Get all meta tags
-                all_meta_tags = await self.wiki_data_manager.get_meta_tags()
+                all_meta_tags = await self._fetch_wiki_meta_tags()
 
                 # Categorize tags by type for this genre
                 genre_tags = {
@@ -4483,7 +4991,7 @@ class SunoCommandGenerator:
             if self.wiki_data_manager:
                 try:
                     # Get all meta tags and filter by genre compatibility
-                    all_tags = await self.wiki_data_manager.get_meta_tags()
+                    all_tags = await self._fetch_wiki_meta_tags()
                     genre_tags = {
                         'style': [],
                         'structural': [],
@@ -4626,7 +5134,7 @@ class SunoCommandGenerator:
         if self.wiki_data_manager:
             try:
                 # Get emotional meta tags from wiki
-                emotional_tags = await self.wiki_data_manager.get_meta_tags(category="emotional")
+                emotional_tags = await self._fetch_wiki_meta_tags(category="emotional")
 
                 for emotion in emotions:
                     emotion_lower = emotion.lower()
@@ -4816,7 +5324,7 @@ class SunoCommandGenerator:
             # Try to get from wiki data first (emotional category)
             if self.wiki_data_manager:
                 try:
-                    emotional_tags = await self.wiki_data_manager.get_meta_tags(category="emotional")
+                    emotional_tags = await self._fetch_wiki_meta_tags(category="emotional")
                     matching_tags = []
 
                     for tag in emotional_tags:
@@ -4846,33 +5354,9 @@ class SunoCommandGenerator:
                     if emotion_tags:
                         return emotion_tags[:4]
 
-            # Intelligent fallback with semantic emotion mapping
-            emotion_semantic_mapping = {
-                'joy': ['uplifting', 'happy', 'energetic', 'bright', 'cheerful', 'positive'],
-                'happiness': ['uplifting', 'happy', 'energetic', 'bright', 'cheerful', 'positive'],
-                'sadness': ['melancholic', 'sad', 'introspective', 'minor', 'somber', 'mournful'],
-                'melancholy': ['melancholic', 'sad', 'introspective', 'minor', 'somber', 'mournful'],
-                'anger': ['aggressive', 'intense', 'powerful', 'driving', 'fierce', 'harsh'],
-                'rage': ['aggressive', 'intense', 'powerful', 'driving', 'fierce', 'harsh'],
-                'fear': ['tense', 'dark', 'mysterious', 'anxious', 'ominous', 'suspenseful'],
-                'anxiety': ['tense', 'dark', 'mysterious', 'anxious', 'ominous', 'suspenseful'],
-                'love': ['romantic', 'warm', 'intimate', 'gentle', 'tender', 'affectionate'],
-                'romance': ['romantic', 'warm', 'intimate', 'gentle', 'tender', 'affectionate'],
-                'nostalgia': ['nostalgic', 'wistful', 'reminiscent', 'vintage', 'bittersweet', 'longing'],
-                'longing': ['nostalgic', 'wistful', 'reminiscent', 'vintage', 'bittersweet', 'longing'],
-                'contemplation': ['thoughtful', 'reflective', 'meditative', 'ambient', 'introspective', 'philosophical'],
-                'reflection': ['thoughtful', 'reflective', 'meditative', 'ambient', 'introspective', 'philosophical'],
-                'excitement': ['energetic', 'fast', 'dynamic', 'upbeat', 'thrilling', 'exhilarating'],
-                'energy': ['energetic', 'fast', 'dynamic', 'upbeat', 'thrilling', 'exhilarating'],
-                'peace': ['peaceful', 'calm', 'serene', 'tranquil', 'soothing', 'gentle'],
-                'calm': ['peaceful', 'calm', 'serene', 'tranquil', 'soothing', 'gentle'],
-                'hope': ['hopeful', 'uplifting', 'inspiring', 'optimistic', 'bright', 'encouraging'],
-                'optimism': ['hopeful', 'uplifting', 'inspiring', 'optimistic', 'bright', 'encouraging']
-            }
-
             # Find best semantic match
             emotion_lower = emotion.lower()
-            for emotion_key, tags in emotion_semantic_mapping.items():
+            for emotion_key, tags in FALLBACK_EMOTION_TAGS.items():
                 if emotion_key in emotion_lower or emotion_lower in emotion_key:
                     return tags[:4]
 
@@ -4890,7 +5374,7 @@ class SunoCommandGenerator:
         if self.wiki_data_manager:
             try:
                 # Get instrumental meta tags from wiki
-                instrumental_tags = await self.wiki_data_manager.get_meta_tags(category="instrumental")
+                instrumental_tags = await self._fetch_wiki_meta_tags(category="instrumental")
 
                 for instrument in instruments:
                     instrument_lower = instrument.lower()
@@ -5067,46 +5551,47 @@ class SunoCommandGenerator:
             logger.warning(f"Failed to get fallback instrument tags for {instrument}: {e}")
             return [instrument]
 
+    @traced("command_generation")
     async def generate_suno_commands(self, artist_persona: ArtistPersona, character: StandardCharacterProfile, ctx: Context,
                                    emotional_states: Optional[List[EmotionalState]] = None,
                                    beat_progression: Optional[Dict] = None) -> List[SunoCommand]:
         """Generate multiple Suno AI command variations from artist persona"""
         await ctx.info(f"Generating Suno commands for {artist_persona.artist_name}...")
 
-        commands = []
-
-        # Generate different command types
-
-        # 1. Simple prompt command
-        simple_command = await self._generate_simple_command(artist_persona, character)
-        commands.append(simple_command)
-
-        # 2. Custom mode command with detailed parameters
-        custom_command = await self._generate_custom_command(artist_persona, character)
-        commands.append(custom_command)
-
-        # 3. Bracket notation command for precise control
-        bracket_command = await self._generate_bracket_command(artist_persona, character)
-        commands.append(bracket_command)
-
-        # 4. NEW: Emotion-driven beat command if emotional states are provided
-        if emotional_states and len(emotional_states) > 0:
-            emotion_beat_command = await self._generate_emotion_beat_command(
+        # Plan every variant's wiki lookups, resolve them concurrently, then assemble
+        # the variants (simple, custom, bracket, emotion beat, lyric-focused, collaboration)
+        variants = self.plan_command_variants(artist_persona, character, emotional_states)
+        lookups = [lookup for _variant, variant_lookups in variants for lookup in variant_lookups.values()]
+
+        async with self.prefetch_tag_lookups(lookups):
+            commands = await asyncio.gather(*(
+                self._build_command_variant(variant, artist_persona, character, emotional_states, beat_progression)
+                for variant, _variant_lookups in variants
+            ))
+
+        return list(commands)
+
+    @traced("command_variant")
+    async def _build_command_variant(self, variant: str, artist_persona: ArtistPersona, character: StandardCharacterProfile,
+                                     emotional_states: Optional[List[EmotionalState]] = None,
+                                     beat_progression: Optional[Dict] = None) -> SunoCommand:
+        """Assemble a single planned command variant"""
+        annotate(variant=variant)
+        if variant == 'simple':
+            return await self._generate_simple_command(artist_persona, character)
+        if variant == 'custom':
+            return await self._generate_custom_command(artist_persona, character)
+        if variant == 'bracket':
+            return await self._generate_bracket_command(artist_persona, character)
+        if variant == 'emotion_beat':
+            return await self._generate_emotion_beat_command(
                 artist_persona, character, emotional_states, beat_progression or {}
             )
-            commands.append(emotion_beat_command)
-
-        # 5. Lyric-focused command if character has strong narrative elements
-        if len(character.motivations) > 1 or len(character.conflicts) > 1:
-            lyric_command = await self._generate_lyric_focused_command(artist_persona, character)
-            commands.append(lyric_command)
-
-        # 6. Collaboration-style command if character has relationships
-        if len(character.relationships) > 2:
-            collab_command = await self._generate_collaboration_command(artist_persona, character)
-            commands.append(collab_command)
-
-        return commands
+        if variant == 'lyric_focused':
+            return await self._generate_lyric_focused_command(artist_persona, character)
+        if variant == 'collaboration':
+            return await self._generate_collaboration_command(artist_persona, character)
+        raise ValueError(f"Unknown command variant: {variant}")
 
     async def _generate_simple_command(self, artist_persona: ArtistPersona, character: StandardCharacterProfile) -> SunoCommand:
         """Generate simple Suno command with basic prompt"""
@@ -5119,12 +5604,14 @@ class SunoCommandGenerator:
                 f"conveying {emotional_core} with {artist_persona.vocal_style}. " \
                 f"Inspired by {character.name}'s journey and experiences."
 
+        lookups = self._simple_command_lookups(artist_persona, character)
+
         # Select relevant style tags from wiki data
-        style_tags = await self.get_style_tags_for_genre(artist_persona.primary_genre)
+        style_tags = await self._resolve_tag_lookup(lookups['style'])
 
         # Get structure and vocal tags from wiki data
-        structure_tags = await self.get_structure_tags_for_complexity('simple')
-        vocal_tags = await self.get_vocal_tags_for_style(artist_persona.vocal_style, emotional_core)
+        structure_tags = await self._resolve_tag_lookup(lookups['structure'])
+        vocal_tags = await self._resolve_tag_lookup(lookups['vocal'])
 
         # Check for tag compatibility
         all_tags = style_tags + structure_tags + vocal_tags
@@ -5159,11 +5646,10 @@ class SunoCommandGenerator:
                 f"{character.personality_drivers[0] if character.personality_drivers else 'complex nature'}. " \
                 f"Incorporate elements of {artist_persona.secondary_genres[0] if artist_persona.secondary_genres else 'crossover style'}."
 
+        lookups = self._custom_command_lookups(artist_persona, character)
+
         # Use advanced genre-specific meta tag selection
-        genre_tags = await self.get_genre_specific_meta_tags(
-            artist_persona.primary_genre,
-            context=emotions.split(', ')[0] if emotions else None
-        )
+        genre_tags = await self._resolve_tag_lookup(lookups['genre'])
 
         # Get style tags with contextual filtering
         style_tags = genre_tags['style'][:3]
@@ -5172,33 +5658,25 @@ class SunoCommandGenerator:
 
         # Get structure tags from genre-specific selection
         structure_tags = genre_tags['structural'][:2]
-        complexity = 'complex' if character.confidence_score > 0.7 else 'simple'
-        additional_structure = await self.get_structure_tags_for_complexity(complexity, character.personality_drivers)
+        additional_structure = await self._resolve_tag_lookup(lookups['structure'])
         structure_tags.extend(additional_structure[:2])
 
         # Use advanced emotion-to-meta-tag mapping
         primary_emotion = emotions.split(', ')[0] if emotions else None
         if primary_emotion:
-            emotion_mapping = await self.create_emotion_to_meta_tag_mapping(
-                [primary_emotion],
-                artist_persona.primary_genre
-            )
+            emotion_mapping = await self._resolve_tag_lookup(lookups['emotion'])
             emotional_tags = emotion_mapping.get(primary_emotion, [])
             style_tags.extend(emotional_tags[:2])
 
         # Get vocal tags from genre-specific selection and persona
         vocal_tags = genre_tags['vocal'][:2]
-        persona_vocal_tags = await self.get_vocal_tags_for_style(artist_persona.vocal_style, primary_emotion)
+        persona_vocal_tags = await self._resolve_tag_lookup(lookups['vocal'])
         vocal_tags.extend(persona_vocal_tags[:2])
 
         # Use advanced instrument-to-meta-tag correlation
         sound_effects = []
         if artist_persona.instrumental_preferences:
-            instrument_correlation = await self.correlate_instruments_to_meta_tags(
-                artist_persona.instrumental_preferences,
-                artist_persona.primary_genre,
-                primary_emotion
-            )
+            instrument_correlation = await self._resolve_tag_lookup(lookups['instruments'])
 
             # Collect correlated tags from all instruments
             for _instrument, tags in instrument_correlation.items():
@@ -5260,21 +5738,19 @@ class SunoCommandGenerator:
                 f"Song inspired by {character.name}'s journey through {artist_persona.lyrical_themes[0] if artist_persona.lyrical_themes else 'life experiences'}"
 
         # Get wiki-based tags for bracket notation
-        style_tags = await self.get_style_tags_for_genre(artist_persona.primary_genre)
+        lookups = self._bracket_command_lookups(artist_persona, character)
+        style_tags = await self._resolve_tag_lookup(lookups['style'])
         style_tags.extend([artist_persona.primary_genre, 'precise control'])
 
-        structure_tags = await self.get_structure_tags_for_complexity('simple')
+        structure_tags = await self._resolve_tag_lookup(lookups['structure'])
         structure_tags.append('controlled structure')
 
-        vocal_tags = await self.get_vocal_tags_for_style(artist_persona.vocal_style)
+        vocal_tags = await self._resolve_tag_lookup(lookups['vocal'])
 
         # Get instrumental tags for sound effects
         sound_effects = ['specified elements']
         if artist_persona.instrumental_preferences:
-            instrumental_tags = await self.get_instrumental_meta_tags(
-                artist_persona.instrumental_preferences[:2],
-                artist_persona.primary_genre
-            )
+            instrumental_tags = await self._resolve_tag_lookup(lookups['instruments'])
             sound_effects.extend(instrumental_tags)
 
         return SunoCommand(
@@ -5314,14 +5790,15 @@ class SunoCommandGenerator:
                 f"The song should capture the essence of {character.name}'s experience and emotional journey."
 
         # Get wiki-based tags for lyric-focused command
-        style_tags = await self.get_style_tags_for_genre(artist_persona.primary_genre)
+        lookups = self._lyric_focused_command_lookups(artist_persona, character)
+        style_tags = await self._resolve_tag_lookup(lookups['style'])
         style_tags.extend([artist_persona.primary_genre, 'storytelling', 'narrative'])
 
-        structure_tags = await self.get_structure_tags_for_complexity('narrative', character.personality_drivers)
+        structure_tags = await self._resolve_tag_lookup(lookups['structure'])
         structure_tags.extend(['verse-heavy', 'lyrical focus', 'story structure'])
 
         # Get vocal tags optimized for storytelling
-        vocal_tags = await self.get_vocal_tags_for_style(artist_persona.vocal_style)
+        vocal_tags = await self._resolve_tag_lookup(lookups['vocal'])
         storytelling_vocals = ['storytelling vocals', 'clear delivery', 'emotional expression']
         vocal_tags.extend(storytelling_vocals)
 
@@ -5365,25 +5842,23 @@ class SunoCommandGenerator:
                 f"with multiple vocal parts and {', '.join(artist_persona.instrumental_preferences[:2])}."
 
         # Get wiki-based tags for collaboration command
-        style_tags = await self.get_style_tags_for_genre(artist_persona.primary_genre)
+        lookups = self._collaboration_command_lookups(artist_persona, character)
+        style_tags = await self._resolve_tag_lookup(lookups['style'])
         style_tags.extend([artist_persona.primary_genre, 'collaborative', 'ensemble'])
 
-        structure_tags = await self.get_structure_tags_for_complexity('complex', character.personality_drivers)
+        structure_tags = await self._resolve_tag_lookup(lookups['structure'])
         collaboration_structure = ['multiple parts', 'call and response', 'harmony']
         structure_tags.extend(collaboration_structure)
 
         # Get vocal tags for collaborative performance
-        vocal_tags = await self.get_vocal_tags_for_style(artist_persona.vocal_style)
+        vocal_tags = await self._resolve_tag_lookup(lookups['vocal'])
         collaboration_vocals = ['multiple vocals', 'harmony', 'interaction']
         vocal_tags.extend(collaboration_vocals)
 
         # Get instrumental tags for ensemble
         sound_effects = []
         if artist_persona.instrumental_preferences:
-            instrumental_tags = await self.get_instrumental_meta_tags(
-                artist_persona.instrumental_preferences,
-                artist_persona.primary_genre
-            )
+            instrumental_tags = await self._resolve_tag_lookup(lookups['instruments'])
             sound_effects.extend(instrumental_tags)
 
         return SunoCommand(
@@ -5460,20 +5935,14 @@ class SunoCommandGenerator:
                 f"Key phrases: {', '.join(lyric_structure['key_phrases'][:3])}"
 
         # Use advanced genre-specific meta tag selection with emotional context
-        genre_tags = await self.get_genre_specific_meta_tags(
-            artist_persona.primary_genre,
-            context=primary_emotion
-        )
+        lookups = self._emotion_beat_command_lookups(artist_persona, character, emotional_states)
+        genre_tags = await self._resolve_tag_lookup(lookups['genre'])
 
         # Get style tags with emotional filtering
         style_tags = genre_tags['style'][:3]
 
         # Use advanced emotion-to-meta-tag mapping for multiple emotions
-        all_emotions = [state.primary_emotion for state in emotional_states[:3]]
-        emotion_mapping = await self.create_emotion_to_meta_tag_mapping(
-            all_emotions,
-            artist_persona.primary_genre
-        )
+        emotion_mapping = await self._resolve_tag_lookup(lookups['emotion'])
 
         # Collect emotional tags from all states
         for _emotion, tags in emotion_mapping.items():
@@ -5487,8 +5956,7 @@ class SunoCommandGenerator:
         structure_tags = genre_tags['structural'][:2]
 
         # Add complexity-based structure tags
-        complexity = 'complex' if len(emotional_states) > 2 else 'emotional'
-        complexity_structure = await self.get_structure_tags_for_complexity(complexity, character.personality_drivers)
+        complexity_structure = await self._resolve_tag_lookup(lookups['structure'])
         structure_tags.extend(complexity_structure[:2])
 
         # Add emotion-specific structure tags
@@ -5500,7 +5968,7 @@ class SunoCommandGenerator:
 
         # Get vocal tags from genre-specific selection and emotional context
         vocal_tags = genre_tags['vocal'][:2]
-        persona_vocal_tags = await self.get_vocal_tags_for_style(artist_persona.vocal_style, primary_emotion)
+        persona_vocal_tags = await self._resolve_tag_lookup(lookups['vocal'])
         vocal_tags.extend(persona_vocal_tags[:2])
 
         # Add emotional authenticity vocals
@@ -5510,11 +5978,7 @@ class SunoCommandGenerator:
         # Use advanced instrument-to-meta-tag correlation for emotional texture
         sound_effects = []
         if artist_persona.instrumental_preferences:
-            instrument_correlation = await self.correlate_instruments_to_meta_tags(
-                artist_persona.instrumental_preferences,
-                artist_persona.primary_genre,
-                primary_emotion
-            )
+            instrument_correlation = await self._resolve_tag_lookup(lookups['instruments'])
 
             # Collect correlated tags from all instruments
             for _instrument, tags in instrument_correlation.items():
@@ -5567,7 +6031,7 @@ async def ensure_wiki_data_manager():
     """Ensure wiki data manager is available, initialize if needed"""
     global wiki_data_manager
 
-    if wiki_data_manager is None and WIKI_INTEGRATION_AVAILABLE:
+    if wiki_data_manager is None and _load_wiki_integration():
         try:
             logger.info("Initializing wiki data manager on demand...")
             from wiki_data_models import WikiConfig
@@ -5591,7 +6055,7 @@ async def initialize_server():
     logger.info("Initializing Character-Driven Music Generation MCP Server...")
 
     # Initialize wiki integration if available
-    if WIKI_INTEGRATION_AVAILABLE:
+    if _load_wiki_integration():
         try:
             logger.info("Initializing wiki data integration...")
 
@@ -5622,6 +6086,38 @@ async def initialize_server():
     logger.info("Server initialization complete")
     logger.info("Ready to process narrative content and generate music commands")
 
+def _dump_result(result: Any) -> str:
+    """Serialize a tool result as indented JSON, timed as the json_serialization stage"""
+    with span("json_serialization"):
+        return json.dumps(result, indent=2)
+
+async def _run_traced(tool_name: str, trace_format: Optional[str], run: Callable[[], Awaitable[str]]) -> str:
+    """
+    Run a tool body, adding a per-stage timing trace to its JSON result on request
+
+    Args:
+        tool_name: Name of the root span
+        trace_format: None for no trace, "tree" for the span tree or "chrome"
+            for Chrome trace-event JSON (chrome://tracing, Perfetto)
+        run: Produces the tool's JSON result
+    """
+    if not trace_format:
+        return await run()
+    if trace_format not in TRACE_FORMATS:
+        return json.dumps({"error": f"Unknown trace format '{trace_format}'. Use one of: {', '.join(TRACE_FORMATS)}"})
+
+    with start_trace(tool_name) as trace:
+        result = await run()
+
+    try:
+        payload = json.loads(result)
+    except (TypeError, json.JSONDecodeError):
+        payload = result
+    if not isinstance(payload, dict):
+        payload = {"result": payload}
+    payload["trace"] = trace.export(trace_format)
+    return json.dumps(payload, indent=2)
+
 # Internal callable version for use by other tools
 async def _analyze_character_text_internal(text: str, ctx: Context) -> str:
     """
@@ -5662,14 +6158,15 @@ async def _analyze_character_text_internal(text: str, ctx: Context) -> str:
 
         await ctx.info(f"Enhanced analysis complete: {len(result['characters'])} characters, {len(result['narrative_themes'])} themes, {len(result['emotional_arc'])} emotional states found")
 
-        return json.dumps(result, indent=2)
+        return _dump_result(result)
 
     except Exception as e:
         await ctx.error(f"Enhanced character analysis failed: {str(e)}")
         return json.dumps({"error": f"Enhanced analysis failed: {str(e)}"})
 
 @mcp.tool
-async def analyze_character_text(text: str, ctx: Context) -> str:
+@single_flight_tool
+async def analyze_character_text(text: str, ctx: Context, trace: Optional[str] = None) -> str:
     """
     Analyze narrative text to extract detailed character profiles using three-layer methodology.
 
@@ -5685,11 +6182,12 @@ async def analyze_character_text(text: str, ctx: Context) -> str:
 
     Args:
         text: Narrative text content (unlimited length supported)
+        trace: "tree" or "chrome" to add per-stage timings to the result under "trace"
 
     Returns:
         JSON string containing detailed character analysis results
     """
-    return await _analyze_character_text_internal(text, ctx)
+    return await _run_traced("analyze_character_text", trace, lambda: _analyze_character_text_internal(text, ctx))
 
 # Internal callable version for use by other tools
 async def _generate_artist_personas_internal(characters_json: str, ctx: Context,
@@ -5737,7 +6235,7 @@ async def _generate_artist_personas_internal(characters_json: str, ctx: Context,
 
                 # Generate artist persona (with optional genre alignment)
                 persona = await persona_generator.generate_artist_persona(character, ctx, requested_genre)
-                artist_personas.append(asdict(persona))
+                artist_personas.append(persona.to_dict())
 
             except Exception as e:
                 await ctx.error(f"Failed to process character data {char_data}: {str(e)}")
@@ -5751,14 +6249,16 @@ async def _generate_artist_personas_internal(characters_json: str, ctx: Context,
 
         await ctx.info(f"Generated {len(artist_personas)} artist personas")
 
-        return json.dumps(result, indent=2)
+        return _dump_result(result)
 
     except Exception as e:
         await ctx.error(f"Artist persona generation failed: {str(e)}")
         return json.dumps({"error": f"Persona generation failed: {str(e)}"})
 
 @mcp.tool
-async def generate_artist_personas(characters_json: str, ctx: Context, requested_genre: Optional[str] = None) -> str:
+@single_flight_tool
+async def generate_artist_personas(characters_json: str, ctx: Context, requested_genre: Optional[str] = None,
+                                   trace: Optional[str] = None) -> str:
     """
     Generate musical artist personas from character profiles.
 
@@ -5767,11 +6267,13 @@ async def generate_artist_personas(characters_json: str, ctx: Context, requested
 
     Args:
         characters_json: JSON string containing character profiles from analyze_character_text
+        trace: "tree" or "chrome" to add per-stage timings to the result under "trace"
 
     Returns:
         JSON string containing generated artist personas
     """
-    return await _generate_artist_personas_internal(characters_json, ctx, requested_genre)
+    return await _run_traced("generate_artist_personas", trace,
+                             lambda: _generate_artist_personas_internal(characters_json, ctx, requested_genre))
 
 # Internal callable version for use by other tools
 async def _create_suno_commands_internal(personas_json: str, characters_json: str, ctx: Context) -> str:
@@ -5866,6 +6368,7 @@ async def _create_suno_commands_internal(personas_json: str, characters_json: st
 
         await ctx.info(f"Processing {len(personas)} personas and {len(characters)} characters")
 
+        prepared_personas = []
         for i, persona_data in enumerate(personas):
             # Validate persona data structure
             if not isinstance(persona_data, dict):
@@ -5942,32 +6445,46 @@ async def _create_suno_commands_internal(personas_json: str, characters_json: st
             if 'beat_progression' in characters_data:
                 beat_progression = characters_data.get('beat_progression')
 
-            await ctx.info(f"About to generate commands for {persona.character_name}")
+            prepared_personas.append((persona, character, emotional_states, beat_progression))
+
+        # Plan the wiki tag lookups of every persona up front so identical queries
+        # across variants and personas are resolved once, concurrently
+        planned_lookups = []
+        for persona, character, emotional_states, _beat_progression in prepared_personas:
             try:
-                commands = await command_generator.generate_suno_commands(
-                    persona, character, ctx, emotional_states, beat_progression
-                )
-                await ctx.info(f"Generated {len(commands)} commands for {persona.character_name}")
-                for cmd in commands:
-                    all_commands.append(asdict(cmd))
+                planned_lookups.extend(command_generator.plan_tag_lookups(persona, character, emotional_states))
             except Exception as e:
-                await ctx.error(f"Failed to generate commands for {persona.character_name}: {e}")
-                import traceback
-                await ctx.error(f"Traceback: {traceback.format_exc()}")
-                # Create a fallback simple command
-                fallback_command = {
-                    'command_type': 'simple',
-                    'prompt': f"A {persona.primary_genre or 'music'} song inspired by {persona.character_name}",
-                    'style_tags': [persona.primary_genre] if persona.primary_genre else [],
-                    'structure_tags': [],
-                    'sound_effect_tags': [],
-                    'vocal_tags': [persona.vocal_style] if persona.vocal_style else [],
-                    'character_source': persona.character_name,
-                    'artist_persona': persona.artist_name,
-                    'command_rationale': f"Fallback command for {persona.character_name}",
-                    'estimated_effectiveness': 0.5
-                }
-                all_commands.append(fallback_command)
+                # Generation below retries this persona's lookups directly and reports the error
+                logger.debug(f"Could not plan tag lookups for {persona.character_name}: {e}")
+
+        async with command_generator.prefetch_tag_lookups(planned_lookups):
+            for persona, character, emotional_states, beat_progression in prepared_personas:
+                await ctx.info(f"About to generate commands for {persona.character_name}")
+                try:
+                    commands = await command_generator.generate_suno_commands(
+                        persona, character, ctx, emotional_states, beat_progression
+                    )
+                    await ctx.info(f"Generated {len(commands)} commands for {persona.character_name}")
+                    for cmd in commands:
+                        all_commands.append(cmd.to_dict())
+                except Exception as e:
+                    await ctx.error(f"Failed to generate commands for {persona.character_name}: {e}")
+                    import traceback
+                    await ctx.error(f"Traceback: {traceback.format_exc()}")
+                    # Create a fallback simple command
+                    fallback_command = {
+                        'command_type': 'simple',
+                        'prompt': f"A {persona.primary_genre or 'music'} song inspired by {persona.character_name}",
+                        'style_tags': [persona.primary_genre] if persona.primary_genre else [],
+                        'structure_tags': [],
+                        'sound_effect_tags': [],
+                        'vocal_tags': [persona.vocal_style] if persona.vocal_style else [],
+                        'character_source': persona.character_name,
+                        'artist_persona': persona.artist_name,
+                        'command_rationale': f"Fallback command for {persona.character_name}",
+                        'estimated_effectiveness': 0.5
+                    }
+                    all_commands.append(fallback_command)
 
         # Convert personas to dict format for result validation
         personas_for_result = []
@@ -5988,14 +6505,15 @@ async def _create_suno_commands_internal(personas_json: str, characters_json: st
 
         await ctx.info(f"Generated {len(all_commands)} Suno commands")
 
-        return json.dumps(result.model_dump(), indent=2)
+        return _dump_result(result.model_dump())
 
     except Exception as e:
         await ctx.error(f"Suno command generation failed: {str(e)}")
         return json.dumps({"error": f"Command generation failed: {str(e)}"})
 
 @mcp.tool
-async def create_suno_commands(personas_json: str, characters_json: str, ctx: Context) -> str:
+@single_flight_tool
+async def create_suno_commands(personas_json: str, characters_json: str, ctx: Context, trace: Optional[str] = None) -> str:
     """
     Generate optimized Suno AI commands from artist personas and character profiles.
 
@@ -6005,11 +6523,13 @@ async def create_suno_commands(personas_json: str, characters_json: str, ctx: Co
     Args:
         personas_json: JSON string containing artist personas from generate_artist_personas
         characters_json: JSON string containing character profiles
+        trace: "tree" or "chrome" to add per-stage timings to the result under "trace"
 
     Returns:
         JSON string containing Suno AI commands with metadata
     """
-    return await _create_suno_commands_internal(personas_json, characters_json, ctx)
+    return await _run_traced("create_suno_commands", trace,
+                             lambda: _create_suno_commands_internal(personas_json, characters_json, ctx))
 
 # Internal callable version for use by other tools
 async def _complete_workflow_internal(text: str, ctx: Context, requested_genre: Optional[str] = None) -> str:
@@ -6032,43 +6552,51 @@ async def _complete_workflow_internal(text: str, ctx: Context, requested_genre:
 
         # Step 1: Character Analysis
         await ctx.info("Step 1: Analyzing characters...")
-        characters_result = await _analyze_character_text_internal(text, ctx)
+        with span("analyze_character_text"):
+            characters_result = await _analyze_character_text_internal(text, ctx)
 
         # Step 2: Generate Artist Personas
         await ctx.info("Step 2: Generating artist personas...")
-        personas_result = await _generate_artist_personas_internal(characters_result, ctx, requested_genre)
+        with span("generate_artist_personas"):
+            personas_result = await _generate_artist_personas_internal(characters_result, ctx, requested_genre)
 
         # Step 3: Create Suno Commands
         await ctx.info("Step 3: Creating Suno AI commands...")
-        commands_result = await _create_suno_commands_internal(personas_result, characters_result, ctx)
+        with span("create_suno_commands"):
+            commands_result = await _create_suno_commands_internal(personas_result, characters_result, ctx)
 
         # Add wiki attribution context
-        wiki_attribution = await _build_wiki_attribution_context({
-            "characters": json.loads(characters_result),
-            "personas": json.loads(personas_result),
-            "commands": json.loads(commands_result)
-        }, ctx)
+        with span("json_parsing"):
+            attribution_input = {
+                "characters": json.loads(characters_result),
+                "personas": json.loads(personas_result),
+                "commands": json.loads(commands_result)
+            }
+        wiki_attribution = await _build_wiki_attribution_context(attribution_input, ctx)
 
         # Combine results
-        workflow_result = {
-            "workflow_status": "completed",
-            "character_analysis": json.loads(characters_result),
-            "artist_personas": json.loads(personas_result),
-            "suno_commands": json.loads(commands_result),
-            "workflow_summary": "Complete character-driven music generation workflow executed successfully",
-            "wiki_attribution": wiki_attribution if wiki_attribution else "Using fallback data - no wiki sources available"
-        }
+        with span("json_parsing"):
+            workflow_result = {
+                "workflow_status": "completed",
+                "character_analysis": json.loads(characters_result),
+                "artist_personas": json.loads(personas_result),
+                "suno_commands": json.loads(commands_result),
+                "workflow_summary": "Complete character-driven music generation workflow executed successfully",
+                "wiki_attribution": wiki_attribution if wiki_attribution else "Using fallback data - no wiki sources available"
+            }
 
         await ctx.info("Workflow completed successfully!")
 
-        return json.dumps(workflow_result, indent=2)
+        return _dump_result(workflow_result)
 
     except Exception as e:
         await ctx.error(f"Workflow execution failed: {str(e)}")
         return json.dumps({"error": f"Workflow failed: {str(e)}"})
 
 @mcp.tool
-async def complete_workflow(text: str, ctx: Context, requested_genre: Optional[str] = None) -> str:
+@single_flight_tool
+async def complete_workflow(text: str, ctx: Context, requested_genre: Optional[str] = None,
+                            trace: Optional[str] = None) -> str:
     """
     Execute complete character-to-music workflow in one operation.
 
@@ -6079,13 +6607,15 @@ async def complete_workflow(text: str, ctx: Context, requested_genre: Optional[s
 
     Args:
         text: Input narrative text for analysis
+        trace: "tree" or "chrome" to add per-stage timings to the result under "trace"
 
     Returns:
         JSON string containing complete workflow results
     """
-    return await _complete_workflow_internal(text, ctx, requested_genre)
+    return await _run_traced("complete_workflow", trace, lambda: _complete_workflow_internal(text, ctx, requested_genre))
 
 @mcp.tool
+@single_flight_tool
 async def creative_music_generation(concept: str, style_preference: str = "any", ctx: Context = None) -> str:
     """
     Generate creative music commands from abstract concepts with meaningful musical analysis.
@@ -6355,6 +6885,7 @@ async def _understand_topic_with_emotions_internal(
         return json.dumps({"error": error_msg})
 
 @mcp.tool
+@single_flight_tool
 async def understand_topic_with_emotions(
     topic_text: str,
     source_type: str = "book",
@@ -6680,6 +7211,7 @@ def _get_topic_mood_production_focus(mood: str) -> str:
     return mood_focus.get(mood, "balanced musical elements")
 
 @mcp.tool
+@single_flight_tool
 async def process_universal_content(
     content: str,
     character_description: str,
@@ -6867,6 +7399,7 @@ async def process_universal_content(
         return json.dumps({"error": f"Processing failed: {str(e)}"})
 
 @mcp.tool
+@single_flight_tool
 async def create_conceptual_album(
     content: str,
     album_concept: str = None,
@@ -6875,7 +7408,8 @@ async def create_conceptual_album(
     track_count: int = 8,
     genre: str = "alternative",
     processing_mode: str = "auto",
-    ctx: Context = None
+    ctx: Context = None,
+    trace: Optional[str] = None
 ) -> str:
     """
     Create a comprehensive conceptual album with meaningful track progression.
@@ -6894,50 +7428,298 @@ async def create_conceptual_album(
         track_count: Number of tracks (3-12)
         genre: Musical genre preference
         processing_mode: "narrative", "character", "conceptual", or "auto"
+        trace: "tree" or "chrome" to add per-stage timings to the result under "trace"
 
     Returns:
         JSON containing complete album with meaningful track progression
     """
+    async def create() -> str:
+        try:
+            album_result = await _create_conceptual_album_internal(
+                content, album_concept, character_name, character_description,
+                track_count, genre, processing_mode, ctx
+            )
+            return _dump_result(album_result)
+
+        except Exception as e:
+            await ctx.error(f"Conceptual album creation failed: {str(e)}")
+            return json.dumps({"error": f"Album creation failed: {str(e)}"})
+
+    return await _run_traced("create_conceptual_album", trace, create)
+
+# Internal callable version for use by the album tools and album worker processes
+@traced("album_creation")
+async def _create_conceptual_album_internal(
+    content: str,
+    album_concept: Optional[str],
+    character_name: Optional[str],
+    character_description: Optional[str],
+    track_count: int,
+    genre: str,
+    processing_mode: str,
+    ctx: Context
+) -> Dict[str, Any]:
+    """Create one conceptual album, returning the album or an {"error": ...} dict for invalid input"""
+    await ctx.info(f"Starting conceptual album creation with {processing_mode} mode...")
+
+    # Validate inputs
+    if track_count < 3 or track_count > 12:
+        return {"error": "Track count must be between 3 and 12"}
+
+    if not content or len(content.strip()) < 50:
+        return {"error": "Content too short. Please provide substantial content for album creation."}
+
+    # Step 1: Determine processing mode and content type
+    detected_mode = await _detect_content_type(content, character_description, processing_mode, ctx)
+    await ctx.info(f"Processing mode: {detected_mode}")
+
+    # Step 2: Process content based on detected mode
+    if detected_mode == "narrative":
+        album_result = await _create_narrative_album(
+            content, album_concept, character_name, track_count, genre, ctx
+        )
+    elif detected_mode == "character":
+        album_result = await _create_character_driven_album(
+            content, character_description, album_concept, track_count, genre, ctx
+        )
+    elif detected_mode == "conceptual":
+        album_result = await _create_conceptual_thematic_album(
+            content, album_concept, track_count, genre, ctx
+        )
+    else:
+        # Hybrid mode - combine approaches
+        album_result = await _create_hybrid_album(
+            content, album_concept, character_name, character_description, track_count, genre, ctx
+        )
+
+    await ctx.info(f"Conceptual album creation complete: {track_count} unique tracks")
+    return album_result
+
+# ================================================================================================
+# BATCH ALBUM GENERATION
+# ================================================================================================
+
+# Documents accepted by one create_conceptual_albums_batch call
+MAX_ALBUM_BATCH_SIZE = 500
+
+# Per-document fields of a batch; anything missing falls back to the batch defaults
+ALBUM_BATCH_FIELDS = ('content', 'album_concept', 'character_name', 'character_description',
+                      'track_count', 'genre', 'processing_mode')
+
+# Album the worker pool's parent creates while warming up
+WORKER_WARMUP_DOCUMENT = ("Elena walked through the ruined city, remembering her brother. "
+                          "The story follows her struggle with grief and hope. ") * 3
+
+
+class _AlbumWorkerContext:
+    """Stand-in for the MCP context inside album worker processes, which cannot reach the client"""
+
+    def __init__(self):
+        self.errors: List[str] = []
+
+    async def info(self, message: str) -> None:
+        pass
+
+    async def warning(self, message: str) -> None:
+        pass
+
+    async def error(self, message: str) -> None:
+        self.errors.append(message)
+
+
+def _create_album_in_worker(document: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create one album of a batch in a worker process
+
+    Runs the same pipeline as create_conceptual_album on a private event loop.
+    Failures are returned as {"error": ...} so one bad document never takes the
+    rest of the batch down with it.
+    """
+    worker_ctx = _AlbumWorkerContext()
     try:
-        await ctx.info(f"Starting conceptual album creation with {processing_mode} mode...")
+        return asyncio.run(_create_conceptual_album_internal(ctx=worker_ctx, **document))
+    except Exception as e:
+        return {"error": f"Album creation failed: {str(e)}"}
+
+
+def warm_worker_parent() -> None:
+    """
+    Warm-up hook of the worker pool's parent process
 
-        # Validate inputs
-        if track_count < 3 or track_count > 12:
-            return json.dumps({"error": "Track count must be between 3 and 12"})
+    Importing this module has already constructed the analyzers and compiled
+    the shared patterns. This loads the wiki snapshot from local storage and
+    runs one album through the pipeline, so the state built on first use is
+    in place before workers are forked from the parent.
+    """
+    asyncio.run(persona_generator._ensure_wiki_integration())
+    _create_album_in_worker({'content': WORKER_WARMUP_DOCUMENT, 'album_concept': None, 'character_name': None,
+                             'character_description': None, 'track_count': 3, 'genre': 'alternative',
+                             'processing_mode': 'auto'})
 
-        if not content or len(content.strip()) < 50:
-            return json.dumps({"error": "Content too short. Please provide substantial content for album creation."})
 
-        # Step 1: Determine processing mode and content type
-        detected_mode = await _detect_content_type(content, character_description, processing_mode, ctx)
-        await ctx.info(f"Processing mode: {detected_mode}")
+# Workers for CPU-heavy tools are forked from a parent warmed up by warm_worker_parent
+get_warm_worker_pool().configure(warmup=[task_reference(warm_worker_parent)])
 
-        # Step 2: Process content based on detected mode
-        if detected_mode == "narrative":
-            album_result = await _create_narrative_album(
-                content, album_concept, character_name, track_count, genre, ctx
-            )
-        elif detected_mode == "character":
-            album_result = await _create_character_driven_album(
-                content, character_description, album_concept, track_count, genre, ctx
-            )
-        elif detected_mode == "conceptual":
-            album_result = await _create_conceptual_thematic_album(
-                content, album_concept, track_count, genre, ctx
-            )
+
+def _normalize_album_batch(documents: List[Any], defaults: Dict[str, Any]) -> Tuple[List[Optional[Dict[str, Any]]], List[Optional[str]]]:
+    """
+    Turn batch entries into create_conceptual_album arguments
+
+    Entries may be plain content strings or dicts of ALBUM_BATCH_FIELDS.
+    Returns the arguments per entry (None where the entry is malformed) and
+    the matching error messages (None where it is well formed).
+    """
+    arguments: List[Optional[Dict[str, Any]]] = []
+    errors: List[Optional[str]] = []
+    for entry in documents:
+        if isinstance(entry, str):
+            entry = {'content': entry}
+        if not isinstance(entry, dict) or not isinstance(entry.get('content'), str):
+            arguments.append(None)
+            errors.append("Each document must be a string or an object with a string 'content'")
+            continue
+
+        unknown = sorted(set(entry) - set(ALBUM_BATCH_FIELDS))
+        if unknown:
+            arguments.append(None)
+            errors.append(f"Unknown document fields: {', '.join(unknown)}")
+            continue
+
+        arguments.append({name: entry.get(name, defaults.get(name)) for name in ALBUM_BATCH_FIELDS})
+        errors.append(None)
+    return arguments, errors
+
+
+@mcp.tool
+@single_flight_tool
+async def create_conceptual_albums_batch(
+    documents: List[Any],
+    track_count: int = 8,
+    genre: str = "alternative",
+    processing_mode: str = "auto",
+    max_workers: Optional[int] = None,
+    ctx: Context = None
+) -> str:
+    """
+    Create one conceptual album per document, spread across the warm worker pool.
+
+    Each document goes through the same pipeline as create_conceptual_album.
+    Documents with identical content and options are only processed once.
+    Completion of each album is reported through ctx.info as it happens.
+
+    Args:
+        documents: Source documents, each a content string or an object with
+            "content" and optionally "album_concept", "character_name",
+            "character_description", "track_count", "genre" and "processing_mode"
+        track_count: Default number of tracks per album (3-12)
+        genre: Default musical genre preference
+        processing_mode: Default mode: "narrative", "character", "conceptual", or "auto"
+        max_workers: Albums to run at once in the warm worker pool (defaults to the pool size)
+
+    Returns:
+        JSON with one entry per document, in input order, each holding either
+        the album or the error for that document, plus a batch summary
+    """
+    try:
+        if not documents:
+            return json.dumps({"error": "No documents provided"})
+        if len(documents) > MAX_ALBUM_BATCH_SIZE:
+            return json.dumps({"error": f"A batch holds at most {MAX_ALBUM_BATCH_SIZE} documents"})
+
+        defaults = {'track_count': track_count, 'genre': genre, 'processing_mode': processing_mode}
+        arguments, errors = _normalize_album_batch(documents, defaults)
+
+        # Identical documents share one album task
+        task_keys: Dict[str, int] = {}
+        task_arguments: List[Dict[str, Any]] = []
+        document_tasks: List[Optional[int]] = []
+        for document_arguments in arguments:
+            if document_arguments is None:
+                document_tasks.append(None)
+                continue
+            key = json.dumps(document_arguments, sort_keys=True)
+            if key not in task_keys:
+                task_keys[key] = len(task_arguments)
+                task_arguments.append(document_arguments)
+            document_tasks.append(task_keys[key])
+
+        workers = max(1, min(max_workers or get_warm_worker_pool().max_workers, len(task_arguments) or 1))
+        await ctx.info(f"Creating {len(task_arguments)} albums for {len(documents)} documents with {workers} workers...")
+
+        task_results: List[Optional[Dict[str, Any]]] = [None] * len(task_arguments)
+        completed = 0
+
+        async def report(task_index: int, album_result: Dict[str, Any]) -> None:
+            nonlocal completed
+            task_results[task_index] = album_result
+            completed += 1
+            if "error" in album_result:
+                await ctx.info(f"Album {completed}/{len(task_arguments)} failed: {album_result['error']}")
+            else:
+                title = album_result.get("album_info", {}).get("title", "untitled")
+                await ctx.info(f"Album {completed}/{len(task_arguments)} complete: {title}")
+
+        if workers == 1:
+            # Not worth a pool; run in this process one album at a time
+            for task_index, document_arguments in enumerate(task_arguments):
+                await report(task_index, await asyncio.to_thread(_create_album_in_worker, document_arguments))
         else:
-            # Hybrid mode - combine approaches
-            album_result = await _create_hybrid_album(
-                content, album_concept, character_name, character_description, track_count, genre, ctx
-            )
+            pool = get_warm_worker_pool()
+            if not pool.running:
+                await asyncio.to_thread(pool.start)
+            # The pool is shared with other calls; this batch keeps at most `workers` albums in it
+            waiting = list(enumerate(task_arguments))[::-1]
+            pending: Dict[asyncio.Future, int] = {}
+
+            def submit_waiting() -> None:
+                while waiting and len(pending) < workers:
+                    task_index, document_arguments = waiting.pop()
+                    future = asyncio.wrap_future(pool.submit(_create_album_in_worker, document_arguments))
+                    pending[future] = task_index
 
-        await ctx.info(f"Conceptual album creation complete: {track_count} unique tracks")
-        return json.dumps(album_result, indent=2)
+            try:
+                submit_waiting()
+                while pending:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        task_index = pending.pop(future)
+                        try:
+                            album_result = future.result()
+                        except Exception as e:
+                            # The worker itself died (e.g. killed); the document gets the error
+                            album_result = {"error": f"Album creation failed: {str(e)}"}
+                        await report(task_index, album_result)
+                    submit_waiting()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        albums = []
+        for index, (task_index, error) in enumerate(zip(document_tasks, errors, strict=True)):
+            album_result = task_results[task_index] if task_index is not None else {"error": error}
+            if "error" in album_result:
+                albums.append({"index": index, "status": "failed", "error": album_result["error"]})
+            else:
+                albums.append({"index": index, "status": "completed", "album": album_result})
+
+        failed = sum(1 for album in albums if album["status"] == "failed")
+        await ctx.info(f"Batch album creation complete: {len(albums) - failed} albums, {failed} failed")
+        return json.dumps({
+            "albums": albums,
+            "batch_summary": {
+                "documents": len(documents),
+                "albums_created": len(albums) - failed,
+                "failed": failed,
+                "unique_documents": len(task_arguments),
+                "workers": workers
+            }
+        }, indent=2)
 
     except Exception as e:
-        await ctx.error(f"Conceptual album creation failed: {str(e)}")
-        return json.dumps({"error": f"Album creation failed: {str(e)}"})
+        await ctx.error(f"Batch album creation failed: {str(e)}")
+        return json.dumps({"error": f"Batch album creation failed: {str(e)}"})
 
+@traced("story_beats")
 async def _extract_story_beats(narrative_text: str, character: StandardCharacterProfile, ctx: Context) -> List[Dict]:
     """Extract key story beats and plot points from narrative"""
 
@@ -7183,6 +7965,7 @@ Key themes: {', '.join(track_concept['track_themes'])}
     return suno_command
 
 @mcp.tool
+@single_flight_tool
 async def analyze_artist_psychology(
     character_json: str,
     persona_json: str,
@@ -7723,6 +8506,7 @@ def _map_core_to_music(character: CharacterProfile, persona: ArtistPersona) -> s
     return f"Core motivations and fears drive the {persona.primary_genre} choice and {', '.join(persona.lyrical_themes[:2])} thematic focus"
 
 @mcp.tool
+@single_flight_tool
 async def crawl_suno_wiki_best_practices(
     topic: str = "all",
     ctx: Context = None
@@ -7956,6 +8740,7 @@ async def crawl_suno_wiki_best_practices(
 
 # Consolidated album creation helper functions
 
+@traced("content_type_detection")
 async def _detect_content_type(content: str, character_description: str, processing_mode: str, ctx: Context) -> str:
     """Detect the appropriate processing mode for the content"""
     if processing_mode != "auto":
@@ -7986,6 +8771,7 @@ async def _detect_content_type(content: str, character_description: str, process
     else:
         return "conceptual"  # Default to conceptual for shorter, abstract content
 
+@traced("narrative_album")
 async def _create_narrative_album(content: str, album_concept: str, character_name: str,
                                 track_count: int, genre: str, ctx: Context) -> Dict:
     """Create album from narrative content with story progression"""
@@ -8067,6 +8853,7 @@ async def _create_narrative_album(content: str, album_concept: str, character_na
         # Fallback to conceptual mode
         return await _create_conceptual_thematic_album(content, album_concept, track_count, genre, ctx)
 
+@traced("character_driven_album")
 async def _create_character_driven_album(content: str, character_description: str, album_concept: str,
                                        track_count: int, genre: str, ctx: Context) -> Dict:
     """Create album using explicit character description"""
@@ -8142,6 +8929,7 @@ async def _create_character_driven_album(content: str, character_description: st
         "album_summary": f"Created {track_count}-track character-driven album through {character_name}'s perspective"
     }
 
+@traced("conceptual_album")
 async def _create_conceptual_thematic_album(content: str, album_concept: str, track_count: int,
                                           genre: str, ctx: Context) -> Dict:
     """Create album from conceptual/philosophical content"""
@@ -8194,6 +8982,7 @@ async def _create_conceptual_thematic_album(content: str, album_concept: str, tr
         "album_summary": f"Created {track_count}-track conceptual album exploring thematic elements"
     }
 
+@traced("hybrid_album")
 async def _create_hybrid_album(content: str, album_concept: str, character_name: str,
                              character_description: str, track_count: int, genre: str, ctx: Context) -> Dict:
     """Create album combining multiple approaches"""
@@ -9038,97 +9827,88 @@ def _create_track_perspective(character_traits: Dict, template: Dict, theme: str
 
 def _extract_character_name(character_description: str) -> str:
     """Extract character name from description"""
-    import re
-
-    # Try multiple name patterns
-    name_patterns = [
-        r'([A-Z][A-Z]+ [A-Z][a-zA-Z]+)',  # DJ Memphis, MC Something
-        r'([A-Z][a-z]+ [A-Z][a-zA-Z]+)',  # John Smith or John McKenzie
-        r'([A-Z][a-z]+ (?:"[^"]*" )?[A-Z][a-z]+)',  # John "Nickname" Smith
-        r'^([A-Z][a-z]+(?:\s+[A-Z][a-zA-Z]+)+)',  # Multiple names at start
-        r'([A-Z][A-Z]+)',  # Single names like DJ, MC (fallback)
-    ]
-
     # First try to find name in the first sentence
     first_sentence = character_description.split('.')[0] if '.' in character_description else character_description.split('\n')[0]
 
-    for pattern in name_patterns:
-        match = re.search(pattern, first_sentence)
+    for pattern in DESCRIPTION_NAME_PATTERNS:
+        match = pattern.search(first_sentence)
         if match:
             return match.group(1)
 
     # If still no match, try the whole description
-    for pattern in name_patterns:
-        match = re.search(pattern, character_description)
+    for pattern in DESCRIPTION_NAME_PATTERNS:
+        match = pattern.search(character_description)
         if match:
             return match.group(1)
 
     return "Independent Artist"
 
 
+# Genre patterns with priority (more specific first)
+CHARACTER_GENRE_PATTERNS = {
+    # Electronic subgenres (most specific first)
+    "liquid drum and bass": ["liquid drum and bass", "liquid dnb", "liquid d&b", "liquid drum & bass"],
+    "drum and bass": ["drum and bass", "dnb", "d&b", "drum & bass", "jungle"],
+    "dubstep": ["dubstep", "dub step", "bass music"],
+    "house": ["house music", "deep house", "tech house"],
+    "techno": ["techno", "detroit techno", "minimal techno"],
+    "trance": ["trance", "progressive trance", "uplifting trance"],
+    "electronic": ["electronic music", "electronic producer", "electronic artist", "edm"],
+
+    # Hip-hop subgenres
+    "memphis hip-hop": ["memphis hip-hop", "memphis rap", "memphis hip hop"],
+    "trap": ["trap music", "trap beats", "trap producer", "trap artist"],
+    "boom bap": ["boom bap", "boom-bap", "old school hip hop"],
+    "hip-hop": ["hip-hop", "hip hop", "rap music", "rap"],
+
+    # Latin/Caribbean genres
+    "reggaeton": ["reggaeton", "reggaeton producer", "reggaeton artist"],
+    "latin trap": ["latin trap", "trap-reggaeton", "trap reggaeton"],
+    "salsa": ["salsa", "salsa music"],
+    "bachata": ["bachata", "bachata music"],
+
+    # Rock subgenres
+    "metal": ["metal", "heavy metal", "death metal", "black metal"],
+    "punk": ["punk", "punk rock", "hardcore punk"],
+    "grunge": ["grunge", "alternative rock", "seattle sound"],
+    "indie rock": ["indie rock", "independent rock"],
+    "rock": ["rock music", "rock"],
+
+    # Soul/R&B
+    "neo-soul": ["neo-soul", "neo soul", "neosoul"],
+    "r&b": ["r&b", "rnb", "rhythm and blues"],
+    "soul": ["soul music", "soul"],
+    "funk": ["funk", "funk music"],
+
+    # Jazz subgenres
+    "smooth jazz": ["smooth jazz", "contemporary jazz"],
+    "bebop": ["bebop", "be-bop"],
+    "fusion": ["jazz fusion", "fusion"],
+    "jazz": ["jazz", "jazz music"],
+
+    # Folk and acoustic
+    "indie folk": ["indie folk", "independent folk"],
+    "country": ["country", "country music", "americana"],
+    "folk": ["folk music", "folk"],
+    "acoustic": ["acoustic", "acoustic music"],
+
+    # Pop subgenres
+    "indie pop": ["indie pop", "independent pop"],
+    "synth pop": ["synth pop", "synthpop", "new wave"],
+    "pop": ["pop music", "pop"],
+
+    # Alternative (catch-all)
+    "alternative": ["alternative", "alt rock", "alternative rock", "indie"]
+}
+
+
 def _extract_character_genre(character_description: str) -> str:
     """Extract genre from character description"""
     desc_lower = character_description.lower()
 
-    # Genre patterns with priority (more specific first)
-    genre_patterns = {
-        # Electronic subgenres (most specific first)
-        "liquid drum and bass": ["liquid drum and bass", "liquid dnb", "liquid d&b", "liquid drum & bass"],
-        "drum and bass": ["drum and bass", "dnb", "d&b", "drum & bass", "jungle"],
-        "dubstep": ["dubstep", "dub step", "bass music"],
-        "house": ["house music", "deep house", "tech house"],
-        "techno": ["techno", "detroit techno", "minimal techno"],
-        "trance": ["trance", "progressive trance", "uplifting trance"],
-        "electronic": ["electronic music", "electronic producer", "electronic artist", "edm"],
-
-        # Hip-hop subgenres
-        "memphis hip-hop": ["memphis hip-hop", "memphis rap", "memphis hip hop"],
-        "trap": ["trap music", "trap beats", "trap producer", "trap artist"],
-        "boom bap": ["boom bap", "boom-bap", "old school hip hop"],
-        "hip-hop": ["hip-hop", "hip hop", "rap music", "rap"],
-
-        # Latin/Caribbean genres
-        "reggaeton": ["reggaeton", "reggaeton producer", "reggaeton artist"],
-        "latin trap": ["latin trap", "trap-reggaeton", "trap reggaeton"],
-        "salsa": ["salsa", "salsa music"],
-        "bachata": ["bachata", "bachata music"],
-
-        # Rock subgenres
-        "metal": ["metal", "heavy metal", "death metal", "black metal"],
-        "punk": ["punk", "punk rock", "hardcore punk"],
-        "grunge": ["grunge", "alternative rock", "seattle sound"],
-        "indie rock": ["indie rock", "independent rock"],
-        "rock": ["rock music", "rock"],
-
-        # Soul/R&B
-        "neo-soul": ["neo-soul", "neo soul", "neosoul"],
-        "r&b": ["r&b", "rnb", "rhythm and blues"],
-        "soul": ["soul music", "soul"],
-        "funk": ["funk", "funk music"],
-
-        # Jazz subgenres
-        "smooth jazz": ["smooth jazz", "contemporary jazz"],
-        "bebop": ["bebop", "be-bop"],
-        "fusion": ["jazz fusion", "fusion"],
-        "jazz": ["jazz", "jazz music"],
-
-        # Folk and acoustic
-        "indie folk": ["indie folk", "independent folk"],
-        "country": ["country", "country music", "americana"],
-        "folk": ["folk music", "folk"],
-        "acoustic": ["acoustic", "acoustic music"],
-
-        # Pop subgenres
-        "indie pop": ["indie pop", "independent pop"],
-        "synth pop": ["synth pop", "synthpop", "new wave"],
-        "pop": ["pop music", "pop"],
-
-        # Alternative (catch-all)
-        "alternative": ["alternative", "alt rock", "alternative rock", "indie"]
-    }
 
     # Check for genre patterns
-    for genre, patterns in genre_patterns.items():
+    for genre, patterns in CHARACTER_GENRE_PATTERNS.items():
         for pattern in patterns:
             if pattern in desc_lower:
                 return genre
@@ -9378,6 +10158,56 @@ async def workflow_integration_resource() -> str:
     - Maintains character relationships across processing
     """
 
+@mcp.resource("metrics://prometheus", mime_type="text/plain; version=0.0.4; charset=utf-8")
+async def prometheus_metrics_resource() -> str:
+    """
+    Server metrics in the Prometheus text exposition format.
+
+    Covers per-tool latency histograms and outcomes, wiki cache hits and misses,
+    download volume, monitored operation durations (downloads, parsing,
+    generation), circuit breaker states and retry outcomes. Set
+    CHARACTER_MUSIC_METRICS_PORT to also serve them over HTTP at /metrics.
+    """
+    return get_metrics_registry().render(openmetrics=False)
+
+@mcp.resource("memory://diagnostics", mime_type="application/json")
+async def memory_diagnostics_resource() -> str:
+    """
+    Memory held by long-lived component state, measured now
+
+    For each component that keeps state for the life of the process (usage
+    records, download and retry history, caches, metric deques) this gives an
+    estimate of the bytes and items each attribute retains, and lists
+    attributes that kept growing over recent snapshots as leak suspects.
+    With CHARACTER_MUSIC_MEMORY_SNAPSHOT_INTERVAL set, tracemalloc runs and
+    the report adds allocation growth since the previous snapshot by owner.
+    """
+    report = await asyncio.to_thread(get_memory_diagnostics().snapshot)
+    return json.dumps(report, indent=2)
+
+@mcp.resource("profiles://slow-calls", mime_type="application/json")
+async def slow_call_profiles_resource() -> str:
+    """
+    Profiles kept for slow tool calls, newest first
+
+    Each entry has the tool, start time, duration, sample count and the
+    functions with the most self time. Profiling is off unless
+    CHARACTER_MUSIC_PROFILE_RATE sets the fraction of calls to sample;
+    CHARACTER_MUSIC_PROFILE_THRESHOLD_MS sets how slow a call must be for its
+    profile to be kept. Read profiles://slow-calls/{profile_id} for the
+    collapsed-stack flamegraph of one profile.
+    """
+    profiles = await asyncio.to_thread(get_tool_profiler().list_profiles)
+    return json.dumps({"profiles": profiles, "count": len(profiles)}, indent=2)
+
+@mcp.resource("profiles://slow-calls/{profile_id}", mime_type="text/plain")
+async def slow_call_flamegraph_resource(profile_id: str) -> str:
+    """Collapsed-stack flamegraph of one slow-call profile (flamegraph.pl / speedscope format)"""
+    flamegraph = await asyncio.to_thread(get_tool_profiler().store.read_flamegraph, profile_id)
+    if flamegraph is None:
+        raise ValueError(f"No profile {profile_id}")
+    return flamegraph
+
 # ================================================================================================
 # PROMPTS
 # ================================================================================================
@@ -9548,6 +10378,7 @@ async def suno_optimization_prompt(artist_persona: str, character_background: st
 # WIKI ATTRIBUTION HELPERS
 # ================================================================================================
 
+@traced("wiki_attribution")
 async def _build_wiki_attribution_context(analysis_data: Dict[str, Any], ctx: Context) -> str:
     """Build attribution context for wiki-sourced content used in analysis
 
@@ -9606,6 +10437,7 @@ async def _build_wiki_attribution_context(analysis_data: Dict[str, Any], ctx: Co
 # ================================================================================================
 
 @mcp.tool
+@single_flight_tool
 async def detect_input_format(text: str, ctx: Context) -> str:
     """
     Detect input format and provide processing recommendations
@@ -9655,6 +10487,7 @@ async def detect_input_format(text: str, ctx: Context) -> str:
         return json.dumps({"error": f"Format detection failed: {str(e)}"})
 
 @mcp.tool
+@single_flight_tool
 async def request_clarification(text: str, detection_result: str = None, ctx: Context = None) -> str:
     """
     Request clarification for ambiguous input content
@@ -9702,6 +10535,7 @@ async def request_clarification(text: str, detection_result: str = None, ctx: Co
         return json.dumps({"error": f"Clarification generation failed: {str(e)}"})
 
 @mcp.tool
+@single_flight_tool
 async def process_with_guidance(text: str, user_choice: str, additional_context: str = "", ctx: Context = None) -> str:
     """
     Process content with user-provided guidance
@@ -9774,7 +10608,93 @@ async def process_with_guidance(text: str, user_choice: str, additional_context:
             await ctx.error(f"Failed to process with guidance: {str(e)}")
         return json.dumps({"error": f"Processing with guidance failed: {str(e)}"})
 
+PROCESSING_GUIDANCE = {
+    "processing_modes": {
+        "character_description": {
+            "when_to_use": "When you have explicit character details, artist bios, or persona descriptions",
+            "examples": [
+                "John Smith, 28-year-old indie folk artist from Portland",
+                "Character: Sarah - A philosophical songwriter who explores existential themes",
+                "Artist Profile: DJ Memphis, electronic producer specializing in ambient soundscapes"
+            ],
+            "tool_to_use": "analyze_character_text",
+            "output": "Uses your character details directly to create music content"
+        },
+        "narrative_fiction": {
+            "when_to_use": "When you have stories, narratives, or fictional content with characters",
+            "examples": [
+                "Story excerpts with dialogue and character actions",
+                "Novel chapters or short stories",
+                "Narrative descriptions of events and characters"
+            ],
+            "tool_to_use": "analyze_character_text",
+            "output": "Extracts characters from the story and creates music from their perspective"
+        },
+        "philosophical_conceptual": {
+            "when_to_use": "When you have abstract ideas, philosophical content, or conceptual themes",
+            "examples": [
+                "Philosophical essays or excerpts",
+                "Abstract concepts like 'the nature of time'",
+                "Thematic content about existentialism, spirituality, etc."
+            ],
+            "tool_to_use": "create_conceptual_album",
+            "output": "Creates characters that embody and explore these concepts through music"
+        },
+        "poetic_content": {
+            "when_to_use": "When you have poetry, lyrical content, or highly metaphorical text",
+            "examples": [
+                "Poems or verses",
+                "Lyrical content with rich imagery",
+                "Metaphorical or symbolic text"
+            ],
+            "tool_to_use": "analyze_character_text",
+            "output": "Creates characters from the poetic voice and transforms themes into music"
+        },
+        "concept_outline": {
+            "when_to_use": "When you have structured outlines, lists, or organized conceptual content",
+            "examples": [
+                "Numbered lists of ideas or themes",
+                "Structured outlines of concepts",
+                "Organized frameworks or systems"
+            ],
+            "tool_to_use": "create_conceptual_album",
+            "output": "Processes each concept systematically to create coherent characters"
+        },
+        "mixed_content": {
+            "when_to_use": "When your content combines multiple types or you're unsure",
+            "examples": [
+                "Content that mixes narrative with philosophical elements",
+                "Character descriptions embedded in stories",
+                "Any content that doesn't fit clearly into other categories"
+            ],
+            "tool_to_use": "complete_workflow",
+            "output": "Uses adaptive processing to handle multiple content types intelligently"
+        }
+    },
+    "workflow_recommendations": [
+        "1. Start with 'detect_input_format' to understand your content type",
+        "2. If results are unclear, use 'request_clarification' for guidance",
+        "3. Use 'process_with_guidance' if you want to specify the processing approach",
+        "4. For general processing, use the recommended tool from format detection"
+    ],
+    "tips": [
+        "Be as specific as possible about what you want to achieve",
+        "If you're unsure, start with 'detect_input_format' for analysis",
+        "You can always provide additional context to guide the processing",
+        "Character descriptions work best when they include age, background, and musical style",
+        "Narrative content works best when it has clear characters and dialogue",
+        "Conceptual content works best when themes are clearly articulated"
+    ],
+    "troubleshooting": {
+        "empty_results": "Try providing more detailed content or switching to a different processing mode",
+        "generic_output": "Add more specific details about characters, themes, or context",
+        "wrong_interpretation": "Use 'request_clarification' to specify the correct processing approach"
+    }
+}
+
+
 @mcp.tool
+@single_flight_tool
 async def get_processing_guidance(content_type: str = None, ctx: Context = None) -> str:
     """
     Get guidance on different processing modes and when to use them
@@ -9793,102 +10713,18 @@ async def get_processing_guidance(content_type: str = None, ctx: Context = None)
         if ctx:
             await ctx.info("Providing processing guidance")
 
-        guidance = {
-            "processing_modes": {
-                "character_description": {
-                    "when_to_use": "When you have explicit character details, artist bios, or persona descriptions",
-                    "examples": [
-                        "John Smith, 28-year-old indie folk artist from Portland",
-                        "Character: Sarah - A philosophical songwriter who explores existential themes",
-                        "Artist Profile: DJ Memphis, electronic producer specializing in ambient soundscapes"
-                    ],
-                    "tool_to_use": "analyze_character_text",
-                    "output": "Uses your character details directly to create music content"
-                },
-                "narrative_fiction": {
-                    "when_to_use": "When you have stories, narratives, or fictional content with characters",
-                    "examples": [
-                        "Story excerpts with dialogue and character actions",
-                        "Novel chapters or short stories",
-                        "Narrative descriptions of events and characters"
-                    ],
-                    "tool_to_use": "analyze_character_text",
-                    "output": "Extracts characters from the story and creates music from their perspective"
-                },
-                "philosophical_conceptual": {
-                    "when_to_use": "When you have abstract ideas, philosophical content, or conceptual themes",
-                    "examples": [
-                        "Philosophical essays or excerpts",
-                        "Abstract concepts like 'the nature of time'",
-                        "Thematic content about existentialism, spirituality, etc."
-                    ],
-                    "tool_to_use": "create_conceptual_album",
-                    "output": "Creates characters that embody and explore these concepts through music"
-                },
-                "poetic_content": {
-                    "when_to_use": "When you have poetry, lyrical content, or highly metaphorical text",
-                    "examples": [
-                        "Poems or verses",
-                        "Lyrical content with rich imagery",
-                        "Metaphorical or symbolic text"
-                    ],
-                    "tool_to_use": "analyze_character_text",
-                    "output": "Creates characters from the poetic voice and transforms themes into music"
-                },
-                "concept_outline": {
-                    "when_to_use": "When you have structured outlines, lists, or organized conceptual content",
-                    "examples": [
-                        "Numbered lists of ideas or themes",
-                        "Structured outlines of concepts",
-                        "Organized frameworks or systems"
-                    ],
-                    "tool_to_use": "create_conceptual_album",
-                    "output": "Processes each concept systematically to create coherent characters"
-                },
-                "mixed_content": {
-                    "when_to_use": "When your content combines multiple types or you're unsure",
-                    "examples": [
-                        "Content that mixes narrative with philosophical elements",
-                        "Character descriptions embedded in stories",
-                        "Any content that doesn't fit clearly into other categories"
-                    ],
-                    "tool_to_use": "complete_workflow",
-                    "output": "Uses adaptive processing to handle multiple content types intelligently"
-                }
-            },
-            "workflow_recommendations": [
-                "1. Start with 'detect_input_format' to understand your content type",
-                "2. If results are unclear, use 'request_clarification' for guidance",
-                "3. Use 'process_with_guidance' if you want to specify the processing approach",
-                "4. For general processing, use the recommended tool from format detection"
-            ],
-            "tips": [
-                "Be as specific as possible about what you want to achieve",
-                "If you're unsure, start with 'detect_input_format' for analysis",
-                "You can always provide additional context to guide the processing",
-                "Character descriptions work best when they include age, background, and musical style",
-                "Narrative content works best when it has clear characters and dialogue",
-                "Conceptual content works best when themes are clearly articulated"
-            ],
-            "troubleshooting": {
-                "empty_results": "Try providing more detailed content or switching to a different processing mode",
-                "generic_output": "Add more specific details about characters, themes, or context",
-                "wrong_interpretation": "Use 'request_clarification' to specify the correct processing approach"
-            }
-        }
-
         # If specific content type requested, focus on that
-        if content_type and content_type in guidance["processing_modes"]:
+        if content_type and content_type in PROCESSING_GUIDANCE["processing_modes"]:
             focused_guidance = {
                 "requested_mode": content_type,
-                "details": guidance["processing_modes"][content_type],
-                "workflow_recommendations": guidance["workflow_recommendations"],
-                "tips": guidance["tips"],
-                "troubleshooting": guidance["troubleshooting"]
+                "details": PROCESSING_GUIDANCE["processing_modes"][content_type],
+                "workflow_recommendations": PROCESSING_GUIDANCE["workflow_recommendations"],
+                "tips": PROCESSING_GUIDANCE["tips"],
+                "troubleshooting": PROCESSING_GUIDANCE["troubleshooting"]
             }
             return json.dumps(focused_guidance, indent=2)
 
-        return json.dumps(guidance, indent=2)
+        return json.dumps(PROCESSING_GUIDANCE, indent=2)
 
     except Exception as e:
         if ctx:
@@ -10030,5 +10866,29 @@ if __name__ == "__main__":
     import asyncio
     asyncio.run(startup())
 
+    # Optional local metrics endpoint for Prometheus-style scrapers
+    if os.environ.get("CHARACTER_MUSIC_METRICS_PORT"):
+        start_metrics_server(int(os.environ["CHARACTER_MUSIC_METRICS_PORT"]),
+                             os.environ.get("CHARACTER_MUSIC_METRICS_HOST", "127.0.0.1"))
+
+    # Optional periodic memory snapshots with tracemalloc growth attribution
+    if os.environ.get("CHARACTER_MUSIC_MEMORY_SNAPSHOT_INTERVAL"):
+        get_memory_diagnostics().start(float(os.environ["CHARACTER_MUSIC_MEMORY_SNAPSHOT_INTERVAL"]))
+
+    # Optional sampling profiler keeping profiles of slow tool calls
+    if os.environ.get("CHARACTER_MUSIC_PROFILE_RATE"):
+        get_tool_profiler().configure(
+            sample_rate=float(os.environ["CHARACTER_MUSIC_PROFILE_RATE"]),
+            threshold_seconds=float(os.environ.get("CHARACTER_MUSIC_PROFILE_THRESHOLD_MS", "1000")) / 1000,
+            output_dir=os.environ.get("CHARACTER_MUSIC_PROFILE_DIR", "./data/profiles"))
+
+    # Optional sizing and recycling limits of the warm worker pool for CPU-heavy tools
+    if os.environ.get("CHARACTER_MUSIC_WORKERS") or os.environ.get("CHARACTER_MUSIC_WORKER_MAX_TASKS") \
+            or os.environ.get("CHARACTER_MUSIC_WORKER_MAX_RSS_MB"):
+        get_warm_worker_pool().configure(
+            max_workers=int(os.environ.get("CHARACTER_MUSIC_WORKERS", "0")) or None,
+            max_tasks_per_worker=int(os.environ.get("CHARACTER_MUSIC_WORKER_MAX_TASKS", "0")) or None,
+            max_worker_rss_mb=float(os.environ.get("CHARACTER_MUSIC_WORKER_MAX_RSS_MB", "0")) or None)
+
     # Run the FastMCP server
     mcp.run()
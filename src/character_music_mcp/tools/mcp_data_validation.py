@@ -10,7 +10,7 @@ helpful error messages for debugging.
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +109,99 @@ class ValidationResult:
         return f"Invalid: {error_count} errors, {warning_count} warnings"
 
 
+# Character layer fields checked for completeness
+SKIN_LAYER_FIELDS = ('physical_description', 'mannerisms', 'speech_patterns', 'behavioral_traits')
+FLESH_LAYER_FIELDS = ('backstory', 'relationships', 'formative_experiences', 'social_connections')
+CORE_LAYER_FIELDS = ('motivations', 'fears', 'desires', 'conflicts', 'personality_drivers')
+
+PLACEHOLDER_CHARACTER_NAMES = frozenset({'unknown', 'character', 'unknown character', 'test', 'example'})
+
+
+# Schema compilation
+
+_MISSING = object()
+
+
+def _compile_field_checks(field_name: str, field_schema: Dict[str, Any], index: int,
+                          namespace: Dict[str, Any]) -> List[str]:
+    """Generate the source lines that check one schema field"""
+    expected_type = field_schema['type']
+    type_name = f"_type_{index}"
+    namespace[type_name] = expected_type
+
+    lines = [f"    value = data.get({field_name!r}, _MISSING)"]
+    if field_schema.get('required', False):
+        lines.append("    if value is _MISSING:")
+        lines.append("        return False")
+        lines.append(f"    if not isinstance(value, {type_name}):")
+        lines.append("        return False")
+        indent = "    "
+    else:
+        lines.append("    if value is not _MISSING:")
+        lines.append(f"        if not isinstance(value, {type_name}):")
+        lines.append("            return False")
+        indent = "        "
+
+    # Mirror the interpreter: constraints apply by the runtime type of the value.
+    # str, list and numbers are disjoint, so the interpreter's elif chain becomes separate ifs.
+    branches = []
+    min_length = field_schema.get('min_length', 0)
+    if min_length == 1:
+        # Same as len(value.strip()) < 1 without allocating the stripped copy
+        branches.append(("str", "not value or value.isspace()"))
+        branches.append(("list", "not value"))
+    elif min_length > 1:
+        namespace[f"_min_length_{index}"] = min_length
+        branches.append(("str", f"len(value.strip()) < _min_length_{index}"))
+        branches.append(("list", f"len(value) < _min_length_{index}"))
+
+    bounds = []
+    if field_schema.get('min') is not None:
+        namespace[f"_min_{index}"] = field_schema['min']
+        bounds.append(f"value < _min_{index}")
+    if field_schema.get('max') is not None:
+        namespace[f"_max_{index}"] = field_schema['max']
+        bounds.append(f"value > _max_{index}")
+    if bounds:
+        branches.append(("(int, float)", " or ".join(bounds)))
+
+    for runtime_type, condition in branches:
+        lines.append(f"{indent}if isinstance(value, {runtime_type}) and ({condition}):")
+        lines.append(f"{indent}    return False")
+
+    return lines
+
+
+def compile_schema(schema: Dict[str, Any], context: str) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile a field schema into a specialized validator function
+
+    The generated function checks exactly what ``_validate_against_schema``
+    checks, but returns a bool instead of collecting issues, so valid data is
+    checked without allocating anything. Callers fall back to the interpreter
+    only when it returns False, to get detailed issues.
+
+    Args:
+        schema: Field schema in the ``_get_*_schema`` format
+        context: Name used for the generated function
+
+    Returns:
+        Function returning True when data satisfies the schema
+    """
+    namespace: Dict[str, Any] = {'_MISSING': _MISSING}
+    function_name = f"check_{''.join(c if c.isalnum() else '_' for c in context)}"
+    lines = [f"def {function_name}(data):"]
+    for index, (field_name, field_schema) in enumerate(schema.items()):
+        lines.extend(_compile_field_checks(field_name, field_schema, index, namespace))
+    lines.append("    return True")
+
+    source = "\n".join(lines)
+    exec(compile(source, f"<compiled schema {context}>", "exec"), namespace)
+    check = namespace[function_name]
+    check.schema_source = source
+    return check
+
+
 class MCPDataValidator:
     """Centralized validator for all MCP tool data structures"""
 
@@ -117,12 +210,19 @@ class MCPDataValidator:
         self.persona_data_schema = self._get_persona_data_schema()
         self.suno_command_schema = self._get_suno_command_schema()
 
-    def validate_character_profile(self, data: Any) -> ValidationResult:
+        # Specialized validators; the schema interpreter only runs to explain failures
+        self._check_character_profile = compile_schema(self.character_profile_schema, "character_profile")
+        self._check_persona_data = compile_schema(self.persona_data_schema, "persona_data")
+        self._check_suno_command = compile_schema(self.suno_command_schema, "suno_command")
+
+    def validate_character_profile(self, data: Any, trusted: bool = False) -> ValidationResult:
         """
         Validate character profile data structure
 
         Args:
             data: Character profile data to validate
+            trusted: Data was produced by one of our own pipeline stages, so
+                schema validation is skipped and only content checks run
 
         Returns:
             ValidationResult with validation details
@@ -141,19 +241,22 @@ class MCPDataValidator:
             return result
 
         # Validate against schema
-        self._validate_against_schema(data, self.character_profile_schema, result, "character_profile")
+        if not trusted and not self._check_character_profile(data):
+            self._validate_against_schema(data, self.character_profile_schema, result, "character_profile")
 
         # Additional character-specific validations
         self._validate_character_profile_content(data, result)
 
         return result
 
-    def validate_persona_data(self, data: Any) -> ValidationResult:
+    def validate_persona_data(self, data: Any, trusted: bool = False) -> ValidationResult:
         """
         Validate persona data structure
 
         Args:
             data: Persona data to validate
+            trusted: Data was produced by one of our own pipeline stages, so
+                schema validation is skipped and only content checks run
 
         Returns:
             ValidationResult with validation details
@@ -172,19 +275,22 @@ class MCPDataValidator:
             return result
 
         # Validate against schema
-        self._validate_against_schema(data, self.persona_data_schema, result, "persona_data")
+        if not trusted and not self._check_persona_data(data):
+            self._validate_against_schema(data, self.persona_data_schema, result, "persona_data")
 
         # Additional persona-specific validations
         self._validate_persona_data_content(data, result)
 
         return result
 
-    def validate_suno_command_data(self, data: Any) -> ValidationResult:
+    def validate_suno_command_data(self, data: Any, trusted: bool = False) -> ValidationResult:
         """
         Validate Suno command data structure
 
         Args:
             data: Suno command data to validate
+            trusted: Data was produced by one of our own pipeline stages, so
+                schema validation is skipped and only content checks run
 
         Returns:
             ValidationResult with validation details
@@ -203,7 +309,8 @@ class MCPDataValidator:
             return result
 
         # Validate against schema
-        self._validate_against_schema(data, self.suno_command_schema, result, "suno_command")
+        if not trusted and not self._check_suno_command(data):
+            self._validate_against_schema(data, self.suno_command_schema, result, "suno_command")
 
         # Additional Suno-specific validations
         self._validate_suno_command_content(data, result)
@@ -607,7 +714,7 @@ class MCPDataValidator:
 
         # Check for meaningful character information
         name = data.get('name', '').strip()
-        if name.lower() in ['unknown', 'character', 'unknown character', 'test', 'example']:
+        if name.lower() in PLACEHOLDER_CHARACTER_NAMES:
             result.add_warning(
                 field="name",
                 message="Character name appears to be a placeholder",
@@ -615,13 +722,9 @@ class MCPDataValidator:
             )
 
         # Check for three-layer completeness
-        skin_fields = ['physical_description', 'mannerisms', 'speech_patterns', 'behavioral_traits']
-        flesh_fields = ['backstory', 'relationships', 'formative_experiences', 'social_connections']
-        core_fields = ['motivations', 'fears', 'desires', 'conflicts', 'personality_drivers']
-
-        skin_complete = any(data.get(field) for field in skin_fields)
-        flesh_complete = any(data.get(field) for field in flesh_fields)
-        core_complete = any(data.get(field) for field in core_fields)
+        skin_complete = any(map(data.get, SKIN_LAYER_FIELDS))
+        flesh_complete = any(map(data.get, FLESH_LAYER_FIELDS))
+        core_complete = any(map(data.get, CORE_LAYER_FIELDS))
 
         if not skin_complete:
             result.add_warning(
@@ -702,46 +805,50 @@ class MCPDataValidator:
 
 # Convenience functions for common validation scenarios
 
+_default_validator: Optional[MCPDataValidator] = None
+
+
+def _get_default_validator() -> MCPDataValidator:
+    """Shared validator so convenience functions don't recompile schemas per call"""
+    global _default_validator
+    if _default_validator is None:
+        _default_validator = MCPDataValidator()
+    return _default_validator
+
+
 def validate_character_profile(data: Any) -> ValidationResult:
     """Quick character profile validation"""
-    validator = MCPDataValidator()
-    return validator.validate_character_profile(data)
+    return _get_default_validator().validate_character_profile(data)
 
 
 def validate_persona_data(data: Any) -> ValidationResult:
     """Quick persona data validation"""
-    validator = MCPDataValidator()
-    return validator.validate_persona_data(data)
+    return _get_default_validator().validate_persona_data(data)
 
 
 def validate_text_input(text: Any, min_length: int = 10) -> ValidationResult:
     """Quick text input validation"""
-    validator = MCPDataValidator()
-    return validator.validate_text_input(text, min_length=min_length)
+    return _get_default_validator().validate_text_input(text, min_length=min_length)
 
 
 def validate_suno_commands(data: Any) -> ValidationResult:
     """Quick Suno command validation"""
-    validator = MCPDataValidator()
-    return validator.validate_suno_command_data(data)
+    return _get_default_validator().validate_suno_command_data(data)
 
 
 def validate_content_type_detection(content: str, detected_type: str) -> ValidationResult:
     """Quick content type detection validation"""
-    validator = MCPDataValidator()
-    return validator.validate_content_type_detection(content, detected_type)
+    return _get_default_validator().validate_content_type_detection(content, detected_type)
 
 
 def validate_workflow_state(workflow_state: Dict[str, Any]) -> ValidationResult:
     """Quick workflow state validation"""
-    validator = MCPDataValidator()
-    return validator.validate_workflow_state(workflow_state)
+    return _get_default_validator().validate_workflow_state(workflow_state)
 
 
 def validate_processing_strategy(content_type: str, strategy_name: str) -> ValidationResult:
     """Quick processing strategy validation"""
-    validator = MCPDataValidator()
-    return validator.validate_processing_strategy(content_type, strategy_name)
+    return _get_default_validator().validate_processing_strategy(content_type, strategy_name)
 
 
 # Error handling utilities
@@ -6,13 +6,21 @@ This module provides structured error handling, detailed logging, and recovery m
 for all MCP tools in the character-driven music generation system.
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import sys
 import traceback
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Truncation limits for logged input data
+MAX_LOGGED_STRING_CHARS = 200
+MAX_LOGGED_STRUCTURE_CHARS = 300
 
 
 # Configure structured logging
@@ -60,11 +68,163 @@ class FormatMismatchError:
         """Convert to dictionary for JSON serialization"""
         return asdict(self)
 
+class LazyLogValue:
+    """
+    Log argument that is only computed when a handler actually formats the record
+
+    The record is formatted on the log listener's thread, possibly after the
+    caller has moved on, so the arguments must be immutable (a result string,
+    say); summaries of mutable data are built with the record instead.
+    """
+
+    __slots__ = ("_func", "_args", "_value")
+
+    def __init__(self, func: Callable[..., Any], *args: Any):
+        self._func = func
+        self._args = args
+        self._value = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = str(self._func(*self._args))
+        return self._value
+
+    __repr__ = __str__
+
+
+def bounded_repr(value: Any, limit: int) -> Tuple[str, bool]:
+    """Render value like str() but stop once limit characters have been produced.
+
+    Returns the (possibly partial) text and whether it was truncated. Nested strings
+    are sliced before rendering, so the cost is bounded by the limit rather than by
+    the size of the payload.
+    """
+    parts: List[str] = []
+    budget = [limit]
+
+    def emit(text: str) -> bool:
+        parts.append(text)
+        budget[0] -= len(text)
+        return budget[0] >= 0
+
+    def render(item: Any) -> bool:
+        if isinstance(item, str):
+            return emit(repr(item[:budget[0] + 1]))
+        if isinstance(item, dict):
+            if not emit("{"):
+                return False
+            for index, (key, nested) in enumerate(item.items()):
+                if (index and not emit(", ")) or not render(key) or not emit(": ") or not render(nested):
+                    return False
+            return emit("}")
+        if isinstance(item, (list, tuple)):
+            if isinstance(item, list):
+                opening, closing = "[", "]"
+            else:
+                opening, closing = "(", ",)" if len(item) == 1 else ")"
+            if not emit(opening):
+                return False
+            for index, nested in enumerate(item):
+                if (index and not emit(", ")) or not render(nested):
+                    return False
+            return emit(closing)
+        return emit(repr(item))
+
+    complete = render(value)
+    text = "".join(parts)
+    return text[:limit], not complete or len(text) > limit
+
+
+def sanitize_input_for_log(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Sanitize input data for logging (remove sensitive info, truncate large data)"""
+    sanitized = {}
+
+    for key, value in input_data.items():
+        if isinstance(value, str):
+            # Truncate long strings
+            if len(value) > MAX_LOGGED_STRING_CHARS:
+                sanitized[key] = value[:MAX_LOGGED_STRING_CHARS] + "... [truncated]"
+            else:
+                sanitized[key] = value
+        elif isinstance(value, (dict, list, tuple)):
+            # Truncate large structures without rendering the whole payload
+            value_str, truncated = bounded_repr(value, MAX_LOGGED_STRUCTURE_CHARS)
+            if truncated:
+                sanitized[key] = value_str + "... [truncated]"
+            else:
+                sanitized[key] = value
+        else:
+            sanitized[key] = value
+
+    return sanitized
+
+
+def format_input_for_log(input_data: Dict[str, Any]) -> str:
+    """Sanitized input data rendered to text, so later changes to the data cannot reach the log"""
+    return str(sanitize_input_for_log(input_data))
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line for structured log ingestion"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "event": getattr(record, "event", None),
+            "tool": getattr(record, "tool", None),
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks or formats on the caller's thread.
+
+    Records are enqueued with their arguments unformatted so message building happens
+    on the listener thread. When the queue is full the record is dropped and counted
+    instead of stalling the event loop.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped_records = 0
+        self.listener: Optional[logging.handlers.QueueListener] = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
+
 class MCPErrorHandler:
     """Centralized error handling system for all MCP tools"""
 
-    def __init__(self, log_file_path: str = "mcp_tools_errors.log"):
+    def __init__(
+        self,
+        log_file_path: str = "mcp_tools_errors.log",
+        structured_log_path: Optional[str] = None,
+        structured_log_max_bytes: int = 10 * 1024 * 1024,
+        structured_log_backup_count: int = 5,
+        queue_logging: bool = True,
+        queue_size: int = 10000
+    ):
         self.log_file_path = log_file_path
+        self.structured_log_path = structured_log_path
+        self.structured_log_max_bytes = structured_log_max_bytes
+        self.structured_log_backup_count = structured_log_backup_count
+        self.queue_logging = queue_logging
+        self.queue_size = queue_size
+        self._queue_handler: Optional[DroppingQueueHandler] = None
         self.logger = self._setup_logger()
         self.error_stats = {
             "total_errors": 0,
@@ -84,6 +244,7 @@ class MCPErrorHandler:
         # Remove existing handlers to avoid duplicates
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
+            _shutdown_handler(handler)
 
         # File handler for detailed logs
         file_handler = logging.FileHandler(self.log_file_path, mode='a', encoding='utf-8')
@@ -107,21 +268,76 @@ class MCPErrorHandler:
         file_handler.setFormatter(file_formatter)
         console_handler.setFormatter(console_formatter)
 
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        handlers: List[logging.Handler] = [file_handler, console_handler]
+
+        # Optional structured JSONL output with size-based rotation
+        if self.structured_log_path:
+            structured_handler = logging.handlers.RotatingFileHandler(
+                self.structured_log_path,
+                maxBytes=self.structured_log_max_bytes,
+                backupCount=self.structured_log_backup_count,
+                encoding='utf-8'
+            )
+            structured_handler.setLevel(logging.DEBUG)
+            structured_handler.setFormatter(JsonLinesFormatter())
+            handlers.append(structured_handler)
+
+        if not self.queue_logging:
+            for handler in handlers:
+                logger.addHandler(handler)
+            return logger
+
+        # Hand records to a background listener so file writes and message
+        # formatting stay off the event loop thread
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=self.queue_size)
+        queue_handler = DroppingQueueHandler(log_queue)
+        queue_handler.listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        queue_handler.listener.start()
+        logger.addHandler(queue_handler)
+        self._queue_handler = queue_handler
 
         return logger
 
+    @property
+    def dropped_log_records(self) -> int:
+        """Number of records dropped because the log queue was full"""
+        return self._queue_handler.dropped_records if self._queue_handler else 0
+
+    def flush(self) -> None:
+        """Block until every queued record has been written, then flush handlers"""
+        if self._queue_handler and self._queue_handler.listener:
+            self._queue_handler.queue.join()
+            for handler in self._queue_handler.listener.handlers:
+                handler.flush()
+        else:
+            for handler in self.logger.handlers:
+                handler.flush()
+
+    def close(self) -> None:
+        """Drain the log queue, stop the listener and close file handlers"""
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            _shutdown_handler(handler)
+        self._queue_handler = None
+
     def log_tool_entry(self, tool_name: str, function_name: str, input_data: Dict[str, Any]) -> None:
         """Log tool entry with input data"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        # Rendered here, bounded by the truncation limits: the tool may still change its arguments
         self.logger.info(
-            f"TOOL_ENTRY | {tool_name}.{function_name} | Input: {self._sanitize_input_for_log(input_data)}"
+            "TOOL_ENTRY | %s.%s | Input: %s", tool_name, function_name, format_input_for_log(input_data),
+            extra={"event": "TOOL_ENTRY", "tool": tool_name}
         )
 
-    def log_tool_success(self, tool_name: str, function_name: str, execution_time: float, output_summary: str) -> None:
+    def log_tool_success(self, tool_name: str, function_name: str, execution_time: float, output_summary: Any) -> None:
         """Log successful tool execution"""
         self.logger.info(
-            f"TOOL_SUCCESS | {tool_name}.{function_name} | Time: {execution_time:.3f}s | Output: {output_summary}"
+            "TOOL_SUCCESS | %s.%s | Time: %.3fs | Output: %s", tool_name, function_name,
+            execution_time, output_summary,
+            extra={"event": "TOOL_SUCCESS", "tool": tool_name, "fields": {"execution_time": execution_time}}
         )
 
     def log_format_mismatch(
@@ -146,18 +362,17 @@ class MCPErrorHandler:
         )
 
         self.logger.error(
-            f"FORMAT_MISMATCH | {tool_name}.{function_name} | "
-            f"Field: {format_error.field_name} | "
-            f"Expected: {format_error.expected_format} | "
-            f"Actual: {format_error.actual_format} | "
-            f"Suggestion: {format_error.conversion_suggestion}"
+            "FORMAT_MISMATCH | %s.%s | Field: %s | Expected: %s | Actual: %s | Suggestion: %s",
+            tool_name, function_name, format_error.field_name, format_error.expected_format,
+            format_error.actual_format, format_error.conversion_suggestion,
+            extra={"event": "FORMAT_MISMATCH", "tool": tool_name}
         )
 
         # Log detailed format comparison
         self.logger.debug(
-            f"FORMAT_DETAILS | {tool_name}.{function_name} | "
-            f"Expected sample: {format_error.sample_expected} | "
-            f"Actual sample: {format_error.sample_actual}"
+            "FORMAT_DETAILS | %s.%s | Expected sample: %s | Actual sample: %s",
+            tool_name, function_name, format_error.sample_expected, format_error.sample_actual,
+            extra={"event": "FORMAT_DETAILS", "tool": tool_name}
         )
 
         return error_context
@@ -193,16 +408,16 @@ class MCPErrorHandler:
         )
 
         self.logger.error(
-            f"CHARACTER_DETECTION_FAILURE | {tool_name}.{function_name} | "
-            f"Method: {detection_method} | "
-            f"Text length: {len(text_sample)} | "
-            f"Analysis: {text_analysis}"
+            "CHARACTER_DETECTION_FAILURE | %s.%s | Method: %s | Text length: %d | Analysis: %s",
+            tool_name, function_name, detection_method, len(text_sample), text_analysis,
+            extra={"event": "CHARACTER_DETECTION_FAILURE", "tool": tool_name}
         )
 
         # Log text sample for debugging
         self.logger.debug(
-            f"TEXT_SAMPLE | {tool_name}.{function_name} | "
-            f"Sample: {text_sample[:200]}{'...' if len(text_sample) > 200 else ''}"
+            "TEXT_SAMPLE | %s.%s | Sample: %s%s", tool_name, function_name,
+            text_sample[:200], '...' if len(text_sample) > 200 else '',
+            extra={"event": "TEXT_SAMPLE", "tool": tool_name}
         )
 
         return error_context
@@ -236,9 +451,9 @@ class MCPErrorHandler:
         )
 
         self.logger.error(
-            f"FUNCTION_NOT_CALLABLE | {tool_name}.{function_name} | "
-            f"Type: {type(function_object)} | "
-            f"Analysis: {function_analysis}"
+            "FUNCTION_NOT_CALLABLE | %s.%s | Type: %s | Analysis: %s",
+            tool_name, function_name, type(function_object), function_analysis,
+            extra={"event": "FUNCTION_NOT_CALLABLE", "tool": tool_name}
         )
 
         return error_context
@@ -270,9 +485,9 @@ class MCPErrorHandler:
         )
 
         self.logger.error(
-            f"PROCESSING_ERROR | {tool_name}.{function_name} | "
-            f"Stage: {processing_stage} | "
-            f"Error: {type(error).__name__}: {str(error)}"
+            "PROCESSING_ERROR | %s.%s | Stage: %s | Error: %s: %s",
+            tool_name, function_name, processing_stage, type(error).__name__, error,
+            extra={"event": "PROCESSING_ERROR", "tool": tool_name}
         )
 
         return error_context
@@ -289,15 +504,17 @@ class MCPErrorHandler:
         error_context.recovery_attempted = True
 
         self.logger.warning(
-            f"RECOVERY_ATTEMPT | {error_context.tool_name}.{error_context.function_name} | "
-            f"Method: {recovery_method} | "
-            f"Original error: {error_context.error_type}"
+            "RECOVERY_ATTEMPT | %s.%s | Method: %s | Original error: %s",
+            error_context.tool_name, error_context.function_name, recovery_method, error_context.error_type,
+            extra={"event": "RECOVERY_ATTEMPT", "tool": error_context.tool_name}
         )
 
-        self.logger.debug(
-            f"RECOVERY_DATA | {error_context.tool_name}.{error_context.function_name} | "
-            f"Data: {self._sanitize_input_for_log(recovery_data)}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "RECOVERY_DATA | %s.%s | Data: %s",
+                error_context.tool_name, error_context.function_name, format_input_for_log(recovery_data),
+                extra={"event": "RECOVERY_DATA", "tool": error_context.tool_name}
+            )
 
     def log_recovery_success(
         self,
@@ -311,15 +528,17 @@ class MCPErrorHandler:
         error_context.recovery_successful = True
 
         self.logger.info(
-            f"RECOVERY_SUCCESS | {error_context.tool_name}.{error_context.function_name} | "
-            f"Method: {recovery_method} | "
-            f"Original error: {error_context.error_type}"
+            "RECOVERY_SUCCESS | %s.%s | Method: %s | Original error: %s",
+            error_context.tool_name, error_context.function_name, recovery_method, error_context.error_type,
+            extra={"event": "RECOVERY_SUCCESS", "tool": error_context.tool_name}
         )
 
-        self.logger.debug(
-            f"RECOVERED_DATA | {error_context.tool_name}.{error_context.function_name} | "
-            f"Data: {self._sanitize_input_for_log(recovered_data)}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "RECOVERED_DATA | %s.%s | Data: %s",
+                error_context.tool_name, error_context.function_name, format_input_for_log(recovered_data),
+                extra={"event": "RECOVERED_DATA", "tool": error_context.tool_name}
+            )
 
     def log_recovery_failure(
         self,
@@ -329,9 +548,10 @@ class MCPErrorHandler:
     ) -> None:
         """Log failed error recovery attempts"""
         self.logger.error(
-            f"RECOVERY_FAILURE | {error_context.tool_name}.{error_context.function_name} | "
-            f"Method: {recovery_method} | "
-            f"Recovery error: {type(recovery_error).__name__}: {str(recovery_error)}"
+            "RECOVERY_FAILURE | %s.%s | Method: %s | Recovery error: %s: %s",
+            error_context.tool_name, error_context.function_name, recovery_method,
+            type(recovery_error).__name__, recovery_error,
+            extra={"event": "RECOVERY_FAILURE", "tool": error_context.tool_name}
         )
 
     def get_error_statistics(self) -> Dict[str, Any]:
@@ -349,26 +569,7 @@ class MCPErrorHandler:
 
     def _sanitize_input_for_log(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize input data for logging (remove sensitive info, truncate large data)"""
-        sanitized = {}
-
-        for key, value in input_data.items():
-            if isinstance(value, str):
-                # Truncate long strings
-                if len(value) > 200:
-                    sanitized[key] = value[:200] + "... [truncated]"
-                else:
-                    sanitized[key] = value
-            elif isinstance(value, (dict, list)):
-                # Truncate large structures
-                value_str = str(value)
-                if len(value_str) > 300:
-                    sanitized[key] = value_str[:300] + "... [truncated]"
-                else:
-                    sanitized[key] = value
-            else:
-                sanitized[key] = value
-
-        return sanitized
+        return sanitize_input_for_log(input_data)
 
     def _analyze_text_for_debugging(self, text: str) -> Dict[str, Any]:
         """Analyze text to help debug character detection issues"""
@@ -458,6 +659,16 @@ class MCPErrorHandler:
                 "recommendation": "general_system_review"
             }
 
+def _shutdown_handler(handler: logging.Handler) -> None:
+    """Drain and stop a queue handler's listener, or close a plain handler"""
+    listener = getattr(handler, "listener", None)
+    if listener is not None:
+        listener.stop()
+        for target in listener.handlers:
+            target.close()
+        handler.listener = None
+    handler.close()
+
 # Global error handler instance
 _error_handler = None
 
@@ -468,6 +679,20 @@ def get_error_handler() -> MCPErrorHandler:
         _error_handler = MCPErrorHandler()
     return _error_handler
 
+def configure_error_handler(**kwargs: Any) -> MCPErrorHandler:
+    """Replace the global error handler, e.g. to enable structured JSONL output"""
+    global _error_handler
+    if _error_handler is not None:
+        _error_handler.close()
+    _error_handler = MCPErrorHandler(**kwargs)
+    return _error_handler
+
+@atexit.register
+def _shutdown_error_handler() -> None:
+    """Write out queued records before the interpreter exits"""
+    if _error_handler is not None:
+        _error_handler.close()
+
 def create_format_mismatch_error(
     expected_format: str,
     actual_format: str,
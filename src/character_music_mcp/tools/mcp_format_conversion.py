@@ -86,8 +86,10 @@ class FormatConverter:
             # Create StandardCharacterProfile
             character_profile = StandardCharacterProfile.from_dict(converted_data)
 
-            # Validate the result
-            profile_validation = self.validator.validate_character_profile(character_profile.to_dict())
+            # Validate the result; from_dict already enforced the schema, so only content is checked
+            profile_validation = self.validator.validate_character_profile(
+                character_profile.to_dict(), trusted=True
+            )
 
             # Merge validation results
             validation_result.issues.extend(profile_validation.issues)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Call Coalescing (Single-Flight)
+
+This module lets concurrent, identical MCP tool calls share one computation.
+The first call for a given tool and normalized arguments runs the tool; calls
+with the same arguments that arrive while it is still running wait for it
+and receive the same result. Nothing is kept once the computation finishes,
+so this sits in front of any result cache rather than acting as one.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+
+@dataclass
+class _Flight:
+    """One shared computation and the number of callers waiting on it"""
+    task: asyncio.Task
+    waiters: int = 0
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for coalesced tool calls"""
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+    cancelled_waiters: int = 0
+    abandoned: int = 0
+    coalesced_by_tool: Dict[str, int] = field(default_factory=dict)
+
+
+class SingleFlight:
+    """Runs at most one computation per key at a time and shares its outcome"""
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.stats = SingleFlightStats()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of shared computations currently running"""
+        return len(self._flights)
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]], label: str = "") -> Any:
+        """
+        Await the computation for key, starting it if none is running
+
+        The computation runs as a task of its own, so a caller that is
+        cancelled only stops waiting; the others still get the result. Once
+        every waiting caller has been cancelled the computation is cancelled
+        too. Exceptions raised by the computation reach every waiting caller.
+
+        Args:
+            key: Identity of the computation
+            compute: Starts the computation when no identical one is running
+            label: Name the coalesced calls are counted under (e.g. the tool name)
+        """
+        self.stats.calls += 1
+        flight = self._flights.get(key)
+        if flight is None:
+            self.stats.executions += 1
+            flight = _Flight(asyncio.ensure_future(compute()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(functools.partial(self._finish, key))
+        else:
+            self.stats.coalesced += 1
+            self.stats.coalesced_by_tool[label] = self.stats.coalesced_by_tool.get(label, 0) + 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                self.stats.cancelled_waiters += 1
+                if flight.waiters == 1:
+                    self.stats.abandoned += 1
+                    # Callers arriving while the cancellation lands start a new computation
+                    if self._flights.get(key) is flight:
+                        del self._flights[key]
+                    flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every waiter was cancelled first
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of the counters and the number of computations in flight"""
+        return {
+            "calls": self.stats.calls,
+            "executions": self.stats.executions,
+            "coalesced": self.stats.coalesced,
+            "cancelled_waiters": self.stats.cancelled_waiters,
+            "abandoned": self.stats.abandoned,
+            "in_flight": self.in_flight,
+            "coalesced_by_tool": dict(self.stats.coalesced_by_tool),
+        }
+
+
+def single_flight_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+    """
+    Hash of a tool name and its arguments
+
+    Arguments are serialized as canonical JSON (sorted keys, so dict order
+    does not matter); values JSON cannot represent fall back to their repr.
+    """
+    payload = json.dumps(arguments, sort_keys=True, separators=(',', ':'), default=repr)
+    return f"{tool_name}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+def single_flight_tool(func: Optional[Callable] = None, *, exclude: Iterable[str] = ("ctx",)) -> Callable:
+    """
+    Decorator coalescing concurrent identical calls of an async MCP tool
+
+    Calls are identical when they bind to the same arguments once defaults
+    are filled in. Parameters in exclude (the per-request MCP context by
+    default) are left out of the comparison; coalesced calls receive the
+    result computed with the first caller's context.
+    """
+    excluded = frozenset(exclude)
+
+    def decorator(tool: Callable) -> Callable:
+        signature = inspect.signature(tool)
+        tool_name = tool.__name__
+
+        @functools.wraps(tool)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {name: value for name, value in bound.arguments.items() if name not in excluded}
+            key = single_flight_key(tool_name, arguments)
+            return await get_single_flight().run(key, lambda: tool(*args, **kwargs), label=tool_name)
+
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
+
+
+# Global single-flight group shared by the MCP tools
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get or create the global single-flight group"""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
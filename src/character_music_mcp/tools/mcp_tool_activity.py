@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Activity Tracking
+
+This module counts MCP tool calls in flight so background maintenance (cache
+warm-up, prefetching) can run while the server is idle and step aside as soon
+as a tool call arrives.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# How often wait_until_idle re-checks while tool calls are running
+IDLE_POLL_INTERVAL = 0.05
+
+# Tracker already counting the call in the current context, so nested tracking counts it once
+_tracking: ContextVar[Optional["ToolActivityTracker"]] = ContextVar("tool_activity_tracking", default=None)
+
+
+class ToolActivityTracker:
+    """Counts in-flight tool calls and how long the server has been idle"""
+
+    def __init__(self):
+        self._in_flight = 0
+        self._last_activity = time.monotonic()
+        self.total_calls = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of tool calls currently running"""
+        return self._in_flight
+
+    def idle_seconds(self) -> float:
+        """Seconds since the last tool call finished (0.0 while one is running)"""
+        if self._in_flight:
+            return 0.0
+        return time.monotonic() - self._last_activity
+
+    @contextmanager
+    def tool_call(self) -> Iterator[None]:
+        """Mark a tool call as in flight for the duration of the block"""
+        if _tracking.get() is self:
+            yield
+            return
+
+        token = _tracking.set(self)
+        self._in_flight += 1
+        self.total_calls += 1
+        try:
+            yield
+        finally:
+            _tracking.reset(token)
+            self._in_flight -= 1
+            self._last_activity = time.monotonic()
+
+    async def wait_until_idle(self, idle_seconds: float = 0.0, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no tool call has run for idle_seconds
+
+        Args:
+            idle_seconds: Quiet period required after the last tool call
+            timeout: Give up after this many seconds (None waits indefinitely)
+
+        Returns:
+            True once idle, False if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = idle_seconds - self.idle_seconds() if not self._in_flight else IDLE_POLL_INTERVAL
+            if not self._in_flight and remaining <= 0:
+                return True
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                remaining = min(remaining, left)
+            await asyncio.sleep(remaining)
+
+
+# Global tool activity tracker
+_tool_activity_tracker: Optional[ToolActivityTracker] = None
+
+
+def get_tool_activity_tracker() -> ToolActivityTracker:
+    """Get or create the global tool activity tracker"""
+    global _tool_activity_tracker
+    if _tool_activity_tracker is None:
+        _tool_activity_tracker = ToolActivityTracker()
+    return _tool_activity_tracker
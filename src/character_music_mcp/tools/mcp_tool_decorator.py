@@ -11,15 +11,29 @@ import json
 import time
 from typing import Any, Callable, Dict, Optional
 
-from mcp_error_handler import ErrorContext, create_format_mismatch_error, get_error_handler
+from mcp_error_handler import (
+    ErrorContext,
+    LazyLogValue,
+    create_format_mismatch_error,
+    get_error_handler,
+)
 from mcp_error_recovery import RecoveryResult, get_recovery_system
+from mcp_tool_activity import get_tool_activity_tracker
+from mcp_tool_metrics import get_tool_metrics, mark_current_tool_call_failed
+from retry_system import latency_budget
+from sampling_profiler import get_tool_profiler
+
+# Latency budgets (seconds) that retried operations inside a tool call must fit in
+TOOL_LATENCY_BUDGET = 20.0
+WORKFLOW_LATENCY_BUDGET = 60.0
 
 
 def mcp_tool_with_error_handling(
     tool_name: str,
     expected_input_format: Optional[Dict[str, str]] = None,
     enable_recovery: bool = True,
-    max_retries: int = 2
+    max_retries: int = 2,
+    latency_budget_seconds: Optional[float] = None
 ):
     """
     Decorator that adds comprehensive error handling to MCP tools
@@ -29,10 +43,14 @@ def mcp_tool_with_error_handling(
         expected_input_format: Dictionary mapping parameter names to expected types
         enable_recovery: Whether to attempt error recovery
         max_retries: Maximum number of retry attempts
+        latency_budget_seconds: Time budget for the call that RetrySystem retries
+            and wiki downloads are clipped to (None for no budget)
+
+    A sampled fraction of calls is profiled when the global ToolProfiler
+    is given a sample rate (see sampling_profiler).
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs) -> str:
+        async def handled(*args, **kwargs) -> str:
             error_handler = get_error_handler()
             recovery_system = get_recovery_system()
             function_name = func.__name__
@@ -78,8 +96,9 @@ def mcp_tool_with_error_handling(
 
                 # Log successful execution
                 execution_time = time.time() - start_time
-                output_summary = _create_output_summary(result)
-                error_handler.log_tool_success(tool_name, function_name, execution_time, output_summary)
+                error_handler.log_tool_success(
+                    tool_name, function_name, execution_time, _output_summary_for_log(result)
+                )
 
                 return result
 
@@ -105,7 +124,7 @@ def mcp_tool_with_error_handling(
                     total_time = time.time() - start_time
                     error_handler.log_tool_success(
                         tool_name, function_name, total_time,
-                        f"Recovered: {_create_output_summary(recovery_result.recovered_data)}"
+                        _create_recovered_summary(recovery_result.recovered_data)
                     )
 
                     # Return recovered data in proper format
@@ -123,6 +142,13 @@ def mcp_tool_with_error_handling(
                         recovery_result.error_message or str(e)
                     )
 
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> str:
+            with (get_tool_activity_tracker().tool_call(), get_tool_metrics().track(tool_name),
+                  latency_budget(latency_budget_seconds)):
+                async with get_tool_profiler().profile(tool_name):
+                    return await handled(*args, **kwargs)
+
         return wrapper
     return decorator
 
@@ -164,25 +190,30 @@ async def _validate_input_format(
 
     return ValidationResult(success=True)
 
-def _types_match(actual_type: str, expected_type: str) -> bool:
-    """Check if actual type matches expected type (with some flexibility)"""
-
-    # Direct match
-    if actual_type == expected_type:
-        return True
-
-    # Flexible matches
-    type_equivalents = {
+# Flexible type-name matches, lowercased once at import
+_TYPE_EQUIVALENTS = {
+    type_name: frozenset(variant.lower() for variant in variants)
+    for type_name, variants in {
         "str": ["string", "text"],
         "dict": ["dictionary", "object", "mapping"],
         "list": ["array", "sequence"],
         "int": ["integer", "number"],
         "float": ["number", "decimal"],
         "bool": ["boolean"]
-    }
+    }.items()
+}
+
+def _types_match(actual_type: str, expected_type: str) -> bool:
+    """Check if actual type matches expected type (with some flexibility)"""
+
+    # Direct match
+    if actual_type == expected_type:
+        return True
 
-    expected_variants = type_equivalents.get(expected_type, [expected_type])
-    return actual_type.lower() in [t.lower() for t in expected_variants]
+    expected_variants = _TYPE_EQUIVALENTS.get(expected_type)
+    if expected_variants is None:
+        return actual_type.lower() == expected_type.lower()
+    return actual_type.lower() in expected_variants
 
 def _get_sample_for_type(type_name: str) -> str:
     """Get a sample value for a given type"""
@@ -260,9 +291,19 @@ def _find_function_parameter(kwargs: Dict[str, Any]) -> Optional[Any]:
 
     return None
 
+# Larger string outputs are summarized by size instead of being parsed
+MAX_SUMMARY_PARSE_CHARS = 65536
+
 def _create_output_summary(result: Any) -> str:
     """Create a summary of the output for logging"""
     if isinstance(result, str):
+        if len(result) > MAX_SUMMARY_PARSE_CHARS:
+            head = result.lstrip()[:1]
+            if head == "{":
+                return f"JSON object ({len(result)} chars)"
+            if head == "[":
+                return f"JSON array ({len(result)} chars)"
+            return f"String ({len(result)} chars)"
         try:
             # Try to parse as JSON for better summary
             parsed = json.loads(result)
@@ -284,13 +325,27 @@ def _create_output_summary(result: Any) -> str:
     else:
         return f"{type(result).__name__}"
 
+def _output_summary_for_log(result: Any) -> Any:
+    """
+    Output summary log argument: built when the record is written for a result
+    string, which cannot change meanwhile, and right away for anything else
+    """
+    if isinstance(result, str):
+        return LazyLogValue(_create_output_summary, result)
+    return _create_output_summary(result)
+
+def _create_recovered_summary(recovered_data: Any) -> str:
+    """Create a summary of recovered output for logging"""
+    return f"Recovered: {_create_output_summary(recovered_data)}"
+
 def _create_error_response(
     tool_name: str,
     function_name: str,
     error_context: ErrorContext,
     error_message: str
 ) -> str:
-    """Create a standardized error response"""
+    """Create a standardized error response and count the tool call as failed"""
+    mark_current_tool_call_failed()
 
     error_response = {
         "error": True,
@@ -333,7 +388,8 @@ def character_analysis_tool(func: Callable) -> Callable:
             "text": "str"
         },
         enable_recovery=True,
-        max_retries=2
+        max_retries=2,
+        latency_budget_seconds=TOOL_LATENCY_BUDGET
     )(func)
 
 def persona_generation_tool(func: Callable) -> Callable:
@@ -344,7 +400,8 @@ def persona_generation_tool(func: Callable) -> Callable:
             "characters_json": "str"
         },
         enable_recovery=True,
-        max_retries=2
+        max_retries=2,
+        latency_budget_seconds=TOOL_LATENCY_BUDGET
     )(func)
 
 def command_generation_tool(func: Callable) -> Callable:
@@ -356,7 +413,8 @@ def command_generation_tool(func: Callable) -> Callable:
             "characters_json": "str"
         },
         enable_recovery=True,
-        max_retries=2
+        max_retries=2,
+        latency_budget_seconds=TOOL_LATENCY_BUDGET
     )(func)
 
 def creative_generation_tool(func: Callable) -> Callable:
@@ -367,7 +425,8 @@ def creative_generation_tool(func: Callable) -> Callable:
             "concept": "str"
         },
         enable_recovery=True,
-        max_retries=2
+        max_retries=2,
+        latency_budget_seconds=TOOL_LATENCY_BUDGET
     )(func)
 
 def workflow_tool(func: Callable) -> Callable:
@@ -378,5 +437,6 @@ def workflow_tool(func: Callable) -> Callable:
             "text": "str"
         },
         enable_recovery=True,
-        max_retries=3  # More retries for complex workflows
+        max_retries=3,  # More retries for complex workflows
+        latency_budget_seconds=WORKFLOW_LATENCY_BUDGET
     )(func)
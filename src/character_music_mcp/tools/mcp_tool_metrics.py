@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Latency and Outcome Metrics
+
+This module times MCP tool calls into a latency histogram per tool and counts
+their outcomes, for the metrics exposition. The server middleware times every
+@mcp.tool call and counts a result whose JSON has a top-level "error" key as
+a failure (the tools catch their exceptions and return such a result);
+mcp_tool_with_error_handling marks a call as failed when it turns an
+exception into an error response.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from metrics_exposition import Histogram, MetricsBuilder, get_metrics_registry
+
+
+@dataclass
+class ToolCall:
+    """Outcome of the tool call being timed"""
+    tool: str
+    failed: bool = False
+
+
+# Call timed in the current context, so nested timing of the same call counts it once
+_current_call: ContextVar[Optional[ToolCall]] = ContextVar("current_tool_call", default=None)
+
+
+class ToolMetrics:
+    """Latency histograms and outcome counts per tool"""
+
+    def __init__(self):
+        self.latency: Dict[str, Histogram] = {}
+        self.calls: Dict[Tuple[str, str], int] = {}
+
+    @contextmanager
+    def track(self, tool: str) -> Iterator[ToolCall]:
+        """
+        Time a tool call for the duration of the block
+
+        The call counts as an error if the block raises or the yielded
+        ToolCall is marked failed. Inside a call that is already being
+        timed this yields the outer call and records nothing itself.
+        """
+        outer = _current_call.get()
+        if outer is not None:
+            yield outer
+            return
+
+        call = ToolCall(tool)
+        token = _current_call.set(call)
+        start = time.perf_counter()
+        try:
+            yield call
+        except BaseException:
+            call.failed = True
+            raise
+        finally:
+            _current_call.reset(token)
+            self.record(call.tool, time.perf_counter() - start, not call.failed)
+
+    def record(self, tool: str, duration: float, success: bool) -> None:
+        """Count one finished tool call"""
+        histogram = self.latency.get(tool)
+        if histogram is None:
+            histogram = self.latency[tool] = Histogram()
+        histogram.observe(duration)
+        key = (tool, "success" if success else "error")
+        self.calls[key] = self.calls.get(key, 0) + 1
+
+    def collect_metrics(self, builder: MetricsBuilder) -> None:
+        """Write the per-tool series into a scrape"""
+        for tool, histogram in list(self.latency.items()):
+            builder.histogram("character_music_tool_duration_seconds",
+                              "MCP tool call latency", histogram, tool=tool)
+        for (tool, outcome), count in list(self.calls.items()):
+            builder.counter("character_music_tool_calls", "MCP tool calls by outcome",
+                            count, tool=tool, outcome=outcome)
+
+
+def mark_current_tool_call_failed() -> None:
+    """Count the tool call being timed as an error even though it returned"""
+    call = _current_call.get()
+    if call is not None:
+        call.failed = True
+
+
+def is_error_response(result: Any) -> bool:
+    """Whether a tool result is an error response: a JSON object with a top-level "error" key"""
+    if getattr(result, "is_error", False):
+        return True
+    for content in getattr(result, "content", None) or []:
+        text = getattr(content, "text", None)
+        # Only objects mentioning "error" are parsed, so ordinary results cost a substring scan
+        if not text or not text.lstrip().startswith("{") or '"error"' not in text:
+            continue
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(payload, dict) and payload.get("error"):
+            return True
+    return False
+
+
+# Global tool metrics
+_tool_metrics: Optional[ToolMetrics] = None
+
+
+def get_tool_metrics() -> ToolMetrics:
+    """Get or create the global tool metrics, exposed through the metrics registry"""
+    global _tool_metrics
+    if _tool_metrics is None:
+        _tool_metrics = ToolMetrics()
+        get_metrics_registry().register(_tool_metrics)
+    return _tool_metrics
@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import aiofiles
+from memory_diagnostics import get_memory_diagnostics
+from metrics_exposition import MetricsBuilder, get_metrics_registry
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -92,6 +94,9 @@ class WikiCacheManager:
         self._cache_hits = 0
         self._cache_misses = 0
 
+        get_metrics_registry().register(self)
+        get_memory_diagnostics().register(self, "_cache_entries")
+
     async def initialize(self) -> None:
         """Initialize cache manager and load existing cache index"""
         logger.info(f"Initializing WikiCacheManager with root: {self.cache_root}")
@@ -247,28 +252,36 @@ class WikiCacheManager:
         if url not in self._cache_entries:
             return False
 
-        entry = self._cache_entries[url]
+        self._delete_entry(url)
+        await self._save_cache_index()
 
-        # Remove physical file
-        try:
-            file_path = Path(entry.local_path)
-            if file_path.exists():
-                file_path.unlink()
+        logger.info(f"Removed file from cache: {url}")
+        return True
 
-            # Remove metadata file if exists
-            metadata_path = file_path.with_suffix('.meta.json')
-            if metadata_path.exists():
-                metadata_path.unlink()
+    async def remove_files(self, urls: List[str]) -> int:
+        """
+        Remove several files from cache with a single index write
 
-        except Exception as e:
-            logger.warning(f"Error removing file {entry.local_path}: {e}")
+        Args:
+            urls: URLs to remove
 
-        # Remove from index
-        del self._cache_entries[url]
-        await self._save_cache_index()
+        Returns:
+            Number of files removed
+        """
+        if not self._cache_loaded:
+            await self.initialize()
 
-        logger.info(f"Removed file from cache: {url}")
-        return True
+        removed_count = 0
+        for url in urls:
+            if url in self._cache_entries:
+                self._delete_entry(url)
+                removed_count += 1
+
+        if removed_count > 0:
+            await self._save_cache_index()
+            logger.info(f"Removed {removed_count} files from cache")
+
+        return removed_count
 
     async def cleanup_old_files(self, max_age_hours: int) -> int:
         """
@@ -293,10 +306,7 @@ class WikiCacheManager:
                 urls_to_remove.append(url)
 
         # Remove old files
-        removed_count = 0
-        for url in urls_to_remove:
-            if await self.remove_file(url):
-                removed_count += 1
+        removed_count = await self.remove_files(urls_to_remove)
 
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} old cache files")
@@ -336,6 +346,16 @@ class WikiCacheManager:
             cache_hit_rate=hit_rate
         )
 
+    def collect_metrics(self, builder: MetricsBuilder) -> None:
+        """Write lookup counts and cache size into a metrics scrape"""
+        self._collect_cache_metrics(builder, self._cache_hits, self._cache_misses)
+
+    def _collect_cache_metrics(self, builder: MetricsBuilder, hits: int, misses: int) -> None:
+        cache = type(self).__name__
+        builder.counter("character_music_cache_requests", "Cache lookups by result", hits, cache=cache, result="hit")
+        builder.counter("character_music_cache_requests", "Cache lookups by result", misses, cache=cache, result="miss")
+        builder.gauge("character_music_cache_entries", "Entries in the cache", len(self._cache_entries), cache=cache)
+
     async def list_cached_urls(self) -> List[str]:
         """
         Get list of all cached URLs
@@ -400,6 +420,23 @@ class WikiCacheManager:
 
     # Private methods
 
+    def _delete_entry(self, url: str) -> None:
+        """Delete a cached file, its metadata file and its index entry (index not saved)"""
+        entry = self._cache_entries.pop(url)
+
+        try:
+            file_path = Path(entry.local_path)
+            if file_path.exists():
+                file_path.unlink()
+
+            # Remove metadata file if exists
+            metadata_path = file_path.with_suffix('.meta.json')
+            if metadata_path.exists():
+                metadata_path.unlink()
+
+        except Exception as e:
+            logger.warning(f"Error removing file {entry.local_path}: {e}")
+
     async def _setup_directory_structure(self) -> None:
         """Set up cache directory structure"""
         directories = [
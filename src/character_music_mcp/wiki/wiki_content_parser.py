@@ -23,6 +23,7 @@ except ImportError:
     )
 
 from performance_monitor import PerformanceMonitor
+from regex_registry import WHITESPACE_RUN, compile_all, compile_pattern
 from wiki_data_models import Genre, MetaTag, Technique
 
 # Configure logging
@@ -79,6 +80,42 @@ class ParsedContent:
         """Get total number of parsed items"""
         return len(self.genres) + len(self.meta_tags) + len(self.techniques)
 
+# ================================================================================================
+# PARSING PATTERNS
+# ================================================================================================
+
+# Main content containers and list items
+MAIN_CONTENT_CLASS = re.compile(r'content|main|body', re.IGNORECASE)
+NUMBERED_ITEM = re.compile(r'^\d+\.')
+LIST_MARKER = re.compile(r'^[•\-*→\d\.]+\s*')
+
+# Wiki markup left in extracted text
+WIKI_LINK = re.compile(r'\[\[([^\]]+)\]\]')
+WIKI_REFERENCE = re.compile(r'\[([^\]]+)\]')
+SPACE_BEFORE_PUNCTUATION = re.compile(r'\s+([,.!?;:])')
+
+# Meta tag entries: **Tag** : Description, handling both markdown bold and HTML strong tags
+META_TAG_COLON_PATTERNS = compile_all([
+    r'\*\*(.*?)\*\*\s*:\s*(.*)',  # **Tag** : Description
+    r'<strong>(.*?)</strong>\s*:\s*(.*)',  # <strong>Tag</strong> : Description
+    r'([^:]+?)\s*:\s*(.*)'  # Tag : Description (fallback)
+], re.IGNORECASE)
+BOLD_MARKUP = re.compile(r'(\*\*(.*?)\*\*|<strong>(.*?)</strong>)')
+
+# Examples in a description
+EXAMPLE_PATTERNS = compile_all([
+    r'example[s]?[:\-]?\s*([^.]+)',
+    r'such as\s+([^.]+)',
+    r'like\s+([^.]+)'
+], re.IGNORECASE)
+EXAMPLE_SEPARATOR = re.compile(r'[,;]')
+
+# Technique titles and descriptions
+HOW_TO_PREFIX = re.compile(r'^How to\s+', re.IGNORECASE)
+FOR_SUNO_SUFFIX = re.compile(r'\s+for Suno AI$', re.IGNORECASE)
+SOLUTION_PREFIX = re.compile(r'^\*\*Solution:\*\*\s*')
+LEADING_SEPARATOR = re.compile(r'^[:\-]\s*')
+
 # ================================================================================================
 # BASE CONTENT PARSER
 # ================================================================================================
@@ -158,7 +195,7 @@ class ContentParser:
                 # Get text and clean it up
                 text = element.get_text(separator=' ', strip=True)
                 # Remove extra whitespace
-                text = re.sub(r'\s+', ' ', text)
+                text = WHITESPACE_RUN.sub(' ', text)
                 return text.strip()
             else:
                 return str(element).strip()
@@ -209,9 +246,10 @@ class ContentParser:
         try:
             # Look for headings that match our indicators
             for indicator in section_indicators:
+                indicator_pattern = compile_pattern(indicator, re.IGNORECASE)
                 # Try different heading levels
                 for heading_tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                    headings = soup.find_all(heading_tag, string=re.compile(indicator, re.IGNORECASE))
+                    headings = soup.find_all(heading_tag, string=indicator_pattern)
                     for heading in headings:
                         # Find the parent section or the heading itself
                         section = heading.find_parent(['section', 'div', 'article']) or heading
@@ -220,7 +258,7 @@ class ContentParser:
 
             # If no specific sections found, look for main content areas
             if not sections:
-                main_content = soup.find(['main', 'article', 'div'], class_=re.compile(r'content|main|body', re.IGNORECASE))
+                main_content = soup.find(['main', 'article', 'div'], class_=MAIN_CONTENT_CLASS)
                 if main_content:
                     sections.append(main_content)
 
@@ -254,9 +292,9 @@ class ContentParser:
             for p in paragraphs:
                 text = self.extract_text_content(p)
                 # Check if paragraph looks like a list item (starts with bullet, number, etc.)
-                if text and (text.startswith(('•', '-', '*', '→')) or re.match(r'^\d+\.', text)):
+                if text and (text.startswith(('•', '-', '*', '→')) or NUMBERED_ITEM.match(text)):
                     # Clean up list markers
-                    cleaned_text = re.sub(r'^[•\-*→\d\.]+\s*', '', text).strip()
+                    cleaned_text = LIST_MARKER.sub('', text).strip()
                     if cleaned_text and cleaned_text not in items:
                         items.append(cleaned_text)
 
@@ -317,14 +355,14 @@ class ContentParser:
             return ""
 
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RUN.sub(' ', text)
 
         # Remove common wiki markup that might remain
-        text = re.sub(r'\[\[([^\]]+)\]\]', r'\1', text)  # [[link]] -> link
-        text = re.sub(r'\[([^\]]+)\]', '', text)  # Remove [references]
+        text = WIKI_LINK.sub(r'\1', text)  # [[link]] -> link
+        text = WIKI_REFERENCE.sub('', text)  # Remove [references]
 
         # Clean up punctuation
-        text = re.sub(r'\s+([,.!?;:])', r'\1', text)  # Fix spacing before punctuation
+        text = SPACE_BEFORE_PUNCTUATION.sub(r'\1', text)  # Fix spacing before punctuation
 
         return text.strip()
 
@@ -728,18 +766,11 @@ class ContentParser:
         cleaned_item = self.clean_text(cleaned_item)
 
         # Look for pattern: **Tag Name** : Description or Tag Name : Description
-        # Handle both markdown bold and HTML strong tags
-        colon_patterns = [
-            r'\*\*(.*?)\*\*\s*:\s*(.*)',  # **Tag** : Description
-            r'<strong>(.*?)</strong>\s*:\s*(.*)',  # <strong>Tag</strong> : Description
-            r'([^:]+?)\s*:\s*(.*)'  # Tag : Description (fallback)
-        ]
-
         tag_name = None
         description = ""
 
-        for pattern in colon_patterns:
-            match = re.search(pattern, cleaned_item, re.IGNORECASE)
+        for pattern in META_TAG_COLON_PATTERNS:
+            match = pattern.search(cleaned_item)
             if match:
                 tag_name = match.group(1).strip()
                 description = match.group(2).strip()
@@ -750,24 +781,19 @@ class ContentParser:
             examples = []
             if 'example' in description.lower():
                 # Try to extract examples from description
-                example_patterns = [
-                    r'example[s]?[:\-]?\s*([^.]+)',
-                    r'such as\s+([^.]+)',
-                    r'like\s+([^.]+)'
-                ]
-                for pattern in example_patterns:
-                    match = re.search(pattern, description, re.IGNORECASE)
+                for pattern in EXAMPLE_PATTERNS:
+                    match = pattern.search(description)
                     if match:
                         example_text = match.group(1).strip()
                         # Split on common separators
-                        example_items = re.split(r'[,;]', example_text)
+                        example_items = EXAMPLE_SEPARATOR.split(example_text)
                         examples.extend([ex.strip() for ex in example_items if ex.strip()])
                         break
 
             return tag_name, description, examples
         else:
             # No colon separator, treat entire text as tag name after removing formatting
-            tag_name = re.sub(r'(\*\*(.*?)\*\*|<strong>(.*?)</strong>)', r'\2\3', cleaned_item)
+            tag_name = BOLD_MARKUP.sub(r'\2\3', cleaned_item)
             return tag_name.strip(), "", []
 
     def _categorize_meta_tag(self, category_name: str, tag_name: str) -> str:
@@ -931,8 +957,8 @@ class ContentParser:
                 return None
 
             # Extract technique name from title (remove "How to" prefix)
-            technique_name = re.sub(r'^How to\s+', '', title, flags=re.IGNORECASE)
-            technique_name = re.sub(r'\s+for Suno AI$', '', technique_name, flags=re.IGNORECASE)
+            technique_name = HOW_TO_PREFIX.sub('', title)
+            technique_name = FOR_SUNO_SUFFIX.sub('', technique_name)
             technique_name = technique_name.strip()
 
             # Get the main content description
@@ -946,7 +972,7 @@ class ContentParser:
             if solution_p:
                 description = self.extract_text_content(solution_p)
                 # Clean up the description
-                description = re.sub(r'^\*\*Solution:\*\*\s*', '', description)
+                description = SOLUTION_PREFIX.sub('', description)
                 description = self.clean_text(description)
 
             # Extract examples from the content
@@ -1038,7 +1064,7 @@ class ContentParser:
                 technique_name = self.extract_text_content(strong_elements[0])
                 # Remove the technique name from description
                 description = text_content.replace(technique_name, '', 1).strip()
-                description = re.sub(r'^[:\-]\s*', '', description)  # Remove leading colon or dash
+                description = LEADING_SEPARATOR.sub('', description)  # Remove leading colon or dash
             else:
                 # Try to extract technique name from the first sentence
                 sentences = text_content.split('.')
@@ -1161,7 +1187,7 @@ class ContentParser:
                 text = self.extract_text_content(p)
                 if 'example' in text.lower():
                     # Try to extract examples from the text
-                    example_match = re.search(r'example[s]?[:\-]?\s*([^.]+)', text, re.IGNORECASE)
+                    example_match = EXAMPLE_PATTERNS[0].search(text)
                     if example_match:
                         example_text = example_match.group(1).strip()
                         if example_text and example_text not in examples:
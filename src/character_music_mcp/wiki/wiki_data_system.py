@@ -52,6 +52,9 @@ class WikiDataManager:
         self._last_refresh: Optional[datetime] = None
         self._cache_valid: bool = False
 
+        # Bumped each time the data lists are reloaded from local storage
+        self._data_version: int = 0
+
     async def initialize(self, config: WikiConfig) -> None:
         """Initialize the wiki data manager with configuration"""
         logger.info("Initializing WikiDataManager")
@@ -132,6 +135,19 @@ class WikiDataManager:
             return [tech for tech in self._techniques if tech.technique_type.lower() == technique_type.lower()]
         return self._techniques.copy()
 
+    @property
+    def data_version(self) -> Optional[int]:
+        """
+        Version of the loaded data, bumped whenever it is reloaded
+
+        None while the manager is uninitialized or due a refresh; callers that
+        memoize on the version then go through get_genres() and friends, which
+        refresh first.
+        """
+        if not self.initialized or self._should_refresh():
+            return None
+        return self._data_version
+
     async def refresh_data(self, force: bool = False) -> RefreshResult:
         """Refresh wiki data from remote sources"""
         if not self.initialized:
@@ -196,22 +212,48 @@ class WikiDataManager:
                    f"{batch_result.failed_downloads} failed, {batch_result.skipped_downloads} skipped")
         return result
 
-    async def _parse_and_cache_data(self) -> None:
-        """Parse downloaded HTML files and cache as structured data"""
+    async def reparse_pages(self, urls: List[str]) -> None:
+        """
+        Re-parse only the given cached pages and merge them into the cached data
+
+        Items parsed earlier from other pages are kept as they are.
+
+        Args:
+            urls: Source URLs whose pages were refreshed
+        """
+        await self._parse_and_cache_data(urls)
+        await self._load_cached_data()
+
+    async def _parse_and_cache_data(self, urls: Optional[List[str]] = None) -> None:
+        """
+        Parse downloaded HTML files and cache as structured data
+
+        Args:
+            urls: Only parse these cached pages, replacing what they produced
+                before (defaults to parsing every cached page)
+        """
         if not self.parser or not self.cache_manager:
             logger.error("Parser or cache manager not initialized")
             return
 
         # Get all cached files
-        cached_urls = await self.cache_manager.list_cached_urls()
+        cached_urls = await self.cache_manager.list_cached_urls() if urls is None else urls
         cached_files = []
         for url in cached_urls:
             entry = await self.cache_manager.get_cache_entry(url)
             if entry:
                 cached_files.append(entry)
 
+        # Keep items from pages that are not being re-parsed
+        if urls is None:
+            genres, meta_tags, techniques = [], [], []
+        else:
+            reparsed = set(urls)
+            genres = [genre for genre in self._genres if genre.source_url not in reparsed]
+            meta_tags = [tag for tag in self._meta_tags if tag.source_url not in reparsed]
+            techniques = [technique for technique in self._techniques if technique.source_url not in reparsed]
+
         # Parse genres
-        genres = []
         for file_info in cached_files:
             if any(genre_url in file_info.url for genre_url in self.config.genre_pages):
                 try:
@@ -228,7 +270,6 @@ class WikiDataManager:
                     logger.error(f"Error parsing genre file {file_info.local_path}: {e}")
 
         # Parse meta tags
-        meta_tags = []
         for file_info in cached_files:
             if any(meta_url in file_info.url for meta_url in self.config.meta_tag_pages):
                 try:
@@ -245,7 +286,6 @@ class WikiDataManager:
                     logger.error(f"Error parsing meta tag file {file_info.local_path}: {e}")
 
         # Parse techniques
-        techniques = []
         for file_info in cached_files:
             if any(tip_url in file_info.url for tip_url in self.config.tip_pages):
                 try:
@@ -386,6 +426,8 @@ class WikiDataManager:
                 logger.error(f"Error loading techniques cache: {e}")
                 self._techniques = []
 
+        self._data_version += 1
+
         # Check if we have any data
         if self._genres or self._meta_tags or self._techniques:
             self._cache_valid = True
@@ -9,20 +9,26 @@ wiki content with error handling, URL validation, and download tracking.
 import asyncio
 import json
 import logging
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 from urllib.parse import urlparse
 
 import aiofiles
 import aiohttp
+from memory_diagnostics import get_memory_diagnostics
 from performance_monitor import PerformanceMonitor
+from retry_system import remaining_budget
 from wiki_cache_manager import WikiCacheManager
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Most recent download attempts kept in the download history
+MAX_DOWNLOAD_HISTORY = 1000
+
 # ================================================================================================
 # DATA MODELS
 # ================================================================================================
@@ -125,7 +131,9 @@ class WikiDownloader:
         self.user_agent = user_agent
 
         self._session: Optional[aiohttp.ClientSession] = None
-        self._download_history: List[DownloadResult] = []
+        self._download_history: Deque[DownloadResult] = deque(maxlen=MAX_DOWNLOAD_HISTORY)
+
+        get_memory_diagnostics().register(self, "_download_history")
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -210,7 +218,10 @@ class WikiDownloader:
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                result = await self._attempt_download(url, sanitized_path, attempt)
+                # Clip the attempt to the latency budget of the calling tool, if any
+                result = await asyncio.wait_for(
+                    self._attempt_download(url, sanitized_path, attempt), timeout=remaining_budget()
+                )
                 if result.success:
                     # Add to cache manager if available
                     if self.cache_manager:
@@ -241,6 +252,10 @@ class WikiDownloader:
                 # Wait before retry (exponential backoff)
                 if attempt < self.max_retries - 1:
                     delay = self.retry_delay * (2 ** attempt)
+                    remaining = remaining_budget()
+                    if remaining is not None and delay >= remaining:
+                        logger.warning(f"Latency budget leaves no time to retry {url}")
+                        break
                     await asyncio.sleep(delay)
 
         # All attempts failed
@@ -428,8 +443,8 @@ class WikiDownloader:
         return str(Path(*parts))
 
     def get_download_history(self) -> List[DownloadResult]:
-        """Get history of all download attempts"""
-        return self._download_history.copy()
+        """Get history of the most recent download attempts"""
+        return list(self._download_history)
 
     def get_successful_downloads(self) -> List[DownloadResult]:
         """Get history of successful downloads only"""
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Memory growth integration test
+
+Runs 10k synthetic tool calls through the MCP tool decorator, each touching
+the components that keep state for the life of the process (source
+attribution usage records, retry sessions and circuits, tool metrics), and
+checks with the memory diagnostics that the state they retain levels off
+instead of growing with the number of calls.
+"""
+
+import json
+import shutil
+import tempfile
+from datetime import datetime
+
+import pytest
+import source_attribution_manager
+from mcp_tool_decorator import mcp_tool_with_error_handling
+from memory_diagnostics import MemoryDiagnostics
+from retry_system import OperationType, RetryPolicy, RetryStrategy, RetrySystem
+from source_attribution_manager import SourceAttributionManager
+
+TOTAL_CALLS = 10_000
+SNAPSHOT_EVERY = 2_000
+
+# Usage records kept during the test, so the cap is reached well before the last snapshots
+USAGE_RECORDS_CAP = 1_000
+
+
+@pytest.fixture
+def storage_dir():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path)
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_retained_state_is_bounded_over_10k_tool_calls(storage_dir, monkeypatch):
+    monkeypatch.setattr(source_attribution_manager, "MAX_USAGE_RECORDS", USAGE_RECORDS_CAP)
+    attribution = SourceAttributionManager(storage_path=f"{storage_dir}/attribution")
+    await attribution.initialize()
+    for genre in range(25):
+        attribution.register_source(f"https://example.com/genres/{genre}", "genre", f"Genre {genre}", datetime.now())
+    retry_system = RetrySystem(storage_path=f"{storage_dir}/retry")
+    await retry_system.initialize()
+    retry_system.add_retry_policy("fast", RetryPolicy(max_attempts=2, base_delay=0.0, jitter=False,
+                                                      strategy=RetryStrategy.FIXED_DELAY))
+
+    diagnostics = MemoryDiagnostics()
+    diagnostics.register(attribution, "sources", "usage_records")
+    diagnostics.register(retry_system, "retry_sessions", "_unsaved_sessions", "circuit_breakers",
+                         "active_sessions", "operation_stats")
+
+    @mcp_tool_with_error_handling("memory_growth_tool", enable_recovery=False)
+    async def synthetic_tool(call: int) -> str:
+        source_url = f"https://example.com/genres/{call % 25}"
+
+        async def fetch():
+            if call % 10 == 0:
+                raise ConnectionError("synthetic transient failure")
+            return {"call": call}
+
+        attribution.track_content_usage(f"content-{call}", source_url, context="memory growth test")
+        try:
+            result = await retry_system.execute_with_retry(fetch, f"fetch-{call}", OperationType.DOWNLOAD,
+                                                           policy_name="fast")
+        except ConnectionError as e:
+            raise ValueError(f"call {call} failed") from e
+        return json.dumps(result)
+
+    reports = []
+    for call in range(1, TOTAL_CALLS + 1):
+        await synthetic_tool(call)
+        if call % SNAPSHOT_EVERY == 0:
+            reports.append(diagnostics.snapshot())
+
+    assert all(report["suspects"] == [] for report in reports)
+
+    # From the second snapshot on every bounded collection is full: the state should stop growing
+    midway, final = reports[1]["components"], reports[-1]["components"]
+    for component, details in final.items():
+        for attribute, entry in details["attributes"].items():
+            before = midway[component]["attributes"][attribute]
+            assert entry["bytes"] <= before["bytes"] * 1.1 + 16 * 1024, f"{component}.{attribute} kept growing"
+            assert entry["items"] <= max(before["items"], USAGE_RECORDS_CAP), f"{component}.{attribute}"
+
+    assert final["SourceAttributionManager"]["attributes"]["usage_records"]["items"] == USAGE_RECORDS_CAP
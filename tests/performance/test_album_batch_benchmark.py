@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Batch Album Generation Benchmarks
+
+Creates albums for a synthetic corpus of 200 distinct documents through
+create_conceptual_albums_batch with 1, 2 and 4 worker processes. One worker
+runs the albums one after another in process (as a loop over
+create_conceptual_album would); with more workers throughput should grow
+with the cores available, less the cost of starting the pool.
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server import create_conceptual_albums_batch
+
+from tests.fixtures.mock_contexts import create_mock_context
+
+DOCUMENTS = 200
+
+NAMES = ['Elena', 'Marcus', 'Ada', 'Tomas', 'Iris', 'Jonah', 'Mira', 'Felix']
+PLACES = ['the ruined city', 'a northern harbor', 'the old library', 'the desert road', 'a flooded village']
+EVENTS = ['lost her brother', 'found a hidden letter', 'betrayed the council', 'fled the war', 'forgave her mother']
+IDEAS = ['time', 'memory', 'freedom', 'identity', 'meaning', 'change', 'truth', 'loss']
+
+
+def _corpus():
+    rng = random.Random(5)
+    documents = []
+    for i in range(DOCUMENTS):
+        if i % 2:
+            sentences = [f"The concept of {rng.choice(IDEAS)} is an abstract idea, a philosophy and principle of "
+                         f"{rng.choice(IDEAS)}." for _ in range(10)]
+        else:
+            name = rng.choice(NAMES)
+            sentences = [f"{name} walked through {rng.choice(PLACES)} and {rng.choice(EVENTS)}. The story follows "
+                         f"{name} through the chapter, a scene of grief and hope." for _ in range(10)]
+        documents.append(' '.join(sentences) + f" Document {i}.")
+    return documents
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="album-batch")
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_album_batch(benchmark, workers):
+    documents = _corpus()
+
+    def run():
+        return json.loads(asyncio.run(create_conceptual_albums_batch(
+            documents, track_count=6, max_workers=workers, ctx=create_mock_context()
+        )))
+
+    result = benchmark.pedantic(run, rounds=2, iterations=1)
+    assert result["batch_summary"]["albums_created"] == DOCUMENTS
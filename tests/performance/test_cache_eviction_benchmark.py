@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Cache Eviction Benchmarks
+
+Cleans a full EnhancedCacheManager down to its 70% target: full rescoring,
+sorting and one index write per victim (as _intelligent_cleanup used to do)
+versus popping victims off the incrementally keyed eviction index and removing
+them with a single index write. The old path is quadratic in the cache size
+(about 11 minutes at 10k entries), so it only runs at 2k.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_cache_manager import CacheConfig, EnhancedCacheManager
+from wiki_cache_manager import CacheEntry
+
+
+def _max_entries(entry_count: int) -> int:
+    # Just over the 80% threshold, so cleanup evicts about 16% of the entries
+    return int(entry_count * 1.2)
+
+
+def _populated_manager(cache_root: str, entry_count: int) -> EnhancedCacheManager:
+    config = CacheConfig(max_entries=_max_entries(entry_count),
+                         priority_patterns=[f"https://wiki/{i}" for i in range(0, entry_count, 100)])
+    manager = EnhancedCacheManager(cache_root, config)
+    manager._cache_loaded = True
+    manager._setup_priority_urls()
+    manager.cache_root.mkdir(parents=True, exist_ok=True)
+
+    now = datetime.now()
+    for i in range(entry_count):
+        url = f"https://wiki/{i}"
+        manager._cache_entries[url] = CacheEntry(
+            url=url, local_path=f"{cache_root}/missing/{i}.html",
+            download_date=now - timedelta(hours=i % 500), file_size=1000 + (i * 37) % 5000
+        )
+        if i % 3 == 0:
+            manager._access_frequency[url] = i % 7
+            manager._last_access_time[url] = now - timedelta(minutes=i % 900)
+    manager._rebuild_eviction_index()
+    return manager
+
+
+async def _legacy_cleanup(manager: EnhancedCacheManager) -> int:
+    # _intelligent_cleanup before the eviction index
+    target_size_mb = manager.config.max_size_mb * 0.7
+    target_entries = int(manager.config.max_entries * 0.7)
+
+    entry_scores = {}
+    for url, entry in manager._cache_entries.items():
+        score = 0.0
+        score -= (datetime.now() - entry.download_date).days * 0.1
+        score += manager._access_frequency.get(url, 0) * 2.0
+        if url in manager._last_access_time:
+            score -= (datetime.now() - manager._last_access_time[url]).total_seconds() / 3600 * 0.01
+        if url in manager._priority_urls:
+            score += 100.0
+        score -= entry.file_size / (1024 * 1024) * 0.1
+        entry_scores[url] = score
+    sorted_entries = sorted(entry_scores.items(), key=lambda x: x[1])
+
+    removed_count = 0
+    current_size_bytes = sum(entry.file_size for entry in manager._cache_entries.values())
+    for url, _score in sorted_entries:
+        if (current_size_bytes / (1024 * 1024) <= target_size_mb and
+                len(manager._cache_entries) <= target_entries):
+            break
+        if url in manager._priority_urls and removed_count < len(sorted_entries) * 0.5:
+            continue
+        entry = manager._cache_entries[url]
+        if await manager.remove_file(url):
+            current_size_bytes -= entry.file_size
+            removed_count += 1
+    return removed_count
+
+
+def _run_cleanup(benchmark, tmp_path, cleanup, entry_count, rounds):
+    managers = iter([_populated_manager(str(tmp_path / f"round-{i}"), entry_count) for i in range(rounds + 1)])
+
+    def setup():
+        return (next(managers),), {}
+
+    def run(manager):
+        assert asyncio.run(cleanup(manager)) == entry_count - int(_max_entries(entry_count) * 0.7)
+
+    benchmark.pedantic(run, setup=setup, rounds=rounds, iterations=1)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.benchmark(group="cache-eviction")
+def test_cleanup_full_rescore_per_victim_writes(benchmark, tmp_path):
+    _run_cleanup(benchmark, tmp_path, _legacy_cleanup, entry_count=2000, rounds=1)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="cache-eviction")
+@pytest.mark.parametrize("entry_count", [2000, 10000])
+def test_cleanup_eviction_index_single_write(benchmark, tmp_path, entry_count):
+    _run_cleanup(benchmark, tmp_path, EnhancedCacheManager._intelligent_cleanup, entry_count=entry_count, rounds=5)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="cache-access")
+def test_access_rekey(benchmark, tmp_path):
+    manager = _populated_manager(str(tmp_path), 10000)
+    urls = list(manager._cache_entries)
+
+    def touch_all():
+        for url in urls:
+            manager._access_frequency[url] += 1
+            manager._update_eviction_entry(url)
+
+    benchmark(touch_all)
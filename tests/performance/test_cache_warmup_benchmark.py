@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Cache Warm-up Benchmarks
+
+Replays a skewed request workload against an EnhancedCacheManager backed by a
+local stand-in wiki with simulated latency, after the cached pages expired.
+Compares no warm-up, the old bookkeeping-only warm-up, and an idle-time
+prefetching warm-up driven by the access history. Hit rates are printed with
+-s and stored in the benchmark's extra_info, overall and for the first
+requests after start-up, when warm-up matters most.
+"""
+
+import asyncio
+import os
+import random
+import sys
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_cache_manager import CacheConfig, EnhancedCacheManager
+from mcp_tool_activity import ToolActivityTracker
+from wiki_downloader import WikiDownloader
+
+PAGE_COUNT = 200
+REQUEST_COUNT = 500
+HOT_PAGES = 40
+COLD_START_REQUESTS = 50
+LATENCY_SECONDS = 0.01
+
+
+def _skewed_workload(seed: int):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(PAGE_COUNT)]
+    return rng.choices(range(PAGE_COUNT), weights=weights, k=REQUEST_COUNT)
+
+
+async def _replay(cache_root: str, warmup: str) -> dict:
+    async def page(request):
+        await asyncio.sleep(LATENCY_SECONDS)
+        return web.Response(text=f"<html><body>{request.path}</body></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{page}", page)
+    server = TestServer(app)
+    await server.start_server()
+    urls = [str(server.make_url(f"/page-{i}")) for i in range(PAGE_COUNT)]
+
+    manager = EnhancedCacheManager(cache_root, CacheConfig(warmup_frequent_urls=HOT_PAGES, warmup_idle_seconds=0.0,
+                                                           warmup_max_concurrent=8),
+                                   activity_tracker=ToolActivityTracker())
+    manager.downloader = WikiDownloader(cache_manager=manager, max_retries=1)
+    await manager.initialize()
+    try:
+        # Access history from the previous session; its pages have since expired
+        for index in _skewed_workload(seed=1):
+            manager._access_frequency[urls[index]] += 1
+
+        if warmup == "prefetch":
+            await manager.warm_cache(wait_for_idle=True)
+        elif warmup == "bookkeeping":
+            # What warm_cache used to do: check freshness, download nothing
+            hot = sorted(manager._access_frequency.items(), key=lambda x: x[1], reverse=True)[:HOT_PAGES]
+            for url, _ in hot:
+                await manager.is_file_fresh(url, 24)
+
+        hits = []
+        for index in _skewed_workload(seed=2):
+            hit = await manager.get_file_path(urls[index]) is not None
+            if not hit:
+                await manager.downloader.download_page(urls[index])
+            hits.append(hit)
+        return {"hit_rate": sum(hits) / REQUEST_COUNT,
+                "cold_start_hit_rate": sum(hits[:COLD_START_REQUESTS]) / COLD_START_REQUESTS}
+    finally:
+        await manager.downloader.cleanup()
+        await manager.cleanup()
+        await server.close()
+
+
+def _run(benchmark, tmp_path, warmup):
+    rounds = iter(range(100))
+    outcome = {}
+
+    def run():
+        outcome.update(asyncio.run(_replay(str(tmp_path / f"{warmup}-{next(rounds)}"), warmup)))
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info.update(outcome)
+    print(f"\n{warmup} warm-up: hit rate {outcome['hit_rate']:.1%}, "
+          f"first {COLD_START_REQUESTS} requests {outcome['cold_start_hit_rate']:.1%}")
+    return outcome
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="cache-warmup")
+def test_workload_without_warmup(benchmark, tmp_path):
+    assert _run(benchmark, tmp_path, "none")["hit_rate"] < 1.0
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="cache-warmup")
+def test_workload_after_bookkeeping_warmup(benchmark, tmp_path):
+    _run(benchmark, tmp_path, "bookkeeping")
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="cache-warmup")
+def test_workload_after_prefetch_warmup(benchmark, tmp_path):
+    outcome = _run(benchmark, tmp_path, "prefetch")
+    assert outcome["cold_start_hit_rate"] > 0.5
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Emotional Fact Extraction Benchmarks
+
+Extracts emotional states from a long narrative: one EmotionalState per regex
+match (as analyze_emotional_facts used to) versus clustering matches and
+building states only for the top-k clusters per fact type. The number of
+states each produces is printed with -s.
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server import FACT_ACTION_PATTERNS, EmotionalBeatEngine
+
+PARAGRAPH = (
+    "She lost her brother to the sea that winter. "
+    "Years later she won the regatta he had always dreamed of, "
+    "but she truly felt he had betrayed her by leaving. "
+    "The harbor was quiet for a long while after that, and the boats stayed tied. "
+)
+
+
+def _per_match_states(engine, text):
+    # analyze_emotional_facts before matches were clustered
+    states = []
+    for emotion_type, pattern in FACT_ACTION_PATTERNS.items():
+        for match in re.finditer(pattern.pattern, text, re.IGNORECASE):
+            context = text[max(0, match.start() - 100):min(len(text), match.end() + 100)]
+            state = engine._map_fact_to_emotion(emotion_type, context, None)
+            if state:
+                states.append(state)
+    return states
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="emotional-facts")
+@pytest.mark.parametrize("repeats", [100, 2000])
+def test_states_per_match(benchmark, repeats):
+    engine = EmotionalBeatEngine()
+    states = benchmark(_per_match_states, engine, PARAGRAPH * repeats)
+    print(f"\nper-match, {repeats} paragraphs: {len(states)} states")
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="emotional-facts")
+@pytest.mark.parametrize("repeats", [100, 2000])
+def test_states_clustered_top_k(benchmark, repeats):
+    engine = EmotionalBeatEngine()
+    states = benchmark(engine.analyze_emotional_facts, PARAGRAPH * repeats)
+    print(f"\nclustered, {repeats} paragraphs: {len(states)} states")
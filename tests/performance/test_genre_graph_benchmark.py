@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Genre Graph Benchmarks
+
+Similar-genre, hierarchy and fuzzy name queries over 1200 genres: scoring the
+target against every genre on each call (as find_similar_genres did) versus
+the GenreGraph, both including its construction and with warm neighbour rows.
+"""
+
+import asyncio
+import os
+import random
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_genre_mapper import EnhancedGenreMapper
+from wiki_data_models import Genre
+
+GENRES = 1200
+QUERIES = 50
+
+BASES = ['rock', 'metal', 'jazz', 'pop', 'folk', 'blues', 'punk', 'house', 'techno', 'soul', 'ambient', 'trap']
+PREFIXES = ['alternative', 'indie', 'hard', 'progressive', 'art', 'dark', 'smooth', 'free', 'death', 'doom',
+            'acoustic', 'traditional', 'dance', 'synth', 'electric', 'delta', 'hardcore', 'post', 'neo', 'lo-fi']
+WORDS = ['driving', 'melancholic', 'loud', 'mellow', 'groovy', 'raw', 'lush', 'sparse', 'fast', 'slow',
+         'gritty', 'dreamy', 'bright', 'heavy']
+INSTRUMENTS = ['guitar', 'bass', 'drums', 'synth', 'piano', 'saxophone', 'violin', 'vocals', 'organ', 'horns']
+
+
+def _genres():
+    rng = random.Random(3)
+    genres = []
+    for i in range(GENRES):
+        name = ' '.join(rng.sample(PREFIXES, rng.randint(1, 2)) + [rng.choice(BASES)]) + f" {i}"
+        genres.append(Genre(
+            name=name.title(),
+            description=' '.join(rng.sample(WORDS, 5)),
+            subgenres=[],
+            characteristics=rng.sample(WORDS, 3),
+            typical_instruments=rng.sample(INSTRUMENTS, 3),
+            mood_associations=rng.sample(WORDS, 2),
+        ))
+    return genres
+
+
+def _full_scan(mapper, genres, target):
+    similarities = []
+    for genre in genres:
+        if genre.name.lower() == target.name.lower():
+            continue
+        combined = (mapper._calculate_content_similarity(target, genre) * 0.3 +
+                    mapper._calculate_structural_similarity(target, genre) * 0.25 +
+                    mapper._calculate_genre_semantic_similarity(target, genre) * 0.25 +
+                    mapper._calculate_hierarchical_similarity(target, genre) * 0.2)
+        if combined >= 0.2:
+            similarities.append((genre, combined))
+    similarities.sort(key=lambda x: x[1], reverse=True)
+    return similarities[:5]
+
+
+async def _graph_queries(mapper, targets):
+    for target in targets:
+        await mapper.find_similar_genres(target.name)
+
+
+def _mapper(genres):
+    mapper = EnhancedGenreMapper(Mock())
+    mapper._genres_cache = genres
+    return mapper
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="genre-similar")
+def test_similar_full_scan(benchmark):
+    genres = _genres()
+    mapper = _mapper(genres)
+    targets = genres[::GENRES // QUERIES]
+    benchmark.pedantic(lambda: [_full_scan(mapper, genres, target) for target in targets], rounds=3, iterations=1)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="genre-similar")
+def test_similar_graph_cold(benchmark):
+    genres = _genres()
+    targets = genres[::GENRES // QUERIES]
+    benchmark.pedantic(lambda: asyncio.run(_graph_queries(_mapper(genres), targets)), rounds=3, iterations=1)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="genre-similar")
+def test_similar_graph_warm(benchmark):
+    genres = _genres()
+    mapper = _mapper(genres)
+    targets = genres[::GENRES // QUERIES]
+    asyncio.run(_graph_queries(mapper, targets))
+    benchmark.pedantic(lambda: asyncio.run(_graph_queries(mapper, targets)), rounds=5, iterations=1)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="genre-fuzzy")
+@pytest.mark.parametrize("indexed", [False, True], ids=["full-scan", "trigram-index"])
+def test_fuzzy_lookup(benchmark, indexed):
+    from difflib import SequenceMatcher
+
+    genres = _genres()
+    mapper = _mapper(genres)
+    mapper._get_genre_graph()
+    queries = [genre.name.lower().replace('o', '0', 1)[:-1] for genre in genres[::GENRES // QUERIES]]
+
+    def full_scan():
+        for query in queries:
+            best_ratio = 0.0
+            for genre in genres:
+                ratio = SequenceMatcher(None, query, genre.name.lower()).ratio()
+                if ratio > best_ratio and ratio >= 0.6:
+                    best_ratio = ratio
+
+    async def indexed_lookups():
+        for query in queries:
+            await mapper._fuzzy_find_genre(query)
+
+    benchmark.pedantic(lambda: asyncio.run(indexed_lookups()) if indexed else full_scan(), rounds=3, iterations=1)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Metrics Exposition Benchmarks
+
+A PerformanceMonitor holding 5,000 and 50,000 recorded metrics across
+downloads, parsing and generation: building the existing download, parsing and
+generation reports, which scan the metric deque, versus rendering the text
+exposition, which reads only the running aggregates and should cost the same
+at both sizes.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from metrics_exposition import MetricsRegistry
+from performance_monitor import PerformanceMonitor
+
+
+def _loaded_monitor(metrics):
+    monitor = PerformanceMonitor(storage_path=tempfile.mkdtemp())
+    monitor.initialized = True
+
+    async def record():
+        for i in range(metrics // 3):
+            await monitor.record_download_metrics(f"https://example.com/{i % 100}", 0.01 * (i % 300), i % 20 != 0,
+                                                  file_size=4096)
+            await monitor.record_parsing_metrics("genre_page", 4096, 0.001 * (i % 50), True, items_parsed=10)
+            await monitor.record_generation_metrics("suno_command", 0.005 * (i % 80), True, wiki_data_used=True)
+
+    asyncio.run(record())
+    return monitor
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="metrics-exposition")
+@pytest.mark.parametrize("metrics", [5000, 50000])
+@pytest.mark.parametrize("method", ["deque_reports", "exposition"])
+def test_scrape(benchmark, method, metrics):
+    monitor = _loaded_monitor(metrics)
+
+    if method == "deque_reports":
+        def scrape():
+            return (monitor.get_download_performance_report(), monitor.get_parsing_performance_report(),
+                    monitor.get_generation_performance_report())
+        benchmark(scrape)
+    else:
+        registry = MetricsRegistry()
+        registry.register(monitor)
+        text = benchmark(registry.render)
+        assert 'character_music_operation_duration_seconds_count{operation="wiki_download"}' in text
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Data Model Memory and Serialization Benchmarks
+
+Compares slotted, label-interning StandardCharacterProfile and ArtistPersona with
+equivalent plain dataclasses: retained memory per object for a large batch, and
+serialization throughput of the hand-written to_dict versus dataclasses.asdict.
+"""
+
+import os
+import sys
+import tracemalloc
+from dataclasses import asdict, field, fields, make_dataclass
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import server
+import standard_character_profile
+from server import ArtistPersona
+from standard_character_profile import StandardCharacterProfile
+
+BATCH_SIZE = 2000
+
+
+def _plain_variant(cls):
+    """Same fields and normalization as cls, without slots"""
+    return make_dataclass(
+        f"Plain{cls.__name__}",
+        [(f.name, f.type, field(default=f.default, default_factory=f.default_factory)) for f in fields(cls)],
+        namespace={'__post_init__': cls.__post_init__}
+    )
+
+
+def _without_interning():
+    identity = lambda value: value  # noqa: E731
+    patches = [patch.object(standard_character_profile, 'intern_label', identity),
+               patch.object(server, 'intern_label', identity)]
+    for active in patches:
+        active.start()
+    return patches
+
+
+PlainCharacterProfile = _plain_variant(StandardCharacterProfile)
+PlainArtistPersona = _plain_variant(ArtistPersona)
+
+
+def _fresh(text: str) -> str:
+    # Parsed input produces a new string object per occurrence
+    return "".join(list(text))
+
+
+def _profile_kwargs(i: int) -> dict:
+    return dict(
+        name=_fresh(f"Character {i % 50}"),
+        aliases=[_fresh(f"C{i % 50}")],
+        backstory="Grew up between two harbors and never settled in either.",
+        relationships=["sister", "mentor"],
+        motivations=["belonging"],
+        fears=["being forgotten"],
+        mannerisms=["hums while thinking"],
+        content_type=_fresh("narrative"),
+        confidence_score=0.8
+    )
+
+
+def _persona_kwargs(i: int) -> dict:
+    return dict(
+        character_name=_fresh(f"Character {i % 50}"),
+        artist_name=_fresh(f"Character {i % 50} Band"),
+        primary_genre=_fresh("indie folk"),
+        secondary_genres=[_fresh("americana"), _fresh("singer-songwriter")],
+        vocal_style=_fresh("breathy"),
+        instrumental_preferences=[_fresh("acoustic guitar"), _fresh("cello")],
+        lyrical_themes=["the sea", "leaving home"],
+        emotional_palette=[_fresh("melancholy"), _fresh("hope")],
+        collaboration_style=_fresh("intimate")
+    )
+
+
+def _retained_bytes_per_object(cls, kwargs_for):
+    inputs = [kwargs_for(i) for i in range(BATCH_SIZE)]
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        instances = [cls(**kwargs) for kwargs in inputs]
+        # Drop the inputs so only what the instances retain is counted
+        del inputs
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(instances) == BATCH_SIZE
+    return (after - before) / BATCH_SIZE
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("slotted,plain,kwargs_for", [
+    (StandardCharacterProfile, PlainCharacterProfile, _profile_kwargs),
+    (ArtistPersona, PlainArtistPersona, _persona_kwargs),
+])
+def test_retained_memory_per_object(slotted, plain, kwargs_for):
+    slotted_bytes = _retained_bytes_per_object(slotted, kwargs_for)
+    # Before: a regular dataclass that keeps its own copy of every label
+    patches = _without_interning()
+    try:
+        plain_bytes = _retained_bytes_per_object(plain, kwargs_for)
+    finally:
+        for active in patches:
+            active.stop()
+
+    print(f"\n{slotted.__name__}: {plain_bytes:.0f} -> {slotted_bytes:.0f} bytes per object")
+    assert slotted_bytes < plain_bytes
+
+
+@pytest.fixture(scope="module")
+def profiles():
+    return [StandardCharacterProfile(**_profile_kwargs(i)) for i in range(BATCH_SIZE)]
+
+
+@pytest.fixture(scope="module")
+def personas():
+    return [ArtistPersona(**_persona_kwargs(i)) for i in range(BATCH_SIZE)]
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="profile-serialization")
+def test_profile_serialization_asdict(benchmark, profiles):
+    benchmark(lambda: [asdict(profile) for profile in profiles])
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="profile-serialization")
+def test_profile_serialization_to_dict(benchmark, profiles):
+    benchmark(lambda: [profile.to_dict() for profile in profiles])
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="persona-serialization")
+def test_persona_serialization_asdict(benchmark, personas):
+    benchmark(lambda: [asdict(persona) for persona in personas])
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="persona-serialization")
+def test_persona_serialization_to_dict(benchmark, personas):
+    benchmark(lambda: [persona.to_dict() for persona in personas])
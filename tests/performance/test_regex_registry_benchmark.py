@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Regex Registry Benchmarks
+
+Runs complete_workflow over the fixture scenarios with a warm stdlib re cache
+and with the cache under pressure from a flood of unrelated patterns (as in a
+long-lived server analyzing many differently named characters). The flood on
+its own is timed as the floor to subtract.
+"""
+
+import asyncio
+import os
+import re
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import server
+from fixtures.mock_contexts import MockContext
+from fixtures.test_data import TestDataManager
+
+# More distinct patterns than the stdlib re cache holds
+FLOOD_PATTERNS = [rf'\bcharacter{i}\w*' for i in range(1200)]
+
+
+def _flood_re_cache():
+    for pattern in FLOOD_PATTERNS:
+        re.compile(pattern)
+
+
+def _texts():
+    return [scenario.narrative_text for scenario in TestDataManager().scenarios.values()]
+
+
+async def _run_workflows(texts, under_pressure):
+    for text in texts:
+        if under_pressure:
+            _flood_re_cache()
+        await server._complete_workflow_internal(text, MockContext())
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="regex-complete-workflow")
+@pytest.mark.parametrize("under_pressure", [False, True], ids=["warm-re-cache", "re-cache-pressure"])
+def test_complete_workflow(benchmark, under_pressure):
+    texts = _texts()
+    benchmark.pedantic(lambda: asyncio.run(_run_workflows(texts, under_pressure)), rounds=5, iterations=1,
+                       warmup_rounds=1)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="regex-complete-workflow")
+def test_re_cache_flood_floor(benchmark):
+    texts = _texts()
+    benchmark.pedantic(lambda: [_flood_re_cache() for _ in texts], rounds=5, iterations=1)
+
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Resolved Data View Benchmarks
+
+Reads genres and meta tags through GracefulDegradationSystem 200 times over a
+wiki data set of 2000 genres and 2000 meta tags: merging every source again on
+each call (as every call did before) versus the memoized resolved views, which
+only merge once per change of wiki, cached or fallback data.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from error_recovery_manager import ErrorRecoveryManager
+from graceful_degradation_system import GracefulDegradationSystem
+from wiki_data_system import Genre, MetaTag, WikiDataManager
+
+ITEMS = 2000
+READS = 200
+
+
+def _system(tmp_path):
+    manager = WikiDataManager()
+    manager.initialized = True
+    manager._genres = [Genre(name=f"Genre {i}", description="") for i in range(ITEMS)]
+    manager._meta_tags = [MetaTag(tag=f"[tag {i}]", category="mood", description="") for i in range(ITEMS)]
+    system = GracefulDegradationSystem(manager, ErrorRecoveryManager(str(tmp_path)))
+    asyncio.run(system.initialize())
+    return system
+
+
+async def _read(system, merge_every_call):
+    for _ in range(READS):
+        if merge_every_call:
+            system.mark_cached_data_changed()
+        await system.get_genres_with_fallback()
+        await system.get_meta_tags_with_fallback()
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="resolved-data-view")
+@pytest.mark.parametrize("merge_every_call", [True, False], ids=["merge-every-call", "resolved-view"])
+def test_repeated_reads(benchmark, tmp_path, merge_every_call):
+    system = _system(tmp_path)
+    benchmark.pedantic(lambda: asyncio.run(_read(system, merge_every_call)), rounds=5, iterations=1,
+                       warmup_rounds=1)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Hedged Retry Benchmarks
+
+Runs 50 calls through RetrySystem against a stand-in operation where every
+tenth call stalls for 200 ms (a slow replica or a dropped packet): plain
+attempts versus hedged attempts, which race a second call once the first
+has taken longer than the hedge delay.
+"""
+
+import asyncio
+import itertools
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from retry_system import OperationType, RetryPolicy, RetryStrategy, RetrySystem
+
+CALLS = 50
+
+
+async def _run_calls(hedge):
+    system = RetrySystem(tempfile.mkdtemp())
+    system.initialized = True
+    system.add_retry_policy("bench", RetryPolicy(
+        max_attempts=2, strategy=RetryStrategy.FIXED_DELAY, jitter=False,
+        hedge=hedge, hedge_delay=0.02
+    ))
+    counter = itertools.count()
+
+    async def stand_in():
+        await asyncio.sleep(0.2 if next(counter) % 10 == 9 else 0.005)
+        return "ok"
+
+    for i in range(CALLS):
+        await system.execute_with_retry(stand_in, f"fetch_{i}", OperationType.NETWORK_REQUEST, "bench")
+    return system.hedge_stats
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="retry-hedging")
+@pytest.mark.parametrize("hedge", [False, True], ids=["plain", "hedged"])
+def test_calls_with_latency_tail(benchmark, hedge):
+    stats = benchmark.pedantic(lambda: asyncio.run(_run_calls(hedge)), rounds=3, iterations=1)
+    assert (stats['hedges_launched'] > 0) == hedge
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Bounded Retry State Benchmarks
+
+Completes 1,000 and 20,000 retry sessions, then times get_retry_statistics
+followed by save_state. Statistics come from running totals and the session
+ring, and saving appends only what changed since the last save, so the cost
+should stay flat as the session count grows.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from retry_system import OperationType, RetrySession, RetrySystem
+
+OPERATION_TYPES = list(OperationType)
+
+
+def _loaded_system(sessions):
+    system = RetrySystem(tempfile.mkdtemp())
+    asyncio.run(system.initialize())
+    now = datetime.now()
+    for i in range(sessions):
+        system._complete_session(RetrySession(
+            operation_id=f"op_{i}", operation_type=OPERATION_TYPES[i % len(OPERATION_TYPES)],
+            start_time=now, end_time=now + timedelta(milliseconds=i % 50),
+            total_attempts=1 + i % 3, final_success=i % 7 != 0
+        ))
+    asyncio.run(system.save_state())
+    return system
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="retry-state")
+@pytest.mark.parametrize("sessions", [1000, 20000])
+def test_statistics_and_save(benchmark, sessions):
+    system = _loaded_system(sessions)
+
+    def statistics_and_save():
+        asyncio.run(system.save_state())
+        return system.get_retry_statistics()
+
+    stats = benchmark(statistics_and_save)
+    assert stats['total_sessions'] == sessions
+    assert len(system.retry_sessions) <= 1000
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Slow-Call Sampling Profiler Benchmarks
+
+About 200 ms of character analysis run through ToolProfiler.profile with
+profiling off, which costs one attribute check, and with every call sampled
+every 5 ms (the default interval), which measures what the sampling thread
+takes from the profiled call. The threshold is set so no profile is written.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_character_analyzer import EnhancedCharacterAnalyzer
+from sampling_profiler import ToolProfiler
+
+STORY = (
+    "Sarah Chen stood at the edge of the pier, remembering her father. Sarah had always feared "
+    "the ocean after the storm took him. \"I will not run anymore,\" Sarah said to Marcus. "
+    "Marcus Webb watched her with worry, knowing Sarah hid her grief behind ambition. "
+) * 20
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="sampling-profiler")
+@pytest.mark.parametrize("sample_rate", [0.0, 1.0], ids=["off", "every-call"])
+def test_profiled_analysis(benchmark, sample_rate):
+    analyzer = EnhancedCharacterAnalyzer()
+    profiler = ToolProfiler(sample_rate=sample_rate, threshold_seconds=60.0, output_dir=tempfile.mkdtemp())
+
+    async def call():
+        async with profiler.profile("analyze_character_text"):
+            return await analyzer.analyze_text(STORY)
+
+    benchmark(lambda: asyncio.run(call()))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Schema Validation Benchmarks
+
+Validates a large list of character profiles with the dict-schema interpreter,
+the compiled schema validators, and trusted internal validation.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from mcp_data_validation import MCPDataValidator, ValidationResult
+from standard_character_profile import StandardCharacterProfile
+
+CHARACTER_COUNT = 5000
+
+
+def _characters():
+    return [
+        StandardCharacterProfile(
+            name=f"Character {i}",
+            aliases=[f"C{i}"],
+            backstory="Grew up between two harbors and never settled in either.",
+            relationships=["sister", "mentor"],
+            motivations=["belonging"],
+            fears=["being forgotten"],
+            mannerisms=["hums while thinking"],
+            confidence_score=(i % 10) / 10
+        ).to_dict()
+        for i in range(CHARACTER_COUNT)
+    ]
+
+
+@pytest.fixture(scope="module")
+def characters():
+    return _characters()
+
+
+def _validate_interpreted(validator, characters):
+    # validate_character_profile before schemas were compiled
+    for data in characters:
+        result = ValidationResult()
+        validator._validate_against_schema(data, validator.character_profile_schema, result, "character_profile")
+        validator._validate_character_profile_content(data, result)
+        assert result.is_valid
+
+
+def _validate_compiled(validator, characters, trusted=False):
+    for data in characters:
+        assert validator.validate_character_profile(data, trusted=trusted).is_valid
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="schema-validation")
+def test_character_list_interpreted_schema(benchmark, characters):
+    validator = MCPDataValidator()
+    benchmark(_validate_interpreted, validator, characters)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="schema-validation")
+def test_character_list_compiled_schema(benchmark, characters):
+    validator = MCPDataValidator()
+    benchmark(_validate_compiled, validator, characters)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="schema-validation")
+def test_character_list_trusted(benchmark, characters):
+    validator = MCPDataValidator()
+    benchmark(_validate_compiled, validator, characters, trusted=True)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="schema-check-only")
+def test_character_list_interpreted_schema_check(benchmark, characters):
+    validator = MCPDataValidator()
+    schema = validator.character_profile_schema
+
+    def run():
+        for data in characters:
+            validator._validate_against_schema(data, schema, ValidationResult(), "character_profile")
+
+    benchmark(run)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="schema-check-only")
+def test_character_list_compiled_schema_check(benchmark, characters):
+    check = MCPDataValidator()._check_character_profile
+
+    def run():
+        for data in characters:
+            check(data)
+
+    benchmark(run)
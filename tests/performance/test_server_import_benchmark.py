@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Server Import Benchmarks
+
+Cold import of the server module in a fresh interpreter, with the wiki stack
+deferred until first use versus loaded eagerly as it was before.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def _cold_import(code: str):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.run([sys.executable, "-c", code], check=True, env=env, timeout=120)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="server-import")
+def test_server_import_deferred_wiki(benchmark):
+    benchmark.pedantic(_cold_import, args=("import server",), rounds=5, iterations=1)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="server-import")
+def test_server_import_eager_wiki(benchmark):
+    benchmark.pedantic(_cold_import, args=("import server; server._load_wiki_integration()",),
+                       rounds=5, iterations=1)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="server-import")
+def test_interpreter_baseline(benchmark):
+    # Interpreter start-up plus fastmcp, which the server cannot avoid
+    benchmark.pedantic(_cold_import, args=("import fastmcp",), rounds=5, iterations=1)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tool Call Coalescing Benchmarks
+
+A burst of 20 concurrent complete_workflow calls on the same manuscript (a
+thundering herd of clients asking for the same thing): each call running the
+workflow on its own versus the single-flight tool, where the burst shares
+one computation.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import server
+from fixtures.mock_contexts import MockContext
+from fixtures.test_data import TestDataManager
+
+BURST = 20
+
+
+async def _burst(tool, text):
+    return await asyncio.gather(*(tool(text, MockContext()) for _ in range(BURST)))
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="single-flight")
+@pytest.mark.parametrize("coalesced", [False, True], ids=["independent", "single-flight"])
+def test_identical_workflow_burst(benchmark, coalesced):
+    text = next(iter(TestDataManager().scenarios.values())).narrative_text
+    tool = server.complete_workflow if coalesced else server.complete_workflow.__wrapped__
+    results = benchmark.pedantic(lambda: asyncio.run(_burst(tool, text)), rounds=5, iterations=1, warmup_rounds=1)
+    assert len(results) == BURST
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Suno Command Generation Benchmarks
+
+Compares generating commands for several personas with inline, sequential wiki
+tag lookups against the planned path that dedupes lookups across variants and
+personas and resolves them concurrently.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server import ArtistPersona, SunoCommandGenerator
+from standard_character_profile import StandardCharacterProfile
+from wiki_data_models import MetaTag
+
+from tests.fixtures.mock_contexts import create_mock_context
+
+WIKI_LATENCY_SECONDS = 0.002
+PERSONA_COUNT = 8
+GENRES = ["rock", "folk", "jazz", "electronic"]
+
+
+class LatentWikiDataManager:
+    """Wiki data manager stand-in that sleeps on every meta tag fetch"""
+
+    def __init__(self):
+        self.fetches = 0
+        self.tags = [
+            MetaTag(tag=f"{genre} {category} tag", category=category,
+                    description=f"{genre} {category} sadness powerful guitar",
+                    compatible_genres=[genre])
+            for genre in GENRES
+            for category in ("style", "structural", "vocal", "emotional", "instrumental")
+        ]
+
+    async def get_meta_tags(self, category: str = None):
+        self.fetches += 1
+        await asyncio.sleep(WIKI_LATENCY_SECONDS)
+        if category:
+            return [tag for tag in self.tags if tag.category == category]
+        return list(self.tags)
+
+
+def _requests():
+    requests = []
+    for i in range(PERSONA_COUNT):
+        name = f"Character {i}"
+        persona = ArtistPersona(
+            character_name=name,
+            artist_name=f"Artist {i}",
+            primary_genre=GENRES[i % len(GENRES)],
+            secondary_genres=["alternative"],
+            vocal_style="powerful emotional",
+            instrumental_preferences=["guitar", "drums"],
+            lyrical_themes=["loss", "home"],
+            emotional_palette=["sadness", "hope"],
+            collaboration_style="open"
+        )
+        character = StandardCharacterProfile(
+            name=name,
+            backstory="Grew up by the harbour and left to chase a promise that never came true.",
+            relationships=["friend", "family", "mentor"],
+            motivations=["find home", "forgive"],
+            conflicts=["pride", "grief"],
+            personality_drivers=["loyal", "stubborn"],
+            confidence_score=0.8
+        )
+        requests.append((persona, character))
+    return requests
+
+
+async def _generate_sequentially(generator, requests):
+    """Previous behaviour: every variant awaits its own lookups one after another"""
+    commands = []
+    for persona, character in requests:
+        for variant, _lookups in generator.plan_command_variants(persona, character):
+            commands.append(await generator._build_command_variant(variant, persona, character))
+    return commands
+
+
+async def _generate_planned(generator, requests, ctx):
+    lookups = [lookup for persona, character in requests
+               for lookup in generator.plan_tag_lookups(persona, character)]
+    commands = []
+    async with generator.prefetch_tag_lookups(lookups):
+        for persona, character in requests:
+            commands.extend(await generator.generate_suno_commands(persona, character, ctx))
+    return commands
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="suno-command-generation")
+def test_multi_persona_sequential_lookups(benchmark):
+    generator = SunoCommandGenerator(LatentWikiDataManager())
+    requests = _requests()
+
+    commands = benchmark.pedantic(
+        lambda: asyncio.run(_generate_sequentially(generator, requests)), rounds=3, iterations=1
+    )
+
+    assert len(commands) == PERSONA_COUNT * 5
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="suno-command-generation")
+def test_multi_persona_planned_lookups(benchmark):
+    wiki = LatentWikiDataManager()
+    generator = SunoCommandGenerator(wiki)
+    requests = _requests()
+    ctx = create_mock_context("performance")
+
+    commands = benchmark.pedantic(
+        lambda: asyncio.run(_generate_planned(generator, requests, ctx)), rounds=3, iterations=1
+    )
+
+    assert len(commands) == PERSONA_COUNT * 5
+    # One fetch per wiki category per round, regardless of persona count
+    assert wiki.fetches <= 3 * 6
+
+
+@pytest.mark.performance
+def test_planned_lookups_match_sequential_output():
+    generator = SunoCommandGenerator(LatentWikiDataManager())
+    requests = _requests()
+    ctx = create_mock_context("performance")
+
+    sequential = asyncio.run(_generate_sequentially(generator, requests))
+    planned = asyncio.run(_generate_planned(generator, requests, ctx))
+
+    assert planned == sequential
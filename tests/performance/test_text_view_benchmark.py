@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Shared Text View Benchmarks
+
+Runs every concept helper of CreativeMusicEngine on the same concept: each
+helper given the raw string and deriving its own lowercased text and splits
+(as they used to) versus all of them sharing one TextView per request.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server import CreativeMusicEngine
+from text_view import TextView
+
+CONCEPT = (
+    "The feeling of standing at the edge of a vast ocean at night, watching the dark water "
+    "break against stone while a distant city hums, wondering whether hope can rise again. "
+)
+
+HELPERS = [
+    "_extract_themes",
+    "_analyze_emotional_qualities",
+    "_analyze_rhythmic_elements",
+    "_analyze_harmonic_elements",
+    "_analyze_textural_elements",
+    "_analyze_structural_elements",
+    "_extract_sonic_palette",
+]
+
+
+def _run_helpers(engine, concept, shared):
+    view = TextView(concept) if shared else concept
+    return [getattr(engine, helper)(view) for helper in HELPERS]
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="text-view")
+@pytest.mark.parametrize("repeats", [1, 40])
+@pytest.mark.parametrize("shared", [False, True], ids=["per-helper", "shared-view"])
+def test_concept_helpers(benchmark, repeats, shared):
+    engine = CreativeMusicEngine()
+    concept = CONCEPT * repeats
+    results = benchmark(_run_helpers, engine, concept, shared)
+    assert results == _run_helpers(engine, concept, not shared)
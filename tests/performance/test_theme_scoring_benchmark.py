@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Narrative Theme Scoring Benchmarks
+
+Finds the thematic (multi-keyword) sentences of every narrative theme in a
+long story: splitting and scanning every sentence once per theme (as
+_analyze_narrative_themes_semantic used to) versus one sentence split and one
+scan per keyword through SentenceKeywordIncidence. The whole theme pass, which
+is dominated by the per-theme regex patterns, is timed separately.
+"""
+
+import asyncio
+import os
+import re
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_character_analyzer import EnhancedCharacterAnalyzer, SentenceKeywordIncidence
+
+PARAGRAPH = (
+    "Elena trusted her friend and loyal companion through the long journey north. "
+    "Marcus sought power to control the council, but his betrayal and lies caught up with him. "
+    "The war left her family scattered; her mother and brother fled the danger to survive. "
+    "In the end she chose forgiveness and mercy, and wondered who am I without this quest? "
+)
+
+
+def _per_theme_sentence_scan(analyzer, text):
+    # Thematic sentence detection before the incidence matrix
+    found = {}
+    for theme_name, theme_data in analyzer.theme_patterns.items():
+        theme_sentences = []
+        for sentence in re.split(r'[.!?]+', text):
+            sentence_lower = sentence.lower()
+            if sum(1 for keyword in theme_data['keywords'] if keyword.lower() in sentence_lower) >= 2:
+                theme_sentences.append(sentence.strip()[:100] + "...")
+        found[theme_name] = theme_sentences
+    return found
+
+
+def _incidence_sentence_scan(analyzer, text):
+    keywords = [keyword for theme_data in analyzer.theme_patterns.values() for keyword in theme_data['keywords']]
+    incidence = SentenceKeywordIncidence(text, keywords)
+    return {
+        theme_name: [incidence.sentences[index].strip()[:100] + "..."
+                     for index in incidence.multi_keyword_sentences(theme_data['keywords'])]
+        for theme_name, theme_data in analyzer.theme_patterns.items()
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="theme-scoring")
+@pytest.mark.parametrize("repeats", [50, 1000])
+def test_per_theme_sentence_scan(benchmark, repeats):
+    analyzer = EnhancedCharacterAnalyzer()
+    found = benchmark(_per_theme_sentence_scan, analyzer, PARAGRAPH * repeats)
+    assert found == _incidence_sentence_scan(analyzer, PARAGRAPH * repeats)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="theme-scoring")
+@pytest.mark.parametrize("repeats", [50, 1000])
+def test_incidence_sentence_scan(benchmark, repeats):
+    analyzer = EnhancedCharacterAnalyzer()
+    benchmark(_incidence_sentence_scan, analyzer, PARAGRAPH * repeats)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="theme-scoring-full")
+@pytest.mark.parametrize("repeats", [50, 1000])
+def test_full_theme_scoring(benchmark, repeats):
+    analyzer = EnhancedCharacterAnalyzer()
+    text = PARAGRAPH * repeats
+    themes = benchmark(lambda: asyncio.run(analyzer._analyze_narrative_themes_semantic(text)))
+    assert themes
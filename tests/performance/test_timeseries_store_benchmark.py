@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Time-Series Store Benchmarks
+
+Per-minute p50/p95/p99 for one operation over the last hour, out of 50,000
+recorded metrics across 10 operations: scanning and sorting the in-memory
+metric deque versus reading the minute rollups of the time-series store.
+Also times recording 50,000 points and flushing them to disk.
+"""
+
+import math
+import os
+import sys
+import tempfile
+from collections import deque
+from datetime import datetime, timedelta
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from performance_monitor import PerformanceMetric
+from timeseries_store import TimeSeriesStore
+
+POINTS = 50000
+OPERATIONS = [f"operation_{i}" for i in range(10)]
+END = datetime(2026, 1, 1, 12)
+START = END - timedelta(hours=1)
+
+
+def _points():
+    for i in range(POINTS):
+        timestamp = START + timedelta(seconds=3600 * i / POINTS)
+        yield OPERATIONS[i % len(OPERATIONS)], timestamp, 0.001 * (1 + i % 997), i % 50 != 0
+
+
+def _scan_deque(metrics, operation):
+    windows = []
+    for minute in range(60):
+        window_start = START + timedelta(minutes=minute)
+        window_end = window_start + timedelta(minutes=1)
+        durations = sorted(m.duration for m in metrics
+                           if m.operation == operation and window_start <= m.timestamp < window_end)
+        windows.append({f"p{int(q * 100)}": durations[max(1, math.ceil(q * len(durations))) - 1]
+                        for q in (0.50, 0.95, 0.99)} if durations else {})
+    return windows
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="timeseries-query")
+@pytest.mark.parametrize("source", ["metric_deque", "timeseries_store"])
+def test_hourly_percentiles(benchmark, source):
+    if source == "metric_deque":
+        metrics = deque((PerformanceMetric(timestamp, operation, duration, success, 0.0, 0.0, {})
+                         for operation, timestamp, duration, success in _points()), maxlen=POINTS)
+        windows = benchmark(_scan_deque, metrics, OPERATIONS[0])
+        assert len(windows) == 60
+    else:
+        store = TimeSeriesStore(tempfile.mkdtemp())
+        for operation, timestamp, duration, success in _points():
+            store.record(operation, timestamp.timestamp(), duration, success)
+        store.flush(now=END.timestamp())
+        windows = benchmark(store.query_range, OPERATIONS[0], START.timestamp(), END.timestamp(), 60)
+        assert sum(window['count'] for window in windows) == POINTS // len(OPERATIONS)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="timeseries-ingest")
+def test_record_and_flush(benchmark):
+    points = [(operation, timestamp.timestamp(), duration, success)
+              for operation, timestamp, duration, success in _points()]
+
+    def record_and_flush():
+        store = TimeSeriesStore(tempfile.mkdtemp())
+        for point in points:
+            store.record(*point)
+        return store.flush(now=END.timestamp())
+
+    assert benchmark.pedantic(record_and_flush, rounds=3, iterations=1) == POINTS
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+MCP Tool Decorator Overhead Benchmarks
+
+Measures the per-call overhead that mcp_tool_with_error_handling adds to a
+trivial tool with a large payload, comparing synchronous file logging with the
+queued, lazily formatted logging pipeline.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import mcp_error_handler
+from mcp_error_handler import configure_error_handler
+from mcp_tool_decorator import mcp_tool_with_error_handling
+
+CALLS_PER_ROUND = 500
+
+ROUNDS = 5
+
+LARGE_TEXT = "The lighthouse keeper's daughter watched the storm roll in. " * 4000
+LARGE_RESULT = json.dumps({"characters": [{"name": f"Character {i}", "backstory": "x" * 500} for i in range(200)]})
+
+
+@mcp_tool_with_error_handling("benchmark_tool", enable_recovery=False)
+async def _trivial_tool(text: str, options: dict) -> str:
+    return LARGE_RESULT
+
+
+async def _call_repeatedly():
+    options = {"genres": ["folk"] * 5000, "depth": "full"}
+    for _ in range(CALLS_PER_ROUND):
+        await _trivial_tool(text=LARGE_TEXT, options=options)
+
+
+@pytest.fixture
+def restore_error_handler():
+    previous = mcp_error_handler._error_handler
+    yield
+    if mcp_error_handler._error_handler is not previous:
+        mcp_error_handler._error_handler.close()
+    mcp_error_handler._error_handler = previous
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="tool-decorator-overhead")
+def test_decorator_overhead_synchronous_logging(benchmark, tmp_path, restore_error_handler):
+    mcp_error_handler._error_handler = None
+    configure_error_handler(log_file_path=str(tmp_path / "tools.log"), queue_logging=False)
+
+    benchmark.pedantic(lambda: asyncio.run(_call_repeatedly()), rounds=ROUNDS, iterations=1)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="tool-decorator-overhead")
+def test_decorator_overhead_queued_logging(benchmark, tmp_path, restore_error_handler):
+    mcp_error_handler._error_handler = None
+    handler = configure_error_handler(log_file_path=str(tmp_path / "tools.log"))
+
+    # Drain the queue between rounds so each round measures the caller's side only
+    benchmark.pedantic(lambda: asyncio.run(_call_repeatedly()), setup=handler.flush, rounds=ROUNDS, iterations=1)
+
+    handler.flush()
+    # --benchmark-disable runs the function once instead of ROUNDS times
+    rounds = 1 if benchmark.disabled else ROUNDS
+    with open(tmp_path / "tools.log") as f:
+        assert f.read().count("TOOL_SUCCESS") + handler.dropped_log_records == rounds * CALLS_PER_ROUND
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="tool-decorator-overhead")
+def test_decorator_overhead_queued_structured_logging(benchmark, tmp_path, restore_error_handler):
+    mcp_error_handler._error_handler = None
+    handler = configure_error_handler(
+        log_file_path=str(tmp_path / "tools.log"),
+        structured_log_path=str(tmp_path / "tools.jsonl")
+    )
+
+    benchmark.pedantic(lambda: asyncio.run(_call_repeatedly()), setup=handler.flush, rounds=ROUNDS, iterations=1)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Per-Stage Tracing Benchmarks
+
+Character analysis of a short story, the most heavily instrumented stage of
+complete_workflow, with no trace active (every span is a no-op) and inside a
+trace recording the full span tree. Also times one call of a @traced function
+outside a trace against the same undecorated function, the fixed cost each
+instrumented stage adds when tracing is off.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_character_analyzer import EnhancedCharacterAnalyzer
+from tracing import start_trace, traced
+
+STORY = (
+    "Sarah Chen stood at the edge of the pier, remembering her father. Sarah had always feared "
+    "the ocean after the storm took him. \"I will not run anymore,\" Sarah said to Marcus. "
+    "Marcus Webb watched her with worry, knowing Sarah hid her grief behind ambition. "
+) * 4
+
+
+def _stage(value):
+    return value + 1
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="tracing")
+@pytest.mark.parametrize("tracing", [False, True], ids=["disabled", "enabled"])
+def test_character_analysis(benchmark, tracing):
+    analyzer = EnhancedCharacterAnalyzer()
+
+    def analyze():
+        if not tracing:
+            return asyncio.run(analyzer.analyze_text(STORY))
+        with start_trace("analyze_character_text") as trace:
+            result = asyncio.run(analyzer.analyze_text(STORY))
+        return result, trace.to_tree()
+
+    result = benchmark(analyze)
+    if tracing:
+        assert result[1]["children"][0]["name"] == "character_analysis"
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="tracing-call")
+@pytest.mark.parametrize("decorated", [False, True], ids=["plain", "traced-no-trace"])
+def test_stage_call_overhead(benchmark, decorated):
+    stage = traced("stage")(_stage) if decorated else _stage
+
+    def call_many():
+        for i in range(1000):
+            stage(i)
+
+    benchmark(call_many)
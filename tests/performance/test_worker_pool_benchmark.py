@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Warm Worker Pool Benchmarks
+
+Time until one album comes back from a new worker process. A process pool
+started for the call (as batch album generation used to start one per batch,
+with workers from a fork server that imports the server module) pays for the
+imports, analyzer construction and wiki loading before the album; a worker
+forked from the warm pool's parent starts with all of that in place. The
+warm pool recycles its worker after every task here, so each round measures
+a fresh fork rather than a reused worker.
+"""
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import server
+from warm_worker_pool import WarmWorkerPool, task_reference
+
+DOCUMENT = {'content': server.WORKER_WARMUP_DOCUMENT, 'album_concept': None, 'character_name': None,
+            'character_description': None, 'track_count': 6, 'genre': 'folk', 'processing_mode': 'auto'}
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="worker-pool")
+def test_album_in_new_process_pool(benchmark):
+    def run():
+        mp_context = multiprocessing.get_context('forkserver')
+        mp_context.set_forkserver_preload(['server'])
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp_context) as pool:
+            return pool.submit(server._create_album_in_worker, DOCUMENT).result()
+
+    result = benchmark.pedantic(run, rounds=3, iterations=1)
+    assert "error" not in result
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="worker-pool")
+def test_album_in_fresh_warm_worker(benchmark):
+    pool = WarmWorkerPool(warmup=[task_reference(server.warm_worker_parent)], max_workers=1, max_tasks_per_worker=1)
+    pool.start()
+    try:
+        result = benchmark.pedantic(lambda: pool.submit(server._create_album_in_worker, DOCUMENT).result(),
+                                    rounds=10, iterations=1)
+    finally:
+        pool.shutdown()
+    assert "error" not in result
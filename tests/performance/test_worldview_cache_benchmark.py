@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Character Worldview Cache Benchmarks
+
+Builds one WorkingUniversalProcessor per track of a 12-track album for the
+same character: every processor parsing the description again (as it used
+to) versus all of them sharing the cached worldview.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import working_universal_processor
+from working_universal_processor import WorkingUniversalProcessor, WorldviewCache
+
+DESCRIPTION = (
+    "Marcus Chen is a 34-year-old electronic music producer from Detroit working in a "
+    "warehouse studio. Philosophical, processing grief after his father's death and "
+    "questioning the religious upbringing he left behind."
+)
+TRACKS = 12
+
+
+def _build_processors():
+    return [WorkingUniversalProcessor(DESCRIPTION) for _ in range(TRACKS)]
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="worldview-cache")
+@pytest.mark.parametrize("cached", [False, True], ids=["parse-per-track", "cached"])
+def test_album_processors(benchmark, monkeypatch, cached):
+    # A cache that keeps nothing parses the description for every processor
+    cache = WorldviewCache() if cached else WorldviewCache(maxsize=0)
+    monkeypatch.setattr(working_universal_processor, "_worldview_cache", cache)
+    processors = benchmark(_build_processors)
+    assert len({id(p.character_worldview) for p in processors}) == (1 if cached else TRACKS)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Batch Album Generation
+
+Tests that create_conceptual_albums_batch returns one entry per document in
+input order, reports per-document errors, processes identical documents once
+and produces the same albums as create_conceptual_album, in process and
+across worker processes.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server import create_conceptual_album, create_conceptual_albums_batch
+
+from tests.fixtures.mock_contexts import create_mock_context
+
+NARRATIVE = ("Elena walked through the ruined city, remembering her brother. "
+             "The story follows her struggle with grief and hope. ") * 12
+CONCEPT = "The concept of time as an abstract idea and philosophy of meaning; a principle of change. " * 8
+
+
+async def run_batch(documents, **kwargs):
+    ctx = create_mock_context()
+    result = json.loads(await create_conceptual_albums_batch(documents, ctx=ctx, **kwargs))
+    return result, [message.message for message in ctx.info_messages]
+
+
+class TestAlbumBatch:
+    """Test batch album generation"""
+
+    @pytest.mark.asyncio
+    async def test_results_in_order_with_per_document_errors(self):
+        documents = [NARRATIVE, "too short", {"content": CONCEPT, "track_count": 4}, 42, {"content": CONCEPT, "tempo": 1}]
+        result, messages = await run_batch(documents, max_workers=1)
+
+        assert [album["index"] for album in result["albums"]] == [0, 1, 2, 3, 4]
+        assert [album["status"] for album in result["albums"]] == ["completed", "failed", "completed", "failed", "failed"]
+        assert "Content too short" in result["albums"][1]["error"]
+        assert result["albums"][2]["album"]["album_info"]["total_tracks"] == 4
+        assert "tempo" in result["albums"][4]["error"]
+        assert result["batch_summary"]["albums_created"] == 2
+        assert sum(1 for message in messages if message.startswith("Album ")) == 3
+
+    @pytest.mark.asyncio
+    async def test_identical_documents_processed_once(self):
+        result, messages = await run_batch([CONCEPT, NARRATIVE, CONCEPT, {"content": CONCEPT}], max_workers=1)
+
+        assert result["batch_summary"]["unique_documents"] == 2
+        assert sum(1 for message in messages if message.startswith("Album ")) == 2
+        albums = [album["album"] for album in result["albums"]]
+        assert albums[0] == albums[2] == albums[3]
+
+    @pytest.mark.asyncio
+    async def test_matches_single_album_tool(self):
+        expected = json.loads(await create_conceptual_album(CONCEPT, genre="folk", track_count=5, ctx=create_mock_context()))
+        result, _ = await run_batch([CONCEPT], genre="folk", track_count=5, max_workers=1)
+
+        assert result["albums"][0]["album"] == expected
+
+    @pytest.mark.asyncio
+    async def test_worker_processes_match_in_process(self):
+        documents = [NARRATIVE, CONCEPT, "too short", {"content": NARRATIVE, "genre": "jazz"}]
+        in_process, _ = await run_batch(documents, max_workers=1)
+        pooled, messages = await run_batch(documents, max_workers=2)
+
+        assert pooled["batch_summary"]["workers"] == 2
+        assert pooled["albums"] == in_process["albums"]
+        assert sum(1 for message in messages if message.startswith("Album ")) == 4
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_and_oversized_batches(self):
+        empty, _ = await run_batch([])
+        oversized, _ = await run_batch([CONCEPT] * 501)
+
+        assert "error" in empty
+        assert "at most" in oversized["error"]
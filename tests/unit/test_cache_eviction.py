@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Incremental Cache Eviction
+
+Tests the EvictionIndex heap and that EnhancedCacheManager keeps it in step with
+its cache entries, evicts cold and large entries before hot and priority ones,
+and removes a whole batch of victims with a single index write.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_cache_manager import CacheConfig, EnhancedCacheManager, EvictionIndex
+
+
+@pytest_asyncio.fixture
+async def manager(tmp_path):
+    cache_manager = EnhancedCacheManager(str(tmp_path), CacheConfig(max_entries=10, priority_patterns=["pinned"]))
+    await cache_manager.initialize()
+    yield cache_manager
+    await cache_manager.cleanup()
+
+
+async def _add(manager, url, size=10, age_days=0):
+    path = manager.cache_root / "general" / f"{url}.html"
+    path.write_text("x" * size)
+    return await manager.add_file(url, str(path), datetime.now() - timedelta(days=age_days))
+
+
+class TestEvictionIndex:
+    """Test heap ordering, re-keying and size tracking"""
+
+    def test_pops_lowest_key_and_pinned_last(self):
+        index = EvictionIndex()
+        index.update("warm", 5.0, 10)
+        index.update("pinned", -100.0, 10, pinned=True)
+        index.update("cold", 1.0, 10)
+
+        assert [index.pop_victim() for _ in range(4)] == ["cold", "warm", "pinned", None]
+        assert index.total_size_bytes == 0
+
+    def test_rekey_and_discard_skip_stale_records(self):
+        index = EvictionIndex()
+        index.update("a", 1.0, 10)
+        index.update("b", 2.0, 30)
+        index.update("a", 3.0, 20)
+        index.discard("b")
+
+        assert len(index) == 1
+        assert index.total_size_bytes == 20
+        assert index.pop_victim() == "a"
+        assert index.pop_victim() is None
+
+    def test_heap_is_compacted_under_repeated_updates(self):
+        index = EvictionIndex()
+        for i in range(10000):
+            index.update("hot", float(i), 10)
+
+        assert len(index._heap) <= 2 * len(index) + 65
+
+
+class TestEnhancedCacheEviction:
+    """Test cleanup through the eviction index"""
+
+    @pytest.mark.asyncio
+    async def test_cleanup_evicts_cold_entries_first(self, manager):
+        await _add(manager, "pinned", age_days=30)
+        await _add(manager, "hot", age_days=30)
+        for _ in range(5):
+            await manager.get_file_path("hot")
+        for i in range(6):
+            await _add(manager, f"fresh-{i}")
+        await _add(manager, "stale", age_days=30)
+
+        # Nine entries are over the 80% threshold, so adding another first cleans down to 70%
+        await _add(manager, "trigger")
+
+        remaining = set(await manager.list_cached_urls())
+        assert len(remaining) == 8
+        assert {"pinned", "hot", "trigger"} <= remaining
+        assert "stale" not in remaining
+        assert manager.metrics.evicted_entries == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_eviction_writes_index_once(self, manager):
+        for i in range(8):
+            await _add(manager, f"entry-{i}", age_days=i)
+
+        writes = []
+        original_save = manager._save_cache_index
+
+        async def counting_save():
+            writes.append(True)
+            await original_save()
+
+        manager._save_cache_index = counting_save
+        manager.config.max_entries = 4
+        removed = await manager._intelligent_cleanup()
+
+        assert removed == 6
+        assert len(writes) == 1
+        assert set(await manager.list_cached_urls()) == {"entry-0", "entry-1"}
+
+    @pytest.mark.asyncio
+    async def test_index_follows_removals_and_size_changes(self, manager):
+        await _add(manager, "a", size=100)
+        await _add(manager, "b", size=50)
+        await manager.remove_file("a")
+        await manager.cleanup_old_files(max_age_hours=0)
+
+        assert len(manager._eviction_index) == len(manager._cache_entries) == 0
+        assert manager._eviction_index.total_size_bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_index_is_rebuilt_from_persisted_state(self, tmp_path, manager):
+        await _add(manager, "a", age_days=2)
+        await _add(manager, "b")
+        await manager.get_file_path("a")
+        await manager.cleanup()
+
+        reloaded = EnhancedCacheManager(str(tmp_path), CacheConfig(max_entries=10))
+        await reloaded.initialize()
+        try:
+            assert len(reloaded._eviction_index) == 2
+            assert reloaded._eviction_index.total_size_bytes == 20
+        finally:
+            await reloaded.cleanup()
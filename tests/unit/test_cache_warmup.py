@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Prefetching Cache Warm-up
+
+Tests that EnhancedCacheManager.warm_cache downloads missing and stale pages
+from a local stand-in wiki through WikiDownloader with bounded concurrency,
+re-parses only those pages, and holds off while tool calls are in flight.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_cache_manager import CacheConfig, EnhancedCacheManager
+from mcp_tool_activity import ToolActivityTracker
+from mcp_tool_decorator import mcp_tool_with_error_handling
+from wiki_data_models import Genre
+from wiki_data_system import WikiDataManager
+from wiki_downloader import WikiDownloader
+
+
+class StandInWiki:
+    """Local wiki server that records requests and peak concurrency"""
+
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+        self.requests = []
+        self.active = 0
+        self.peak_active = 0
+
+    async def handle(self, request):
+        self.requests.append(request.path)
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            return web.Response(text=f"<html><body>{request.path}</body></html>", content_type="text/html")
+        finally:
+            self.active -= 1
+
+
+@pytest_asyncio.fixture
+async def wiki():
+    stand_in = StandInWiki()
+    app = web.Application()
+    app.router.add_get("/{page}", stand_in.handle)
+    server = TestServer(app)
+    await server.start_server()
+    stand_in.url = lambda page: str(server.make_url(f"/{page}"))
+    yield stand_in
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def manager(tmp_path):
+    tracker = ToolActivityTracker()
+    cache_manager = EnhancedCacheManager(str(tmp_path), CacheConfig(warmup_max_concurrent=2, warmup_idle_seconds=0.05),
+                                         activity_tracker=tracker)
+    cache_manager.downloader = WikiDownloader(cache_manager=cache_manager, max_retries=1)
+    await cache_manager.initialize()
+    yield cache_manager
+    await cache_manager.downloader.cleanup()
+    await cache_manager.cleanup()
+
+
+class TestCacheWarmup:
+    """Test prefetching through the downloader"""
+
+    @pytest.mark.asyncio
+    async def test_prefetches_missing_and_stale_pages_only(self, manager, wiki):
+        fresh, stale = wiki.url("fresh"), wiki.url("stale")
+        for url, age in ((fresh, 0), (stale, 48)):
+            path = manager.get_organized_path(url)
+            with open(path, "w") as f:
+                f.write("cached")
+            await manager.add_file(url, path, datetime.now() - timedelta(hours=age))
+
+        reparsed = []
+
+        async def reparse(urls):
+            reparsed.extend(urls)
+
+        manager.reparse_callback = reparse
+        urls = [fresh, stale] + [wiki.url(f"missing-{i}") for i in range(5)]
+        result = await manager.warm_cache(urls)
+
+        assert result.already_fresh == 1
+        assert result.successful_warmups == 7
+        assert sorted(result.prefetched_urls) == sorted(urls[1:])
+        assert sorted(reparsed) == sorted(urls[1:])
+        assert "/fresh" not in wiki.requests
+        assert wiki.peak_active <= 2
+        for url in urls:
+            assert await manager.get_file_path(url) is not None
+
+    @pytest.mark.asyncio
+    async def test_without_downloader_stale_pages_are_failures(self, manager, wiki):
+        manager.downloader, downloader = None, manager.downloader
+        try:
+            result = await manager.warm_cache([wiki.url("missing")])
+        finally:
+            manager.downloader = downloader
+
+        assert result.successful_warmups == 0
+        assert result.failed_warmups == 1
+        assert wiki.requests == []
+
+    @pytest.mark.asyncio
+    async def test_failed_downloads_are_reported(self, manager, wiki):
+        result = await manager.warm_cache([wiki.url("ok"), wiki.url("ok").replace("/ok", "/nested/missing")])
+
+        assert result.prefetched_urls == [wiki.url("ok")]
+        assert result.failed_warmups == 1
+        assert "HTTP 404" in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_idle_warmup_waits_for_tool_calls(self, manager, wiki):
+        tracker = manager._activity_tracker
+        with tracker.tool_call():
+            warmup = asyncio.create_task(manager.warm_cache([wiki.url("page")], wait_for_idle=True))
+            await asyncio.sleep(0.2)
+            assert wiki.requests == []
+
+        result = await asyncio.wait_for(warmup, timeout=5)
+        assert result.prefetched_urls == [wiki.url("page")]
+
+
+class TestToolActivityTracker:
+    """Test in-flight tool call tracking"""
+
+    @pytest.mark.asyncio
+    async def test_wait_until_idle(self):
+        tracker = ToolActivityTracker()
+        with tracker.tool_call():
+            assert tracker.in_flight == 1
+            assert tracker.idle_seconds() == 0.0
+            assert not await tracker.wait_until_idle(timeout=0.05)
+
+        assert await tracker.wait_until_idle(0.01, timeout=1)
+
+    def test_nested_tool_call_counts_once(self):
+        tracker = ToolActivityTracker()
+        with tracker.tool_call():
+            with tracker.tool_call():
+                assert tracker.in_flight == 1
+            assert tracker.in_flight == 1
+            assert tracker.idle_seconds() == 0.0
+
+        assert tracker.in_flight == 0
+        assert tracker.total_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_decorated_tools_are_tracked(self, monkeypatch):
+        import mcp_tool_decorator
+
+        tracker = ToolActivityTracker()
+        monkeypatch.setattr(mcp_tool_decorator, "get_tool_activity_tracker", lambda: tracker)
+        seen = []
+
+        @mcp_tool_with_error_handling("probe")
+        async def probe() -> str:
+            seen.append(tracker.in_flight)
+            return "ok"
+
+        assert await probe() == "ok"
+        assert seen == [1]
+        assert tracker.in_flight == 0
+        assert tracker.total_calls == 1
+
+
+class TestReparsePages:
+    """Test that only refreshed pages are re-parsed"""
+
+    @pytest.mark.asyncio
+    async def test_reparse_replaces_items_from_refreshed_pages(self, tmp_path, manager, wiki):
+        class PageParser:
+            def __init__(self):
+                self.parsed = []
+
+            def parse_genre_page(self, html):
+                self.parsed.append(html)
+                return [Genre(name="refreshed", description="")]
+
+        old_page, kept_page = wiki.url("genres-a"), wiki.url("genres-b")
+        for url in (old_page, kept_page):
+            path = manager.get_organized_path(url)
+            with open(path, "w") as f:
+                f.write(url)
+            await manager.add_file(url, path)
+
+        data_manager = WikiDataManager()
+        data_manager.config = type("Config", (), {"genre_pages": ["genres-"], "meta_tag_pages": [], "tip_pages": []})()
+        data_manager.storage_path = tmp_path
+        data_manager.cache_manager = manager
+        data_manager.parser = PageParser()
+        data_manager._genres = [Genre(name="stale", description="", source_url=old_page),
+                                Genre(name="kept", description="", source_url=kept_page)]
+
+        await data_manager.reparse_pages([old_page])
+
+        assert data_manager.parser.parsed == [old_page]
+        assert sorted(genre.name for genre in data_manager._genres) == ["kept", "refreshed"]
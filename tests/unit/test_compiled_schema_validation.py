@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Compiled Schema Validation
+
+Tests that the specialized validators produced by compile_schema accept and
+reject exactly the data the schema interpreter does, allocate nothing for valid
+data, and that trusted internal data skips schema validation.
+"""
+
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from mcp_data_validation import MCPDataValidator, ValidationResult, compile_schema
+from mcp_format_conversion import FormatConverter
+from standard_character_profile import StandardCharacterProfile
+
+
+def _interpreter_is_valid(validator, data, schema, context):
+    result = ValidationResult()
+    validator._validate_against_schema(data, schema, result, context)
+    return result.is_valid
+
+
+def _character_data():
+    return StandardCharacterProfile(
+        name="Mara Quinn",
+        backstory="Raised in a lighthouse on the northern coast.",
+        motivations=["find her brother"],
+        fears=["open water"],
+        mannerisms=["taps the table"],
+        confidence_score=0.8
+    ).to_dict()
+
+
+# Field replacements covering missing, wrong type, length and range failures
+CHARACTER_MUTATIONS = [
+    ('name', None),
+    ('name', ''),
+    ('name', '   '),
+    ('name', ' x '),
+    ('name', 42),
+    ('aliases', 'not a list'),
+    ('aliases', []),
+    ('backstory', ['wrong']),
+    ('confidence_score', 1.5),
+    ('confidence_score', -0.1),
+    ('confidence_score', 0),
+    ('confidence_score', True),
+    ('confidence_score', float('nan')),
+    ('confidence_score', '0.5'),
+    ('importance_score', 1),
+    ('unknown_field', object()),
+]
+
+SUNO_MUTATIONS = [
+    ('commands', None),
+    ('commands', []),
+    ('commands', ['[Verse] rain']),
+    ('commands', 'a string'),
+    ('metadata', []),
+    ('generation_notes', {}),
+]
+
+
+class TestCompiledSchemaValidation:
+    """Test compiled validators against the schema interpreter"""
+
+    @pytest.mark.parametrize("field_name,value", CHARACTER_MUTATIONS)
+    def test_character_profile_matches_interpreter(self, field_name, value):
+        validator = MCPDataValidator()
+        data = _character_data()
+        if value is None:
+            del data[field_name]
+        else:
+            data[field_name] = value
+
+        assert validator._check_character_profile(data) == _interpreter_is_valid(
+            validator, data, validator.character_profile_schema, "character_profile"
+        )
+
+    @pytest.mark.parametrize("field_name,value", SUNO_MUTATIONS)
+    def test_suno_command_matches_interpreter(self, field_name, value):
+        validator = MCPDataValidator()
+        data = {'commands': ['[Verse] rain on the harbor'], 'metadata': {}}
+        if value is None:
+            del data[field_name]
+        else:
+            data[field_name] = value
+
+        assert validator._check_suno_command(data) == _interpreter_is_valid(
+            validator, data, validator.suno_command_schema, "suno_command"
+        )
+
+    def test_invalid_data_still_reports_detailed_issues(self):
+        validator = MCPDataValidator()
+        data = _character_data()
+        data['confidence_score'] = 3.0
+        data['aliases'] = "Mara"
+
+        result = validator.validate_character_profile(data)
+
+        assert not result.is_valid
+        assert {issue.field for issue in result.get_errors()} == {'aliases', 'confidence_score'}
+
+    def test_valid_data_check_allocates_nothing(self):
+        validator = MCPDataValidator()
+        characters = [_character_data() for _ in range(200)]
+        check = validator._check_character_profile
+        check(characters[0])
+
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            for data in characters:
+                assert check(data)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Nothing per character; allow a little slack for interpreter bookkeeping
+        assert peak - before < 1024
+
+    def test_compiled_source_is_inspectable(self):
+        check = compile_schema({'title': {'type': str, 'required': True, 'min_length': 1}}, "album-title")
+
+        assert check.__name__ == "check_album_title"
+        assert "def check_album_title(data):" in check.schema_source
+        assert check({'title': 'Tides'})
+        assert not check({'title': ' '})
+        assert not check({})
+
+
+class TestTrustedValidation:
+    """Test that trusted internal data skips schema validation"""
+
+    def test_trusted_skips_schema_but_keeps_content_checks(self):
+        validator = MCPDataValidator()
+        data = {'name': 'test', 'aliases': 'not a list'}
+
+        untrusted = validator.validate_character_profile(data)
+        trusted = validator.validate_character_profile(data, trusted=True)
+
+        assert not untrusted.is_valid
+        assert trusted.is_valid
+        assert [issue.field for issue in trusted.issues] == ['name', 'skin_layer', 'flesh_layer', 'core_layer']
+
+    def test_pipeline_profiles_validate_the_same_when_trusted(self):
+        validator = MCPDataValidator()
+        for raw in ({'name': ''}, {'name': 7, 'confidence_score': 4}, {'name': 'Ana', 'fears': 'dark, heights'}):
+            data = StandardCharacterProfile.from_dict(dict(raw)).to_dict()
+
+            assert (validator.validate_character_profile(data, trusted=True).to_dict()
+                    == validator.validate_character_profile(data).to_dict())
+
+    def test_converter_uses_trusted_validation(self):
+        converter = FormatConverter()
+        calls = []
+        original = converter.validator.validate_character_profile
+
+        def recording(data, trusted=False):
+            calls.append(trusted)
+            return original(data, trusted=trusted)
+
+        converter.validator.validate_character_profile = recording
+        profile, result = converter.convert_to_standard_character_profile({'name': 'Mara', 'backstory': 'Coast'})
+
+        assert profile.name == 'Mara'
+        assert result.is_valid
+        assert calls == [True]
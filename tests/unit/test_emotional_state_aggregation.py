@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Bounded Emotional State Extraction
+
+Tests that EmotionalBeatEngine clusters nearby fact matches, keeps only the
+top-k most reinforced states per fact type, and stays bounded in output size
+and memory as the input text grows.
+"""
+
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server import (
+    MAX_STATES_PER_FACT_TYPE,
+    EmotionalBeatEngine,
+    EmotionalState,
+    MatchClusterAggregator,
+)
+
+PARAGRAPH = (
+    "She lost her brother to the sea that winter. "
+    "Years later she won the regatta he had always dreamed of, "
+    "but she truly felt he had betrayed her by leaving. "
+    "The harbor was quiet for a long while after that, and the boats stayed tied. "
+)
+
+
+class TestMatchClusterAggregator:
+    """Test clustering and top-k selection"""
+
+    def test_nearby_matches_fold_into_one_cluster(self):
+        aggregator = MatchClusterAggregator(top_k=3, window_chars=100)
+        for start in (0, 10, 90, 150, 400):
+            aggregator.add("loss", start, start + 4)
+
+        clusters = aggregator.clusters()["loss"]
+
+        assert [(cluster.start, cluster.count) for cluster in clusters] == [(0, 3), (150, 1), (400, 1)]
+        assert aggregator.total_matches == 5
+
+    def test_keeps_most_reinforced_clusters_earliest_first_on_ties(self):
+        aggregator = MatchClusterAggregator(top_k=2, window_chars=10)
+        for start in (0, 100, 101, 102, 200, 300, 301):
+            aggregator.add("loss", start, start + 1)
+
+        clusters = aggregator.clusters()["loss"]
+
+        # Counts: 0->1, 100->3, 200->1, 300->2; kept in text order
+        assert [(cluster.start, cluster.count) for cluster in clusters] == [(100, 3), (300, 2)]
+
+    def test_labels_are_independent_and_keep_first_seen_order(self):
+        aggregator = MatchClusterAggregator(top_k=1)
+        aggregator.add("joy", 50, 53)
+        aggregator.add("loss", 0, 4)
+        aggregator.add("joy", 60, 63)
+
+        clusters = aggregator.clusters()
+
+        assert list(clusters) == ["joy", "loss"]
+        assert clusters["joy"][0].count == 2
+
+    def test_label_order_does_not_depend_on_when_clusters_close(self):
+        aggregator = MatchClusterAggregator(top_k=3, window_chars=10)
+        aggregator.add("loss", 0, 4)
+        aggregator.add("joy", 100, 103)
+        aggregator.add("joy", 200, 203)  # Closes the first joy cluster while loss is still open
+
+        assert list(aggregator.clusters()) == ["loss", "joy"]
+
+
+class TestBoundedEmotionalFacts:
+    """Test EmotionalBeatEngine extraction on short and long texts"""
+
+    def test_short_text_states_are_unchanged(self):
+        states = EmotionalBeatEngine().analyze_emotional_facts("She lost her home in the flood.")
+
+        assert len(states) == 1
+        assert states[0].primary_emotion == "grief"
+        assert states[0].occurrences == 1
+        assert states[0].factual_triggers == ["She lost her home in the flood."]
+
+    def test_states_follow_fact_type_then_text_order(self):
+        text = "She lost her home. " + "The road went on. " * 20 + "He won the race. " + \
+            "The road went on. " * 20 + "He won again."
+        states = EmotionalBeatEngine().analyze_emotional_facts(text)
+
+        # As before clustering: fact types in pattern order, each type's states in text order
+        assert [state.primary_emotion for state in states] == ["grief", "joy", "joy"]
+
+    def test_long_text_output_is_bounded(self):
+        engine = EmotionalBeatEngine()
+        short_states = engine.analyze_emotional_facts(PARAGRAPH * 5)
+        long_states = engine.analyze_emotional_facts(PARAGRAPH * 2000)
+
+        # Only loss, achievement and betrayal map to states
+        assert len(long_states) <= 3 * MAX_STATES_PER_FACT_TYPE
+        assert len(long_states) == len(short_states)
+        assert {state.primary_emotion for state in long_states} == {"grief", "joy", "anger"}
+
+    def test_factual_events_are_bounded_and_counted(self):
+        events = EmotionalBeatEngine()._extract_factual_events(PARAGRAPH * 1000, top_k=2)
+
+        assert len(events) <= 5 * 2
+        assert all(event['occurrences'] >= 1 for event in events)
+        assert sum(event['occurrences'] for event in events) < 5 * 1000 * 2
+
+    def test_occurrences_round_trip_through_dicts(self):
+        state = EmotionalBeatEngine().analyze_emotional_facts(PARAGRAPH)[0]
+        assert EmotionalState(**state.to_dict()) == state
+
+    @pytest.mark.parametrize("repeats", [500])
+    def test_extraction_memory_does_not_grow_with_input(self, repeats):
+        engine = EmotionalBeatEngine()
+
+        def peak_bytes(text):
+            engine.analyze_emotional_facts(text)
+            tracemalloc.start()
+            try:
+                engine.analyze_emotional_facts(text)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small = peak_bytes(PARAGRAPH * repeats)
+        large = peak_bytes(PARAGRAPH * repeats * 10)
+
+        assert large < small * 2
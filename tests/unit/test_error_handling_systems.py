@@ -37,6 +37,7 @@ from retry_system import (
     CircuitState,
     OperationType,
     RetryPolicy,
+    RetrySession,
     RetryStrategy,
     RetrySystem,
 )
@@ -377,13 +378,17 @@ class TestRetrySystem:
 
     def test_retry_statistics(self, retry_system):
         """Test getting retry statistics"""
-        # Add some mock sessions
-        retry_system.retry_sessions.extend([
-            Mock(final_success=True, total_attempts=1, operation_type=OperationType.DOWNLOAD,
-                 start_time=datetime.now(), duration=timedelta(seconds=1)),
-            Mock(final_success=False, total_attempts=3, operation_type=OperationType.PARSE,
-                 start_time=datetime.now(), duration=timedelta(seconds=5))
-        ])
+        # Complete some sessions
+        now = datetime.now()
+        for success, attempts, operation_type, seconds in [
+            (True, 1, OperationType.DOWNLOAD, 1),
+            (False, 3, OperationType.PARSE, 5)
+        ]:
+            retry_system._complete_session(RetrySession(
+                operation_id=f"op_{operation_type.value}", operation_type=operation_type,
+                start_time=now, end_time=now + timedelta(seconds=seconds),
+                total_attempts=attempts, final_success=success
+            ))
 
         stats = retry_system.get_retry_statistics()
 
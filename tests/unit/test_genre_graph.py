@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Genre Graph
+
+Tests that GenreGraph answers similar-genre, parent, related-genre and fuzzy
+name queries exactly as EnhancedGenreMapper's full scans over every genre did,
+and that the mapper rebuilds it when the wiki data version changes.
+"""
+
+import os
+import random
+import sys
+from difflib import SequenceMatcher
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_genre_mapper import PARENT_GENRE_PATTERNS, EnhancedGenreMapper, GenreGraph
+from wiki_data_models import Genre
+
+BASES = ['rock', 'metal', 'jazz', 'pop', 'folk', 'blues', 'punk', 'house', 'techno', 'soul', 'ambient', 'trap']
+PREFIXES = ['alternative', 'indie', 'hard', 'progressive', 'art', 'dark', 'smooth', 'free', 'death', 'doom',
+            'acoustic', 'traditional', 'dance', 'synth', 'electric', 'delta', 'hardcore', 'post']
+WORDS = ['driving', 'melancholic', 'loud', 'mellow', 'groovy', 'raw', 'lush', 'sparse', 'fast', 'slow']
+INSTRUMENTS = ['guitar', 'bass', 'drums', 'synth', 'piano', 'saxophone', 'violin', 'vocals']
+
+
+def make_genres(count, seed=7):
+    rng = random.Random(seed)
+    names = ['rock', 'jazz', 'electronic', 'metal', 'folk']
+    while len(names) < count:
+        words = rng.sample(PREFIXES, rng.randint(0, 2)) + [rng.choice(BASES)]
+        names.append(' '.join(words))
+    genres = []
+    for i, name in enumerate(names):
+        genres.append(Genre(
+            name=name.title() if i % 3 else name,
+            description=' '.join(rng.sample(WORDS, 4)),
+            subgenres=[rng.choice(names).title() for _ in range(rng.randint(0, 2))],
+            characteristics=rng.sample(WORDS, 3),
+            typical_instruments=rng.sample(INSTRUMENTS, 3),
+            mood_associations=rng.sample(WORDS, 2),
+        ))
+    return genres
+
+
+def mapper_for(genres):
+    mapper = EnhancedGenreMapper(Mock())
+    mapper._genres_cache = genres
+    return mapper
+
+
+def scan_similar(mapper, genres, target, max_results, threshold):
+    similarities = []
+    for genre in genres:
+        if genre.name.lower() == target.name.lower():
+            continue
+        combined = (mapper._calculate_content_similarity(target, genre) * 0.3 +
+                    mapper._calculate_structural_similarity(target, genre) * 0.25 +
+                    mapper._calculate_genre_semantic_similarity(target, genre) * 0.25 +
+                    mapper._calculate_hierarchical_similarity(target, genre) * 0.2)
+        if combined >= threshold:
+            similarities.append((genre, combined))
+    similarities.sort(key=lambda x: x[1], reverse=True)
+    return similarities[:max_results]
+
+
+def scan_parents(mapper, genres, genre):
+    genre_names = [g.name.lower() for g in genres]
+    parents = [parent for parent, children in PARENT_GENRE_PATTERNS.items()
+               if any(child in genre.name.lower() for child in children) and parent in genre_names]
+    for other in genres:
+        if other.subgenres and genre.name in other.subgenres and other.name not in parents:
+            parents.append(other.name)
+    for part in mapper._extract_compound_genre_parts(genre.name):
+        if part in genre_names and part not in parents:
+            parents.append(part)
+    return parents
+
+
+def scan_related(mapper, genres, genre):
+    scores = []
+    for other in genres:
+        if other.name == genre.name:
+            continue
+        combined = (mapper._calculate_content_similarity(genre, other) * 0.4 +
+                    mapper._calculate_genre_semantic_similarity(genre, other) * 0.4 +
+                    mapper._calculate_hierarchical_similarity(genre, other) * 0.2)
+        if combined > 0.3:
+            scores.append((other.name, combined))
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return [name for name, _ in scores[:8]]
+
+
+def scan_fuzzy(genres, name, threshold):
+    best, best_ratio = None, 0.0
+    for genre in genres:
+        if genre.name.lower() == name.lower():
+            return genre
+        ratio = SequenceMatcher(None, name.lower(), genre.name.lower()).ratio()
+        if ratio > best_ratio and ratio >= threshold:
+            best, best_ratio = genre, ratio
+    return best
+
+
+class TestGenreGraphEquivalence:
+    """Test graph lookups against full scans"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_results,threshold", [(3, 0.3), (5, 0.2), (16, 0.0), (25, 0.2)])
+    async def test_similar_genres_match_full_scan(self, max_results, threshold):
+        genres = make_genres(150)
+        mapper = mapper_for(genres)
+
+        for genre in genres[::5]:
+            target = mapper._find_genre_by_name(genre.name)
+            expected = scan_similar(mapper, genres, target, max_results, threshold)
+            actual = await mapper.find_similar_genres(genre.name, max_results, threshold)
+            assert [(g.name, score) for g, score in actual] == [(g.name, score) for g, score in expected]
+
+    @pytest.mark.asyncio
+    async def test_hierarchy_matches_full_scan(self):
+        genres = make_genres(150)
+        mapper = mapper_for(genres)
+
+        for genre in genres[::3]:
+            hierarchy = await mapper.get_genre_hierarchy(genre.name)
+            target = mapper._find_genre_by_name(genre.name)
+            assert hierarchy.parent_genres == scan_parents(mapper, genres, target)
+            assert hierarchy.related_genres == scan_related(mapper, genres, target)
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_lookup_matches_full_scan(self):
+        genres = make_genres(150)
+        mapper = mapper_for(genres)
+        queries = ['Alt Rock', 'progresive metal', 'Jaz', 'indie folks', 'Dark Ambiant', 'rock', 'zzz']
+
+        for query in queries:
+            for threshold in (0.5, 0.6, 0.8):
+                expected = scan_fuzzy(genres, query, threshold)
+                assert await mapper._fuzzy_find_genre(query, threshold) is expected
+
+
+class TestGenreGraph:
+    """Test graph construction and rebuilding"""
+
+    def test_neighbors_are_kept_per_genre(self):
+        graph = GenreGraph(make_genres(40))
+        indexes, scores = graph.neighbors(0)
+
+        assert graph.neighbors(0)[0] is indexes
+        assert len(indexes) == len(scores) == 16
+        assert list(scores) == sorted(scores, reverse=True)
+
+    def test_first_genre_wins_duplicate_names(self):
+        genres = [Genre(name="Rock", description="first"), Genre(name="rock", description="second")]
+        graph = GenreGraph(genres)
+
+        assert graph.index_by_name["rock"] == 0
+        assert graph.rank_similar(graph.features[0], 5)[0].tolist() == []
+
+    @pytest.mark.asyncio
+    async def test_graph_follows_wiki_data_version(self):
+        manager = Mock()
+        manager.data_version = 1
+        manager.get_genres = AsyncMock(return_value=make_genres(20))
+        mapper = EnhancedGenreMapper(manager)
+
+        await mapper.find_similar_genres("rock")
+        first_graph = mapper._genre_graph
+        await mapper.find_similar_genres("jazz")
+        assert mapper._genre_graph is first_graph
+        assert manager.get_genres.await_count == 1
+
+        manager.data_version = 2
+        manager.get_genres.return_value = make_genres(30, seed=11)
+        await mapper.find_similar_genres("rock")
+        assert manager.get_genres.await_count == 2
+        assert mapper._genre_graph is not first_graph
+        assert mapper._genre_graph.size == 30
+
+    def test_assigned_genre_list_rebuilds_graph(self):
+        mapper = mapper_for(make_genres(20))
+        assert mapper._find_genre_by_name("ROCK") is mapper._genres_cache[0]
+
+        mapper._genres_cache = [Genre(name="Polka", description="")]
+        assert mapper._find_genre_by_name("polka").name == "Polka"
+        assert mapper._find_genre_by_name("rock") is None
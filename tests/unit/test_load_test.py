@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the MCP Load-Test Harness
+
+Tests percentile and per-tool summaries, that a seed fixes the requests sent,
+short open- and closed-loop stages against the in-process server, and the
+comparison of two runs' results.
+"""
+
+import copy
+import os
+import random
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastmcp import Client
+
+from scripts.load_test import (
+    LoadTestConfig,
+    LoadTestRunner,
+    Stage,
+    ToolStats,
+    compare_results,
+    percentile,
+    run_load_test,
+)
+
+
+class TestStatistics:
+    """Test percentiles and per-tool summaries"""
+
+    def test_nearest_rank_percentiles(self):
+        values = [i / 1000 for i in range(1, 1001)]
+        assert percentile(values, 50) == 0.5
+        assert percentile(values, 99) == 0.99
+        assert percentile(values, 99.9) == 0.999
+        assert percentile([0.2], 99.9) == 0.2
+        assert percentile([], 50) is None
+
+    def test_tool_summary(self):
+        stats = ToolStats()
+        for latency in (0.1, 0.2, 0.3):
+            stats.record(latency, None)
+        stats.record(0.0, "timeout")
+
+        summary = stats.summary(elapsed=2.0)
+        assert summary["requests"] == 4 and summary["errors"] == 1
+        assert summary["error_rate"] == 0.25
+        assert summary["throughput_rps"] == 1.5
+        assert summary["p50_ms"] == pytest.approx(200.0)
+        assert summary["p99.9_ms"] == pytest.approx(300.0)
+        assert summary["error_kinds"] == {"timeout": 1}
+
+
+class TestRequests:
+    """Test the request mix"""
+
+    def test_seed_fixes_requests(self):
+        runner = LoadTestRunner(client=None, config=LoadTestConfig(input_pool_size=4))
+        runner.pool.characters_json = runner.pool.personas_json = ["{}"] * 4
+
+        def requests(seed):
+            rng = random.Random(seed)
+            return [runner._next_request(rng) for _ in range(50)]
+
+        assert requests(1) == requests(1)
+        assert requests(1) != requests(2)
+        assert {tool for tool, _ in requests(1)} >= {"analyze_character_text", "create_suno_commands"}
+
+    def test_unknown_category(self):
+        with pytest.raises(ValueError, match="Unknown request categories: lyrics"):
+            LoadTestRunner(client=None, config=LoadTestConfig(mix={"lyrics": 1}))
+
+
+class TestStages:
+    """Test stages against the in-process server"""
+
+    @pytest.mark.asyncio
+    async def test_open_and_closed_loop_stages(self):
+        import server
+
+        config = LoadTestConfig(
+            mix={"analysis": 1, "wiki": 1},
+            stages=[Stage("open", 10, 1.0), Stage("closed", 2, 1.0)],
+            input_pool_size=2,
+            warmup_requests=2,
+        )
+        results = await run_load_test(config, client=Client(server.mcp))
+
+        open_stage, closed_stage = results["stages"]
+        assert open_stage["mode"] == "open" and closed_stage["mode"] == "closed"
+        assert open_stage["offered_requests"] > 0 and open_stage["dropped"] == 0
+        assert set(open_stage["tools"]) <= {"analyze_character_text", "crawl_suno_wiki_best_practices"}
+        for stage in results["stages"]:
+            overall = stage["all"]
+            assert overall["requests"] > 0 and overall["error_rate"] == 0.0
+            assert overall["p50_ms"] <= overall["p95_ms"] <= overall["p99_ms"] <= overall["p99.9_ms"]
+        assert results["config"]["stages"][0] == {"mode": "open", "level": 10, "duration": 1.0}
+
+
+class TestComparison:
+    """Test comparing two runs"""
+
+    @staticmethod
+    def results(p99_ms, throughput_rps, seed=42):
+        summary = {"p50_ms": 10.0, "p99_ms": p99_ms, "throughput_rps": throughput_rps, "error_rate": 0.0}
+        return {
+            "config": {"seed": seed, "transport": "inprocess", "stages": []},
+            "stages": [{"mode": "open", "level": 5, "duration": 10, "tools": {"analyze_character_text": summary},
+                        "all": summary}],
+        }
+
+    def test_regressions_flagged(self):
+        baseline = self.results(p99_ms=100.0, throughput_rps=5.0)
+        comparison = compare_results(self.results(p99_ms=105.0, throughput_rps=5.0), baseline)
+        assert comparison["comparable"]
+        assert not any(row["regression"] for row in comparison["rows"])
+
+        comparison = compare_results(self.results(p99_ms=150.0, throughput_rps=5.0), baseline)
+        assert [row["tool"] for row in comparison["rows"] if row["regression"]] == ["analyze_character_text", "all"]
+        assert comparison["rows"][0]["p99_ms"] == (100.0, 150.0, 0.5)
+
+        errors = copy.deepcopy(baseline)
+        errors["stages"][0]["all"] = dict(errors["stages"][0]["all"], error_rate=0.1)
+        assert compare_results(errors, baseline)["rows"][-1]["regression"]
+
+    def test_different_requests_not_comparable(self):
+        comparison = compare_results(self.results(100.0, 5.0, seed=1), self.results(100.0, 5.0))
+        assert not comparison["comparable"]
+        assert comparison["differing_options"] == ["seed"]
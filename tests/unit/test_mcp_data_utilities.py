@@ -78,6 +78,27 @@ class TestMcpDataUtilitiesIntegration:
         assert True
 
 
+class TestMcpDataManagerWorkflow:
+    """Test the complete workflow of MCPDataManager"""
+
+    def test_workflow_validates_its_own_commands_as_trusted(self, monkeypatch):
+        from mcp_data_utilities import MCPDataManager
+
+        manager = MCPDataManager()
+        calls = []
+        validate = manager.validator.validate_suno_command_data
+        monkeypatch.setattr(manager.validator, "validate_suno_command_data",
+                            lambda data, trusted=False: calls.append(trusted) or validate(data, trusted))
+
+        results = manager.execute_complete_workflow(
+            "Sarah stood at the edge of the pier, remembering her father. She feared the ocean."
+        )
+
+        assert results['success'], results['errors']
+        assert results['steps_completed'][-1] == 'validation'
+        assert calls == [True]
+
+
 # Additional test functions for module-level functions
 def test_module_level_functions():
     """Test module-level functions"""
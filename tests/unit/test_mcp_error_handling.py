@@ -8,7 +8,9 @@ to ensure it works correctly with various error scenarios.
 
 import asyncio
 import json
+import logging
 import os
+import shutil
 import tempfile
 from unittest.mock import AsyncMock, Mock
 
@@ -17,8 +19,11 @@ import pytest
 # Import the error handling components
 from mcp_error_handler import (
     ErrorContext,
+    LazyLogValue,
     MCPErrorHandler,
+    bounded_repr,
     create_format_mismatch_error,
+    sanitize_input_for_log,
 )
 from mcp_error_recovery import (
     MCPErrorRecovery,
@@ -43,6 +48,7 @@ class TestMCPErrorHandler:
 
     def teardown_method(self):
         """Cleanup after each test method"""
+        self.error_handler.close()
         # Remove temporary log file
         if os.path.exists(self.temp_log.name):
             os.unlink(self.temp_log.name)
@@ -59,6 +65,7 @@ class TestMCPErrorHandler:
         input_data = {"text": "test input", "param": "value"}
 
         self.error_handler.log_tool_entry("test_tool", "test_function", input_data)
+        self.error_handler.flush()
 
         # Check that log file contains entry
         with open(self.temp_log.name, 'r') as f:
@@ -125,6 +132,139 @@ class TestMCPErrorHandler:
         assert "most_common_error_type" in stats
         assert "error_trends" in stats
 
+class TestQueuedLogging:
+    """Test the queued, lazily formatted logging pipeline"""
+
+    def setup_method(self):
+        """Setup for each test method"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.temp_dir, "tools.log")
+        self.jsonl_path = os.path.join(self.temp_dir, "tools.jsonl")
+
+    def teardown_method(self):
+        """Cleanup after each test method"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_sanitize_never_renders_full_payload(self):
+        """Large structures are truncated without stringifying the whole value"""
+        class ExplodingRepr:
+            def __repr__(self):
+                raise AssertionError("element beyond the truncation limit was rendered")
+
+        payload = {"data": ["x" * 50] * 10 + [ExplodingRepr()]}
+        sanitized = sanitize_input_for_log(payload)
+
+        assert sanitized["data"].endswith("... [truncated]")
+        assert len(sanitized["data"]) == 300 + len("... [truncated]")
+
+    def test_sanitize_keeps_small_structures(self):
+        """Structures under the limit are kept as-is"""
+        payload = {"kwargs": {"text": "short"}, "args": (1, 2)}
+
+        assert sanitize_input_for_log(payload) == payload
+
+    def test_bounded_repr_matches_str(self):
+        """Bounded rendering produces the same text as str() for nested data"""
+        value = {"a": [1, "two", (3,)], "b": {"c": None, "d": 4.5}}
+
+        assert bounded_repr(value, 300) == (str(value), False)
+        assert bounded_repr(value, 10) == (str(value)[:10], True)
+
+    def test_lazy_value_not_computed_when_level_disabled(self):
+        """Lazily logged values are skipped when no handler would emit them"""
+        handler = MCPErrorHandler(self.log_path)
+        calls = []
+        try:
+            handler.logger.debug("DETAIL | %s", LazyLogValue(lambda: calls.append(1) or "value"))
+            handler.logger.setLevel(logging.WARNING)
+            handler.log_tool_entry("tool", "func", {"text": "ignored"})
+            handler.logger.info("SUMMARY | %s", LazyLogValue(lambda: calls.append(2) or "value"))
+            handler.flush()
+        finally:
+            handler.close()
+
+        # Only the DEBUG record passed the logger level, and it was formatted by the file handler
+        assert calls == [1]
+
+    def test_entry_logs_input_as_it_was_at_the_call(self):
+        """Input changed after the entry is logged does not reach the record"""
+        handler = MCPErrorHandler(self.log_path)
+        kwargs = {"tags": ["calm"], "options": {"mode": "fast"}}
+        handler.logger.propagate = False  # Keep other handlers from formatting the record on this thread
+        try:
+            handler._queue_handler.listener.stop()
+            handler.log_tool_entry("tool", "func", {"kwargs": kwargs})
+            kwargs["tags"].append("changed")
+            kwargs["options"]["extra"] = True
+            handler._queue_handler.listener.start()
+            handler.flush()
+        finally:
+            handler.logger.propagate = True
+            handler.close()
+
+        with open(self.log_path) as f:
+            logged = f.read()
+        assert "'tags': ['calm']" in logged
+        assert "changed" not in logged and "extra" not in logged
+
+    def test_structured_jsonl_output(self):
+        """Structured output writes one JSON object per record"""
+        handler = MCPErrorHandler(self.log_path, structured_log_path=self.jsonl_path)
+        try:
+            handler.log_tool_entry("test_tool", "test_function", {"text": "hello"})
+            handler.log_tool_success("test_tool", "test_function", 0.25, "String (5 chars)")
+            handler.flush()
+        finally:
+            handler.close()
+
+        with open(self.jsonl_path) as f:
+            entries = [json.loads(line) for line in f]
+
+        assert [entry["event"] for entry in entries] == ["TOOL_ENTRY", "TOOL_SUCCESS"]
+        assert entries[0]["tool"] == "test_tool"
+        assert "hello" in entries[0]["message"]
+        assert entries[1]["execution_time"] == 0.25
+
+    def test_structured_output_rotates_by_size(self):
+        """Structured output rolls over once it reaches the size limit"""
+        handler = MCPErrorHandler(
+            self.log_path, structured_log_path=self.jsonl_path,
+            structured_log_max_bytes=2000, structured_log_backup_count=2
+        )
+        try:
+            for i in range(100):
+                handler.log_tool_entry("tool", "func", {"index": i, "text": "x" * 100})
+            handler.flush()
+        finally:
+            handler.close()
+
+        assert os.path.exists(self.jsonl_path + ".1")
+        assert os.path.exists(self.jsonl_path + ".2")
+        assert not os.path.exists(self.jsonl_path + ".3")
+        assert os.path.getsize(self.jsonl_path) <= 2000
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        """A full log queue drops records rather than blocking the caller"""
+        handler = MCPErrorHandler(self.log_path, queue_size=1)
+        try:
+            handler._queue_handler.listener.stop()
+            for i in range(5):
+                handler.log_tool_entry("tool", "func", {"index": i})
+            assert handler.dropped_log_records == 4
+        finally:
+            handler._queue_handler.listener.start()
+            handler.close()
+
+    def test_synchronous_mode_writes_immediately(self):
+        """queue_logging=False keeps the direct handler behaviour"""
+        handler = MCPErrorHandler(self.log_path, queue_logging=False)
+        try:
+            handler.log_tool_entry("tool", "func", {"text": "now"})
+            with open(self.log_path) as f:
+                assert "TOOL_ENTRY | tool.func" in f.read()
+        finally:
+            handler.close()
+
 class TestMCPErrorRecovery:
     """Test the error recovery functionality"""
 
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Memory Diagnostics
+
+Tests retained-size estimates, registering component owners, per-component
+size reports, leak-suspect detection, tracemalloc growth attribution to the
+owner's module, the metrics exposition and the MCP resource.
+"""
+
+import json
+import os
+import sys
+import tracemalloc
+from collections import deque
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import memory_diagnostics
+from fastmcp import Client
+from memory_diagnostics import (
+    SUSPECT_MIN_GROWTH_BYTES,
+    SUSPECT_SNAPSHOTS,
+    MemoryDiagnostics,
+    estimate_retained_size,
+)
+from metrics_exposition import MetricsBuilder
+
+
+class Record:
+    def __init__(self, index):
+        self.name = f"record-{index}"
+        self.values = [index] * 10
+
+
+class SlottedRecord:
+    __slots__ = ("payload",)
+
+    def __init__(self, payload):
+        self.payload = payload
+
+
+class Component:
+    """Owner with one growing and one fixed attribute"""
+
+    def __init__(self):
+        self.history = []
+        self.settings = {"mode": "test"}
+
+    def grow(self, count):
+        self.history.extend(Record(i) for i in range(count))
+
+
+class DerivedComponent(Component):
+    pass
+
+
+@pytest.fixture
+def diagnostics():
+    return MemoryDiagnostics()
+
+
+class TestRetainedSize:
+    """Test retained-size estimates"""
+
+    def test_counts_referenced_objects_once(self):
+        shared = "x" * 10_000
+        size, truncated = estimate_retained_size([shared, shared, (shared,)])
+        assert not truncated
+        assert sys.getsizeof(shared) < size < 2 * sys.getsizeof(shared)
+
+    def test_follows_instances_and_slots(self):
+        payload = "y" * 50_000
+        assert estimate_retained_size(Record(1))[0] > sys.getsizeof(Record(1).values)
+        assert estimate_retained_size(SlottedRecord(payload))[0] > len(payload)
+        assert estimate_retained_size(deque([payload]))[0] > len(payload)
+
+    def test_large_containers_are_sampled(self):
+        records = [Record(i) for i in range(5000)]
+        exact, _ = estimate_retained_size(records, sample_items=len(records))
+        sampled, _ = estimate_retained_size(records, sample_items=100)
+        assert sampled == pytest.approx(exact, rel=0.1)
+
+    def test_container_changed_during_walk_is_copied_again(self):
+        class ResizedOnce(dict):
+            copies = 0
+
+            def items(self):
+                ResizedOnce.copies += 1
+                if ResizedOnce.copies == 1:
+                    raise RuntimeError("dictionary changed size during iteration")
+                return super().items()
+
+        payload = "z" * 50_000
+        size, truncated = estimate_retained_size(ResizedOnce(key=payload))
+        assert not truncated and size > len(payload)
+        assert ResizedOnce.copies == 2
+
+    def test_truncated_at_max_objects(self):
+        size, truncated = estimate_retained_size([Record(i) for i in range(100)], max_objects=50)
+        assert truncated and size > 0
+
+
+class TestComponentSizes:
+    """Test per-component reports and leak suspects"""
+
+    def test_register_and_report(self, diagnostics):
+        first, second = Component(), DerivedComponent()
+        first.grow(100)
+        diagnostics.register(first, "history")
+        diagnostics.register(first, "settings")
+        diagnostics.register(second, "history")
+
+        components = diagnostics.component_sizes()
+        component = components["Component"]
+        assert component["instances"] == 1
+        assert component["attributes"]["history"]["items"] == 100
+        assert component["retained_bytes"] == sum(entry["bytes"] for entry in component["attributes"].values())
+        assert components["DerivedComponent"]["attributes"]["history"]["items"] == 0
+
+    def test_owners_are_held_weakly(self, diagnostics):
+        diagnostics.register(Component(), "history")
+        assert diagnostics.component_sizes() == {}
+
+    def test_steady_growth_is_a_suspect(self, diagnostics):
+        component, fixed = Component(), DerivedComponent()
+        diagnostics.register(component, "history", "settings")
+        diagnostics.register(fixed, "history")
+
+        reports = []
+        for _ in range(SUSPECT_SNAPSHOTS + 1):
+            component.grow(SUSPECT_MIN_GROWTH_BYTES // 400)
+            reports.append(diagnostics.snapshot())
+
+        assert all(report["suspects"] == [] for report in reports[:-1])
+        suspects = reports[-1]["suspects"]
+        assert [(s["component"], s["attribute"]) for s in suspects] == [("Component", "history")]
+        assert suspects[0]["growth_bytes"] >= SUSPECT_MIN_GROWTH_BYTES
+
+        diagnostics.snapshot()  # Growth stopped
+        assert diagnostics.latest_report()["suspects"] == []
+
+
+class TestAllocationGrowth:
+    """Test tracemalloc growth attribution"""
+
+    def test_growth_attributed_to_owner_module(self, diagnostics):
+        component = Component()
+        diagnostics.register(component, "history")
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(8)
+        try:
+            first = diagnostics.snapshot()["tracemalloc"]
+            component.grow(20_000)
+            growth = diagnostics.snapshot()["tracemalloc"]
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+        assert "growth_by_owner" not in first
+        assert growth["growth_by_owner"]["Component"] > 1_000_000
+        assert growth["growth_since_baseline_bytes"] > 1_000_000
+        top_site = growth["top_growth_sites"][0]
+        assert top_site["owner"] == "Component"
+        assert top_site["location"].startswith(__file__)
+
+
+class TestExposure:
+    """Test the metrics exposition and the MCP resource"""
+
+    def test_collect_metrics(self, diagnostics):
+        builder = MetricsBuilder()
+        diagnostics.collect_metrics(builder)
+        assert builder.render() == "# EOF\n"
+
+        component = Component()
+        component.grow(10)
+        diagnostics.register(component, "history")
+        diagnostics.snapshot()
+        diagnostics.collect_metrics(builder)
+        assert 'character_music_component_retained_bytes{component="Component",attribute="history"}' \
+            in builder.render()
+
+    @pytest.mark.asyncio
+    async def test_mcp_resource(self, diagnostics, monkeypatch):
+        import server
+
+        component = Component()
+        diagnostics.register(component, "history")
+        monkeypatch.setattr(memory_diagnostics, "_memory_diagnostics", diagnostics)
+
+        async with Client(server.mcp) as client:
+            report = json.loads((await client.read_resource("memory://diagnostics"))[0].text)
+
+        assert report["components"]["Component"]["instances"] == 1
+        assert report["suspects"] == []
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Metrics Exposition
+
+Tests the OpenMetrics and Prometheus text rendering, per-tool latency and
+outcome tracking, the statistics each registered component exposes, the
+optional HTTP endpoint and the MCP resource.
+"""
+
+import os
+import sys
+import urllib.error
+import urllib.request
+from datetime import datetime
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_cache_manager import EnhancedCacheManager
+from error_monitoring_system import ErrorMonitoringSystem, ErrorSeverity
+from fastmcp import Client
+from mcp_tool_decorator import mcp_tool_with_error_handling
+from mcp_tool_metrics import ToolMetrics, get_tool_metrics, mark_current_tool_call_failed
+from metrics_exposition import (
+    CONTENT_TYPE_OPENMETRICS,
+    CONTENT_TYPE_PROMETHEUS,
+    Histogram,
+    MetricsBuilder,
+    MetricsRegistry,
+    get_metrics_registry,
+    start_metrics_server,
+)
+from performance_monitor import PerformanceMonitor
+from retry_system import CircuitBreakerState, CircuitState, OperationType, RetrySession, RetrySystem
+from wiki_cache_manager import WikiCacheManager
+
+
+class StaticSource:
+    """Registry source exposing one fixed counter"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def collect_metrics(self, builder):
+        builder.counter("demo_events", "Demo events", self.value, kind="demo")
+
+
+class TestRendering:
+    """Test the text formats"""
+
+    def test_openmetrics_and_prometheus_formats(self):
+        builder = MetricsBuilder()
+        builder.counter("demo_requests", "Requests", 3, path='say "hi"\\now')
+        builder.gauge("demo_temperature", "Temperature\nin C", 21.5)
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        builder.histogram("demo_latency_seconds", "Latency", histogram, tool="t")
+
+        openmetrics = builder.render().splitlines()
+        assert openmetrics == [
+            '# HELP demo_latency_seconds Latency',
+            '# TYPE demo_latency_seconds histogram',
+            'demo_latency_seconds_bucket{tool="t",le="0.1"} 2',
+            'demo_latency_seconds_bucket{tool="t",le="1.0"} 3',
+            'demo_latency_seconds_bucket{tool="t",le="+Inf"} 4',
+            'demo_latency_seconds_count{tool="t"} 4',
+            'demo_latency_seconds_sum{tool="t"} 2.65',
+            '# HELP demo_requests Requests',
+            '# TYPE demo_requests counter',
+            'demo_requests_total{path="say \\"hi\\"\\\\now"} 3',
+            '# HELP demo_temperature Temperature\\nin C',
+            '# TYPE demo_temperature gauge',
+            'demo_temperature 21.5',
+            '# EOF',
+        ]
+
+        prometheus = builder.render(openmetrics=False)
+        assert '# TYPE demo_requests_total counter' in prometheus
+        assert '# EOF' not in prometheus
+
+    def test_same_series_from_several_sources_add_up(self):
+        builder = MetricsBuilder()
+        first, second = Histogram((1.0,)), Histogram((1.0,))
+        first.observe(0.5)
+        second.observe(5.0)
+        for histogram in (first, second):
+            builder.counter("demo_hits", "Hits", 2, cache="a")
+            builder.histogram("demo_seconds", "Seconds", histogram)
+
+        text = builder.render()
+        assert 'demo_hits_total{cache="a"} 4' in text
+        assert 'demo_seconds_bucket{le="1.0"} 1' in text
+        assert 'demo_seconds_count 2' in text
+        assert first.count == 1  # Sources are never modified
+
+        with pytest.raises(ValueError):
+            builder.gauge("demo_hits", "Hits", 1)
+
+    def test_registry_holds_sources_weakly(self):
+        registry = MetricsRegistry()
+        source = StaticSource(7)
+        registry.register(source)
+
+        assert 'demo_events_total{kind="demo"} 7' in registry.render()
+        del source
+        assert registry.render() == "# EOF\n"
+
+
+class TestToolMetrics:
+    """Test per-tool latency and outcome tracking"""
+
+    def test_outcomes_and_nested_tracking(self):
+        metrics = ToolMetrics()
+
+        with metrics.track("ok_tool"):
+            with metrics.track("ok_tool_inner"):
+                pass
+        with pytest.raises(RuntimeError):
+            with metrics.track("raising_tool"):
+                raise RuntimeError("boom")
+        with metrics.track("soft_failure_tool"):
+            mark_current_tool_call_failed()
+
+        assert metrics.calls == {("ok_tool", "success"): 1, ("raising_tool", "error"): 1,
+                                 ("soft_failure_tool", "error"): 1}
+        assert metrics.latency["ok_tool"].count == 1
+
+    @pytest.mark.asyncio
+    async def test_error_responses_count_as_failures(self):
+        @mcp_tool_with_error_handling("metrics_test_tool", enable_recovery=False)
+        async def failing_tool():
+            raise ValueError("bad input")
+
+        before = get_tool_metrics().calls.get(("metrics_test_tool", "error"), 0)
+        response = await failing_tool()
+
+        assert '"error": true' in response
+        assert get_tool_metrics().calls[("metrics_test_tool", "error")] == before + 1
+
+
+class TestComponentMetrics:
+    """Test the series registered components expose"""
+
+    @pytest.mark.asyncio
+    async def test_performance_monitor(self, tmp_path):
+        monitor = PerformanceMonitor(storage_path=str(tmp_path))
+        monitor.initialized = True
+        await monitor.record_download_metrics("https://example.com/a", 0.2, True, file_size=1000)
+        await monitor.record_download_metrics("https://example.com/b", 3.0, False)
+        await monitor.record_parsing_metrics("genre_page", 500, 0.02, True)
+
+        builder = MetricsBuilder()
+        monitor.collect_metrics(builder)
+        text = builder.render()
+
+        assert 'character_music_operation_duration_seconds_count{operation="wiki_download"} 2' in text
+        assert 'character_music_operation_duration_seconds_bucket{operation="content_parsing",le="0.025"} 1' in text
+        assert 'character_music_operations_total{operation="wiki_download",outcome="error"} 1' in text
+        assert 'character_music_download_bytes_total 1000' in text
+
+    def test_error_monitoring_system(self, tmp_path):
+        monitoring = ErrorMonitoringSystem(storage_path=str(tmp_path))
+        monitoring.initialized = True
+        monitoring.log_success("wiki_fetch", 0.1)
+        monitoring.log_success("wiki_fetch", 0.1)
+        monitoring.log_success("wiki_fetch", 0.1)
+        monitoring.log_error("wiki_fetch", ConnectionError("refused"), ErrorSeverity.HIGH)
+
+        builder = MetricsBuilder()
+        monitoring.collect_metrics(builder)
+        text = builder.render()
+
+        assert 'character_music_errors_total{error_type="ConnectionError",severity="high"} 1' in text
+        assert 'character_music_monitored_operations_total{operation="wiki_fetch",outcome="success"} 3' in text
+        assert 'character_music_operation_failure_ratio{operation="wiki_fetch"} 0.25' in text
+
+    def test_retry_system(self, tmp_path):
+        retry_system = RetrySystem(str(tmp_path))
+        retry_system.circuit_breakers["download"] = CircuitBreakerState(state=CircuitState.OPEN, open_until=0.0)
+        retry_system.circuit_breakers["parse"] = CircuitBreakerState()
+        session = RetrySession(operation_id="op", operation_type=OperationType.PARSE,
+                               start_time=datetime.now(), total_attempts=2, final_success=False)
+        retry_system._complete_session(session)
+
+        builder = MetricsBuilder()
+        retry_system.collect_metrics(builder)
+        text = builder.render()
+
+        assert 'character_music_circuit_breaker_state{circuit="download",state="half_open"} 1' in text
+        assert 'character_music_circuit_breaker_state{circuit="download",state="open"} 0' in text
+        assert 'character_music_circuit_breaker_state{circuit="parse",state="closed"} 1' in text
+        assert retry_system.circuit_breakers["download"].state == CircuitState.OPEN  # Scrapes change nothing
+        assert 'character_music_retry_sessions_total{operation_type="parse",outcome="error"} 1' in text
+        assert 'character_music_retry_attempts_total{operation_type="parse"} 2' in text
+
+    @pytest.mark.asyncio
+    async def test_cache_managers(self, tmp_path):
+        wiki_cache = WikiCacheManager(str(tmp_path / "wiki"))
+        enhanced_cache = EnhancedCacheManager(str(tmp_path / "enhanced"))
+        for cache in (wiki_cache, enhanced_cache):
+            await cache.initialize()
+            await cache.get_file_path("https://example.com/missing")
+        await enhanced_cache.cleanup()
+
+        text = get_metrics_registry().render()
+
+        assert 'character_music_cache_requests_total{cache="WikiCacheManager",result="miss"}' in text
+        assert 'character_music_cache_requests_total{cache="EnhancedCacheManager",result="miss"}' in text
+        assert 'character_music_cache_evictions_total{cache="EnhancedCacheManager"}' in text
+
+
+class TestEndpoints:
+    """Test the HTTP endpoint and the MCP resource"""
+
+    def test_http_endpoint_negotiates_format(self):
+        registry = MetricsRegistry()
+        source = StaticSource(5)
+        registry.register(source)
+        server = start_metrics_server(0, registry=registry)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{base}/metrics") as response:
+                assert response.headers["Content-Type"] == CONTENT_TYPE_PROMETHEUS
+                assert 'demo_events_total{kind="demo"} 5' in response.read().decode()
+
+            request = urllib.request.Request(f"{base}/metrics", headers={"Accept": "application/openmetrics-text"})
+            with urllib.request.urlopen(request) as response:
+                assert response.headers["Content-Type"] == CONTENT_TYPE_OPENMETRICS
+                assert response.read().decode().endswith("# EOF\n")
+
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(f"{base}/other")
+            assert error.value.code == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @pytest.mark.asyncio
+    async def test_mcp_resource_includes_tool_calls(self):
+        import server
+
+        story = "Sarah walked home in the rain. She had always feared the empty house her father left behind."
+        async with Client(server.mcp) as client:
+            await client.call_tool("analyze_character_text", {"text": story})
+            await client.call_tool("analyze_character_text", {"text": "Too short."})
+            contents = await client.read_resource("metrics://prometheus")
+
+        text = contents[0].text
+        assert 'character_music_tool_calls_total{tool="analyze_character_text",outcome="success"}' in text
+        assert 'character_music_tool_calls_total{tool="analyze_character_text",outcome="error"}' in text
+        assert 'character_music_tool_duration_seconds_bucket{tool="analyze_character_text",le="+Inf"}' in text
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Precompiled Regex Registry
+
+Tests the bounded per-name pattern cache, alternation gating, and that the
+analyzers and parsers no longer hand inline pattern strings to the re module.
+"""
+
+import os
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import regex_registry
+from regex_registry import (
+    DYNAMIC_PATTERN_CACHE_SIZE,
+    compile_alternation,
+    compile_pattern,
+    dynamic_pattern_cache_info,
+)
+from server import EmotionalBeatEngine
+
+SOURCE_ROOT = Path(__file__).resolve().parents[2] / "src" / "character_music_mcp"
+CONVERTED_MODULES = [
+    "server.py",
+    "analyzers/enhanced_character_analyzer.py",
+    "data/working_universal_processor.py",
+    "wiki/wiki_content_parser.py",
+]
+INLINE_PATTERN_CALL = re.compile(r"""\bre\.(?:search|match|fullmatch|findall|finditer|sub|subn|split)\(\s*r?['"]""")
+
+
+class TestCompilePattern:
+    """Test the per-name pattern cache"""
+
+    def test_same_pattern_is_compiled_once(self):
+        first = compile_pattern(r"\bElena\b", re.IGNORECASE)
+
+        assert compile_pattern(r"\bElena\b", re.IGNORECASE) is first
+        assert compile_pattern(r"\bElena\b") is not first
+
+    def test_cache_is_bounded(self):
+        compile_pattern.cache_clear()
+        for i in range(DYNAMIC_PATTERN_CACHE_SIZE * 2):
+            compile_pattern(rf"\bName{i}\b")
+
+        info = dynamic_pattern_cache_info()
+        assert info.currsize == DYNAMIC_PATTERN_CACHE_SIZE
+        assert info.misses == DYNAMIC_PATTERN_CACHE_SIZE * 2
+
+
+class TestCompileAlternation:
+    """Test gating a sequence of patterns with one alternation"""
+
+    @pytest.mark.parametrize("text", ["she was running late", "walking home", "a calm sea", "nothing here", ""])
+    def test_gate_matches_when_any_pattern_does(self, text):
+        patterns = [r'\b(running|racing)\b', r'\b(walking|moving)\b', r'\b(sleeping|calm)\b']
+        gate = compile_alternation(patterns, re.IGNORECASE)
+
+        assert bool(gate.search(text)) == any(re.search(p, text, re.IGNORECASE) for p in patterns)
+
+
+class TestGatedSequences:
+    """Test that gated first-match sequences keep their priority order"""
+
+    # Texts of 5-20 words, so sentence length leaves the base tempo alone
+    @pytest.mark.parametrize("text, tempo", [
+        ("They were walking for hours, then running, then finally sleeping", 140),
+        ("She kept sleeping late and walking the dog at noon", 100),
+        ("He sat there thinking about the calm grey sea", 75),
+        ("It was a calm night over the quiet harbor town", 60),
+        ("Nothing at all happened in the harbor town today", 80),
+    ])
+    def test_tempo_prefers_fastest_activity(self, text, tempo):
+        assert EmotionalBeatEngine()._generate_tempo_from_content(text, []) == tempo
+
+    def test_conflict_and_defense_fall_back_to_none(self):
+        engine = EmotionalBeatEngine()
+
+        assert engine._detect_internal_conflict("She wanted to stay but left", None) == "impulse vs restraint"
+        assert engine._detect_internal_conflict("An ordinary day", None) is None
+        assert engine._detect_defense_mechanism_in_text("It was never true") == "denial"
+        assert engine._detect_defense_mechanism_in_text("An ordinary day") is None
+
+
+class TestNoInlinePatterns:
+    """Test that converted modules use compiled patterns"""
+
+    @pytest.mark.parametrize("module", CONVERTED_MODULES)
+    def test_no_inline_pattern_strings(self, module):
+        source = (SOURCE_ROOT / module).read_text()
+
+        assert INLINE_PATTERN_CALL.findall(source) == []
+
+    def test_registry_patterns_are_compiled(self):
+        for name in ("SENTENCE_BOUNDARY", "CAPITALIZED_WORD", "CAPITALIZED_NAME", "WHITESPACE_RUN", "AGE_IN_YEARS"):
+            assert isinstance(getattr(regex_registry, name), re.Pattern)
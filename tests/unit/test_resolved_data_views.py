@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Resolved Data Views
+
+Tests that GracefulDegradationSystem merges wiki, cached and fallback data once
+per (wiki data version, cache state, fallback state), shares the resulting
+snapshot between concurrent readers, and merges again as soon as one of the
+sources changes.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from error_recovery_manager import DataSource, ErrorRecoveryManager, FallbackData
+from graceful_degradation_system import GracefulDegradationSystem
+from wiki_data_system import Genre, MetaTag, WikiDataManager
+
+
+async def _load(manager, genres=(), meta_tags=()):
+    cache_dir = manager.storage_path / "cache"
+    cache_dir.mkdir(exist_ok=True)
+    (cache_dir / "genres.json").write_text(json.dumps([Genre(name=name, description="").to_dict()
+                                                      for name in genres]))
+    (cache_dir / "meta_tags.json").write_text(json.dumps([MetaTag(tag=tag, category=category, description="").to_dict()
+                                                         for tag, category in meta_tags]))
+    await manager._load_cached_data()
+
+
+class CountingWikiDataManager(WikiDataManager):
+    """WikiDataManager over local cache files that counts list reads"""
+
+    def __init__(self, storage_path, delay: float = 0.0):
+        super().__init__()
+        self.storage_path = storage_path
+        self.initialized = True
+        self.delay = delay
+        self.reads = 0
+
+    async def get_genres(self):
+        self.reads += 1
+        await asyncio.sleep(self.delay)
+        return await super().get_genres()
+
+    async def get_meta_tags(self, category=None):
+        self.reads += 1
+        return await super().get_meta_tags(category)
+
+
+@pytest_asyncio.fixture
+async def wiki(tmp_path):
+    manager = CountingWikiDataManager(tmp_path)
+    await _load(manager, genres=["Rock", "Jazz"], meta_tags=[("[upbeat]", "mood"), ("[piano]", "instrument")])
+    return manager
+
+
+@pytest_asyncio.fixture
+async def system(tmp_path, wiki):
+    degradation_system = GracefulDegradationSystem(wiki, ErrorRecoveryManager(str(tmp_path / "recovery")))
+    await degradation_system.initialize()
+    wiki.reads = 0
+    return degradation_system
+
+
+class TestResolvedDataViews:
+    """Test memoized merging of data sources"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sources_share_one_snapshot(self, system, wiki):
+        first, first_metrics = await system.get_genres_with_fallback()
+        second, second_metrics = await system.get_genres_with_fallback()
+
+        assert [genre.name for genre in first] == ["Rock", "Jazz"]
+        assert isinstance(first, tuple)
+        assert second is first and second_metrics is first_metrics
+        assert wiki.reads == 1
+        assert (system.resolved_view_hits, system.resolved_view_misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_readers_wait_for_one_merge(self, system, wiki):
+        wiki.delay = 0.05
+        results = await asyncio.gather(*(system.get_genres_with_fallback() for _ in range(10)))
+
+        assert wiki.reads == 1
+        assert all(genres is results[0][0] for genres, _ in results)
+
+    @pytest.mark.asyncio
+    async def test_reloaded_wiki_data_is_merged_again(self, system, wiki):
+        before, _ = await system.get_genres_with_fallback()
+        await _load(wiki, genres=["Rock", "Jazz", "Blues"])
+        after, metrics = await system.get_genres_with_fallback()
+
+        assert [genre.name for genre in after] == ["Rock", "Jazz", "Blues"]
+        assert metrics.wiki_items == 3
+        assert wiki.reads == 2
+        assert after is not before
+
+    @pytest.mark.asyncio
+    async def test_wiki_due_a_refresh_is_read_through(self, system, wiki):
+        await system.get_genres_with_fallback()
+        wiki._should_refresh = lambda: True
+
+        await system.get_genres_with_fallback()
+        await system.get_genres_with_fallback()
+
+        assert wiki.data_version is None
+        assert wiki.reads == 3
+
+    @pytest.mark.asyncio
+    async def test_replaced_fallback_and_changed_cache_are_merged_again(self, system, wiki):
+        await _load(wiki)
+        genres, metrics = await system.get_genres_with_fallback()
+        assert metrics.fallback_items == len(genres) > 0
+
+        system.error_recovery_manager.fallback_data_cache['genres'] = FallbackData(
+            data=[{'name': 'Polka'}], source=DataSource.HARDCODED_FALLBACK, quality_score=0.6,
+            last_updated=datetime.now())
+        genres, _ = await system.get_genres_with_fallback()
+        assert [genre.name for genre in genres] == ["Polka"]
+
+        system.mark_cached_data_changed()
+        await system.get_genres_with_fallback()
+        assert system.resolved_view_misses == 3
+
+    @pytest.mark.asyncio
+    async def test_alternating_filters_keep_last_quality_entry(self, system, wiki):
+        mood, mood_metrics = await system.get_meta_tags_with_fallback("mood")
+        await system.get_meta_tags_with_fallback("instrument")
+        again, again_metrics = await system.get_meta_tags_with_fallback("mood")
+
+        assert [tag.tag for tag in mood] == ["[upbeat]"]
+        assert again is mood
+        assert system.data_quality_cache['meta_tags'] is mood_metrics is again_metrics
+        assert wiki.reads == 2
+
+    @pytest.mark.asyncio
+    async def test_unversioned_and_failed_reads_are_not_kept(self, tmp_path):
+        manager = Mock(spec=WikiDataManager)
+        manager.get_genres = AsyncMock(side_effect=ConnectionError("Network error"))
+        system = GracefulDegradationSystem(manager, ErrorRecoveryManager(str(tmp_path)))
+
+        await system.get_genres_with_fallback()
+        manager.get_genres.side_effect = None
+        manager.get_genres.return_value = [Genre(name="Rock", description="")]
+        genres, metrics = await system.get_genres_with_fallback()
+        await system.get_genres_with_fallback()
+
+        assert metrics.wiki_items == 1
+        assert manager.get_genres.await_count == 3
+        assert system.resolved_view_hits == 0
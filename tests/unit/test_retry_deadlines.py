@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Deadline-Aware and Hedged Retries
+
+Runs RetrySystem against a local stand-in server that injects latency, to
+check that attempts and backoff stay within the caller's latency budget and
+that hedged attempts take the first success.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from mcp_tool_decorator import mcp_tool_with_error_handling
+from retry_system import (
+    DeadlineExceededError,
+    OperationType,
+    RetryPolicy,
+    RetryStrategy,
+    RetrySystem,
+    latency_budget,
+    remaining_budget,
+)
+
+
+@pytest_asyncio.fixture
+async def stand_in_server():
+    """Local HTTP server answering after the next queued delay (default 0)"""
+    delays = []
+
+    async def handler(request):
+        await asyncio.sleep(delays.pop(0) if delays else 0.0)
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/page", handler)
+    server = TestServer(app)
+    await server.start_server()
+    async with aiohttp.ClientSession() as session:
+        async def fetch():
+            async with session.get(server.make_url("/page")) as response:
+                return await response.text()
+
+        yield fetch, delays
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def retry_system(tmp_path):
+    system = RetrySystem(str(tmp_path))
+    await system.initialize()
+    system.add_retry_policy("slow_backoff", RetryPolicy(
+        max_attempts=3, base_delay=1.0, jitter=False, strategy=RetryStrategy.FIXED_DELAY
+    ))
+    system.add_retry_policy("hedged", RetryPolicy(
+        max_attempts=2, base_delay=0.01, jitter=False, strategy=RetryStrategy.FIXED_DELAY,
+        hedge=True, hedge_delay=0.05
+    ))
+    return system
+
+
+class TestLatencyBudget:
+    """Test the budget carried by the context variable"""
+
+    def test_no_budget_by_default(self):
+        assert remaining_budget() is None
+
+    def test_nested_budget_cannot_extend_deadline(self):
+        with latency_budget(0.5) as outer:
+            with latency_budget(10.0) as inner:
+                assert inner == outer
+                assert remaining_budget() <= 0.5
+            with latency_budget(0.1):
+                assert remaining_budget() <= 0.1
+        assert remaining_budget() is None
+
+    @pytest.mark.asyncio
+    async def test_tool_decorator_sets_budget(self):
+        @mcp_tool_with_error_handling("budget_tool", enable_recovery=False, latency_budget_seconds=5.0)
+        async def tool():
+            return remaining_budget()
+
+        assert 4.0 < await tool() <= 5.0
+        assert remaining_budget() is None
+
+
+class TestDeadlineAwareRetries:
+    """Test attempts and backoff are clipped to the budget"""
+
+    @pytest.mark.asyncio
+    async def test_backoff_longer_than_budget_is_skipped(self, retry_system):
+        async def failing():
+            raise ConnectionError("connection refused")
+
+        started = time.monotonic()
+        with latency_budget(0.5), pytest.raises(ConnectionError):
+            await retry_system.execute_with_retry(
+                failing, "wiki_fetch", OperationType.NETWORK_REQUEST, "slow_backoff"
+            )
+
+        assert time.monotonic() - started < 0.3
+        assert retry_system.retry_sessions[-1].total_attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_attempt_cut_off_at_deadline(self, retry_system, stand_in_server):
+        fetch, delays = stand_in_server
+        delays.append(2.0)
+
+        started = time.monotonic()
+        with latency_budget(0.2), pytest.raises(DeadlineExceededError):
+            await retry_system.execute_with_retry(fetch, "wiki_fetch", OperationType.NETWORK_REQUEST)
+
+        assert time.monotonic() - started < 1.0
+        assert retry_system.retry_sessions[-1].total_attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_without_budget_behaves_as_before(self, retry_system, stand_in_server):
+        fetch, delays = stand_in_server
+        delays.append(0.05)
+
+        assert await retry_system.execute_with_retry(fetch, "wiki_fetch", OperationType.NETWORK_REQUEST) == "ok"
+        assert retry_system.retry_sessions[-1].hedged is False
+
+    @pytest.mark.asyncio
+    async def test_operation_timeout_is_retried(self, retry_system):
+        calls = []
+
+        async def times_out_twice():
+            calls.append(None)
+            if len(calls) < 3:
+                raise TimeoutError("read timed out")
+            return "ok"
+
+        fast = RetryPolicy(max_attempts=3, base_delay=0.0, jitter=False, strategy=RetryStrategy.FIXED_DELAY)
+        retry_system.add_retry_policy("fast", fast)
+        assert await retry_system.execute_with_retry(
+            times_out_twice, "wiki_fetch", OperationType.NETWORK_REQUEST, "fast"
+        ) == "ok"
+        assert len(calls) == 3
+
+        calls.clear()
+        with latency_budget(5.0):
+            assert await retry_system.execute_with_retry(
+                times_out_twice, "wiki_fetch", OperationType.NETWORK_REQUEST, "fast"
+            ) == "ok"
+        assert len(calls) == 3
+
+
+class TestHedgedAttempts:
+    """Test a slow first attempt is raced by a second one"""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_over_slow_attempt(self, retry_system, stand_in_server):
+        fetch, delays = stand_in_server
+        delays.extend([2.0, 0.01])
+
+        started = time.monotonic()
+        result = await retry_system.execute_with_retry(
+            fetch, "wiki_fetch", OperationType.NETWORK_REQUEST, "hedged"
+        )
+
+        assert result == "ok"
+        assert time.monotonic() - started < 1.0
+        session = retry_system.retry_sessions[-1]
+        assert session.total_attempts == 1 and session.hedged
+        assert retry_system.hedge_stats == {'hedges_launched': 1, 'hedge_wins': 1}
+
+    @pytest.mark.asyncio
+    async def test_fast_attempt_is_not_hedged(self, retry_system, stand_in_server):
+        fetch, _ = stand_in_server
+
+        assert await retry_system.execute_with_retry(
+            fetch, "wiki_fetch", OperationType.NETWORK_REQUEST, "hedged"
+        ) == "ok"
+        assert retry_system.hedge_stats['hedges_launched'] == 0
+
+    @pytest.mark.asyncio
+    async def test_hedge_still_needs_one_success(self, retry_system):
+        calls = 0
+
+        async def slow_failure():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.1)
+            raise PermissionError("denied")
+
+        with pytest.raises(PermissionError):
+            await retry_system.execute_with_retry(
+                slow_failure, "wiki_fetch", OperationType.NETWORK_REQUEST, "hedged"
+            )
+        assert calls == 2
+
+    def test_hedge_delay_follows_latency_quantile(self, retry_system):
+        policy = retry_system.retry_policies["hedged"]
+        assert retry_system._hedge_delay(OperationType.DOWNLOAD, policy) == 0.05
+
+        for latency in range(1, 101):
+            retry_system._record_latency(OperationType.DOWNLOAD, latency / 1000)
+
+        assert retry_system._hedge_delay(OperationType.DOWNLOAD, policy) == 0.095
+        assert retry_system._hedge_delay(OperationType.DOWNLOAD, retry_system.retry_policies["default"]) is None
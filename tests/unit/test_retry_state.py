@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Bounded Retry System State
+
+Tests that completed sessions are kept in a fixed-size ring with running
+totals, that circuit breakers recover on access without a polling task, and
+that state is persisted as compacted append-only logs.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+import pytest
+import pytest_asyncio
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import retry_system as retry_module
+from retry_system import (
+    CircuitState,
+    OperationType,
+    RetryPolicy,
+    RetryStrategy,
+    RetrySystem,
+)
+
+
+@pytest_asyncio.fixture
+async def retry_system(tmp_path, monkeypatch):
+    monkeypatch.setattr(retry_module, "MAX_RETRY_SESSIONS", 5)
+    system = RetrySystem(str(tmp_path))
+    await system.initialize()
+    system.add_retry_policy("breaker", RetryPolicy(
+        max_attempts=1, base_delay=0.0, jitter=False, strategy=RetryStrategy.CIRCUIT_BREAKER,
+        failure_threshold=2, recovery_timeout=30, success_threshold=1
+    ))
+    return system
+
+
+async def _succeed():
+    return "ok"
+
+
+async def _fail():
+    raise ConnectionError("connection refused")
+
+
+async def _run(system, operation, operation_id="op", policy="default"):
+    try:
+        return await system.execute_with_retry(operation, operation_id, OperationType.DOWNLOAD, policy)
+    except Exception as e:
+        return e
+
+
+class TestSessionRing:
+    """Test completed sessions use constant memory"""
+
+    @pytest.mark.asyncio
+    async def test_ring_is_bounded_and_totals_are_not(self, retry_system):
+        for i in range(12):
+            await _run(retry_system, _succeed, f"op_{i}")
+
+        assert len(retry_system.retry_sessions) == 5
+        assert retry_system.retry_sessions[0].operation_id == "op_7"
+        assert not retry_system.active_sessions
+
+        stats = retry_system.get_retry_statistics()
+        assert stats['total_sessions'] == 12
+        assert stats['operations_by_type']['download'] == {'total': 12, 'successful': 12, 'failed': 0}
+
+    @pytest.mark.asyncio
+    async def test_records_are_compact(self, retry_system):
+        await _run(retry_system, _fail, "failing", "breaker")
+
+        record = retry_system.retry_sessions[-1]
+        assert not hasattr(record, "__dict__")
+        assert record.final_error == "connection refused"
+        assert retry_system.get_retry_statistics()['recent_failures'][0]['final_error'] == "connection refused"
+
+    @pytest.mark.asyncio
+    async def test_no_background_tasks(self, tmp_path):
+        before = asyncio.all_tasks()
+        system = RetrySystem(str(tmp_path / "fresh"))
+        await system.initialize()
+
+        assert asyncio.all_tasks() == before
+
+
+class TestLazyCircuitBreakers:
+    """Test circuit transitions happen on access"""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_moves_to_half_open_on_access(self, retry_system):
+        key = "download:op"
+        await _run(retry_system, _fail, policy="breaker")
+        await _run(retry_system, _fail, policy="breaker")
+
+        circuit = retry_system.circuit_breakers[key]
+        assert circuit.state == CircuitState.OPEN
+        assert "Circuit breaker is OPEN" in str(await _run(retry_system, _succeed, policy="breaker"))
+
+        circuit.open_until = time.monotonic() - 1
+        assert retry_system.get_circuit_breaker_status(key).state == CircuitState.HALF_OPEN
+        assert await _run(retry_system, _succeed, policy="breaker") == "ok"
+        assert circuit.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_failure_reopens_for_recovery_timeout(self, retry_system):
+        await _run(retry_system, _fail, policy="breaker")
+        await _run(retry_system, _fail, policy="breaker")
+        circuit = retry_system.circuit_breakers["download:op"]
+        circuit.open_until = time.monotonic() - 1
+
+        await _run(retry_system, _fail, policy="breaker")
+
+        assert circuit.state == CircuitState.OPEN
+        assert circuit.open_until > time.monotonic() + 25
+
+
+class TestAppendOnlyPersistence:
+    """Test save_state appends only what changed and compacts the logs"""
+
+    @pytest.mark.asyncio
+    async def test_save_appends_changes_only(self, retry_system, tmp_path):
+        await _run(retry_system, _fail, "a", "breaker")
+        await _run(retry_system, _succeed, "b")
+        await retry_system.save_state()
+        await retry_system.save_state()
+
+        sessions = (tmp_path / "retry_sessions.jsonl").read_text().splitlines()
+        circuits = (tmp_path / "circuit_breakers.jsonl").read_text().splitlines()
+        assert [json.loads(line)['operation_id'] for line in sessions] == ["a", "b"]
+        assert len(circuits) == 1 and json.loads(circuits[0])['key'] == "download:a"
+        assert ": " not in sessions[0]
+
+        await _run(retry_system, _succeed, "c")
+        await retry_system.save_state()
+        assert len((tmp_path / "retry_sessions.jsonl").read_text().splitlines()) == 3
+
+    @pytest.mark.asyncio
+    async def test_session_log_is_compacted(self, retry_system, tmp_path):
+        for i in range(30):
+            await _run(retry_system, _succeed, f"op_{i}")
+            await retry_system.save_state()
+
+        lines = (tmp_path / "retry_sessions.jsonl").read_text().splitlines()
+        assert len(lines) <= retry_module.LOG_COMPACTION_FACTOR * 5
+        assert json.loads(lines[-1])['operation_id'] == "op_29"
+
+    @pytest.mark.asyncio
+    async def test_circuits_replayed_on_load(self, retry_system, tmp_path):
+        await _run(retry_system, _fail, "a", "breaker")
+        await _run(retry_system, _fail, "a", "breaker")
+        await retry_system.save_state()
+        with open(tmp_path / "circuit_breakers.jsonl", "a") as f:
+            f.write('{"key": "download:torn", "sta')
+
+        reloaded = RetrySystem(str(tmp_path))
+        await reloaded.initialize()
+
+        circuit = reloaded.circuit_breakers["download:a"]
+        assert circuit.state == CircuitState.OPEN and circuit.failure_count == 2
+        assert circuit.open_until > time.monotonic() + 25
+        assert "download:torn" not in reloaded.circuit_breakers
+
+    @pytest.mark.asyncio
+    async def test_appends_after_torn_line_survive_reload(self, retry_system, tmp_path):
+        await _run(retry_system, _succeed, "first")
+        await retry_system.save_state()
+        for name in ("circuit_breakers.jsonl", "retry_sessions.jsonl"):
+            with open(tmp_path / name, "a") as f:
+                f.write('{"key": "download:torn", "sta')
+
+        restarted = RetrySystem(str(tmp_path))
+        await restarted.initialize()
+        restarted.add_retry_policy("breaker", retry_system.retry_policies["breaker"])
+        await _run(restarted, _fail, "c", "breaker")
+        await _run(restarted, _fail, "c", "breaker")
+        await restarted.save_state()
+
+        reloaded = RetrySystem(str(tmp_path))
+        await reloaded.initialize()
+        assert reloaded.circuit_breakers["download:c"].state == CircuitState.OPEN
+        sessions = [json.loads(line) for line in (tmp_path / "retry_sessions.jsonl").read_text().splitlines()]
+        assert [session['operation_id'] for session in sessions] == ["first", "c", "c"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_circuit_file_migrated(self, tmp_path):
+        (tmp_path / "circuit_breakers.json").write_text(json.dumps({
+            "download:legacy": {"state": "closed", "failure_count": 1, "success_count": 0}
+        }))
+        system = RetrySystem(str(tmp_path))
+        await system.initialize()
+        await system.save_state()
+
+        assert system.circuit_breakers["download:legacy"].failure_count == 1
+        assert json.loads((tmp_path / "circuit_breakers.jsonl").read_text())['key'] == "download:legacy"
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Slow-Call Sampling Profiler
+
+Tests stack sampling of running, suspended and idle calls, keeping only slow
+calls' profiles, the collapsed-stack and top self-time output, rotation on
+disk, and profiling through the tool decorator and the MCP resources.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import sampling_profiler
+from fastmcp import Client
+from mcp_tool_decorator import mcp_tool_with_error_handling
+from sampling_profiler import (
+    IDLE_FRAME,
+    MAX_STACK_DEPTH,
+    OTHER_TASKS_FRAME,
+    ProfileSession,
+    ProfileStore,
+    StackSampler,
+    ToolProfiler,
+)
+
+
+def busy_work(seconds):
+    deadline = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+def leaf_frame():
+    return sys._getframe()
+
+
+def deep_frame(depth):
+    return deep_frame(depth - 1) if depth else leaf_frame()
+
+
+async def slow_call(profiler, tool="demo_tool", busy=0.06, idle=0.06):
+    async with profiler.profile(tool) as session:
+        busy_work(busy)
+        await asyncio.sleep(idle)
+    return session
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    return ToolProfiler(sample_rate=1.0, threshold_seconds=0.05, interval=0.002, output_dir=str(tmp_path))
+
+
+class TestSampling:
+    """Test stack sampling"""
+
+    @pytest.mark.asyncio
+    async def test_running_and_idle_samples(self, profiler):
+        session = await slow_call(profiler)
+
+        assert session.samples > 10
+        running = {stack: count for stack, count in session.stacks.items() if stack[-1] != IDLE_FRAME}
+        assert all(stack[0] == "demo_tool" for stack in session.stacks)
+        assert any("busy_work" in stack[-1] for stack in running)
+        assert all("slow_call" in stack[1] for stack in running)  # Rooted at the profiled coroutine
+        assert 0 < session.stacks.get(("demo_tool", IDLE_FRAME), 0) < session.samples
+
+    @pytest.mark.asyncio
+    async def test_tasks_run_while_suspended(self, profiler):
+        async def spawned_work():
+            busy_work(0.06)
+
+        async with profiler.profile("demo_tool") as session:
+            await asyncio.create_task(spawned_work())
+
+        other = [stack for stack in session.stacks if stack[1] == OTHER_TASKS_FRAME]
+        assert any("busy_work" in stack[-1] for stack in other)
+        assert any("spawned_work" in label for stack in other for label in stack)
+
+    @pytest.mark.asyncio
+    async def test_disabled_and_nested_calls(self, tmp_path):
+        disabled = ToolProfiler(output_dir=str(tmp_path))
+        assert await slow_call(disabled, busy=0.0, idle=0.0) is None
+
+        profiler = ToolProfiler(sample_rate=1.0, threshold_seconds=10.0, output_dir=str(tmp_path))
+        async with profiler.profile("outer") as outer:
+            async with profiler.profile("inner") as inner:
+                pass
+        assert outer is not None and inner is None
+        assert profiler.calls == {"kept": 0, "discarded": 1}
+
+    def test_deep_stacks_keep_innermost_frames(self):
+        session = ProfileSession("tool", sys._getframe())
+        stack = StackSampler()._stack(session, deep_frame(MAX_STACK_DEPTH * 2))
+
+        assert len(stack) == MAX_STACK_DEPTH
+        assert stack[0] == "tool"
+        assert "leaf_frame" in stack[-1]
+        assert all("deep_frame" in label for label in stack[1:-1])
+
+    def test_collapsed_stacks_and_top_functions(self):
+        session = ProfileSession("tool", sys._getframe())
+        for stack, count in ((("tool", "a", "b"), 6), (("tool", "a"), 2), (("tool", IDLE_FRAME), 2)):
+            for _ in range(count):
+                session.add_sample(stack)
+
+        assert session.collapsed_stacks() == "tool;<idle> 2\ntool;a 2\ntool;a;b 6\n"
+        top = session.top_functions(duration=1.0, limit=2)
+        assert top == [
+            {"function": "b", "self_samples": 6, "self_percent": 60.0, "self_ms": 600.0},
+            {"function": "a", "self_samples": 2, "self_percent": 20.0, "self_ms": 200.0},
+        ]
+
+
+class TestProfileStore:
+    """Test keeping profiles on disk"""
+
+    @pytest.mark.asyncio
+    async def test_only_slow_calls_are_kept(self, profiler, tmp_path):
+        await slow_call(profiler, busy=0.0, idle=0.0)
+        await slow_call(profiler)
+
+        profiles = profiler.list_profiles()
+        assert profiler.calls == {"kept": 1, "discarded": 1}
+        assert len(profiles) == 1
+        summary = profiles[0]
+        assert summary["tool"] == "demo_tool"
+        assert summary["duration_ms"] >= 100
+        assert summary["top_functions"][0]["self_samples"] > 0
+        flamegraph = profiler.store.read_flamegraph(summary["profile_id"])
+        assert flamegraph.startswith("demo_tool;")
+        assert (tmp_path / summary["flamegraph_file"]).exists()
+
+    @pytest.mark.asyncio
+    async def test_rotation_by_count_and_size(self, profiler, tmp_path):
+        profiler.configure(max_profiles=3)
+        for _ in range(5):
+            await slow_call(profiler, busy=0.03, idle=0.03)
+        assert len(profiler.list_profiles()) == 3
+        assert len(list(tmp_path.iterdir())) == 6
+
+        profiler.configure(max_bytes=1)
+        await slow_call(profiler, busy=0.03, idle=0.03)
+        assert profiler.list_profiles() == []
+
+    def test_unknown_or_unsafe_profile_ids(self, tmp_path):
+        store = ProfileStore(str(tmp_path))
+        assert store.read_flamegraph("../secrets") is None
+        assert store.read_flamegraph("20240101T000000-tool-0123abcd") is None
+
+
+class TestToolProfiling:
+    """Test profiling through the tool decorator and the MCP resources"""
+
+    @pytest.mark.asyncio
+    async def test_decorated_tool_is_profiled(self, profiler, monkeypatch):
+        monkeypatch.setattr(sampling_profiler, "_tool_profiler", profiler)
+
+        @mcp_tool_with_error_handling("profiled_test_tool", enable_recovery=False)
+        async def slow_tool():
+            busy_work(0.08)
+            return json.dumps({"ok": True})
+
+        assert json.loads(await slow_tool()) == {"ok": True}
+        summary = profiler.list_profiles()[0]
+        assert summary["tool"] == "profiled_test_tool"
+        assert any("busy_work" in entry["function"] for entry in summary["top_functions"])
+
+    @pytest.mark.asyncio
+    async def test_mcp_resources(self, profiler, monkeypatch):
+        import server
+
+        profiler.configure(threshold_seconds=0.0)
+        monkeypatch.setattr(sampling_profiler, "_tool_profiler", profiler)
+
+        async with Client(server.mcp) as client:
+            await client.call_tool("analyze_character_text", {"text": "Sarah walked home in the rain."})
+            listing = json.loads((await client.read_resource("profiles://slow-calls"))[0].text)
+            profile_id = listing["profiles"][0]["profile_id"]
+            flamegraph = (await client.read_resource(f"profiles://slow-calls/{profile_id}"))[0].text
+
+        assert listing["count"] == 1
+        assert listing["profiles"][0]["tool"] == "analyze_character_text"
+        assert flamegraph.startswith("analyze_character_text;")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Server Import Cost
+
+Tests that importing the server leaves the wiki stack and its heavy
+dependencies unloaded until wiki integration is first used, that the wiki
+classes stay reachable as server attributes, and that the server's own
+import time, measured with python -X importtime, stays within a budget.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+DEFERRED_MODULES = [
+    'wiki_data_system', 'wiki_downloader', 'wiki_content_parser', 'enhanced_genre_mapper',
+    'source_attribution_manager', 'aiohttp', 'aiofiles', 'bs4', 'psutil', 'watchdog',
+]
+
+SOURCE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                           "src", "character_music_mcp")
+
+# Import time of the repo's own modules (self time, excluding their dependencies) may be at most
+# this multiple of the cumulative import time of fastmcp, which the server cannot avoid
+PROJECT_IMPORT_BUDGET_RATIO = 2.0
+
+# Repo modules importing the server may load
+PROJECT_MODULE_BUDGET = 20
+
+# "import time: self [us] | cumulative | imported package" lines of -X importtime
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+
+def _run_in_fresh_interpreter(code: str) -> dict:
+    # sys.modules is shared within the test session, so import in a clean process
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _import_times(module: str) -> dict:
+    """Self and cumulative import time in seconds of every module loaded by importing module"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               capture_output=True, text=True, env=env, timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    times = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            times[match.group(3)] = (int(match.group(1)) / 1e6, int(match.group(2)) / 1e6)
+    return times
+
+
+class TestServerImport:
+    """Test deferred imports in the server module"""
+
+    def test_import_does_not_load_wiki_stack(self):
+        loaded = _run_in_fresh_interpreter(
+            "import json, sys, server\n"
+            f"print(json.dumps([name for name in {DEFERRED_MODULES!r} if name in sys.modules]))"
+        )
+        assert loaded == []
+
+    def test_wiki_names_load_on_first_access(self):
+        result = _run_in_fresh_interpreter(
+            "import json, sys, server\n"
+            "available = server.WIKI_INTEGRATION_AVAILABLE\n"
+            "print(json.dumps({'available': available,\n"
+            "                  'mapper': server.EnhancedGenreMapper.__name__,\n"
+            "                  'loaded': 'wiki_data_system' in sys.modules}))"
+        )
+        assert result == {'available': True, 'mapper': 'EnhancedGenreMapper', 'loaded': True}
+
+    def test_unknown_attribute_still_raises(self):
+        import server
+
+        missing = "not_a_server_attribute"
+        with pytest.raises(AttributeError):
+            getattr(server, missing)
+
+
+class TestServerImportBudget:
+    """Test the server's import time with python -X importtime"""
+
+    def test_import_time_within_budget(self):
+        times = _import_times("server")
+        project_modules = {name[:-3] for _, _, files in os.walk(SOURCE_ROOT) for name in files
+                           if name.endswith(".py")}
+        loaded = sorted(name for name in times if name in project_modules)
+        project_seconds = sum(times[name][0] for name in loaded)
+        fastmcp_seconds = times["fastmcp"][1]
+
+        assert not set(DEFERRED_MODULES) & set(times)
+        assert len(loaded) <= PROJECT_MODULE_BUDGET, loaded
+        assert project_seconds <= PROJECT_IMPORT_BUDGET_RATIO * fastmcp_seconds, (
+            f"repo modules took {project_seconds:.3f}s to import, fastmcp {fastmcp_seconds:.3f}s: "
+            + ", ".join(f"{name} {times[name][0]:.3f}s" for name in
+                        sorted(loaded, key=lambda name: times[name][0], reverse=True)[:5])
+        )
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for MCP Tool Call Coalescing
+
+Tests that concurrent identical tool calls share one computation, that
+different arguments do not, and that errors and cancellation reach the
+waiting callers correctly.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import mcp_single_flight
+from mcp_single_flight import SingleFlight, single_flight_key, single_flight_tool
+
+from tests.fixtures.mock_contexts import create_mock_context
+
+
+@pytest.fixture(autouse=True)
+def fresh_single_flight(monkeypatch):
+    group = SingleFlight()
+    monkeypatch.setattr(mcp_single_flight, "_single_flight", group)
+    return group
+
+
+def make_tool(release: asyncio.Event, calls: list):
+    @single_flight_tool
+    async def slow_tool(text: str, ctx=None, mode: str = "full") -> str:
+        calls.append((text, mode))
+        await release.wait()
+        if text == "boom":
+            raise ValueError("boom")
+        return f"{text}:{mode}:{len(calls)}"
+
+    return slow_tool
+
+
+class TestSingleFlight:
+    """Test coalescing of identical calls"""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_computation(self, fresh_single_flight):
+        release, calls = asyncio.Event(), []
+        tool = make_tool(release, calls)
+
+        waiters = [asyncio.ensure_future(tool("text", create_mock_context())) for _ in range(3)]
+        waiters.append(asyncio.ensure_future(tool(text="text", mode="full", ctx=create_mock_context())))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["text:full:1"] * 4
+        assert calls == [("text", "full")]
+        stats = fresh_single_flight.get_stats()
+        assert stats["executions"] == 1
+        assert stats["coalesced_by_tool"] == {"slow_tool": 3}
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_arguments_and_later_calls_run_again(self):
+        release, calls = asyncio.Event(), []
+        tool = make_tool(release, calls)
+        release.set()
+
+        assert await asyncio.gather(tool("a"), tool("a", mode="short"), tool("b")) == ["a:full:1", "a:short:2", "b:full:3"]
+        assert await tool("a") == "a:full:4"
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self):
+        release, calls = asyncio.Event(), []
+        tool = make_tool(release, calls)
+
+        waiters = [asyncio.ensure_future(tool("boom")) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_computation_running(self, fresh_single_flight):
+        release, calls = asyncio.Event(), []
+        tool = make_tool(release, calls)
+
+        first = asyncio.ensure_future(tool("text"))
+        second = asyncio.ensure_future(tool("text"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == "text:full:1"
+        assert first.cancelled()
+        assert fresh_single_flight.get_stats()["cancelled_waiters"] == 1
+        assert fresh_single_flight.get_stats()["abandoned"] == 0
+
+    @pytest.mark.asyncio
+    async def test_computation_cancelled_when_every_waiter_leaves(self, fresh_single_flight):
+        release, calls = asyncio.Event(), []
+        tool = make_tool(release, calls)
+
+        waiters = [asyncio.ensure_future(tool("text")) for _ in range(2)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert fresh_single_flight.get_stats()["abandoned"] == 1
+        assert fresh_single_flight.in_flight == 0
+        release.set()
+        assert await tool("text") == "text:full:2"
+
+    @pytest.mark.asyncio
+    async def test_call_after_abandonment_starts_a_new_computation(self, fresh_single_flight):
+        release, calls = asyncio.Event(), []
+        tool = make_tool(release, calls)
+
+        abandoned = asyncio.ensure_future(tool("text"))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        await asyncio.sleep(0)
+        late = asyncio.ensure_future(tool("text"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await late == "text:full:2"
+        assert abandoned.cancelled()
+        assert fresh_single_flight.get_stats()["executions"] == 2
+
+    def test_key_ignores_dict_order(self):
+        first = single_flight_key("tool", {"a": 1, "b": {"x": 1, "y": 2}})
+        second = single_flight_key("tool", {"b": {"y": 2, "x": 1}, "a": 1})
+
+        assert first == second
+        assert first != single_flight_key("other", {"a": 1, "b": {"x": 1, "y": 2}})
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Slotted Data Models
+
+Tests that StandardCharacterProfile and the server's ArtistPersona, SunoCommand,
+EmotionalState and BeatPattern are slotted, intern their short labels, and keep
+to_dict/from_dict compatible with the asdict-based serialization.
+"""
+
+import os
+import sys
+from dataclasses import asdict
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server import ArtistPersona, BeatPattern, EmotionalState, SunoCommand
+from standard_character_profile import StandardCharacterProfile, intern_label
+
+
+def _fresh(text: str) -> str:
+    # Build an equal but distinct string object, as parsing would
+    return "".join(list(text))
+
+
+def _profile() -> StandardCharacterProfile:
+    return StandardCharacterProfile(
+        name=_fresh("Mara Quinn"),
+        aliases=["Mara"],
+        backstory="Raised in a lighthouse.",
+        motivations=["find her brother"],
+        fears=["open water"],
+        conceptual_basis=["isolation"],
+        content_type=_fresh("narrative")
+    )
+
+
+def _command() -> SunoCommand:
+    return SunoCommand(
+        command_type=_fresh("simple"), prompt="A storm song", style_tags=[_fresh("folk")],
+        structure_tags=["verse"], sound_effect_tags=[], vocal_tags=["raspy"],
+        character_source="Mara", artist_persona="Mara Band", command_rationale="test",
+        estimated_effectiveness=0.8, variations=[]
+    )
+
+
+class TestSlottedModels:
+    """Test slot layout and label interning"""
+
+    @pytest.mark.parametrize("instance", [
+        _profile(),
+        ArtistPersona(character_name="Mara", artist_name="Mara Band"),
+        _command(),
+        EmotionalState("sadness", ["longing"], 0.7, ["left home"], None, None, 0.8),
+        BeatPattern((60, 80), "slow", ["brushed snare"], "building", "sadness", []),
+    ])
+    def test_instances_have_no_instance_dict(self, instance):
+        assert not hasattr(instance, '__dict__')
+        with pytest.raises(AttributeError):
+            instance.undeclared_attribute = True
+
+    def test_short_labels_are_interned(self):
+        first, second = _profile(), _profile()
+        assert first.name is second.name
+        assert first.content_type is second.content_type
+
+        personas = [ArtistPersona(character_name="Mara", artist_name="Mara Band",
+                                  primary_genre=_fresh("folk"), secondary_genres=[_fresh("indie")])
+                    for _ in range(2)]
+        assert personas[0].primary_genre is personas[1].primary_genre
+        assert personas[0].secondary_genres[0] is personas[1].secondary_genres[0]
+
+        states = [EmotionalState(_fresh("grief"), [_fresh("anger")], 0.5, [], None, None, 0.5) for _ in range(2)]
+        assert states[0].primary_emotion is states[1].primary_emotion
+        assert states[0].secondary_emotions[0] is states[1].secondary_emotions[0]
+
+        assert _command().style_tags[0] is _command().style_tags[0]
+
+    def test_long_text_is_not_interned(self):
+        text = _fresh("x" * 500)
+        assert intern_label(text) is text
+        assert intern_label(None) is None
+
+
+class TestFastSerialization:
+    """Test hand-written to_dict against asdict"""
+
+    def test_profile_to_dict_matches_asdict(self):
+        profile = _profile()
+        assert profile.to_dict() == asdict(profile)
+
+    def test_profile_to_dict_lists_are_copies(self):
+        profile = _profile()
+        data = profile.to_dict()
+        data['aliases'].append("Lighthouse Girl")
+        assert profile.aliases == ["Mara"]
+
+    def test_profile_round_trip(self):
+        profile = _profile()
+        assert StandardCharacterProfile.from_dict(profile.to_dict()) == profile
+
+    def test_profile_to_dict_keeps_missing_conceptual_basis(self):
+        profile = StandardCharacterProfile(name="Mara", conceptual_basis=None)
+        assert profile.to_dict()['conceptual_basis'] is None
+
+    def test_server_models_to_dict_match_asdict(self):
+        persona = ArtistPersona(character_name="Mara", artist_name="Mara Band", primary_genre="folk",
+                                secondary_genres=["indie"], emotional_palette=["grief"])
+        state = EmotionalState("sadness", ["longing"], 0.7, ["left home"], "pride", "denial", 0.8)
+        command = _command()
+
+        assert persona.to_dict() == asdict(persona)
+        assert state.to_dict() == asdict(state)
+        assert command.to_dict() == asdict(command)
+        assert ArtistPersona.from_dict(persona.to_dict()) == persona
+        assert EmotionalState(**state.to_dict()) == state
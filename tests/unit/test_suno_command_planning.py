@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Suno Command Lookup Planning
+
+Tests that SunoCommandGenerator plans each variant's wiki tag lookups up front,
+dedupes identical lookups across variants and personas, and produces the same
+commands as resolving every lookup inline.
+"""
+
+import asyncio
+import os
+import sys
+from collections import Counter
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server import ArtistPersona, EmotionalState, SunoCommandGenerator
+from standard_character_profile import StandardCharacterProfile
+from wiki_data_models import MetaTag
+
+from tests.fixtures.mock_contexts import create_mock_context
+
+
+class CountingWikiDataManager:
+    """Minimal wiki data manager that records every meta tag fetch"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = Counter()
+        self.tags = [
+            MetaTag(tag="driving rhythm", category="style", description="energetic rock", compatible_genres=["rock"]),
+            MetaTag(tag="verse-chorus", category="structural", description="simple structure"),
+            MetaTag(tag="bridge build", category="structural", description="complex dynamic bridge"),
+            MetaTag(tag="raspy lead", category="vocal", description="powerful raspy vocals"),
+            MetaTag(tag="melancholic", category="emotional", description="sadness and longing"),
+            MetaTag(tag="guitar-driven", category="instrumental", description="electric guitar focus"),
+        ]
+
+    async def get_meta_tags(self, category: str = None):
+        self.calls[category] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if category:
+            return [tag for tag in self.tags if tag.category == category]
+        return list(self.tags)
+
+
+def _persona(name: str, genre: str = "rock") -> ArtistPersona:
+    return ArtistPersona(
+        character_name=name,
+        artist_name=f"{name} Band",
+        primary_genre=genre,
+        secondary_genres=["alternative"],
+        vocal_style="powerful raspy",
+        instrumental_preferences=["guitar", "drums"],
+        lyrical_themes=["loss", "resilience"],
+        emotional_palette=["sadness", "hope"],
+        collaboration_style="open"
+    )
+
+
+def _character(name: str) -> StandardCharacterProfile:
+    return StandardCharacterProfile(
+        name=name,
+        backstory="A long history of leaving home and finding it again in strangers.",
+        relationships=["friend Ana", "family", "mentor Bo"],
+        motivations=["find home", "protect others"],
+        conflicts=["pride", "fear of loss"],
+        personality_drivers=["stubborn", "loyal"],
+        confidence_score=0.9
+    )
+
+
+def _states():
+    return [
+        EmotionalState("sadness", ["longing"], 0.7, ["left home"], None, None, 0.8),
+        EmotionalState("anger", [], 0.5, ["betrayed"], "pride vs love", "denial", 0.4),
+        EmotionalState("hope", [], 0.6, ["new friend"], None, None, 0.9),
+    ]
+
+
+class TestCommandLookupPlanning:
+    """Test planning and deduplication of wiki tag lookups"""
+
+    def test_plan_covers_all_variants_in_order(self):
+        generator = SunoCommandGenerator(CountingWikiDataManager())
+        variants = generator.plan_command_variants(_persona("Mara"), _character("Mara"), _states())
+
+        assert [name for name, _ in variants] == [
+            'simple', 'custom', 'bracket', 'emotion_beat', 'lyric_focused', 'collaboration'
+        ]
+
+    def test_identical_lookups_share_one_key(self):
+        generator = SunoCommandGenerator(CountingWikiDataManager())
+        lookups = generator.plan_tag_lookups(_persona("Mara"), _character("Mara"))
+
+        # Every variant asks for the same genre style tags
+        style_lookup = generator._tag_lookup('get_style_tags_for_genre', 'rock')
+        assert lookups.count(style_lookup) == 4
+        assert len(set(lookups)) < len(lookups)
+
+    @pytest.mark.asyncio
+    async def test_planned_commands_match_inline_resolution(self):
+        generator = SunoCommandGenerator(CountingWikiDataManager())
+        persona, character = _persona("Mara"), _character("Mara")
+        ctx = create_mock_context("basic")
+
+        planned = await generator.generate_suno_commands(persona, character, ctx)
+
+        # Build each variant without a prefetch scope, as the generator did before planning
+        inline = []
+        for variant, _lookups in generator.plan_command_variants(persona, character):
+            inline.append(await generator._build_command_variant(variant, persona, character))
+
+        assert planned == inline
+
+    @pytest.mark.asyncio
+    async def test_meta_tag_fetches_are_shared_per_category(self):
+        wiki = CountingWikiDataManager(latency=0.001)
+        generator = SunoCommandGenerator(wiki)
+        ctx = create_mock_context("basic")
+
+        await generator.generate_suno_commands(_persona("Mara"), _character("Mara"), ctx)
+
+        assert wiki.calls
+        assert all(count == 1 for count in wiki.calls.values())
+
+    @pytest.mark.asyncio
+    async def test_batch_scope_resolves_shared_lookups_once(self):
+        wiki = CountingWikiDataManager()
+        generator = SunoCommandGenerator(wiki)
+        ctx = create_mock_context("basic")
+        requests = [(_persona(name), _character(name)) for name in ("Mara", "Jonah", "Iris")]
+
+        lookups = [lookup for persona, character in requests
+                   for lookup in generator.plan_tag_lookups(persona, character)]
+        async with generator.prefetch_tag_lookups(lookups):
+            fetches_after_prefetch = sum(wiki.calls.values())
+            for persona, character in requests:
+                commands = await generator.generate_suno_commands(persona, character, ctx)
+                assert commands
+
+        # Personas share genre, vocal style and instruments, so nothing is re-fetched
+        assert sum(wiki.calls.values()) == fetches_after_prefetch
+
+    @pytest.mark.asyncio
+    async def test_resolved_results_are_copied_per_variant(self):
+        generator = SunoCommandGenerator(CountingWikiDataManager())
+        lookup = generator._tag_lookup('get_style_tags_for_genre', 'rock')
+
+        async with generator.prefetch_tag_lookups([lookup]) as resolved:
+            first = await generator._resolve_tag_lookup(lookup)
+            first.append('mutated')
+            second = await generator._resolve_tag_lookup(lookup)
+
+        assert 'mutated' not in second
+        assert 'mutated' not in resolved[lookup]
+
+    @pytest.mark.asyncio
+    async def test_failed_prefetch_falls_back_to_direct_lookup(self):
+        generator = SunoCommandGenerator(None)
+
+        resolved = await generator.resolve_tag_lookups([('missing_method', ())])
+
+        assert resolved == {}
+        with pytest.raises(AttributeError):
+            await generator._resolve_tag_lookup(('missing_method', ()))
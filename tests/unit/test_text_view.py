@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Shared Text View
+
+Tests that TextView derives each view of a text once and that the concept and
+beat helpers give the same results for a string and for a shared view.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from server import CreativeMusicEngine, EmotionalBeatEngine, EmotionalState
+from text_view import TextView
+
+CONCEPTS = [
+    "The feeling of standing at the edge of a vast ocean at night, wondering what lies beyond?",
+    "Urban rain on a city street, dark and intense, a journey through broken memory!",
+    "gentle piano",
+    "A celebration of joy and hope, bright light rising.\n\nSecond part. Third; with: colons!",
+    "Thinking about the complex layered sadness of winter and the mysterious unknown cycle",
+]
+
+
+class TestTextView:
+    """Test the derived views"""
+
+    def test_views_match_string_operations(self):
+        text = "  Rain on the Window.  A quiet ROOM.\n\nSecond, paragraph; here: done?  "
+        view = TextView(text)
+
+        assert view.lowered == text.lower()
+        assert view.tokens == tuple(text.split())
+        assert view.lowered_tokens == tuple(text.lower().split())
+        assert view.sentences == tuple(s.strip() for s in text.split('.') if s.strip())
+        assert view.sentence_word_counts == tuple(len(s.split()) for s in view.sentences)
+        assert view.paragraphs == tuple(p.strip() for p in text.split('\n\n') if p.strip())
+        assert len(view) == len(text)
+        assert [view.count(c) for c in ',;:?!'] == [text.count(c) for c in ',;:?!']
+
+    def test_views_are_computed_once(self):
+        view = TextView("Quiet rain. Soft light.")
+
+        assert view.lowered is view.lowered
+        assert view.sentences is view.sentences
+        assert view.contains("rain") and view.contains("rain")
+        assert view._phrase_hits == {"rain": True}
+        assert view.count_present(["rain", "snow", "light"]) == 2
+        assert not view.contains_any(["snow", "hail"])
+
+    def test_view_is_immutable(self):
+        view = TextView("text")
+
+        with pytest.raises(AttributeError):
+            view.original = "other"
+        assert TextView.of(view) is view
+        assert TextView("text") == view
+
+
+class TestHelpersShareView:
+    """Test the helpers behave the same for a string and a shared view"""
+
+    @pytest.mark.parametrize("concept", CONCEPTS)
+    def test_concept_analysis_unchanged(self, concept):
+        engine = CreativeMusicEngine()
+        view = TextView(concept)
+
+        assert engine.analyze_musical_concept(view) == engine.analyze_musical_concept(concept)
+        assert 'lowered' in view.__dict__
+
+    @pytest.mark.parametrize("concept", CONCEPTS)
+    def test_beat_helpers_unchanged(self, concept):
+        engine = EmotionalBeatEngine()
+        states = [EmotionalState(
+            primary_emotion="dark grief", secondary_emotions=[], intensity=0.5,
+            factual_triggers=["at home in the city"], internal_conflict=None,
+            defense_mechanism=None, authenticity_score=0.9
+        )]
+        view = TextView(concept)
+
+        for helper in (engine._generate_tempo_from_content, engine._generate_rhythm_from_content,
+                       engine._design_sounds_from_content, engine._generate_structure_from_content):
+            assert helper(view, states) == helper(concept, states)
+        assert engine._calculate_authenticity(view) == engine._calculate_authenticity(concept)
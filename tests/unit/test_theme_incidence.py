@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Sentence x Keyword Theme Incidence
+
+Tests the SentenceKeywordIncidence columns against plain substring checks and
+that narrative theme scoring through it returns exactly the NarrativeTheme
+results of the per-theme sentence scan it replaced.
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from enhanced_character_analyzer import (
+    EnhancedCharacterAnalyzer,
+    NarrativeTheme,
+    SentenceKeywordIncidence,
+)
+
+TEXTS = [
+    "",
+    "Nothing thematic here at all",
+    "Love and passion filled her heart. She would betray no one! Who am I? "
+    "Her mother and father were family... The quest, the journey, the voyage to discover the secret.",
+    "The war was a struggle and a fight. They had to survive the danger, escape and hide. "
+    "Power and control corrupted the rule of law, and forgiveness came too late for redemption",
+    ("Elena trusted her friend and loyal companion. Marcus sought power to control the council, "
+     "but his betrayal and lies caught up with him. In the end she chose forgiveness and mercy! ") * 20,
+]
+
+
+def _legacy_themes(analyzer, text):
+    # _analyze_narrative_themes_semantic before the incidence matrix
+    themes = []
+    text_lower = text.lower()
+    for theme_name, theme_data in analyzer.theme_patterns.items():
+        keyword_matches = []
+        pattern_matches = []
+        for keyword in theme_data['keywords']:
+            count = text_lower.count(keyword.lower())
+            if count > 0:
+                keyword_matches.append(f"{keyword} ({count} occurrences)")
+        for pattern in theme_data.get('patterns', []):
+            matches = re.findall(pattern, text, re.IGNORECASE)
+            if matches:
+                pattern_matches.extend([f"Pattern match: {match}" for match in matches[:3]])
+        theme_sentences = []
+        for sentence in re.split(r'[.!?]+', text):
+            sentence_lower = sentence.lower()
+            if sum(1 for keyword in theme_data['keywords'] if keyword.lower() in sentence_lower) >= 2:
+                theme_sentences.append(sentence.strip()[:100] + "...")
+        total_strength = len(keyword_matches) * 0.1 + len(pattern_matches) * 0.15 + len(theme_sentences) * 0.2
+        if total_strength > 0.1:
+            evidence = keyword_matches + pattern_matches + [f"Thematic context: {sent}" for sent in theme_sentences[:2]]
+            themes.append(NarrativeTheme(
+                theme=theme_name.replace('_', ' ').title(),
+                strength=min(total_strength, 1.0),
+                evidence=evidence[:5],
+                keywords=theme_data['keywords'][:5]
+            ))
+    themes.sort(key=lambda x: x.strength, reverse=True)
+    return themes[:8]
+
+
+class TestSentenceKeywordIncidence:
+    """Test incidence columns"""
+
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_columns_match_substring_checks(self, text):
+        keywords = ['love', 'who am I', 'family', 'e', 'war', 'struggle', 'control the', 'mercy']
+        incidence = SentenceKeywordIncidence(text, keywords)
+        sentences = re.split(r'[.!?]+', text)
+
+        for keyword in keywords + ['not indexed', '']:
+            expected = [i for i, sentence in enumerate(sentences) if keyword.lower() in sentence.lower()]
+            assert incidence.sentences_with(keyword) == expected
+
+    def test_multi_keyword_sentences_in_text_order(self):
+        incidence = SentenceKeywordIncidence("war and fight. peace. fight on, war! war", ['war', 'fight'])
+
+        assert incidence.multi_keyword_sentences(['war', 'fight']) == [0, 2]
+        assert incidence.multi_keyword_sentences(['war', 'fight'], minimum=1) == [0, 2, 3]
+
+    def test_matches_do_not_span_sentences(self):
+        incidence = SentenceKeywordIncidence("it was the end. Game over", ['end game', 'endgame'])
+
+        assert incidence.sentences_with('end game') == []
+        assert incidence.sentences_with('endgame') == []
+
+    def test_lowercase_longer_than_original(self):
+        incidence = SentenceKeywordIncidence("İİİİİİİİİİ x. love here. y. hope", ['love', 'hope'])
+
+        assert incidence.sentences_with('love') == [1]
+        assert incidence.sentences_with('hope') == [3]
+
+
+class TestNarrativeThemeScoring:
+    """Test that theme scoring output is unchanged"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", TEXTS)
+    async def test_themes_match_per_theme_scan(self, text):
+        analyzer = EnhancedCharacterAnalyzer()
+
+        assert await analyzer._analyze_narrative_themes_semantic(text) == _legacy_themes(analyzer, text)
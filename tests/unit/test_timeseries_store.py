@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Time-Series Store
+
+Tests that recorded points reach their segments and rollups, that range queries
+give percentiles and throughput per window from each resolution, that history
+survives a restart, and that compaction seals segments and applies retention.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from performance_monitor import PerformanceMonitor
+from timeseries_store import LatencySummary, TimeSeriesStore
+
+# An hour boundary, so minute and hour windows line up with the test data
+T0 = 1_700_002_800.0
+
+
+def fill(store, operation="tool", minutes=3, per_minute=100, failures_every=10):
+    """Record per_minute points in each minute with durations 1..per_minute ms"""
+    for minute in range(minutes):
+        for i in range(per_minute):
+            store.record(operation, T0 + minute * 60 + i * 0.5, (i + 1) / 1000,
+                         success=(i % failures_every != 0))
+
+
+class TestLatencySummary:
+    """Test the mergeable histogram summary"""
+
+    def test_quantiles_within_one_bucket(self):
+        summary = LatencySummary()
+        for i in range(1, 1001):
+            summary.add(i / 1000, True)
+
+        for q, exact in ((0.5, 0.5), (0.95, 0.95), (0.99, 0.99)):
+            assert exact <= summary.quantile(q) <= exact * 1.2
+        assert summary.quantile(1.0) == 1.0
+        assert LatencySummary().quantile(0.5) is None
+
+    def test_merge_equals_combined(self):
+        left, right, combined = LatencySummary(), LatencySummary(), LatencySummary()
+        for i in range(200):
+            (left if i % 2 else right).add(i / 100, i % 3 != 0)
+            combined.add(i / 100, i % 3 != 0)
+
+        left.merge(right)
+        assert left.to_dict() == combined.to_dict()
+        assert LatencySummary.from_dict(left.to_dict()) == left
+
+
+class TestQueries:
+    """Test range queries at each resolution"""
+
+    def test_minute_windows_before_and_after_flush(self, tmp_path):
+        store = TimeSeriesStore(tmp_path)
+        fill(store)
+
+        pending = store.query_range("tool", T0, T0 + 180, step=60)
+        store.flush(now=T0 + 3600)
+        flushed = store.query_range("tool", T0, T0 + 180, step=60)
+
+        assert pending == flushed
+        assert [window['count'] for window in flushed] == [100, 100, 100]
+        assert flushed[0]['errors'] == 10
+        assert flushed[0]['throughput_per_sec'] == pytest.approx(100 / 60)
+        assert 0.050 <= flushed[0]['p50'] <= 0.060
+        assert 0.099 <= flushed[0]['p99'] <= 0.100
+
+    def test_hour_windows_include_open_minutes(self, tmp_path):
+        store = TimeSeriesStore(tmp_path)
+        fill(store)
+        store.flush(now=T0 + 90)  # First minute closed, the rest still open
+
+        hour = store.query_range("tool", T0, T0 + 3600, step=3600)
+
+        assert hour[0]['count'] == 300
+        assert hour[0]['errors'] == 30
+
+    def test_raw_windows_are_exact(self, tmp_path):
+        store = TimeSeriesStore(tmp_path)
+        fill(store, minutes=1)
+        store.flush(now=T0 + 30)
+        store.record("tool", T0 + 55, 0.5, True)  # Still buffered
+
+        windows = store.query_range("tool", T0, T0 + 60, step=30)
+
+        assert [window['count'] for window in windows] == [60, 41]
+        assert windows[0]['p50'] == 0.030
+        assert windows[1]['p99'] == 0.5
+        assert store.summarize("tool", T0, T0 + 30)['count'] == 60
+
+    def test_invalid_ranges_rejected(self, tmp_path):
+        store = TimeSeriesStore(tmp_path)
+
+        with pytest.raises(ValueError):
+            store.query_range("tool", T0, T0, step=60)
+        with pytest.raises(ValueError):
+            store.query_range("tool", T0, T0 + 86400 * 365, step=1)
+
+
+class TestPersistence:
+    """Test segment files, restarts and compaction"""
+
+    def test_history_survives_restart(self, tmp_path):
+        store = TimeSeriesStore(tmp_path)
+        fill(store)
+        store.flush(finalize_all=True, now=T0 + 100)
+        before = store.query_range("tool", T0, T0 + 180, step=60)
+
+        restarted = TimeSeriesStore(tmp_path)
+        fill(restarted, minutes=1)  # The same minute again after the restart
+        restarted.flush(finalize_all=True, now=T0 + 200)
+
+        after = restarted.query_range("tool", T0, T0 + 180, step=60)
+        assert [window['count'] for window in after] == [200, 100, 100]
+        assert after[1] == before[1]
+        assert restarted.query_range("tool", T0, T0 + 3600, step=3600)[0]['count'] == 400
+        assert restarted.query_range("tool", T0, T0 + 60, step=60.0 - 1e-9)[0]['count'] == 200
+
+    def test_torn_writes_are_skipped(self, tmp_path):
+        store = TimeSeriesStore(tmp_path)
+        fill(store, minutes=2)
+        store.flush(now=T0 + 3600 * 2)
+
+        segment = next(tmp_path.glob("raw/tool/*.seg"))
+        with open(segment, 'ab') as f:
+            f.write(b'TSB1\xff')
+        rollup = next(tmp_path.glob("minute/*.jsonl"))
+        with open(rollup, 'a') as f:
+            f.write('{"op":"tool","sta')
+
+        assert store.query_range("tool", T0, T0 + 120, step=30)[0]['count'] == 60
+        assert store.query_range("tool", T0, T0 + 120, step=60)[0]['count'] == 100
+
+        # Points flushed after a restart land after the intact data, not inside the torn tail
+        restarted = TimeSeriesStore(tmp_path)
+        for i in range(10):
+            restarted.record("tool", T0 + 150 + i, 0.001, True)
+        restarted.flush(now=T0 + 3600 * 2)
+
+        raw = restarted.query_range("tool", T0, T0 + 180, step=30)
+        assert [window['count'] for window in raw] == [60, 40, 60, 40, 0, 10]
+        minutes = restarted.query_range("tool", T0, T0 + 180, step=60)
+        assert [window['count'] for window in minutes] == [100, 100, 10]
+
+    def test_compaction_seals_and_expires(self, tmp_path):
+        store = TimeSeriesStore(tmp_path, raw_retention=3600)
+        for minute in range(3):
+            fill(store, minutes=1)
+            store.flush(now=T0 + 60 * (minute + 1))
+        segment = next(tmp_path.glob("raw/tool/*.seg"))
+        size = segment.stat().st_size
+
+        assert store.compact(now=T0 + 3600) == {'removed_files': 0, 'sealed_segments': 1}
+        assert segment.stat().st_size == size - 2 * 8
+        assert store.query_range("tool", T0, T0 + 60, step=1)[0]['count'] == 6
+        assert store.compact(now=T0 + 3600)['sealed_segments'] == 0
+
+        assert store.compact(now=T0 + 3600 * 3)['removed_files'] == 1
+        assert not segment.exists()
+        assert store.query_range("tool", T0, T0 + 60, step=60)[0]['count'] == 300
+
+
+class TestPerformanceMonitorIntegration:
+    """Test the monitor feeds and queries the store"""
+
+    @pytest.mark.asyncio
+    async def test_recorded_metrics_are_queryable(self, tmp_path):
+        monitor = PerformanceMonitor(storage_path=str(tmp_path))
+        monitor.initialized = True
+
+        for i in range(20):
+            await monitor.record_download_metrics(f"https://example.com/{i}", 0.1 * (i + 1), i != 0)
+        await monitor.save_state()
+
+        restarted = PerformanceMonitor(storage_path=str(tmp_path))
+        windows = await restarted.query_timeseries("wiki_download", 0, 4_000_000_000, step=4_000_000_000)
+
+        assert windows[0]['count'] == 20
+        assert windows[0]['errors'] == 1
+        assert 1.8 <= windows[0]['p99'] <= 2.0
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Per-Stage Tracing
+
+Tests span nesting and timing, the no-op behaviour outside a trace, the span
+limit, the tree and Chrome trace exports, and the opt-in trace parameter of
+the MCP tools.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import tracing
+from fastmcp import Client
+from tracing import annotate, span, start_trace, traced, tracing_active
+
+SAMPLE_TEXT = (
+    "Sarah Chen stood at the edge of the pier, remembering her father. Sarah had always feared "
+    "the ocean after the storm took him. \"I will not run anymore,\" Sarah said to Marcus. "
+    "Marcus Webb watched her with worry, knowing Sarah hid her grief behind ambition."
+)
+
+
+@traced("sync_stage")
+def sync_stage(value):
+    annotate(value=value)
+    return value * 2
+
+
+@traced()
+async def async_stage(value):
+    await asyncio.sleep(0)
+    return sync_stage(value)
+
+
+def _names(node):
+    return [node["name"]] + [name for child in node.get("children", []) for name in _names(child)]
+
+
+class TestSpans:
+    """Test span recording"""
+
+    def test_nothing_recorded_outside_a_trace(self):
+        assert not tracing_active()
+        with span("orphan") as current:
+            assert current is None
+        annotate(ignored=True)
+        assert sync_stage(2) == 4
+
+    def test_spans_nest_under_the_trace(self):
+        with start_trace("request", user="test") as trace:
+            assert tracing_active()
+            with span("outer", size=3):
+                sync_stage(1)
+            assert sync_stage(5) == 10
+
+        tree = trace.to_tree()
+        assert tree["name"] == "request"
+        assert tree["attributes"] == {"user": "test"}
+        outer, second = tree["children"]
+        assert outer["name"] == "outer"
+        assert outer["attributes"] == {"size": 3}
+        assert outer["children"][0] == {**outer["children"][0], "name": "sync_stage", "attributes": {"value": 1}}
+        assert second["attributes"] == {"value": 5}
+        assert tree["duration_ms"] >= outer["duration_ms"] >= outer["children"][0]["duration_ms"]
+        assert second["start_ms"] >= outer["start_ms"] + outer["duration_ms"]
+        assert not tracing_active()
+
+    def test_exceptions_are_recorded_and_propagate(self):
+        with pytest.raises(ValueError):
+            with start_trace("request") as trace:
+                with span("failing"):
+                    raise ValueError("boom")
+
+        tree = trace.to_tree()
+        assert tree["attributes"] == {"error": "ValueError"}
+        assert tree["children"][0]["attributes"] == {"error": "ValueError"}
+
+    @pytest.mark.asyncio
+    async def test_async_spans_and_tasks(self):
+        with start_trace("request") as trace:
+            results = await asyncio.gather(async_stage(1), async_stage(2))
+
+        assert results == [2, 4]
+        tree = trace.to_tree()
+        assert [child["name"] for child in tree["children"]] == ["async_stage"] * 2
+        assert all(child["children"][0]["name"] == "sync_stage" for child in tree["children"])
+
+        chrome = trace.to_chrome_trace()
+        lanes = {event["tid"] for event in chrome["traceEvents"] if event["name"] == "async_stage"}
+        assert len(lanes) == 2  # Each gathered task gets its own timeline row
+
+    def test_span_limit(self, monkeypatch):
+        monkeypatch.setattr(tracing, "MAX_TRACE_SPANS", 3)
+        with start_trace("request") as trace:
+            for _ in range(5):
+                with span("stage"):
+                    pass
+
+        tree = trace.to_tree()
+        assert len(tree["children"]) == 2
+        assert tree["dropped_spans"] == 3
+
+
+class TestExport:
+    """Test the trace export formats"""
+
+    def test_chrome_trace_events(self):
+        with start_trace("request") as trace:
+            with span("stage", kind="demo"):
+                pass
+
+        chrome = trace.export("chrome")
+        assert chrome["displayTimeUnit"] == "ms"
+        root, stage = chrome["traceEvents"]
+        assert root["name"] == "request" and root["ph"] == "X" and root["ts"] == 0
+        assert stage["args"] == {"kind": "demo"}
+        assert root["dur"] >= stage["dur"] >= 0
+        assert root["tid"] == stage["tid"]
+        json.dumps(chrome)
+
+    def test_unknown_format(self):
+        with start_trace("request") as trace:
+            pass
+        with pytest.raises(ValueError):
+            trace.export("flame")
+
+
+class TestToolTracing:
+    """Test the trace parameter of the MCP tools"""
+
+    @pytest.mark.asyncio
+    async def test_complete_workflow_trace_tree(self):
+        import server
+
+        async with Client(server.mcp) as client:
+            plain = await client.call_tool("complete_workflow", {"text": SAMPLE_TEXT})
+            traced_result = await client.call_tool("complete_workflow", {"text": SAMPLE_TEXT, "trace": "tree"})
+
+        assert "trace" not in json.loads(plain.content[0].text)
+        result = json.loads(traced_result.content[0].text)
+        assert result["workflow_status"] == json.loads(plain.content[0].text)["workflow_status"]
+        names = _names(result["trace"])
+        assert names[0] == "complete_workflow"
+        for stage in ("analyze_character_text", "character_detection", "character_profile",
+                      "generate_artist_personas", "persona_generation", "create_suno_commands",
+                      "command_generation", "json_serialization", "json_parsing"):
+            assert stage in names
+
+    @pytest.mark.asyncio
+    async def test_chrome_format_and_invalid_format(self):
+        import server
+
+        async with Client(server.mcp) as client:
+            chrome = await client.call_tool("analyze_character_text", {"text": SAMPLE_TEXT, "trace": "chrome"})
+            invalid = await client.call_tool("analyze_character_text", {"text": SAMPLE_TEXT, "trace": "flame"})
+
+        events = json.loads(chrome.content[0].text)["trace"]["traceEvents"]
+        assert events[0]["name"] == "analyze_character_text"
+        assert "character_analysis" in {event["name"] for event in events}
+        assert "Unknown trace format" in json.loads(invalid.content[0].text)["error"]
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Warm Worker Pool
+
+Tests that workers are forked from the warmed parent, results and errors
+come back to the caller, a dead worker only fails its own task, workers are
+recycled by task count and memory, and the utilization metrics.
+"""
+
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from metrics_exposition import MetricsBuilder
+from warm_worker_pool import WarmWorkerPool, WorkerLostError, task_reference
+
+# Set by warm_up in the pool's parent, so workers see it only if forked after warm-up
+WARMED_BY = None
+
+
+def warm_up():
+    global WARMED_BY
+    WARMED_BY = os.getpid()
+
+
+def worker_state():
+    return os.getpid(), os.getppid(), WARMED_BY
+
+
+def square(value):
+    return value * value
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def exit_worker():
+    os._exit(3)
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**kwargs):
+        pool = WarmWorkerPool(warmup=[task_reference(warm_up)], **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+
+class TestWarmWorkers:
+    """Test running tasks in workers forked from the warm parent"""
+
+    def test_workers_forked_from_warmed_parent(self, make_pool):
+        pool = make_pool(max_workers=2)
+        states = [future.result() for future in [pool.submit(worker_state) for _ in range(6)]]
+
+        parents = {parent for _, parent, _ in states}
+        assert len(parents) == 1
+        assert all(warmed_by == parent for _, parent, warmed_by in states)
+        assert os.getpid() not in {pid for pid, _, _ in states} | parents
+        assert pool.stats()["warmup_seconds"] is not None
+
+    def test_results_and_errors(self, make_pool):
+        pool = make_pool(max_workers=2)
+        assert [future.result() for future in [pool.submit(square, i) for i in range(10)]] == [i * i for i in range(10)]
+        with pytest.raises(ValueError, match="bad document"):
+            pool.submit(fail, "bad document").result()
+        assert pool.stats()["tasks"] == {"completed": 10, "failed": 1, "lost": 0}
+
+    def test_lost_worker_fails_only_its_task(self, make_pool):
+        pool = make_pool(max_workers=1)
+        with pytest.raises(WorkerLostError):
+            pool.submit(exit_worker).result()
+        assert pool.submit(square, 3).result() == 9
+        assert pool.stats()["recycled"]["lost"] == 1
+
+    def test_worker_killed_while_idle_is_replaced(self, make_pool):
+        pool = make_pool(max_workers=1)
+        pid = pool.submit(worker_state).result()[0]
+        os.kill(pid, signal.SIGKILL)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            try:
+                os.kill(pid, 0)  # Reaped by the pool's parent once it exits
+            except ProcessLookupError:
+                break
+            time.sleep(0.01)
+
+        assert [pool.submit(square, i).result() for i in range(4)] == [0, 1, 4, 9]
+        stats = pool.stats()
+        assert stats["recycled"]["lost"] == 1
+        assert stats["tasks"] == {"completed": 5, "failed": 0, "lost": 0}
+
+    @pytest.mark.asyncio
+    async def test_async_run(self, make_pool):
+        pool = make_pool(max_workers=1)
+        assert await pool.run(square, 7) == 49
+
+    def test_only_module_level_functions(self, make_pool):
+        with pytest.raises(ValueError, match="module-level"):
+            make_pool().submit(lambda: None)
+
+
+class TestRecycling:
+    """Test replacing workers by task count and memory"""
+
+    def test_recycled_after_max_tasks(self, make_pool):
+        pool = make_pool(max_workers=1, max_tasks_per_worker=2)
+        pids = [pool.submit(worker_state).result()[0] for _ in range(5)]
+
+        assert pids[0] == pids[1] != pids[2] == pids[3] != pids[4]
+        stats = pool.stats()
+        assert stats["recycled"]["tasks"] == 2
+        assert stats["workers_started"] == 3
+
+    def test_recycled_over_memory_limit(self, make_pool):
+        pool = make_pool(max_workers=1, max_worker_rss_mb=1)
+        pids = {pool.submit(worker_state).result()[0] for _ in range(3)}
+
+        assert len(pids) == 3
+        assert pool.stats()["recycled"]["rss"] == 3
+
+
+class TestUtilization:
+    """Test pool settings and metrics"""
+
+    def test_metrics_and_configure(self, make_pool):
+        pool = make_pool(max_workers=2)
+        builder = MetricsBuilder()
+        pool.collect_metrics(builder)
+        assert "worker_pool" not in builder.render()
+
+        pool.configure(max_workers=1)
+        pool.submit(square, 2).result()
+        with pytest.raises(RuntimeError, match="while it is running"):
+            pool.configure(max_workers=4)
+
+        pool.collect_metrics(builder)
+        rendered = builder.render()
+        assert "character_music_worker_pool_workers 1" in rendered
+        assert 'character_music_worker_pool_tasks_total{outcome="completed"} 1' in rendered
+        assert pool.stats()["busy_workers"] == 0 and pool.stats()["queued_tasks"] == 0
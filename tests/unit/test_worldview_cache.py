@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the Character Worldview Cache
+
+Tests that WorkingUniversalProcessor parses each character description once,
+shares the frozen worldview across processors and threads, and that adapting
+one processor to its content leaves the shared worldview untouched.
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import working_universal_processor
+from working_universal_processor import WorkingUniversalProcessor, WorldviewCache, freeze_worldview
+
+DESCRIPTION = (
+    "Marcus Chen is a 34-year-old electronic music producer from Detroit working in a "
+    "warehouse studio. Philosophical, processing grief after his father's death."
+)
+PHILOSOPHICAL_CONTENT = (
+    "The nature of consciousness and existence raises philosophical questions about reality, "
+    "free will and the meaning of being."
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    cache = WorldviewCache(maxsize=4)
+    monkeypatch.setattr(working_universal_processor, "_worldview_cache", cache)
+    return cache
+
+
+class TestWorldviewCache:
+    """Test parsing happens once per description"""
+
+    def test_description_parsed_once(self, fresh_cache, monkeypatch):
+        calls = []
+        original = WorkingUniversalProcessor._parse_character_description
+
+        def counting_parse(self, description):
+            calls.append(description)
+            return original(self, description)
+
+        monkeypatch.setattr(WorkingUniversalProcessor, "_parse_character_description", counting_parse)
+        processors = [WorkingUniversalProcessor(DESCRIPTION) for _ in range(12)]
+
+        assert len(calls) == 1
+        assert all(p.character_worldview is processors[0].character_worldview for p in processors)
+        assert fresh_cache.get_stats() == {"size": 1, "maxsize": 4, "hits": 11, "misses": 1}
+
+    def test_worldview_matches_fresh_parse(self):
+        processor = WorkingUniversalProcessor(DESCRIPTION)
+        parsed = processor._build_worldview(DESCRIPTION)
+
+        assert processor.character_worldview == freeze_worldview(parsed)
+        assert processor.character_worldview["name"] == "Marcus Chen"
+        assert processor.character_worldview["context"]["genre"] == "electronic"
+        assert WorkingUniversalProcessor().character_worldview["name"] == "Emerging Artist"
+        assert WorkingUniversalProcessor("short").character_worldview["name"] == "Independent Artist"
+
+    def test_least_recently_used_evicted(self, fresh_cache):
+        descriptions = [f"{DESCRIPTION} Variant {i}." for i in range(5)]
+        first = WorkingUniversalProcessor(descriptions[0]).character_worldview
+        for description in descriptions[1:4]:
+            WorkingUniversalProcessor(description)
+        assert WorkingUniversalProcessor(descriptions[0]).character_worldview is first
+
+        WorkingUniversalProcessor(descriptions[4])
+
+        assert fresh_cache.get_stats()["size"] == 4
+        assert fresh_cache.key_for(descriptions[1]) not in fresh_cache._entries
+        assert fresh_cache.key_for(descriptions[0]) in fresh_cache._entries
+
+    def test_shared_across_threads(self, fresh_cache):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            worldviews = list(pool.map(lambda _: WorkingUniversalProcessor(DESCRIPTION).character_worldview,
+                                       range(32)))
+
+        assert all(worldview is worldviews[0] for worldview in worldviews)
+        assert fresh_cache.get_stats()["size"] == 1
+
+
+class TestWorldviewImmutability:
+    """Test the shared worldview cannot be changed through a processor"""
+
+    def test_worldview_is_read_only(self):
+        worldview = WorkingUniversalProcessor(DESCRIPTION).character_worldview
+
+        with pytest.raises(TypeError):
+            worldview["name"] = "Someone Else"
+        with pytest.raises(TypeError):
+            worldview["context"]["genre"] = "pop"
+        assert isinstance(worldview["struggles"], tuple)
+        assert "Processing loss and grief" in worldview["struggles"]
+
+    def test_override_is_per_processor(self):
+        shared = WorkingUniversalProcessor(DESCRIPTION).character_worldview
+        adapted = WorkingUniversalProcessor(DESCRIPTION)
+
+        adapted.character_worldview = adapted.extract_or_create_characters(PHILOSOPHICAL_CONTENT)[0]
+
+        assert adapted.character_worldview is not shared
+        assert adapted.process_any_content(PHILOSOPHICAL_CONTENT, "Track").formatted_lyrics
+        assert WorkingUniversalProcessor(DESCRIPTION).character_worldview is shared
+        assert shared["name"] == "Marcus Chen"